@@ -0,0 +1,126 @@
+"""Benchmark bulk job description cleaning on a synthetic scraped corpus.
+
+Compares the previous multi-pass clean_job_description (kept below as the
+reference) with the current single-pass version, in-process and through the
+clean_job_descriptions batch API with a process pool. The outputs must be
+identical on the corpus and on random fuzz strings; the run fails otherwise.
+
+Usage:
+    python benchmarks/bench_clean_descriptions.py [--postings 10000] [--workers 4]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, List
+from gary.utils.clean_job_description import (
+    clean_job_description,
+    clean_job_descriptions,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Characters scraped postings tend to contain, beyond plain ASCII
+NOISE = [
+    "’", "“", "”", "–", "—", "•", "★", " ",
+    "é", "ü", "ﬁ", "™", "®", "‑", "\U0001f680",
+    "\\n", "\\t", "\\r", "\\\\n", "\n", "\r\n", "\t", "\f", "\v", "\x1c",
+    "&amp;", "<br>", "**", "#", "$", "%", "@", "  ", " .", " ,", " !", "?",
+]  # fmt: skip
+
+
+def reference_clean_job_description(text: str) -> str:
+    """The previous implementation, one pass per step."""
+    normalized_text = unicodedata.normalize("NFKD", text)
+    ascii_text = normalized_text.encode("ascii", "ignore").decode("ascii")
+    cleaned_text = (
+        ascii_text.replace("\\n", " ").replace("\\r", " ").replace("\\t", " ")
+    )
+    cleaned_text = cleaned_text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
+    cleaned_text = re.sub(r"[\t\f\v]", " ", cleaned_text)
+    cleaned_text = re.sub(r"[^\w\s.,;:!?()\-\']", " ", cleaned_text)
+    cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    cleaned_text = re.sub(r"\s+([.,;:!?])", r"\1", cleaned_text)
+    cleaned_text = cleaned_text.strip()
+    return cleaned_text
+
+
+def build_corpus(postings: int, seed: int = 0) -> List[str]:
+    """Vary the fixture posting: shuffled paragraphs, noise and ASCII-only copies."""
+    rng = random.Random(seed)
+    text = (FIXTURES_DIR / "job_description.txt").read_text(encoding="utf-8")
+    paragraphs = text.replace("\\n", "\n").split("\n\n")
+    corpus = []
+    for i in range(postings):
+        parts = rng.sample(paragraphs, k=rng.randint(2, len(paragraphs)))
+        posting = "\n\n".join(parts)
+        words = posting.split(" ")
+        for _ in range(rng.randint(0, 20)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(NOISE))
+        posting = " ".join(words)
+        if i % 3 == 0:
+            posting = posting.encode("ascii", "ignore").decode("ascii")
+        corpus.append(posting)
+    return corpus
+
+
+def fuzz_strings(count: int, seed: int = 1) -> List[str]:
+    rng = random.Random(seed)
+    alphabet = NOISE + list("abcXYZ019_.,;:!?()-'\\ ")
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+def time_it(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, help="Pool size (default: CPU count)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed rounds (best)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.postings)
+    megabytes = sum(len(text) for text in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} postings, {megabytes:.1f}M characters\n")
+
+    mismatches = [
+        text
+        for text in corpus + fuzz_strings(20_000)
+        if clean_job_description(text) != reference_clean_job_description(text)
+    ]
+    if mismatches:
+        sys.exit(f"✗ Output differs from the reference for {mismatches[0]!r}")
+    print("✓ Output identical to the previous implementation\n")
+
+    reference = time_it(
+        lambda: [reference_clean_job_description(text) for text in corpus],
+        args.repeat,
+    )
+    single = time_it(lambda: clean_job_descriptions(corpus, max_workers=1), args.repeat)
+    pooled = time_it(
+        lambda: clean_job_descriptions(corpus, max_workers=args.workers), args.repeat
+    )
+
+    print(f"{'previous, in-process':<28} {reference:8.3f}s")
+    print(f"{'single-pass, in-process':<28} {single:8.3f}s  {reference / single:5.1f}x")
+    print(
+        f"{'single-pass, process pool':<28} {pooled:8.3f}s  {reference / pooled:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure the setup and connection time a warm crew pool saves per job.
+
+Compares building a new Gary crew for every job with leasing one from a
+CrewPool, and opening a new HTTPS connection to the LLM endpoint for every
+request with reusing a pooled keep-alive connection. Crew construction runs
+offline; the connection comparison needs network access and is skipped
+with --offline.
+
+Usage:
+    python benchmarks/bench_crew_reuse.py [--jobs 20] [--requests 10] [--offline]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from gary.config import OPENROUTER_DEFAULT_BASE_URL
+from gary.crew import OPENROUTER_BASE_URL, Gary
+from gary.crew_pool import CrewPool
+from gary.models import MasterResume
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def per_job(label: str, fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    seconds = (time.perf_counter() - start) / count
+    print(f"{label:<36} {seconds * 1e3:9.2f}ms per job")
+    return seconds
+
+
+def bench_crews(jobs: int) -> dict:
+    with open(FIXTURES_DIR / "resume.json", "r", encoding="utf-8") as f:
+        master_resume = MasterResume(**json.load(f))
+    pool = CrewPool()
+
+    def leased():
+        with pool.lease(master_resume) as gary:
+            gary.crew()
+
+    cold = per_job(
+        "new crew per job", lambda: Gary(master_resume=master_resume).crew(), jobs
+    )
+    warm = per_job("leased from CrewPool", leased, jobs)
+    return {"cold_seconds": cold, "warm_seconds": warm, "saved_seconds": cold - warm}
+
+
+def bench_connections(requests: int) -> dict:
+    import httpx
+
+    url = OPENROUTER_BASE_URL or OPENROUTER_DEFAULT_BASE_URL
+
+    def fresh():
+        with httpx.Client() as client:
+            client.head(url)
+
+    with httpx.Client() as pooled_client:
+        pooled_client.head(url)  # Open the pooled connection once
+        new = per_job("new connection per request", fresh, requests)
+        pooled = per_job(
+            "pooled keep-alive connection", lambda: pooled_client.head(url), requests
+        )
+    return {"new_seconds": new, "pooled_seconds": pooled, "saved_seconds": new - pooled}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument(
+        "--offline", action="store_true", help="Skip the network comparison"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = {"crew": bench_crews(args.jobs)}
+    if not args.offline:
+        import httpx
+
+        try:
+            results["connection"] = bench_connections(args.requests)
+        except httpx.HTTPError as e:
+            print(f"Connection comparison skipped: {e}")
+
+    saved = sum(r["saved_seconds"] for r in results.values())
+    print(f"\nSaved per job: {saved * 1e3:.1f}ms")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark bulk Word resume rendering in documents per second.
+
+Compares a fresh DocxTemplate per document (the previous behaviour of
+generate_word_resume) with the pre-compiled ResumeWordRenderer, in-process
+and with a process pool.
+
+Usage:
+    python benchmarks/bench_docx_render.py [--documents 200] [--workers 4]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from docxtpl import DocxTemplate
+from gary.config import RESUME_WORD_TEMPLATE
+from gary.models import JobDetails, MasterResume, Resume, ResumeContent
+from gary.utils.resume_word_doc_generator import (
+    ResumeWordRenderer,
+    generate_word_resumes,
+    resume_file_name,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_documents(count: int):
+    """Build (Resume, JobDetails) pairs from the fixture resume."""
+    with open(FIXTURES_DIR / "resume.json", "r", encoding="utf-8") as f:
+        master_resume = MasterResume(**json.load(f))
+
+    resume = Resume(
+        header=master_resume.header,
+        resume_content=ResumeContent(
+            professional_summary=master_resume.professional_summary,
+            work_experience=master_resume.work_experience,
+            education=master_resume.education,
+            skills=master_resume.skills,
+            projects=master_resume.projects,
+        ),
+    )
+    return [
+        (
+            resume,
+            JobDetails(
+                company_name=f"Company {i}",
+                job_title="Software Engineer",
+                location="Remote",
+                job_id=str(i),
+                job_description="Benchmark posting",
+                date_applied="01-01-2025",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def render_fresh_template(documents, output_dir: Path) -> None:
+    """Previous behaviour: load and compile the template for every document."""
+    for resume, job_details in documents:
+        doc = DocxTemplate(RESUME_WORD_TEMPLATE)
+        doc.render(resume.model_dump(mode="json"))
+        doc.save(str(output_dir / resume_file_name(resume, job_details)))
+
+
+def render_precompiled(documents, output_dir: Path) -> None:
+    renderer = ResumeWordRenderer()
+    for resume, job_details in documents:
+        renderer.render(resume, job_details, output_dir)
+
+
+def timed(label: str, fn, documents) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        fn(documents, Path(tmp))
+        elapsed = time.perf_counter() - start
+    docs_per_second = len(documents) / elapsed
+    print(f"{label:<28} {elapsed:8.2f}s  {docs_per_second:8.1f} docs/s")
+    return {
+        "name": label,
+        "seconds": round(elapsed, 4),
+        "docs_per_second": round(docs_per_second, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    documents = load_documents(args.documents)
+    print(f"Rendering {len(documents)} documents\n")
+
+    results = [
+        timed("fresh template per doc", render_fresh_template, documents),
+        timed("pre-compiled renderer", render_precompiled, documents),
+        timed(
+            "pre-compiled process pool",
+            lambda docs, out: generate_word_resumes(
+                docs, max_workers=args.workers, output_dir=out
+            ),
+            documents,
+        ),
+    ]
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""Microbenchmarks for Gary's local hot paths, checked against a stored baseline.
+
+Every case runs on fixed fixtures and needs no network access. Results are
+printed as a table and can be written as JSON; with --check, the run fails
+when a case's best time exceeds its baseline by more than the tolerance.
+The best (minimum) round is compared because it is the least sensitive to
+other load on the machine.
+
+Absolute timings depend on the machine, so each case is compared as a
+ratio to the reference case, a fixed pure-Python workload timed in rounds
+interleaved with the case's own. The stored baseline then holds across
+machines of similar architecture, and under a drifting load.
+
+Usage:
+    python benchmarks/bench_hot_paths.py [--repeat 15] [--json results.json]
+    python benchmarks/bench_hot_paths.py --check [--tolerance 0.3]
+    python benchmarks/bench_hot_paths.py --save-baseline
+"""
+
+import argparse
+import atexit
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from gary.models import JobAnalysis, JobDetails, MasterResume, Resume, ResumeContent
+from gary.utils.clean_job_description import clean_job_description
+from gary.utils.result_parser import parse_crew_result, parse_json_model
+from gary.utils.resume_artifact import CompiledResume, load_compiled_resume
+from gary.utils.resume_slicer import slice_master_resume
+from gary.utils.resume_word_doc_generator import ResumeWordRenderer
+
+BENCHMARKS_DIR = Path(__file__).parent
+FIXTURES_DIR = BENCHMARKS_DIR / "fixtures"
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+
+LARGE_DESCRIPTION_BYTES = 50_000
+
+# Case every other case is measured against; always run
+REFERENCE_CASE = "reference"
+
+# (name, setup, calls per timed round); setup returns the function to time
+Case = Tuple[str, Callable[[], Callable[[], object]], int]
+
+
+def _read_fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def _resume_dict() -> dict:
+    return json.loads(_read_fixture("resume.json"))
+
+
+def _resume_content_dict() -> dict:
+    resume = _resume_dict()
+    del resume["header"]
+    return resume
+
+
+def _noisy_crew_output() -> str:
+    """Agent-style output: a long Thought preamble, fenced JSON and a trailer."""
+    thought = (
+        "Thought: I need to align the candidate's experience with the job "
+        "requirements, emphasizing distributed systems, Python and AWS. "
+    ) * 400
+    content = json.dumps(_resume_content_dict(), indent=2)
+    return (
+        f"{thought}\nFinal Answer:\n```json\n{content}\n```\n"
+        "This resume highlights the most relevant experience for the role."
+    )
+
+
+def _job_details() -> JobDetails:
+    return JobDetails(
+        company_name="Benchmark Corp",
+        job_title="Senior Backend Engineer",
+        location="Remote",
+        job_id="BENCH-1",
+        job_description="Benchmark posting",
+        date_applied="01-01-2025",
+    )
+
+
+def setup_reference() -> Callable[[], object]:
+    # Dict, string and JSON work typical of the hot paths, without Gary code
+    text = _read_fixture("job_description.txt")
+    resume = _resume_dict()
+
+    def reference() -> object:
+        counts: Dict[str, int] = {}
+        for word in text.lower().split():
+            counts[word] = counts.get(word, 0) + 1
+        return json.loads(json.dumps(resume)), sorted(counts.items())
+
+    return reference
+
+
+def setup_clean_small() -> Callable[[], object]:
+    text = _read_fixture("job_description.txt")
+    return lambda: clean_job_description(text)
+
+
+def setup_clean_large() -> Callable[[], object]:
+    text = _read_fixture("job_description.txt")
+    text = (text * (LARGE_DESCRIPTION_BYTES // len(text) + 1))[:LARGE_DESCRIPTION_BYTES]
+    return lambda: clean_job_description(text)
+
+
+def setup_parse_noisy() -> Callable[[], object]:
+    output = _noisy_crew_output()
+    return lambda: parse_crew_result(output)
+
+
+def setup_parse_model_noisy() -> Callable[[], object]:
+    output = _noisy_crew_output()
+    return lambda: parse_json_model(output, ResumeContent)
+
+
+def setup_master_resume_validate() -> Callable[[], object]:
+    data = _resume_dict()
+    return lambda: MasterResume.model_validate(data)
+
+
+def setup_master_resume_dump() -> Callable[[], object]:
+    resume = MasterResume.model_validate(_resume_dict())
+    return lambda: resume.model_dump(mode="json")
+
+
+def _scratch_artifact() -> Path:
+    output_dir = Path(tempfile.mkdtemp(prefix="gary-bench-"))
+    atexit.register(shutil.rmtree, output_dir, ignore_errors=True)
+    return output_dir / "resume_artifact.pickle"
+
+
+def setup_master_resume_compile() -> Callable[[], object]:
+    # What every run paid before the artifact: parse, validate and derive
+    raw = _read_fixture("resume.json").encode("utf-8")
+    return lambda: CompiledResume(MasterResume.model_validate_json(raw), "")
+
+
+def setup_master_resume_artifact() -> Callable[[], object]:
+    path = FIXTURES_DIR / "resume.json"
+    artifact = _scratch_artifact()
+    load_compiled_resume(path, artifact)
+    return lambda: load_compiled_resume(path, artifact)
+
+
+def _job_analysis() -> JobAnalysis:
+    return JobAnalysis.model_validate_json(_read_fixture("job_analysis.json"))
+
+
+def setup_slice_uncompiled() -> Callable[[], object]:
+    master = MasterResume.model_validate(_resume_dict())
+    job_analysis = _job_analysis()
+    return lambda: slice_master_resume(master, job_analysis)
+
+
+def setup_slice_compiled() -> Callable[[], object]:
+    master = load_compiled_resume(
+        FIXTURES_DIR / "resume.json", _scratch_artifact()
+    ).master_resume
+    job_analysis = _job_analysis()
+    return lambda: slice_master_resume(master, job_analysis)
+
+
+def setup_resume_content_validate() -> Callable[[], object]:
+    data = _resume_content_dict()
+    return lambda: ResumeContent.model_validate(data)
+
+
+def setup_resume_content_dump() -> Callable[[], object]:
+    content = ResumeContent.model_validate(_resume_content_dict())
+    return lambda: content.model_dump(mode="json")
+
+
+def setup_word_render() -> Callable[[], object]:
+    # Same renderer generate_word_resume uses, writing to a scratch directory
+    # instead of the resumes folder
+    master = MasterResume.model_validate(_resume_dict())
+    resume = Resume(
+        header=master.header,
+        resume_content=ResumeContent.model_validate(_resume_content_dict()),
+    )
+    job_details = _job_details()
+    renderer = ResumeWordRenderer()
+    output_dir = Path(tempfile.mkdtemp(prefix="gary-bench-"))
+    atexit.register(shutil.rmtree, output_dir, ignore_errors=True)
+    return lambda: renderer.render(resume, job_details, output_dir)
+
+
+def setup_crew_construction() -> Callable[[], object]:
+    from gary.crew import Gary
+
+    return lambda: Gary().crew()
+
+
+def setup_cli_import() -> Callable[[], object]:
+    # A fresh interpreter, as when the gary command starts
+    command = [sys.executable, "-c", "import gary.main"]
+    return lambda: subprocess.run(command, check=True)
+
+
+CASES: List[Case] = [
+    (REFERENCE_CASE, setup_reference, 200),
+    ("clean_job_description/small", setup_clean_small, 200),
+    ("clean_job_description/50kb", setup_clean_large, 10),
+    ("parse_crew_result/noisy", setup_parse_noisy, 50),
+    ("parse_json_model/noisy", setup_parse_model_noisy, 50),
+    ("master_resume/validate", setup_master_resume_validate, 500),
+    ("master_resume/model_dump", setup_master_resume_dump, 500),
+    ("master_resume/compile", setup_master_resume_compile, 100),
+    ("master_resume/artifact_load", setup_master_resume_artifact, 100),
+    ("slice_master_resume/uncompiled", setup_slice_uncompiled, 100),
+    ("slice_master_resume/compiled", setup_slice_compiled, 100),
+    ("resume_content/validate", setup_resume_content_validate, 500),
+    ("resume_content/model_dump", setup_resume_content_dump, 500),
+    ("generate_word_resume", setup_word_render, 5),
+    ("crew_construction", setup_crew_construction, 10),
+    ("cli_import", setup_cli_import, 3),
+]
+
+
+def _time_round(func: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def run_case(
+    setup: Callable[[], Callable[[], object]],
+    number: int,
+    repeat: int,
+    reference: Tuple[Callable[[], object], int],
+) -> Dict[str, float]:
+    """
+    Time a case and return per-call statistics in seconds.
+
+    Each round of the case is followed by a round of the reference case, so
+    both see the same load on the machine.
+
+    Args:
+        setup: Builds the function to time
+        number: Calls per timed round
+        repeat: Timed rounds
+        reference: Reference function and its calls per round
+
+    Returns:
+        Dict[str, float]: Median and minimum seconds per call, and the
+        minimum relative to the reference case's
+    """
+    func = setup()
+    func()  # Warm caches and lazy imports outside the timed rounds
+    reference_func, reference_number = reference
+    rounds, reference_rounds = [], []
+    for _ in range(repeat):
+        rounds.append(_time_round(func, number))
+        reference_rounds.append(_time_round(reference_func, reference_number))
+    return {
+        "median": statistics.median(rounds),
+        "min": min(rounds),
+        "relative": min(rounds) / min(reference_rounds),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(repeat: int, selected: Optional[List[str]] = None) -> dict:
+    """
+    Run every case, or those whose name starts with one of selected.
+
+    The reference case always runs, and each case records its best time
+    relative to the reference rounds interleaved with it. A case whose
+    dependencies are not installed is reported as skipped.
+
+    Returns:
+        dict: Environment details and results keyed by case name
+    """
+    results = {}
+    [reference] = [
+        (setup(), number) for name, setup, number in CASES if name == REFERENCE_CASE
+    ]
+    for name, setup, number in CASES:
+        selected_case = not selected or any(name.startswith(s) for s in selected)
+        if name != REFERENCE_CASE and not selected_case:
+            continue
+        try:
+            results[name] = run_case(setup, number, repeat, reference)
+        except ImportError as e:
+            results[name] = {"skipped": f"missing dependency: {e.name}"}
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    List cases whose best time, relative to the reference case, regressed
+    beyond the tolerance.
+
+    Cases missing from either side, or skipped, are not compared.
+
+    Args:
+        report: Output of run_suite
+        baseline: Stored baseline report
+        tolerance: Allowed slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        List[str]: One message per regression
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if name == REFERENCE_CASE or not base:
+            continue
+        if "relative" not in base or "relative" not in result:
+            continue
+        limit = base["relative"] * (1 + tolerance)
+        if result["relative"] > limit:
+            regressions.append(
+                f"{name}: {result['relative']:.2f}x reference > "
+                f"{base['relative']:.2f}x baseline (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+def print_report(report: dict, baseline: Optional[dict]) -> None:
+    print(f"{'case':<30} {'median':>12} {'min':>12} {'vs ref':>9} {'vs baseline':>12}")
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            print(f"{name:<30} {'skipped (' + result['skipped'] + ')':>48}")
+            continue
+        change = ""
+        base = (baseline or {}).get("results", {}).get(name, {})
+        if "relative" in base and name != REFERENCE_CASE:
+            change = f"{result['relative'] / base['relative'] - 1:+.1%}"
+        print(
+            f"{name:<30} {result['median'] * 1e3:10.3f}ms "
+            f"{result['min'] * 1e3:10.3f}ms {result['relative']:8.2f}x {change:>12}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=15, help="Timed rounds per case")
+    parser.add_argument(
+        "--case", action="append", help="Run only cases with this name prefix"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 on regressions vs the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="Allowed slowdown before --check fails (default: 0.3)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store results as the baseline"
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    report = run_suite(args.repeat, args.case)
+    print_report(report, baseline)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✓ Baseline saved to {args.baseline}")
+
+    if args.check:
+        if baseline is None:
+            sys.exit(f"✗ No baseline at {args.baseline}; run with --save-baseline")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("\n✗ Regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Compare JSON extraction from large, noisy agent outputs.
+
+Builds agent-style outputs around the fixture tailored resume: the bare
+JSON, and the JSON in a Markdown fence after a long "Thought:" preamble,
+followed by a closing remark. The preamble may mention braces, and the
+remark may hold a second JSON object. Each output is extracted into
+ResumeContent three ways:
+
+- greedy regex: json.loads, then the first-brace-to-last-brace DOTALL regex,
+  then model validation of the resulting dict (the previous parser)
+- converter: json.loads and json.dumps before model_validate_json, then the
+  same greedy regex (CrewAI's convert_to_model without its LLM fallback)
+- scanner: parse_json_model
+
+Usage:
+    python benchmarks/bench_json_extraction.py [--sizes 10,100,1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from pydantic import ValidationError
+from gary.models import ResumeContent
+from gary.utils.result_parser import parse_json_model
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_GREEDY = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+_CREWAI_PATTERN = re.compile(r"({.*})", re.DOTALL)
+
+
+def greedy_regex(text: str) -> Optional[ResumeContent]:
+    text = text.strip()
+    try:
+        return ResumeContent.model_validate(json.loads(text))
+    except (json.JSONDecodeError, ValidationError):
+        pass
+    match = _GREEDY.search(text)
+    if match:
+        try:
+            return ResumeContent.model_validate(json.loads(match.group(1)))
+        except (json.JSONDecodeError, ValidationError):
+            pass
+    return None
+
+
+def converter(text: str) -> Optional[ResumeContent]:
+    try:
+        return ResumeContent.model_validate_json(
+            json.dumps(json.loads(text, strict=False))
+        )
+    except (json.JSONDecodeError, ValidationError):
+        pass
+    match = _CREWAI_PATTERN.search(text)
+    if match:
+        try:
+            return ResumeContent.model_validate_json(match.group())
+        except ValidationError:
+            pass
+    return None  # CrewAI would now ask the LLM to convert the text
+
+
+def scanner(text: str) -> Optional[ResumeContent]:
+    try:
+        return parse_json_model(text, ResumeContent)
+    except ValueError:
+        return None
+
+
+METHODS: Dict[str, Callable[[str], Optional[ResumeContent]]] = {
+    "greedy regex": greedy_regex,
+    "converter": converter,
+    "scanner": scanner,
+}
+
+
+def outputs(content: str, thought_lines: int) -> Dict[str, str]:
+    thought = (
+        "Thought: the posting stresses distributed systems and Python; "
+        "I will keep the strongest bullets and avoid keyword stuffing.\n"
+    ) * thought_lines
+    answer = f"{thought}Final Answer:\n```json\n{content}\n```\n"
+    remark = "These changes emphasize the most relevant experience."
+    return {
+        "bare": content,
+        "fenced": answer + remark,
+        "braces in thought": answer.replace("systems", "{systems}") + remark,
+        "trailing object": answer + 'Scores: {"ats": 88, "readability": 91}',
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="10,100,1000", help="Thought preamble lengths in lines"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    args = parser.parse_args()
+
+    resume = json.loads((FIXTURES_DIR / "resume.json").read_text(encoding="utf-8"))
+    del resume["header"]
+    content = json.dumps(resume, indent=2)
+    expected = ResumeContent.model_validate(resume)
+
+    print(f"{'output':<32} {'method':<14} {'median':>10}  result")
+    for lines in (int(size) for size in args.sizes.split(",")):
+        for kind, text in outputs(content, lines).items():
+            label = f"{kind} ({len(text) / 1000:.0f} kB)"
+            for name, method in METHODS.items():
+                times: List[float] = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    result = method(text)
+                    times.append(time.perf_counter() - start)
+                outcome = "ok" if result == expected else "FAILED"
+                print(
+                    f"{label:<32} {name:<14} "
+                    f"{statistics.median(times) * 1e3:8.3f}ms  {outcome}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark near-duplicate lookups on a large synthetic posting index.
+
+Indexes a corpus of distinct synthetic postings, then looks up lightly
+edited reposts of indexed postings (which must be found) and new postings
+(which must not). Reports lookup latency, recall by exact Jaccard
+similarity, false positives and the error of the MinHash estimate.
+
+Usage:
+    python benchmarks/bench_near_duplicates.py [--postings 50000] [--queries 1000]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+from gary.config import NEAR_DUPLICATE_SHINGLE_SIZE, NEAR_DUPLICATE_THRESHOLD
+from gary.utils.clean_job_description import clean_job_description
+from gary.utils.near_duplicates import NearDuplicateIndex
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def vocabulary(size: int, rng: random.Random) -> List[str]:
+    """Words of the fixture posting, padded with synthetic terms."""
+    text = (FIXTURES_DIR / "job_description.txt").read_text(encoding="utf-8")
+    words = sorted(set(re.findall(r"[a-z]+", text.lower())))
+    while len(words) < size:
+        words.append("".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=7)))
+    return words
+
+
+def posting(words: List[str], weights: List[float], rng: random.Random) -> str:
+    return clean_job_description(
+        " ".join(rng.choices(words, weights, k=rng.randint(200, 500)))
+    )
+
+
+def repost(text: str, words: List[str], rng: random.Random) -> str:
+    """Edit 0.5-6% of a posting's words, as a recruiter's copy would."""
+    tokens = text.split()
+    for _ in range(max(1, int(len(tokens) * rng.uniform(0.005, 0.06)))):
+        i = rng.randrange(len(tokens))
+        edit = rng.random()
+        if edit < 0.4:
+            tokens[i] = rng.choice(words)
+        elif edit < 0.7:
+            tokens.insert(i, rng.choice(words))
+        else:
+            del tokens[i]
+    return " ".join(tokens)
+
+
+def exact_jaccard(first: str, second: str, size: int) -> float:
+    def shingles(text: str) -> set:
+        words = re.findall(r"\w+", text.lower())
+        return {tuple(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+    a, b = shingles(first), shingles(second)
+    return len(a & b) / len(a | b)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = vocabulary(20_000, rng)
+    weights = [1 / (rank + 1) for rank in range(len(words))]  # Zipf-like
+    corpus = [posting(words, weights, rng) for _ in range(args.postings)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = NearDuplicateIndex(Path(tmp) / "index.sqlite3")
+        start = time.perf_counter()
+        for first in range(0, len(corpus), 1000):
+            index.add_many(enumerate(corpus[first : first + 1000], start=first + 1))
+        build = time.perf_counter() - start
+        print(f"Indexed {len(index)} postings in {build:.1f}s")
+
+        sample = rng.sample(range(len(corpus)), args.queries)
+        reposts = [repost(corpus[i], words, rng) for i in sample]
+        new = [posting(words, weights, rng) for _ in range(args.queries)]
+        index.query(new[0])  # Warm the page cache
+
+        latencies, errors = [], []
+        found, total = Counter(), Counter()
+        for i, text in zip(sample, reposts):
+            start = time.perf_counter()
+            matches = index.query(text)
+            latencies.append(time.perf_counter() - start)
+            similarity = dict(matches).get(i + 1)
+            truth = exact_jaccard(corpus[i], text, NEAR_DUPLICATE_SHINGLE_SIZE)
+            bucket = min(int(truth * 20) / 20, 0.95)  # 0.05 wide
+            total[bucket] += 1
+            if similarity is not None:
+                found[bucket] += 1
+                errors.append(abs(similarity - truth))
+
+        false_positives = 0
+        for text in new:
+            start = time.perf_counter()
+            false_positives += bool(index.query(text))
+            latencies.append(time.perf_counter() - start)
+        index.close()
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"Lookup latency: p50 {p50:.3f}ms, p99 {p99:.3f}ms")
+    print(f"Reposts found (threshold {NEAR_DUPLICATE_THRESHOLD}):")
+    for bucket in sorted(total):
+        print(
+            f"  exact Jaccard {bucket:.2f}-{bucket + 0.05:.2f}: "
+            f"{found[bucket]}/{total[bucket]}"
+        )
+    print(f"False positives: {false_positives}/{len(new)}")
+    if errors:
+        print(f"Similarity estimate error: mean {statistics.mean(errors):.3f}")
+    if p50 >= 1.0:
+        sys.exit("✗ Median lookup is not sub-millisecond")
+
+
+if __name__ == "__main__":
+    main()
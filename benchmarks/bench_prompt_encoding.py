@@ -0,0 +1,141 @@
+"""Measure prompt tokens saved by the compact prompt encoding.
+
+Fills the tailor and validator task prompts from tasks.yaml with the
+fixture resume and job analysis, once in the previous encoding (dict repr
+for the master resume, JSON for the job analysis and tailored resume) and
+once in the compact encoding, and counts tokens with each agent's model
+tokenizer. Also checks that the compact payloads decode back to the same
+models. Runs offline.
+
+To compare output quality, run the crew with COMPACT_PROMPT_ENCODING on and
+off in config.py.
+
+Usage:
+    python benchmarks/bench_prompt_encoding.py [--json results.json]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Callable, Dict
+import yaml
+from gary.config import (
+    RESUME_TAILOR_MODEL,
+    RESUME_VALIDATOR_MODEL,
+    TASKS_CONFIG_PATH,
+)
+from gary.models import JobAnalysis, MasterResume, ResumeContent
+from gary.utils.resume_prompt import (
+    build_resume_content_dict,
+    decode_compact,
+    encode_compact,
+)
+from gary.utils.tokens import estimate_tokens
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Kept in sync with gary.crew, which is not imported to avoid loading CrewAI
+CACHED_JOB_ANALYSIS_CONTEXT = "\n\n    Job Analysis:\n    ```\n    {job_analysis}\n    ```\n"
+TAILORED_RESUME_CONTEXT = "\n\n    Tailored Resume:\n    ```\n    {tailored_resume}\n    ```\n"
+
+
+def token_counter(model: str) -> Callable[[str], int]:
+    """Count tokens with the model's tokenizer, or estimate without LiteLLM."""
+    try:
+        from litellm import token_counter as litellm_token_counter
+    except ImportError:
+        return estimate_tokens
+    return lambda text: litellm_token_counter(model=model, text=text)
+
+
+def fill(template: str, values: Dict[str, str]) -> str:
+    for name, value in values.items():
+        template = template.replace("{" + name + "}", value)
+    return template
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    master = MasterResume.model_validate(
+        json.loads((FIXTURES_DIR / "resume.json").read_text(encoding="utf-8"))
+    )
+    analysis = JobAnalysis.model_validate(
+        json.loads((FIXTURES_DIR / "job_analysis.json").read_text(encoding="utf-8"))
+    )
+    # The fixture resume stands in for the tailor's output
+    tailored = ResumeContent.model_validate(build_resume_content_dict(master))
+    job_description = (FIXTURES_DIR / "job_description.txt").read_text(
+        encoding="utf-8"
+    )
+
+    payloads = {
+        "previous": {
+            "master_resume": str(build_resume_content_dict(master)),
+            # The analyst's raw answer, passed on as task context
+            "analysis_context": analysis.model_dump_json(indent=2),
+            "job_analysis": analysis.model_dump_json(),
+            "tailored_resume": tailored.model_dump_json(),
+        },
+        "compact": {
+            "master_resume": encode_compact(master, exclude={"header"}),
+            "analysis_context": encode_compact(analysis),
+            "job_analysis": encode_compact(analysis),
+            "tailored_resume": encode_compact(tailored),
+        },
+    }
+
+    compact = payloads["compact"]
+    assert decode_compact(compact["master_resume"], ResumeContent) == tailored
+    assert decode_compact(compact["job_analysis"], JobAnalysis) == analysis
+    assert decode_compact(compact["tailored_resume"], ResumeContent) == tailored
+
+    tasks = yaml.safe_load(Path(TASKS_CONFIG_PATH).read_text(encoding="utf-8"))
+    tailor_template = tasks["resume_tailoring_task"]["description"]
+    validator_template = (
+        tasks["resume_validation_task"]["description"]
+        + CACHED_JOB_ANALYSIS_CONTEXT
+        + TAILORED_RESUME_CONTEXT
+    )
+
+    def prompts(values: Dict[str, str]) -> Dict[str, str]:
+        tailor = fill(
+            tailor_template,
+            {
+                "job_description": job_description,
+                "master_resume": values["master_resume"],
+            },
+        )
+        return {
+            "master_resume": values["master_resume"],
+            "job_analysis": values["analysis_context"],
+            "tailored_resume": values["tailored_resume"],
+            # CrewAI appends the analyst's output as context to the tailor prompt
+            "tailor_prompt": tailor + "\n\n" + values["analysis_context"],
+            "validator_prompt": fill(validator_template, values),
+        }
+
+    counters = {
+        "validator_prompt": token_counter(RESUME_VALIDATOR_MODEL),
+        "tailored_resume": token_counter(RESUME_VALIDATOR_MODEL),
+    }
+    default_counter = token_counter(RESUME_TAILOR_MODEL)
+    before = prompts(payloads["previous"])
+    after = prompts(compact)
+
+    results = {}
+    print(f"{'payload':<20} {'previous':>10} {'compact':>10} {'saved':>12}")
+    for name in before:
+        count = counters.get(name, default_counter)
+        old, new = count(before[name]), count(after[name])
+        results[name] = {"previous": old, "compact": new}
+        print(f"{name:<20} {old:>10} {new:>10} {old - new:>6} ({1 - new / old:.1%})")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare single-call and section-parallel tailoring wall time.
+
+Tailors the fixture posting against the fixture master resume with one
+tailoring call and with one concurrent call per section, alternating the
+modes for each round. The fixture job analysis is cached first so both
+modes skip the job analyst. Calls the LLM, so OPENROUTER_API_KEY must be set.
+
+Usage:
+    python benchmarks/bench_section_tailoring.py [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from gary.models import JobAnalysis, JobDetails, MasterResume
+from gary.pipeline import extract_crew_outputs, prepare_crew
+from gary.section_tailoring import describe_section_report, tailor_by_section
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.clean_job_description import prepare_job_description
+from gary.utils.resume_prompt import build_model_prompt
+from gary.utils.tokens import estimate_tokens
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixtures() -> tuple:
+    with open(FIXTURES_DIR / "resume.json", "r", encoding="utf-8") as f:
+        master_resume = MasterResume(**json.load(f))
+    job_analysis = JobAnalysis.model_validate_json(
+        (FIXTURES_DIR / "job_analysis.json").read_text(encoding="utf-8")
+    )
+    description, _ = prepare_job_description(
+        (FIXTURES_DIR / "job_description.txt").read_text(encoding="utf-8")
+    )
+    job_details = JobDetails(
+        company_name="Fixture",
+        job_title="Software Engineer",
+        location="Remote",
+        job_description=description,
+        date_applied="01-01-2024",
+    )
+    return master_resume, job_analysis, job_details
+
+
+def single_call(master_resume, job_details, cache) -> tuple:
+    start = time.perf_counter()
+    with prepare_crew(master_resume, job_details, cache, include_validation=False) as (
+        gary_crew,
+        inputs,
+        _,
+    ):
+        result = gary_crew.kickoff(inputs=inputs)
+    resume_content, _ = extract_crew_outputs(result)
+    return time.perf_counter() - start, resume_content
+
+
+def by_section(master_resume, job_details, cache) -> tuple:
+    start = time.perf_counter()
+    resume_content, _, report = tailor_by_section(master_resume, job_details, cache)
+    print(f"  {describe_section_report(report)}")
+    return time.perf_counter() - start, resume_content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="Rounds per mode")
+    args = parser.parse_args()
+
+    if not os.getenv("OPENROUTER_API_KEY"):
+        sys.exit("✗ OPENROUTER_API_KEY is not set; this benchmark calls the LLM")
+
+    master_resume, job_analysis, job_details = load_fixtures()
+    times = {"single call": [], "per section": []}
+    output_tokens = {"single call": [], "per section": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = JobAnalysisCache(Path(tmp) / "job_analysis.sqlite3")
+        cache.put(job_details.job_description, job_analysis)
+        for round_number in range(1, args.runs + 1):
+            print(f"Round {round_number}/{args.runs}")
+            for mode, tailor in (
+                ("single call", single_call),
+                ("per section", by_section),
+            ):
+                seconds, resume_content = tailor(master_resume, job_details, cache)
+                times[mode].append(seconds)
+                output_tokens[mode].append(
+                    estimate_tokens(build_model_prompt(resume_content))
+                )
+                print(f"  {mode}: {seconds:.1f}s")
+
+    print()
+    single = statistics.median(times["single call"])
+    for mode, values in times.items():
+        median = statistics.median(values)
+        tokens = statistics.median(output_tokens[mode])
+        print(
+            f"{mode:<12} median {median:6.1f}s  {single / median:4.2f}x  "
+            f"~{tokens:.0f} tokens of resume content"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Profile the import time of a Gary module and check heavy dependencies stay lazy.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+prints the slowest top-level imports. The run fails if any forbidden module
+was imported, e.g. CrewAI by the CLI entry point.
+
+Usage:
+    python benchmarks/profile_imports.py [--module gary.main] [--top 15]
+    python benchmarks/profile_imports.py --module gary.utils.read_json --forbid docxtpl
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Modules the CLI entry point must only import when a command needs them
+DEFAULT_FORBIDDEN = ["crewai", "litellm", "docxtpl", "gspread", "numpy"]
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Import a module in a fresh interpreter and collect -X importtime output.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        List[Tuple[str, int, int, int]]: (name, depth, self µs, cumulative µs)
+        per imported module, in completion order
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    entries = []
+    errors = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # Header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    if proc.returncode:
+        raise RuntimeError(f"import {module} failed:\n" + "\n".join(errors))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="gary.main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        help="Fail if this top-level package is imported "
+        f"(default: {', '.join(DEFAULT_FORBIDDEN)})",
+    )
+    args = parser.parse_args()
+
+    try:
+        entries = profile_imports(args.module)
+    except RuntimeError as e:
+        sys.exit(f"✗ {e}")
+
+    top_level = [e for e in entries if e[1] <= 1]
+    total_us = sum(e[3] for e in entries if e[1] == 0)
+    print(f"import {args.module}: {total_us / 1e3:.1f}ms, {len(entries)} modules\n")
+    print(f"{'module':<45} {'self':>10} {'cumulative':>12}")
+    for name, depth, self_us, cumulative_us in sorted(
+        top_level, key=lambda e: e[3], reverse=True
+    )[: args.top]:
+        print(
+            f"{'  ' * depth + name:<45} {self_us / 1e3:8.1f}ms {cumulative_us / 1e3:10.1f}ms"
+        )
+
+    imported = {name.split(".")[0] for name, *_ in entries}
+    loaded = sorted(imported & set(args.forbid or DEFAULT_FORBIDDEN))
+    if loaded:
+        sys.exit(f"\n✗ {args.module} imported forbidden modules: {', '.join(loaded)}")
+    print("\n✓ No forbidden modules imported")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,676 @@
+"""Batch mode: tailor resumes for many job postings concurrently."""
+
+import asyncio
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from gary.config import (
+    DEFAULT_BATCH_CONCURRENCY,
+    METRICS_ENABLED,
+    NEAR_DUPLICATE_ACTION,
+    REPAIR_ENABLED,
+    SECTION_PARALLEL_TAILORING,
+    TRIAGE_MIN_OVERLAP,
+)
+from gary.crew_pool import warm_llm_connections
+from gary.metrics import (
+    MetricsRecorder,
+    PrometheusMetrics,
+    RunMetrics,
+    append_run_metrics,
+    add_usage,
+    crew_usage,
+    timed,
+    write_prometheus_snapshot,
+)
+from gary.models import (
+    InvalidJobRecord,
+    JobAnalysis,
+    JobDetails,
+    MasterResume,
+    NearDuplicateMatch,
+    Resume,
+    ResumeContent,
+    ResumeValidationReport,
+)
+from gary.pipeline import (
+    build_final_resume,
+    cache_job_analysis,
+    extract_crew_outputs,
+    extract_job_analysis,
+    finalize_validation_report,
+    find_near_duplicates,
+    load_reusable_outputs,
+    mirror_ledger_to_sheets,
+    needs_escalation,
+    open_near_duplicate_index,
+    prepare_crew,
+    tailor_tiers,
+    validate_resume,
+)
+from gary.repair import repair_resume
+from gary.section_tailoring import describe_section_report, tailor_by_section
+from gary.triage import triage_jobs
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.application_ledger import (
+    ApplicationLedger,
+    company_key,
+    description_hash,
+)
+from gary.utils.resume_artifact import load_compiled_resume
+from gary.utils.read_job_details import read_job_details_file
+from gary.utils.resume_word_doc_generator import generate_word_resume
+
+# Tailored content of an earlier application (None to tailor again) and the
+# analysis it was tailored to
+ReusedTailoring = Tuple[Optional[ResumeContent], Optional[JobAnalysis]]
+
+
+class BatchJobResult(BaseModel):
+    """Outcome of tailoring a resume for one posting in a batch."""
+
+    job_details: Optional[JobDetails] = Field(
+        None, description="The job posting processed, unless its record is invalid"
+    )
+    source: Optional[str] = Field(
+        None, description="File and line number of an invalid record"
+    )
+    file_path: Optional[str] = Field(None, description="Generated Word document")
+    report_path: Optional[str] = Field(None, description="Saved validation report")
+    passed_validation: Optional[bool] = Field(
+        None, description="Validation verdict, if a report was produced"
+    )
+    elapsed_seconds: float = Field(0.0, description="Wall time for this posting")
+    error: Optional[str] = Field(None, description="Failure reason, if any")
+    tailor_tier: Optional[str] = Field(
+        None, description="Model cascade tier whose resume was kept"
+    )
+    skip_reason: Optional[str] = Field(
+        None, description="Why the posting was not sent to the crew, if skipped"
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.skip_reason is None
+
+    @property
+    def label(self) -> str:
+        if self.job_details is None:
+            return self.source or "unknown record"
+        return f"{self.job_details.company_name} - {self.job_details.job_title}"
+
+    @classmethod
+    def from_invalid_record(cls, record: InvalidJobRecord) -> "BatchJobResult":
+        return cls(source=record.source, error=f"Invalid job record: {record.error}")
+
+
+def write_validation_report(report: ResumeValidationReport, file_path: str) -> str:
+    """
+    Save a validation report as JSON next to its generated Word document.
+
+    Args:
+        report: Validation report for the tailored resume
+        file_path: Path of the generated .docx file
+
+    Returns:
+        str: Path to the saved report
+    """
+    docx_path = Path(file_path)
+    report_path = docx_path.with_name(f"{docx_path.stem}_validation.json")
+    report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    return str(report_path)
+
+
+def write_tailored_resume(resume: Resume, file_path: str) -> str:
+    """
+    Save a tailored resume as JSON next to its generated Word document.
+
+    The saved file can be re-rendered later with `gary render`, without
+    running the crew again.
+
+    Args:
+        resume: Final tailored resume
+        file_path: Path of the generated .docx file
+
+    Returns:
+        str: Path to the saved resume
+    """
+    resume_path = Path(file_path).with_suffix(".json")
+    resume_path.write_text(resume.model_dump_json(indent=2), encoding="utf-8")
+    return str(resume_path)
+
+
+def write_boilerplate_report(job_details: JobDetails, file_path: str) -> Optional[str]:
+    """
+    Save the boilerplate removed from a posting next to its Word document.
+
+    Keeps the stripped sections available for audit after the run.
+
+    Args:
+        job_details: Job details with a boilerplate report
+        file_path: Path of the generated .docx file
+
+    Returns:
+        Optional[str]: Path to the saved report, or None if nothing was removed
+    """
+    report = job_details.boilerplate
+    if report is None or not report.removed_sections:
+        return None
+    docx_path = Path(file_path)
+    report_path = docx_path.with_name(f"{docx_path.stem}_boilerplate.json")
+    report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    return str(report_path)
+
+
+async def _process_job(
+    job_details: JobDetails,
+    master_resume: MasterResume,
+    semaphore: asyncio.Semaphore,
+    analysis_cache: Optional[JobAnalysisCache],
+    ledger: Optional[ApplicationLedger],
+    recorder: Optional[MetricsRecorder] = None,
+    reused: Optional[ReusedTailoring] = None,
+    by_section: bool = SECTION_PARALLEL_TAILORING,
+    prometheus: Optional[PrometheusMetrics] = None,
+) -> BatchJobResult:
+    """
+    Run the crew for one posting, write its outputs and record it in the ledger.
+
+    Any exception is captured in the result so one failed posting does not
+    abort the rest of the batch. With a recorder, the posting's stage timings
+    and LLM calls are appended to the metrics file, and added to prometheus
+    if given. With reused content from a near-duplicate posting, the crew is
+    skipped and the content is only validated locally; a reused analysis
+    alone skips the job analyst. With by_section, the resume is tailored with
+    one concurrent crew per section (validated locally as well). Content
+    that fails validation has its failing sections repaired before the
+    document is written.
+    """
+    async with semaphore:
+        start = time.perf_counter()
+        label = f"{job_details.company_name} - {job_details.job_title}"
+        print(f"→ Started: {label}")
+        run_metrics = RunMetrics(
+            mode="batch",
+            tailoring_mode="sections" if by_section else "single",
+            company_name=job_details.company_name,
+            job_title=job_details.job_title,
+        )
+        stages = run_metrics.stages
+        stage = "tailoring"
+        try:
+            # Crew output is validated once, after the model cascade; reused
+            # and per-section content is validated locally
+            validate_with_llm = False
+            reused_content, job_analysis = reused or (None, None)
+            if reused_content:
+                resume_content = reused_content
+                print(f"✓ Reusing the tailored resume of a near-duplicate: {label}")
+            elif by_section:
+                with timed(stages, stage):
+                    resume_content, job_analysis, section_report = (
+                        await asyncio.to_thread(
+                            tailor_by_section,
+                            master_resume,
+                            job_details,
+                            analysis_cache,
+                            recorder=recorder,
+                            run_metrics=run_metrics,
+                            job_analysis=job_analysis,
+                        )
+                    )
+                run_metrics.crew_usage = {
+                    "prompt_tokens": section_report.prompt_tokens,
+                    "completion_tokens": section_report.completion_tokens,
+                }
+                print(f"✓ {describe_section_report(section_report)}: {label}")
+            else:
+                validate_with_llm = True
+                with timed(stages, stage):
+                    # Stronger model tiers only run when the previous tier's
+                    # resume fails local checks, and reuse its analysis
+                    for tier in tailor_tiers():
+                        with prepare_crew(
+                            master_resume,
+                            job_details,
+                            analysis_cache,
+                            include_validation=False,
+                            tailor_tier=tier,
+                            job_analysis=job_analysis,
+                        ) as (gary_crew, inputs, cached_analysis):
+                            # Kick off on a worker thread bound to this posting's metrics
+                            if recorder:
+                                result = await asyncio.to_thread(
+                                    recorder.call_in_scope,
+                                    run_metrics,
+                                    gary_crew.kickoff,
+                                    inputs=inputs,
+                                )
+                            else:
+                                result = await gary_crew.kickoff_async(inputs=inputs)
+                            # Every tier's tokens count towards the posting
+                            run_metrics.crew_usage = add_usage(
+                                run_metrics.crew_usage,
+                                crew_usage(gary_crew.usage_metrics),
+                            )
+                        cache_job_analysis(result, job_details, analysis_cache)
+                        resume_content, _ = extract_crew_outputs(result)
+                        job_analysis = extract_job_analysis(result) or cached_analysis
+                        if tier:
+                            run_metrics.tailor_tiers.append(tier)
+                        if not needs_escalation(tier, job_analysis, resume_content):
+                            break
+
+            stage = "validation"
+            with timed(stages, stage):
+                if not validate_with_llm:
+                    validation_report, _ = finalize_validation_report(
+                        job_analysis, resume_content, None
+                    )
+                elif recorder:
+                    validation_report, _ = await asyncio.to_thread(
+                        recorder.call_in_scope,
+                        run_metrics,
+                        validate_resume,
+                        job_analysis,
+                        resume_content,
+                    )
+                else:
+                    validation_report, _ = await asyncio.to_thread(
+                        validate_resume, job_analysis, resume_content
+                    )
+
+            if (
+                REPAIR_ENABLED
+                and validation_report is not None
+                and not validation_report.passed_validation
+            ):
+                stage = "repair"
+                with timed(stages, stage):
+                    args = (
+                        job_analysis,
+                        resume_content,
+                        validation_report,
+                        master_resume,
+                    )
+                    if recorder:
+                        repaired = await asyncio.to_thread(
+                            recorder.call_in_scope, run_metrics, repair_resume, *args
+                        )
+                    else:
+                        repaired = await asyncio.to_thread(repair_resume, *args)
+                    resume_content, validation_report, _, _ = repaired
+
+            stage = "document"
+            with timed(stages, stage):
+                final_resume = build_final_resume(
+                    master_resume, resume_content, job_details
+                )
+                file_path = await asyncio.to_thread(
+                    generate_word_resume, final_resume, job_details
+                )
+                write_tailored_resume(final_resume, file_path)
+                write_boilerplate_report(job_details, file_path)
+
+            stage = "logging"
+            with timed(stages, stage):
+                report_path = None
+                passed_validation = None
+                if validation_report:
+                    report_path = write_validation_report(validation_report, file_path)
+                    passed_validation = validation_report.passed_validation
+
+                elapsed = time.perf_counter() - start
+                if ledger is not None:
+                    ledger.record(
+                        job_details, file_path, report_path, validation_report, elapsed
+                    )
+            print(f"✓ Finished: {label} ({elapsed:.1f}s)")
+            return BatchJobResult(
+                job_details=job_details,
+                file_path=file_path,
+                report_path=report_path,
+                passed_validation=passed_validation,
+                elapsed_seconds=elapsed,
+                tailor_tier=(
+                    run_metrics.tailor_tiers[-1] if run_metrics.tailor_tiers else None
+                ),
+            )
+        except Exception as e:
+            run_metrics.failed_stages.append(stage)
+            elapsed = time.perf_counter() - start
+            print(f"✗ Failed: {label} ({elapsed:.1f}s): {e}")
+            return BatchJobResult(
+                job_details=job_details, elapsed_seconds=elapsed, error=str(e)
+            )
+        finally:
+            if recorder:
+                run_metrics.wall_seconds = time.perf_counter() - start
+                append_run_metrics(run_metrics)
+                if prometheus is not None:
+                    prometheus.add(run_metrics)
+
+
+async def run_batch_async(
+    jobs: List[JobDetails],
+    master_resume: MasterResume,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    analysis_cache: Optional[JobAnalysisCache] = None,
+    ledger: Optional[ApplicationLedger] = None,
+    recorder: Optional[MetricsRecorder] = None,
+    reused: Optional[Dict[int, ReusedTailoring]] = None,
+    by_section: bool = SECTION_PARALLEL_TAILORING,
+) -> List[BatchJobResult]:
+    """
+    Tailor resumes for many postings with a bounded number of concurrent crews.
+
+    Args:
+        jobs: Job postings to process
+        master_resume: Parsed master resume shared by every job
+        concurrency: Maximum number of crews running at once
+        analysis_cache: Job analysis cache shared by every job
+        ledger: Application ledger that successful postings are recorded in
+        recorder: Attached metrics recorder, if metrics are enabled
+        reused: Tailoring reused from near-duplicates, keyed by id() of the posting
+        by_section: Whether to tailor with one concurrent crew per section
+
+    Returns:
+        List[BatchJobResult]: One result per job, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    reused = reused or {}
+    return await asyncio.gather(
+        *(
+            _process_job(
+                job,
+                master_resume,
+                semaphore,
+                analysis_cache,
+                ledger,
+                recorder,
+                reused.get(id(job)),
+                by_section,
+            )
+            for job in jobs
+        )
+    )
+
+
+def find_duplicate_jobs(
+    jobs: List[JobDetails], ledger: ApplicationLedger
+) -> Dict[int, BatchJobResult]:
+    """
+    Find postings already in the ledger or repeated earlier in the batch.
+
+    Args:
+        jobs: Job postings in file order
+        ledger: Application ledger
+
+    Returns:
+        Dict[int, BatchJobResult]: Skipped results keyed by id() of the posting
+    """
+    skipped = {}
+    seen = set()
+    for job in jobs:
+        keys = {description_hash(job.job_description)}
+        if job.job_id:
+            keys.add((company_key(job.company_name), job.job_id))
+
+        earlier = ledger.find_duplicates(job)
+        if earlier:
+            reason = f"Already applied on {earlier[-1].job_details.date_applied}"
+        elif keys & seen:
+            reason = "Duplicate of an earlier posting in this file"
+        else:
+            reason = None
+
+        if reason:
+            skipped[id(job)] = BatchJobResult(job_details=job, skip_reason=reason)
+        seen |= keys
+    return skipped
+
+
+def resolve_near_duplicate(
+    job_details: JobDetails,
+    match: NearDuplicateMatch,
+    action: str,
+    analysis_cache: Optional[JobAnalysisCache],
+) -> Tuple[Optional[str], Optional[ReusedTailoring]]:
+    """
+    Apply the configured near-duplicate action to a posting.
+
+    For "analysis" and "reuse", the earlier job analysis is returned for
+    _process_job to pass to the crew, so the job analyst is skipped. It is
+    not cached under this posting's description, so a later run that
+    ignores near-duplicates still analyzes the posting itself.
+
+    Args:
+        job_details: Posting about to be tailored
+        match: Most similar earlier application
+        action: "reuse", "analysis" or "skip" (see NEAR_DUPLICATE_ACTION)
+        analysis_cache: Job analysis cache, if enabled
+
+    Returns:
+        Tuple of the skip reason (for "skip") and the tailoring to reuse: the
+        earlier content (for "reuse", when its resume JSON is still on disk)
+        and analysis (when still cached), or None if neither is available
+    """
+    earlier = match.record.job_details
+    if action == "skip":
+        return (
+            f"Near-duplicate ({match.similarity:.0%}) of {earlier.company_name} - "
+            f"{earlier.job_title}, applied on {earlier.date_applied}",
+            None,
+        )
+
+    analysis, resume_content = load_reusable_outputs(match.record, analysis_cache)
+    if action != "reuse":
+        resume_content = None
+    if resume_content is None and analysis is None:
+        return None, None
+    return None, (resume_content, analysis)
+
+
+def print_batch_summary(results: List[BatchJobResult], wall_seconds: float) -> None:
+    """Print throughput and failures for a finished batch."""
+    succeeded = [r for r in results if r.succeeded]
+    skipped = [r for r in results if r.skip_reason]
+    failed = [r for r in results if r.error]
+    passed = [r for r in succeeded if r.passed_validation]
+
+    print("\n" + "=" * 80)
+    print("BATCH SUMMARY")
+    print("=" * 80)
+    print(f"Jobs: {len(results)}")
+    print(f"Succeeded: {len(succeeded)}")
+    print(f"Failed: {len(failed)}")
+    print(f"Skipped: {len(skipped)}")
+    print(f"Passed Validation: {len(passed)}/{len(succeeded)}")
+    print(f"Wall Time: {wall_seconds:.1f}s")
+    processed = [r for r in results if not r.skip_reason]
+    if processed and wall_seconds > 0:
+        print(f"Throughput: {len(processed) / wall_seconds * 60:.2f} jobs/min")
+        avg = sum(r.elapsed_seconds for r in processed) / len(processed)
+        print(f"Average Time per Job: {avg:.1f}s")
+
+    by_tier: Dict[str, List[float]] = defaultdict(list)
+    for r in succeeded:
+        if r.tailor_tier:
+            by_tier[r.tailor_tier].append(r.elapsed_seconds)
+    if by_tier:
+        print(
+            "Model Cascade: "
+            + ", ".join(
+                f"{tier} {len(times)} (avg {sum(times) / len(times):.1f}s)"
+                for tier, times in by_tier.items()
+            )
+        )
+
+    if failed:
+        print("\nFailures:")
+        for r in failed:
+            print(f"  ✗ {r.label}: {r.error}")
+
+
+def run_batch(
+    file_path: str,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    log_to_sheets: bool = True,
+    use_cache: bool = True,
+    min_overlap: Optional[float] = TRIAGE_MIN_OVERLAP,
+    skip_duplicates: bool = True,
+    near_duplicates: str = NEAR_DUPLICATE_ACTION,
+    by_section: bool = SECTION_PARALLEL_TAILORING,
+) -> List[BatchJobResult]:
+    """
+    Tailor resumes for every posting in a JSONL/CSV file.
+
+    Postings already in the application ledger, and postings whose fit-score
+    overlap with the master resume is below min_overlap, are skipped before
+    any crew is built. Near-duplicates of earlier applications are handled
+    according to near_duplicates. Invalid records become failed results
+    naming their file and line; the other postings still run.
+
+    Args:
+        file_path: Path to a .jsonl or .csv file of JobDetails records
+        concurrency: Maximum number of crews running at once
+        log_to_sheets: Whether to log successful postings to Google Sheets
+        use_cache: Whether to reuse cached job analyses
+        min_overlap: Fit-score threshold in percent (None disables triage)
+        skip_duplicates: Whether to skip postings already in the application ledger
+        near_duplicates: "reuse", "analysis", "skip" or "ignore" (see NEAR_DUPLICATE_ACTION)
+        by_section: Whether to tailor with one concurrent crew per section
+
+    Returns:
+        List[BatchJobResult]: One result per record, in file order
+    """
+    tailor_tiers()  # Reject an empty TAILOR_MODEL_TIERS before any posting runs
+    records = read_job_details_file(Path(file_path))
+    jobs = [r for r in records if isinstance(r, JobDetails)]
+    master_resume = load_compiled_resume().master_resume
+    ledger = ApplicationLedger()
+    print(f"✓ Loaded {len(jobs)} job(s) from {file_path}")
+    invalid = [r for r in records if isinstance(r, InvalidJobRecord)]
+    for record in invalid:
+        print(f"✗ Invalid job record at {record.source}: {record.error}")
+    stripped = [job.boilerplate for job in jobs if job.boilerplate]
+    if any(report.removed_sections for report in stripped):
+        removed_tokens = sum(report.removed_tokens for report in stripped)
+        removed_chars = sum(report.removed_chars for report in stripped)
+        original_chars = sum(report.original_chars for report in stripped)
+        print(
+            f"✓ Boilerplate removed: ~{removed_tokens} input tokens "
+            f"({removed_chars}/{original_chars} chars)"
+        )
+
+    skipped = {}
+    if skip_duplicates:
+        skipped.update(find_duplicate_jobs(jobs, ledger))
+        if skipped:
+            print(f"✓ Skipping {len(skipped)} duplicate posting(s)")
+
+    analysis_cache = JobAnalysisCache() if use_cache else None
+    reused = {}
+    reused_resumes = set()  # Postings whose earlier resume is reused as is
+    index = open_near_duplicate_index(ledger) if near_duplicates != "ignore" else None
+    if index is not None:
+        similar = 0
+        for job in jobs:
+            if id(job) in skipped:
+                continue
+            matches = find_near_duplicates(job, ledger, index)
+            if not matches:
+                continue
+            similar += 1
+            skip_reason, reused_tailoring = resolve_near_duplicate(
+                job, matches[0], near_duplicates, analysis_cache
+            )
+            if skip_reason:
+                skipped[id(job)] = BatchJobResult(
+                    job_details=job, skip_reason=skip_reason
+                )
+            elif reused_tailoring:
+                reused[id(job)] = reused_tailoring
+                if reused_tailoring[0] is not None:
+                    reused_resumes.add(id(job))
+        if similar:
+            print(
+                f"✓ Near-duplicates of earlier applications: {similar} "
+                f"(action: {near_duplicates}, {len(reused_resumes)} resume(s) reused)"
+            )
+
+    if min_overlap is not None:
+        candidates = [
+            job
+            for job in jobs
+            if id(job) not in skipped and id(job) not in reused_resumes
+        ]
+        below = 0
+        for r in triage_jobs(candidates, master_resume, min_overlap):
+            if not r.passed:
+                below += 1
+                skipped[id(r.job_details)] = BatchJobResult(
+                    job_details=r.job_details,
+                    skip_reason=f"Fit-score overlap {r.overlap_percentage:.1f}% below {min_overlap:.0f}%",
+                )
+        print(
+            f"✓ Triage: {len(candidates) - below}/{len(candidates)} job(s) above threshold"
+        )
+
+    to_run = [job for job in jobs if id(job) not in skipped]
+    if len(to_run) > len(reused_resumes):
+        warm_llm_connections()
+
+    start = time.perf_counter()
+    if METRICS_ENABLED:
+        with MetricsRecorder().attach() as recorder:
+            processed = asyncio.run(
+                run_batch_async(
+                    to_run,
+                    master_resume,
+                    concurrency,
+                    analysis_cache,
+                    ledger,
+                    recorder,
+                    reused,
+                    by_section,
+                )
+            )
+        write_prometheus_snapshot()
+    else:
+        processed = asyncio.run(
+            run_batch_async(
+                to_run,
+                master_resume,
+                concurrency,
+                analysis_cache,
+                ledger,
+                None,
+                reused,
+                by_section,
+            )
+        )
+    wall_seconds = time.perf_counter() - start
+
+    processed_by_job = {id(r.job_details): r for r in processed}
+    results = [
+        (
+            BatchJobResult.from_invalid_record(record)
+            if isinstance(record, InvalidJobRecord)
+            else skipped.get(id(record)) or processed_by_job[id(record)]
+        )
+        for record in records
+    ]
+
+    if log_to_sheets:
+        mirror_ledger_to_sheets(ledger)
+
+    print_batch_summary(results, wall_seconds)
+    if analysis_cache is not None:
+        stats = analysis_cache.stats()
+        print(
+            f"Job Analysis Cache: {stats['hits']} hit(s), {stats['misses']} miss(es), {stats['entries']} entries"
+        )
+    return results
@@ -8,6 +8,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 # Data directories
 DATA_DIR = PROJECT_ROOT / "data"
 RESUME_PATH = DATA_DIR / "resume.json"
+APPLICATION_LEDGER_PATH = DATA_DIR / "applications.sqlite3"
 
 # Output directories
 RESUMES_DIR = PROJECT_ROOT / "resumes"
@@ -16,6 +17,173 @@ RESUMES_DIR = PROJECT_ROOT / "resumes"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 RESUME_WORD_TEMPLATE = TEMPLATES_DIR / "resume_word_template.docx"
 
+# Agent and task prompt configuration
+PROMPT_CONFIG_DIR = Path(__file__).parent / "config"
+AGENTS_CONFIG_PATH = PROMPT_CONFIG_DIR / "agents.yaml"
+TASKS_CONFIG_PATH = PROMPT_CONFIG_DIR / "tasks.yaml"
+BOILERPLATE_PHRASES_PATH = PROMPT_CONFIG_DIR / "boilerplate.yaml"
+SKILL_VOCABULARY_PATH = PROMPT_CONFIG_DIR / "skills.yaml"
+
+# LLM models
+JOB_ANALYST_MODEL = "openrouter/google/gemini-2.5-flash"
+RESUME_TAILOR_MODEL = "openrouter/anthropic/claude-sonnet-4"
+RESUME_VALIDATOR_MODEL = "openrouter/google/gemini-2.5-flash"
+
+# Per-agent LLM settings: model, sampling temperature and request timeout in
+# seconds. The resume_tailor settings are used when the model cascade is off,
+# and by the section tailoring and repair crews.
+AGENT_LLM_SETTINGS = {
+    "job_analyst": {"model": JOB_ANALYST_MODEL, "temperature": 0.2, "timeout": 120.0},
+    "resume_tailor": {
+        "model": RESUME_TAILOR_MODEL,
+        "temperature": 0.4,
+        "timeout": 300.0,
+    },
+    "resume_validator": {
+        "model": RESUME_VALIDATOR_MODEL,
+        "temperature": 0.2,
+        "timeout": 120.0,
+    },
+}
+
+# Model cascade for the tailor agent: tiers are tried in order, fastest and
+# cheapest first. A tier's resume is kept when it passes the local validation
+# checks; otherwise tailoring runs again with the next tier (the job analysis
+# is cached by then, so only the tailor runs again).
+MODEL_CASCADE_ENABLED = True
+TAILOR_MODEL_TIERS = {
+    "fast": {
+        "model": "openrouter/google/gemini-2.5-flash",
+        "temperature": 0.4,
+        "timeout": 120.0,
+    },
+    "strong": AGENT_LLM_SETTINGS["resume_tailor"],
+}
+
+# Pooled HTTP connections shared by every LLM call in the process
+OPENROUTER_DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+LLM_HTTP_MAX_CONNECTIONS = 20
+LLM_HTTP_KEEPALIVE_SECONDS = 300.0
+LLM_HTTP_TIMEOUT_SECONDS = 600.0
+LLM_HTTP_WARM_TIMEOUT_SECONDS = 10.0
+
+# Estimated USD per 1M (input, output) tokens, used for cost metrics
+MODEL_PRICING = {
+    "openrouter/google/gemini-2.5-flash": (0.30, 2.50),
+    "openrouter/anthropic/claude-sonnet-4": (3.00, 15.00),
+}
+
+# Cache directories
+CACHE_DIR = PROJECT_ROOT / ".cache"
+JOB_ANALYSIS_CACHE_PATH = CACHE_DIR / "job_analysis.sqlite3"
+JOB_ANALYSIS_CACHE_MAX_ENTRIES = 500
+# Master resume compiled with its prompt payload, term index and per-item
+# term vectors, rebuilt when the content of resume.json changes
+RESUME_ARTIFACT_PATH = CACHE_DIR / "resume_artifact.pickle"
+
+# Checkpoints of each interactive run's stage outputs, for `gary replay`
+CHECKPOINTS_ENABLED = True
+CHECKPOINTS_DIR = CACHE_DIR / "runs"
+CHECKPOINTS_MAX_RUNS = 100  # Older run checkpoints are deleted
+
 # Google Sheets configuration
 DEFAULT_WORKSHEET_NAME = "Sheet1"
 CREDENTIALS_FILE = "googleSheetsCredentials.json"
+SHEETS_OUTBOX_PATH = CACHE_DIR / "sheets_outbox.sqlite3"
+SHEETS_FLUSH_BATCH_SIZE = 500
+SHEETS_MAX_RETRIES = 5
+SHEETS_RETRY_BASE_DELAY = 1.0  # seconds, doubled after each failed attempt
+# A flush claims the rows it sends for this long; rows of a flusher that died
+# mid-flush can be claimed again once the lease expires
+SHEETS_CLAIM_LEASE_SECONDS = 600.0
+
+# Stream the tailor agent's response so sections are shown as they complete
+STREAM_TAILOR_OUTPUT = True
+
+# Section-parallel tailoring: one LLM call per ResumeContent section, run
+# concurrently, with the professional summary written last from the other
+# sections, instead of one call producing the whole resume
+SECTION_PARALLEL_TAILORING = False
+SECTION_TAILORING_CONCURRENCY = 4
+
+# Run metrics: one JSON line per run plus a Prometheus textfile snapshot
+# with p50/p95 over the most recent runs
+METRICS_ENABLED = True
+METRICS_DIR = PROJECT_ROOT / "metrics"
+METRICS_JSONL_PATH = METRICS_DIR / "runs.jsonl"
+METRICS_PROMETHEUS_PATH = METRICS_DIR / "gary.prom"
+METRICS_QUANTILE_WINDOW = 500
+
+# Batch mode configuration
+DEFAULT_BATCH_CONCURRENCY = 3
+
+# Service mode (`gary serve`): local HTTP API for submitting postings
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8765
+SERVE_WORKERS = DEFAULT_BATCH_CONCURRENCY
+SERVE_MAX_QUEUED_JOBS = 100  # Submissions beyond this are rejected with 503
+SERVE_MAX_REQUEST_BYTES = 1_000_000
+
+# Validation thresholds (mirror the resume_validation_task pass/fail criteria)
+MAX_KEYWORD_USES = 3
+MIN_OVERALL_SCORE = 75
+MIN_ATS_SCORE = 70
+MIN_READABILITY_SCORE = 70
+MIN_INTEGRATION_RATE = 60.0
+
+# Local keyword checks decide the verdict without the LLM validator when the
+# integration rate is at or above / below these bounds
+SKIP_LLM_VALIDATION_WHEN_CLEAR = True
+LOCAL_CLEAR_PASS_RATE = 85.0
+LOCAL_CLEAR_FAIL_RATE = 30.0
+
+# Section repair: a resume that fails validation has only the sections
+# concerned by its missing keywords, overused keywords and suggestions
+# regenerated, then re-validated locally, for at most this many rounds
+REPAIR_ENABLED = True
+REPAIR_MAX_ROUNDS = 2
+
+# Fit-score triage: postings where the master resume covers less than this
+# percentage of the skills they mention (config/skills.yaml plus the resume's
+# own skill items) are not sent to the crew
+TRIAGE_MIN_OVERLAP = 30.0
+
+# Boilerplate stripping: EEO statements, benefits, pay transparency and
+# "about us" sections are dropped from job descriptions (phrase library in
+# config/boilerplate.yaml). Stripping is skipped when it would remove more
+# than BOILERPLATE_MAX_REMOVED_FRACTION of a posting.
+BOILERPLATE_STRIPPING_ENABLED = True
+BOILERPLATE_MIN_PHRASE_HITS = 2
+BOILERPLATE_MAX_REMOVED_FRACTION = 0.6
+
+# Near-duplicate postings: reposts of a role already applied to, found with
+# a MinHash/LSH index over word shingles of cleaned descriptions (see
+# utils/near_duplicates.py). With b bands of r rows, postings become
+# candidates from a similarity of about (1/b)^(1/r), 0.71 for 16 x 8; each
+# candidate is then checked against NEAR_DUPLICATE_THRESHOLD.
+NEAR_DUPLICATE_DETECTION_ENABLED = True
+NEAR_DUPLICATE_INDEX_PATH = CACHE_DIR / "near_duplicates.sqlite3"
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of shingle sets
+NEAR_DUPLICATE_SHINGLE_SIZE = 3  # Words per shingle
+NEAR_DUPLICATE_PERMUTATIONS = 128
+NEAR_DUPLICATE_BANDS = 16
+# What batch and serve mode do with a near-duplicate: "reuse" its tailored
+# resume (and analysis), reuse its "analysis" only, "skip" it, or "ignore" it
+NEAR_DUPLICATE_ACTIONS = ("reuse", "analysis", "skip", "ignore")
+NEAR_DUPLICATE_ACTION = "analysis"
+
+# Bulk cleaning of job descriptions uses a process pool from this many texts
+CLEAN_PARALLEL_MIN_TEXTS = 2000
+
+# Relevance slicing of the master resume sent to the tailor agent
+RESUME_SLICING_ENABLED = True
+TAILOR_MAX_BULLETS_PER_ROLE = 6
+TAILOR_MIN_BULLETS_PER_ROLE = 2
+TAILOR_MAX_PROJECTS = 4
+TAILOR_MAX_COURSES = 5
+TAILOR_RESUME_TOKEN_BUDGET = 3000
+
+# Prompt encoding for the master resume, job analysis and tailored resume:
+# compact sections with shared field names (see utils/resume_prompt.py), or
+# the previous dict repr / JSON when False, e.g. to compare output quality
+COMPACT_PROMPT_ENCODING = True
@@ -1,23 +1,135 @@
 import os
+import threading
+from functools import lru_cache
 from crewai import Agent, Crew, Process, Task, LLM
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, before_kickoff, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
-from gary.models import JobAnalysis, ResumeContent, ResumeValidationReport
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.tasks.task_output import TaskOutput
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel, create_model
+from gary.models import (
+    JobAnalysis,
+    MasterResume,
+    ResumeContent,
+    ResumeSliceReport,
+    ResumeValidationReport,
+)
 from gary.tools import ResumeWordDocGeneratorTool
-
+from gary.config import (
+    AGENT_LLM_SETTINGS,
+    COMPACT_PROMPT_ENCODING,
+    LLM_HTTP_KEEPALIVE_SECONDS,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_TIMEOUT_SECONDS,
+    RESUME_SLICING_ENABLED,
+    SKIP_LLM_VALIDATION_WHEN_CLEAR,
+    STREAM_TAILOR_OUTPUT,
+    TAILOR_MODEL_TIERS,
+)
+from gary.utils.local_validation import local_verdict
+from gary.utils.result_parser import parse_json_model
+from gary.utils.resume_prompt import build_model_prompt, build_resume_prompt
+from gary.utils.resume_slicer import describe_slice_report, slice_master_resume
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL")
 
+# Appended to downstream task descriptions when the job analysis comes from
+# the cache instead of the job_analysis_task context
+CACHED_JOB_ANALYSIS_CONTEXT = """
+
+    Job Analysis:
+    ```
+    {job_analysis}
+    ```
+"""
+
+# Appended to the validation task description when it runs in its own crew,
+# after the tailoring crew has finished
+TAILORED_RESUME_CONTEXT = """
+
+    Tailored Resume:
+    ```
+    {tailored_resume}
+    ```
+"""
 
-def llm_config(model: str, temperature: float) -> LLM:
+
+@lru_cache(maxsize=None)
+def section_output_model(section: str) -> Type[BaseModel]:
+    """
+    Build the output model of a section repair: one ResumeContent field.
+
+    Args:
+        section: ResumeContent field name
+
+    Returns:
+        Type[BaseModel]: Model with only that field, e.g. for `skills`
+        a model with `skills: List[Skill]`
+    """
+    field = ResumeContent.model_fields[section]
+    return create_model(
+        f"{section.title().replace('_', '')}Section",
+        **{section: (field.annotation, ...)},
+    )
+
+
+_llm_http_client = None
+_llm_http_lock = threading.Lock()
+
+
+def get_llm_http_client() -> Any:
+    """
+    Return the process-wide HTTP client used for every LLM request.
+
+    Connections stay open between calls for LLM_HTTP_KEEPALIVE_SECONDS
+    (httpx closes idle connections after 5 seconds by default, shorter than
+    a typical agent turn), so later calls, agents and crews skip the TLS
+    handshake.
+
+    Returns:
+        HTTPHandler: LiteLLM handler wrapping a pooled httpx client
+    """
+    global _llm_http_client
+    with _llm_http_lock:
+        if _llm_http_client is None:
+            import httpx
+            from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+            _llm_http_client = HTTPHandler(
+                client=httpx.Client(
+                    timeout=httpx.Timeout(LLM_HTTP_TIMEOUT_SECONDS),
+                    limits=httpx.Limits(
+                        max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_HTTP_MAX_CONNECTIONS,
+                        keepalive_expiry=LLM_HTTP_KEEPALIVE_SECONDS,
+                    ),
+                )
+            )
+        return _llm_http_client
+
+
+@lru_cache(maxsize=None)
+def llm_config(
+    model: str,
+    temperature: float,
+    stream: bool = False,
+    timeout: Optional[float] = None,
+) -> LLM:
     """
     Create LLM configuration with error handling.
 
+    LLM objects hold configuration only, so one instance per setting is
+    shared by every crew in the process. Requests go through the pooled
+    client from get_llm_http_client.
+
     Args:
         model: The model name to use
         temperature: The temperature setting for the model
+        stream: Whether to stream the response, emitting LLMStreamChunkEvents
+        timeout: Request timeout in seconds (default: LLM_HTTP_TIMEOUT_SECONDS)
 
     Returns:
         Configured LLM instance
@@ -32,6 +144,9 @@ def llm_config(model: str, temperature: float) -> LLM:
             temperature=temperature,
             api_key=OPENROUTER_API_KEY,
             base_url=OPENROUTER_BASE_URL,
+            stream=stream,
+            timeout=timeout,
+            client=get_llm_http_client(),
         )
         return llm
 
@@ -39,6 +154,55 @@ def llm_config(model: str, temperature: float) -> LLM:
         raise Exception(f"Failed to configure LLM: {e}")
 
 
+def agent_llm(agent_name: str, tier: Optional[str] = None, stream: bool = False) -> LLM:
+    """
+    Create the LLM of an agent from AGENT_LLM_SETTINGS.
+
+    Args:
+        agent_name: Agent name in agents.yaml
+        tier: Tailor model tier in TAILOR_MODEL_TIERS, replacing the agent's
+            own settings (resume_tailor only)
+        stream: Whether to stream the response
+
+    Returns:
+        Configured LLM instance
+    """
+    settings = TAILOR_MODEL_TIERS[tier] if tier else AGENT_LLM_SETTINGS[agent_name]
+    return llm_config(
+        settings["model"],
+        settings["temperature"],
+        stream=stream,
+        timeout=settings.get("timeout"),
+    )
+
+
+class _JsonExportMixin:
+    """
+    Validate a task's output with parse_json_model before CrewAI's converter.
+
+    CrewAI decodes and re-encodes the output before validating it, and when
+    its greedy brace regex fails it asks the LLM to convert the text, which
+    costs another call. The converter is only used when parse_json_model
+    finds no JSON that validates.
+    """
+
+    def _export_output(self, result: str) -> Any:
+        if self.output_pydantic is not None and isinstance(result, str):
+            try:
+                return parse_json_model(result, self.output_pydantic), None
+            except ValueError:
+                pass
+        return super()._export_output(result)
+
+
+class JsonTask(_JsonExportMixin, Task):
+    """Task whose structured output is extracted by parse_json_model."""
+
+
+class JsonConditionalTask(_JsonExportMixin, ConditionalTask):
+    """ConditionalTask whose structured output is extracted by parse_json_model."""
+
+
 @CrewBase
 class Gary:
     """Gary crew"""
@@ -46,12 +210,166 @@ class Gary:
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    def __init__(
+        self,
+        cached_analysis: Optional[JobAnalysis] = None,
+        master_resume: Optional[MasterResume] = None,
+        include_validation: bool = True,
+        tailor_tier: Optional[str] = None,
+    ):
+        """
+        Args:
+            cached_analysis: Previously computed job analysis. When given, the
+                job analyst is skipped and the analysis is read from the
+                `job_analysis` kickoff input instead.
+            master_resume: Master resume to slice by relevance once the job
+                analysis is available. Only used when the analyst runs; with
+                a cached analysis the inputs are sliced before kickoff.
+            include_validation: Whether crew() ends with the validation task.
+                When False, validation runs separately via validation_crew().
+            tailor_tier: Model tier of the tailor agent in TAILOR_MODEL_TIERS,
+                or None for its AGENT_LLM_SETTINGS entry
+        """
+        self.cached_analysis = cached_analysis
+        self.master_resume = master_resume
+        self.include_validation = include_validation
+        self.tailor_tier = tailor_tier
+        self.slice_report: Optional[ResumeSliceReport] = None
+        self._kickoff_inputs: Dict[str, Any] = {}
+        self._validation_crew: Optional[Crew] = None
+        self._section_repairer: Optional[Agent] = None
+        self._repair_crews: Dict[str, Crew] = {}
+        self._analysis_crew: Optional[Crew] = None
+        self._section_crews: Dict[str, Crew] = {}
+
+    def reset(
+        self,
+        cached_analysis: Optional[JobAnalysis] = None,
+        master_resume: Optional[MasterResume] = None,
+    ) -> None:
+        """
+        Clear per-run state so the built crew can be kicked off again.
+
+        Agents, tasks and the crew itself are kept; task outputs, token
+        counters and the slicing state of the previous run are discarded.
+        Whether an analysis is cached must not change, since it decides
+        which tasks the crew has.
+
+        Args:
+            cached_analysis: Cached job analysis for the next run
+            master_resume: Master resume for the next run
+        """
+        self.cached_analysis = cached_analysis
+        self.master_resume = master_resume
+        self.slice_report = None
+        self._kickoff_inputs = {}
+        tasks = list(getattr(self, "tasks", []))
+        if self._validation_crew:
+            tasks += self._validation_crew.tasks
+        for single_task_crew in (
+            self._analysis_crew,
+            *self._repair_crews.values(),
+            *self._section_crews.values(),
+        ):
+            if single_task_crew:
+                tasks += single_task_crew.tasks
+        for crew_task in tasks:
+            crew_task.output = None
+        for crew_agent in getattr(self, "agents", []):
+            crew_agent.tools_results = []
+            # Crew.usage_metrics sums these, so they must restart per run
+            crew_agent._token_process = TokenProcess()
+
+    @before_kickoff
+    def capture_kickoff_inputs(
+        self, inputs: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        self._kickoff_inputs = dict(inputs or {})
+        return inputs
+
+    def _compact_context(self, output: TaskOutput) -> None:
+        """
+        Replace a task's raw answer, which downstream tasks receive as
+        context, with the compact encoding of its parsed output.
+
+        Args:
+            output: Output of a task with an output_pydantic model
+        """
+        if COMPACT_PROMPT_ENCODING and output.pydantic is not None:
+            output.raw = build_model_prompt(output.pydantic)
+
+    def _on_job_analysis(self, output: TaskOutput) -> None:
+        """
+        Job analysis task callback, run before the downstream tasks start.
+
+        Args:
+            output: Output of the job analysis task
+        """
+        if not isinstance(output.pydantic, JobAnalysis):
+            return
+        self._compact_context(output)
+        if RESUME_SLICING_ENABLED and self.master_resume is not None:
+            self._slice_master_resume(output.pydantic)
+
+    def _slice_master_resume(self, job_analysis: JobAnalysis) -> None:
+        """
+        Re-render the tailoring prompt with a relevance-sliced master resume.
+
+        Kickoff has already interpolated the full master resume into the
+        tailoring task by the time the analysis is available.
+
+        Args:
+            job_analysis: Output of the job analysis task
+        """
+
+        sliced, self.slice_report = slice_master_resume(
+            self.master_resume, job_analysis
+        )
+        inputs = {
+            **self._kickoff_inputs,
+            "master_resume": build_resume_prompt(sliced),
+        }
+        self.resume_tailoring_task().interpolate_inputs_and_add_conversation_history(
+            inputs
+        )
+        print(f"✓ {describe_slice_report(self.slice_report)}")
+
+    def _task_description(self, task_name: str) -> str:
+        description = self.tasks_config[task_name]["description"]
+        if self.cached_analysis:
+            description += CACHED_JOB_ANALYSIS_CONTEXT
+        return description
+
+    def _needs_llm_validation(self, output: TaskOutput) -> bool:
+        """
+        Run the LLM validator only when local keyword checks are inconclusive.
+
+        Args:
+            output: Output of the resume tailoring task
+
+        Returns:
+            bool: False when the local verdict is a clear pass or fail
+        """
+        if not SKIP_LLM_VALIDATION_WHEN_CLEAR:
+            return True
+
+        job_analysis = self.cached_analysis
+        if job_analysis is None and self.job_analysis_task().output:
+            job_analysis = self.job_analysis_task().output.pydantic
+
+        if not isinstance(job_analysis, JobAnalysis) or not isinstance(
+            output.pydantic, ResumeContent
+        ):
+            return True
+
+        return local_verdict(job_analysis, output.pydantic) is None
+
     @agent
     def job_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["job_analyst"],
             verbose=True,
-            llm=llm_config("openrouter/google/gemini-2.5-flash", 0.2),
+            llm=agent_llm("job_analyst"),
             max_iter=7,
             allow_delegation=False,
         )
@@ -61,7 +379,9 @@ class Gary:
         return Agent(
             config=self.agents_config["resume_tailor"],
             verbose=True,
-            llm=llm_config("openrouter/anthropic/claude-sonnet-4", 0.4),
+            llm=agent_llm(
+                "resume_tailor", self.tailor_tier, stream=STREAM_TAILOR_OUTPUT
+            ),
             max_iter=5,
             allow_delegation=False,
         )
@@ -71,7 +391,7 @@ class Gary:
         return Agent(
             config=self.agents_config["resume_validator"],
             verbose=True,
-            llm=llm_config("openrouter/google/gemini-2.5-flash", 0.2),
+            llm=agent_llm("resume_validator"),
             max_iter=3,
             allow_delegation=False,
             tools=[ResumeWordDocGeneratorTool()],
@@ -79,43 +399,205 @@ class Gary:
 
     @task
     def job_analysis_task(self) -> Task:
-        return Task(
+        return JsonTask(
             config=self.tasks_config["job_analysis_task"],
             agent=self.job_analyst(),
             output_pydantic=JobAnalysis,
+            callback=self._on_job_analysis,
         )
 
     @task
     def resume_tailoring_task(self) -> Task:
-        return Task(
+        if self.cached_analysis:
+            context = []
+        else:
+            context = [self.job_analysis_task()]
+
+        return JsonTask(
             config=self.tasks_config["resume_tailoring_task"],
+            description=self._task_description("resume_tailoring_task"),
             agent=self.resume_tailor(),
-            context=[
-                self.job_analysis_task()
-            ],  # Use output from job analysis as context
+            context=context,  # Use output from job analysis as context
             output_pydantic=ResumeContent,
+            callback=self._compact_context,
         )
 
     @task
     def resume_validation_task(self) -> Task:
-        return Task(
+        if self.cached_analysis:
+            context = [self.resume_tailoring_task()]
+        else:
+            context = [self.job_analysis_task(), self.resume_tailoring_task()]
+
+        return JsonConditionalTask(
             config=self.tasks_config["resume_validation_task"],
+            description=self._task_description("resume_validation_task"),
             agent=self.resume_validator(),
-            context=[
-                self.job_analysis_task(),
-                self.resume_tailoring_task(),
-            ],  # Use outputs from job analysis and resume tailoring
+            context=context,  # Use outputs from job analysis and resume tailoring
             output_pydantic=ResumeValidationReport,
+            condition=self._needs_llm_validation,
         )
 
     @crew
     def crew(self) -> Crew:
         """Creates the Gary crew"""
 
+        if self.cached_analysis:
+            # Skip the job analyst entirely; the analysis is passed as input
+            agents = [self.resume_tailor(), self.resume_validator()]
+            tasks = [self.resume_tailoring_task(), self.resume_validation_task()]
+        else:
+            agents = list(self.agents)
+            tasks = list(self.tasks)
+
+        if not self.include_validation:
+            agents.remove(self.resume_validator())
+            tasks.remove(self.resume_validation_task())
+
         return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=True,
+            output_log_file=True,
+        )
+
+    def validation_crew(self) -> Crew:
+        """
+        Creates a crew that only runs the resume validator.
+
+        Used when validation runs after the tailoring crew, concurrently with
+        document rendering. Kickoff inputs must provide `job_analysis` and
+        `tailored_resume` as JSON. The crew is built once per instance.
+        """
+        if self._validation_crew:
+            return self._validation_crew
+
+        task = JsonTask(
+            name="resume_validation_task",
+            config=self.tasks_config["resume_validation_task"],
+            description=self.tasks_config["resume_validation_task"]["description"]
+            + CACHED_JOB_ANALYSIS_CONTEXT
+            + TAILORED_RESUME_CONTEXT,
+            agent=self.resume_validator(),
+            output_pydantic=ResumeValidationReport,
+        )
+        self._validation_crew = Crew(
+            agents=[self.resume_validator()],
+            tasks=[task],
             process=Process.sequential,
             verbose=True,
             output_log_file=True,
         )
+        return self._validation_crew
+
+    def repair_crew(self, section: str) -> Crew:
+        """
+        Creates a crew that regenerates one ResumeContent section.
+
+        Used by the repair loop after a failed validation. Kickoff inputs
+        must provide `section`, `instructions`, `section_content`,
+        `master_section` and `max_keyword_uses`. One crew is built per
+        section and instance; its token counters restart on every call, so
+        usage_metrics after kickoff covers that repair only.
+
+        Args:
+            section: ResumeContent field name
+
+        Returns:
+            Crew: Single-task crew whose output has only that field
+        """
+        if self._section_repairer is None:
+            # Not an @agent, so the tailoring crew does not pick it up
+            self._section_repairer = Agent(
+                config=self.agents_config["resume_tailor"],
+                verbose=True,
+                llm=agent_llm("resume_tailor"),
+                max_iter=3,
+                allow_delegation=False,
+            )
+        self._section_repairer._token_process = TokenProcess()
+
+        if section not in self._repair_crews:
+            task = JsonTask(
+                name="section_repair_task",
+                config=self.tasks_config["section_repair_task"],
+                agent=self._section_repairer,
+                output_pydantic=section_output_model(section),
+            )
+            self._repair_crews[section] = Crew(
+                agents=[self._section_repairer],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=True,
+                output_log_file=True,
+            )
+        return self._repair_crews[section]
+
+    def analysis_crew(self) -> Crew:
+        """
+        Creates a crew that only runs the job analyst.
+
+        Used by section-parallel tailoring, which needs the analysis before
+        the sections fan out. Kickoff inputs must provide `job_description`.
+        The crew is built once per instance.
+        """
+        if self._analysis_crew:
+            return self._analysis_crew
+
+        task = JsonTask(
+            name="job_analysis_task",
+            config=self.tasks_config["job_analysis_task"],
+            agent=self.job_analyst(),
+            output_pydantic=JobAnalysis,
+        )
+        self._analysis_crew = Crew(
+            agents=[self.job_analyst()],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=True,
+            output_log_file=True,
+        )
+        return self._analysis_crew
+
+    def section_crew(self, section: str) -> Crew:
+        """
+        Creates a crew that tailors one ResumeContent section.
+
+        Used by section-parallel tailoring. Each section has its own agent,
+        so the crews can be kicked off concurrently; token counters restart
+        on every call. Kickoff inputs must provide `job_analysis` and
+        `master_section`, plus `tailored_sections` for the professional
+        summary, which is written from the other tailored sections.
+
+        Args:
+            section: ResumeContent field name
+
+        Returns:
+            Crew: Single-task crew whose output has only that field
+        """
+        if section not in self._section_crews:
+            # Not an @agent, so the tailoring crew does not pick it up
+            section_tailor = Agent(
+                config=self.agents_config["resume_tailor"],
+                verbose=True,
+                llm=agent_llm("resume_tailor"),
+                max_iter=3,
+                allow_delegation=False,
+            )
+            task_name = f"{section}_tailoring_task"
+            task = JsonTask(
+                name=task_name,
+                config=self.tasks_config[task_name],
+                agent=section_tailor,
+                output_pydantic=section_output_model(section),
+            )
+            self._section_crews[section] = Crew(
+                agents=[section_tailor],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=True,
+                output_log_file=True,
+            )
+        self._section_crews[section].agents[0]._token_process = TokenProcess()
+        return self._section_crews[section]
@@ -0,0 +1,113 @@
+"""Warm, reusable Gary crews for repeated runs."""
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from gary.crew import OPENROUTER_BASE_URL, Gary, get_llm_http_client
+from gary.config import LLM_HTTP_WARM_TIMEOUT_SECONDS, OPENROUTER_DEFAULT_BASE_URL
+from gary.models import JobAnalysis, MasterResume
+
+
+def warm_llm_connections() -> bool:
+    """
+    Open a pooled connection to the LLM endpoint ahead of the first call.
+
+    The TLS handshake then overlaps other work, such as the job details
+    prompt, instead of delaying the first agent.
+
+    Returns:
+        bool: Whether the endpoint was reached
+    """
+    import httpx
+
+    try:
+        get_llm_http_client().client.head(
+            OPENROUTER_BASE_URL or OPENROUTER_DEFAULT_BASE_URL,
+            timeout=LLM_HTTP_WARM_TIMEOUT_SECONDS,
+        )
+    except httpx.HTTPError:
+        return False
+    return True
+
+
+class CrewPool:
+    """
+    Keeps built Gary crews for reuse across runs.
+
+    Building a crew loads the YAML configs and creates agents, tasks and
+    tools; a leased crew is only reset. Crews are pooled by shape (whether
+    the job analysis is cached, whether validation is included and the
+    tailor model tier), and each is leased to one run at a time, so
+    concurrent batch jobs get separate crews.
+    """
+
+    def __init__(self):
+        self._idle: Dict[Tuple[bool, bool, Optional[str]], List[Gary]] = defaultdict(
+            list
+        )
+        self._lock = threading.Lock()
+        self.built = 0
+        self.reused = 0
+
+    @contextmanager
+    def lease(
+        self,
+        master_resume: Optional[MasterResume] = None,
+        cached_analysis: Optional[JobAnalysis] = None,
+        include_validation: bool = True,
+        tailor_tier: Optional[str] = None,
+    ) -> Iterator[Gary]:
+        """
+        Borrow a crew for one run, building it if none is idle.
+
+        Args:
+            master_resume: Master resume for the run
+            cached_analysis: Cached job analysis, if any
+            include_validation: Whether crew() ends with the validation task
+            tailor_tier: Model tier of the tailor agent (None: its own settings)
+
+        Yields:
+            Gary: Crew container reset for this run
+        """
+        key = (cached_analysis is not None, include_validation, tailor_tier)
+        with self._lock:
+            gary = self._idle[key].pop() if self._idle[key] else None
+            if gary is not None:
+                self.reused += 1
+            else:
+                self.built += 1
+
+        if gary is None:
+            gary = Gary(
+                cached_analysis=cached_analysis,
+                master_resume=master_resume,
+                include_validation=include_validation,
+                tailor_tier=tailor_tier,
+            )
+        else:
+            gary.reset(cached_analysis, master_resume)
+
+        try:
+            yield gary
+        finally:
+            with self._lock:
+                self._idle[key].append(gary)
+
+
+_crew_pool: Optional[CrewPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_crew_pool() -> CrewPool:
+    """
+    Return the process-wide crew pool, creating it on first use.
+
+    Returns:
+        CrewPool: Shared crew pool
+    """
+    global _crew_pool
+    with _pool_lock:
+        if _crew_pool is None:
+            _crew_pool = CrewPool()
+        return _crew_pool
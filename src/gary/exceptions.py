@@ -29,3 +29,15 @@ class CrewExecutionError(GaryBaseException):
     """Raised when CrewAI execution fails."""
 
     pass
+
+
+class ServiceUnavailableError(GaryBaseException):
+    """Raised when the tailoring service cannot accept another job."""
+
+    pass
+
+
+class PipelineCancelled(GaryBaseException):
+    """Raised by a pipeline stage to stop the run without an error."""
+
+    pass
@@ -1,17 +1,71 @@
 #!/usr/bin/env python
+# CrewAI, LiteLLM, docxtpl, gspread and numpy take seconds to import, so
+# they are imported inside the functions that use them: the interactive
+# prompt appears at once while the pipeline loads them in the background,
+# and local-only subcommands never load CrewAI at all. Check with
+# `python benchmarks/profile_imports.py`.
+import argparse
+import asyncio
+import importlib
 import sys
 import warnings
+from contextlib import nullcontext
 from datetime import datetime
-from gary.crew import Gary
-from gary.utils.read_json import read_resume_json
-from gary.models import Resume, JobDetails
-from gary.utils.resume_word_doc_generator import generate_word_resume
-from gary.utils.google_sheets import initialize_sheets_client
-from gary.utils.result_parser import parse_crew_result
-from gary.utils.clean_job_description import clean_job_description
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from gary.exceptions import DataLoadError, PipelineCancelled, ResumeGenerationError
+from gary.metrics import (
+    MetricsRecorder,
+    RunMetrics,
+    add_usage,
+    append_run_metrics,
+    crew_usage,
+    print_run_metrics,
+    timed,
+    write_prometheus_snapshot,
+)
+from gary.scheduler import PipelineScheduler
+from gary.utils.read_json import read_resume_json, read_tailored_resume
+from gary.config import (
+    CHECKPOINTS_ENABLED,
+    DEFAULT_BATCH_CONCURRENCY,
+    METRICS_ENABLED,
+    NEAR_DUPLICATE_ACTION,
+    NEAR_DUPLICATE_ACTIONS,
+    REPAIR_ENABLED,
+    RESUME_PATH,
+    SECTION_PARALLEL_TAILORING,
+    SERVE_HOST,
+    SERVE_PORT,
+    SERVE_WORKERS,
+    TRIAGE_MIN_OVERLAP,
+)
+from gary.models import (
+    ApplicationRecord,
+    JobAnalysis,
+    JobDetails,
+    KeywordReport,
+    MasterResume,
+    NearDuplicateMatch,
+    Resume,
+    ResumeContent,
+    ResumeValidationReport,
+)
+from gary.utils.application_ledger import ApplicationLedger
+from gary.utils.boilerplate import describe_boilerplate_report
+from gary.utils.clean_job_description import prepare_job_description
+from gary.utils.run_checkpoint import (
+    CHECKPOINT_STAGES,
+    REPLAYABLE_STAGES,
+    RunCheckpoint,
+    prune_checkpoints,
+)
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Modules the tailoring stage needs, imported while the user enters the job
+CREW_MODULES = ("gary.pipeline", "gary.streaming", "gary.batch")
+
 
 def get_job_details_from_cli() -> JobDetails:
     """
@@ -44,143 +98,665 @@ def get_job_details_from_cli() -> JobDetails:
     # Automatically set date to today in MM-DD-YYYY format
     date_applied = datetime.now().strftime("%m-%d-%Y")
 
-    # Create JobDetails with cleaned description
+    # Create JobDetails with the boilerplate stripped and the description cleaned
+    raw_job_description = job_description
+    job_description, boilerplate = prepare_job_description(raw_job_description)
     job_details = JobDetails(
         company_name=company_name,
         job_title=job_title,
         location=location,
         job_id=job_id if job_id else None,
-        job_description=clean_job_description(job_description),
+        job_description=job_description,
         date_applied=date_applied,
+        raw_job_description=raw_job_description,
+        boilerplate=boilerplate,
     )
 
     print(
         f"\n✓ Job details collected for {company_name} - {job_title} (Applied: {date_applied})"
     )
+    if boilerplate:
+        print(f"✓ {describe_boilerplate_report(boilerplate)}")
     return job_details
 
 
-def run() -> None:
+def print_validation_report(validation_report: ResumeValidationReport) -> None:
     """
-    Run the crew with comprehensive error handling.
+    Print a validation report to the console.
+
+    Args:
+        validation_report: Validation report from the crew
     """
-    try:
-        # 1. Collect job details from CLI
-        job_details = get_job_details_from_cli()
-
-        # 2. Read master resume from resume.json
-        master_resume = read_resume_json()
-
-        # 3. Extract resume content (without header) for crew processing
-        resume_content_dict = {
-            "professional_summary": master_resume.professional_summary.model_dump(),
-            "work_experience": [
-                exp.model_dump() for exp in master_resume.work_experience
-            ],
-            "education": [edu.model_dump() for edu in master_resume.education],
-            "skills": [skill.model_dump() for skill in master_resume.skills],
-            "projects": [proj.model_dump() for proj in master_resume.projects],
-        }
-
-        # 4. Send resume content and job description to crew
-        inputs = {
-            "job_description": job_details.job_description,
-            "master_resume": resume_content_dict,
-        }
-
-        gary_crew = Gary().crew()
-        result = gary_crew.kickoff(inputs=inputs)
-
-        # 5. Extract outputs from crew tasks
-        # The crew returns the last task's output (validation report)
-        # We need to get the resume content from the resume_tailoring_task
-        from gary.models import ResumeContent, ResumeValidationReport
-
-        # Get the resume content from tasks_output
-        resume_content_output = None
-        validation_report_output = None
-
-        for task_output in result.tasks_output:
-            if task_output.pydantic and isinstance(task_output.pydantic, ResumeContent):
-                resume_content_output = task_output.pydantic
-            elif task_output.pydantic and isinstance(
-                task_output.pydantic, ResumeValidationReport
-            ):
-                validation_report_output = task_output.pydantic
-
-        if not resume_content_output:
-            raise ValueError("Resume content not found in crew output")
-
-        # 6. Prepare final resume with updated header location
-        header = master_resume.header.model_copy()
-        header.location = job_details.location
-        final_resume = Resume(header=header, resume_content=resume_content_output)
-
-        # 7. Display validation report
-        if validation_report_output:
-            print("\n" + "=" * 80)
-            print("RESUME VALIDATION REPORT")
-            print("=" * 80)
-            print(f"Passed Validation: {validation_report_output.passed_validation}")
-            print(f"Overall Score: {validation_report_output.overall_score}/100")
-            print(
-                f"Ready for Generation: {validation_report_output.ready_for_generation}"
+    print("\n" + "=" * 80)
+    print("RESUME VALIDATION REPORT")
+    print("=" * 80)
+    print(f"Passed Validation: {validation_report.passed_validation}")
+    print(f"Overall Score: {validation_report.overall_score}/100")
+    print(f"Ready for Generation: {validation_report.ready_for_generation}")
+    print(
+        f"\nKeyword Integration Rate: {validation_report.keyword_analysis.integration_rate:.1f}%"
+    )
+    print(
+        f"Keywords Integrated: {validation_report.keyword_analysis.keywords_integrated}/{validation_report.keyword_analysis.total_keywords_from_job}"
+    )
+    print(f"ATS Score: {validation_report.feedback.ats_score}/100")
+    print(
+        f"Human Readability Score: {validation_report.feedback.human_readability_score}/100"
+    )
+
+    if validation_report.feedback.strengths:
+        print(f"\nStrengths:")
+        for strength in validation_report.feedback.strengths:
+            print(f"  ✓ {strength}")
+
+    if validation_report.feedback.weaknesses:
+        print(f"\nWeaknesses:")
+        for weakness in validation_report.feedback.weaknesses:
+            print(f"  ✗ {weakness}")
+
+    if validation_report.feedback.suggestions:
+        print(f"\nSuggestions:")
+        for suggestion in validation_report.feedback.suggestions:
+            print(f"  → {suggestion}")
+
+
+def print_keyword_report(keyword_report: KeywordReport) -> None:
+    """
+    Print per-keyword counts per resume section.
+
+    Args:
+        keyword_report: Local keyword analysis
+    """
+    print("\nKeyword Counts by Section:")
+    for count in keyword_report.keywords:
+        if count.total:
+            sections = ", ".join(
+                f"{section}: {n}" for section, n in count.sections.items()
             )
-            print(
-                f"\nKeyword Integration Rate: {validation_report_output.keyword_analysis.integration_rate:.1f}%"
+            print(f"  {count.keyword} [{count.category}]: {count.total} ({sections})")
+        else:
+            print(f"  {count.keyword} [{count.category}]: 0")
+
+
+def print_duplicate_applications(records: List[ApplicationRecord]) -> None:
+    """
+    Print earlier applications to the same posting.
+
+    Args:
+        records: Matching ledger records, oldest first
+    """
+    print("\n✗ You have already applied to this posting:")
+    for r in records:
+        print(
+            f"  {r.job_details.date_applied}  {r.job_details.company_name} - "
+            f"{r.job_details.job_title}  {r.resume_path or ''}"
+        )
+
+
+def print_near_duplicates(matches: List[NearDuplicateMatch]) -> None:
+    """
+    Print earlier applications to postings similar to this one.
+
+    Args:
+        matches: Near-duplicate matches, most similar first
+    """
+    print("\n⚠ This posting is similar to earlier applications:")
+    for m in matches:
+        r = m.record
+        print(
+            f"  {m.similarity:4.0%}  {r.job_details.date_applied}  "
+            f"{r.job_details.company_name} - {r.job_details.job_title}  "
+            f"{r.resume_path or ''}"
+        )
+
+
+def _offer_near_duplicate_reuse(
+    job_details: JobDetails,
+    ledger: ApplicationLedger,
+    index: Any,
+    exclude_ids: List[int],
+) -> Optional[Tuple[Optional[ResumeContent], Optional[JobAnalysis]]]:
+    """
+    Offer to reuse the analysis or tailored resume of a near-duplicate posting.
+
+    A reused analysis is passed to the crew, which then skips the job
+    analyst; it is not cached under this posting's description.
+
+    Args:
+        job_details: Posting about to be tailored
+        ledger: Application ledger
+        index: NearDuplicateIndex
+        exclude_ids: Ledger ids of exact duplicates, already reported
+
+    Returns:
+        The tailored content (None to tailor again) and the analysis the user
+        chose to reuse, or None to tailor from scratch
+    """
+    from gary.pipeline import find_near_duplicates, load_reusable_outputs
+    from gary.utils.analysis_cache import JobAnalysisCache
+
+    matches = find_near_duplicates(job_details, ledger, index, exclude_ids)
+    if not matches:
+        return None
+    print_near_duplicates(matches)
+
+    analysis_cache = JobAnalysisCache()
+    analysis, resume_content = load_reusable_outputs(matches[0].record, analysis_cache)
+    options = {}
+    if resume_content:
+        options["r"] = "Reuse its tailored resume"
+    if analysis:
+        options["a"] = "Reuse its job analysis and tailor again"
+    if not options:
+        print("  Its analysis and tailored resume are no longer available")
+        return None
+
+    print("For the most similar posting:")
+    for key, description in {**options, "s": "Tailor from scratch"}.items():
+        print(f"  [{key}] {description}")
+    choice = input("Choice (s): ").strip().lower()
+    if choice not in options:
+        return None
+    if choice == "r":
+        return resume_content, analysis
+    return None, analysis
+
+
+def _confirm_posting(
+    job_details: JobDetails,
+    master_resume: MasterResume,
+    ledger: ApplicationLedger,
+    near_duplicate_index: Any = None,
+) -> Optional[Tuple[Optional[ResumeContent], Optional[JobAnalysis]]]:
+    """
+    Ask before tailoring a duplicate or poorly matching posting.
+
+    For a near-duplicate of an earlier application, offers to reuse its job
+    analysis or tailored resume instead.
+
+    Args:
+        job_details: Posting about to be tailored
+        master_resume: Parsed master resume
+        ledger: Application ledger
+        near_duplicate_index: NearDuplicateIndex, or None to skip the check
+
+    Returns:
+        Tailored content (None to tailor again) and the analysis to reuse,
+        or None to tailor from scratch
+
+    Raises:
+        PipelineCancelled: If the user declines to continue
+    """
+    # Check the local ledger for an earlier application to this posting
+    duplicates = ledger.find_duplicates(job_details)
+    if duplicates:
+        print_duplicate_applications(duplicates)
+        if input("Continue anyway? (y/N): ").strip().lower() != "y":
+            raise PipelineCancelled("Duplicate posting")
+
+    reused = None
+    if near_duplicate_index is not None:
+        reused = _offer_near_duplicate_reuse(
+            job_details, ledger, near_duplicate_index, [r.id for r in duplicates]
+        )
+        if reused and reused[0]:
+            return reused
+
+    from gary.triage import triage_jobs
+
+    # Check fit locally before spending LLM tokens on a poor match
+    [triage] = triage_jobs([job_details], master_resume)
+    if not triage.passed:
+        print(
+            f"\n✗ Skill overlap with your resume is {triage.overlap_percentage:.1f}% "
+            f"(threshold {TRIAGE_MIN_OVERLAP:.0f}%)"
+        )
+        if triage.missing_skills:
+            print(f"  Missing: {', '.join(triage.missing_skills)}")
+        if input("Continue anyway? (y/N): ").strip().lower() != "y":
+            raise PipelineCancelled("Low fit score")
+    return reused
+
+
+def build_run_pipeline(
+    run_metrics: Optional[RunMetrics] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+    from_stage: Optional[str] = None,
+) -> PipelineScheduler:
+    """
+    Build the interactive run as a dependency graph of stages.
+
+    Importing CrewAI, opening the LLM connection, loading the master resume,
+    opening the ledger, authorizing Google Sheets and compiling the Word
+    template overlap with the job details prompt. After tailoring, validation and document
+    rendering run concurrently; a resume that fails validation then has its
+    failing sections repaired and is rendered again.
+
+    The outputs of each stage in CHECKPOINT_STAGES are saved to the run's
+    checkpoint. Stages the checkpoint already holds are loaded from it
+    instead of running, up to from_stage; the checkpoints of from_stage and
+    later stages are discarded.
+
+    Args:
+        run_metrics: Metrics of this run, or None to skip collection
+        checkpoint: Checkpoint to save stage outputs to and replay from, or None
+        from_stage: First stage to run again when replaying
+
+    Returns:
+        PipelineScheduler: Scheduler with every stage registered
+    """
+    scheduler = PipelineScheduler()
+    recorder = MetricsRecorder(default=run_metrics) if run_metrics else None
+
+    completed = checkpoint.completed_stages if checkpoint else []
+    replaying = "job_details" in completed
+    rerun_from = (
+        CHECKPOINT_STAGES.index(from_stage) if from_stage else len(CHECKPOINT_STAGES)
+    )
+    reused = [s for s in completed if CHECKPOINT_STAGES.index(s) < rerun_from]
+    if checkpoint:
+        checkpoint.discard(s for s in completed if s not in reused)
+
+    def checkpointed(
+        stage: str,
+        func: Callable[[Dict[str, Any]], Any],
+        load: Callable[[Dict[str, Any]], Any],
+        save: Callable[[Any], Dict[str, Any]],
+    ) -> Callable[[Dict[str, Any]], Any]:
+        # Load the stage's outputs from the checkpoint, or run it and save them
+        def run_stage(results: Dict[str, Any]) -> Any:
+            if stage in reused:
+                print(f"✓ Reusing the saved {stage} stage of run {checkpoint.run_id}")
+                return load(results)
+            value = func(results)
+            if checkpoint:
+                checkpoint.save(stage, **save(value))
+            return value
+
+        return run_stage
+
+    def load_document(name: str) -> Tuple[Resume, str]:
+        file_path = checkpoint.load(name)
+        return read_tailored_resume(Path(file_path).with_suffix(".json")), file_path
+
+    def load_master_resume(results: Dict[str, Any]) -> MasterResume:
+        from gary.utils.resume_artifact import load_compiled_resume
+
+        return load_compiled_resume().master_resume
+
+    def load_crew_modules(results: Dict[str, Any]) -> None:
+        for name in CREW_MODULES:
+            importlib.import_module(name)
+
+    def connect_llm(results: Dict[str, Any]) -> bool:
+        from gary.crew_pool import warm_llm_connections
+
+        return warm_llm_connections()
+
+    def connect_sheets(results: Dict[str, Any]) -> Any:
+        from gary.utils.google_sheets import get_sheets_client
+
+        return get_sheets_client()
+
+    def compile_word_template(results: Dict[str, Any]) -> None:
+        from gary.utils.resume_word_doc_generator import prewarm_word_renderer
+
+        prewarm_word_renderer()
+
+    def open_near_duplicate_index(results: Dict[str, Any]) -> Any:
+        from gary.pipeline import open_near_duplicate_index
+
+        return open_near_duplicate_index(results["ledger"])
+
+    def tailor(results: Dict[str, Any]) -> Tuple[Any, ResumeContent, Any]:
+        # Reuse the tailored resume or the analysis of a near-duplicate posting
+        reused_content, job_analysis = results["checks"] or (None, None)
+        if reused_content:
+            print("✓ Reusing the tailored resume of the earlier posting")
+            return None, reused_content, job_analysis
+
+        if SECTION_PARALLEL_TAILORING:
+            return tailor_sections(results, job_analysis)
+
+        from gary.pipeline import (
+            cache_job_analysis,
+            extract_crew_outputs,
+            extract_job_analysis,
+            needs_escalation,
+            prepare_crew,
+            tailor_tiers,
+        )
+        from gary.streaming import TailorStreamMonitor
+        from gary.utils.analysis_cache import JobAnalysisCache
+
+        # Send resume content (without header) and job description to the
+        # crew, skipping the job analyst when the analysis is already cached.
+        # Each model tier runs only if the previous one failed local checks,
+        # and reuses its analysis, so only the tailor runs again.
+        job_details = results["job_details"]
+        analysis_cache = JobAnalysisCache()
+        usage: Dict[str, int] = {}
+        for tier in tailor_tiers():
+            with prepare_crew(
+                results["master_resume"],
+                job_details,
+                analysis_cache,
+                include_validation=False,
+                tailor_tier=tier,
+                job_analysis=job_analysis,
+            ) as (gary_crew, inputs, cached_analysis):
+                with (
+                    recorder.attach() if recorder else nullcontext(),
+                    TailorStreamMonitor(cached_analysis).attach(),
+                ):
+                    result = gary_crew.kickoff(inputs=inputs)
+                # Every tier's tokens count towards the run
+                usage = add_usage(usage, crew_usage(gary_crew.usage_metrics))
+            cache_job_analysis(result, job_details, analysis_cache)
+            resume_content, _ = extract_crew_outputs(result)
+            job_analysis = extract_job_analysis(result) or cached_analysis
+            if run_metrics and tier:
+                run_metrics.tailor_tiers.append(tier)
+            if not needs_escalation(tier, job_analysis, resume_content):
+                break
+        return usage, resume_content, job_analysis
+
+    def tailor_sections(
+        results: Dict[str, Any], job_analysis: Optional[JobAnalysis]
+    ) -> Tuple[Any, ResumeContent, Any]:
+        from gary.section_tailoring import describe_section_report, tailor_by_section
+        from gary.utils.analysis_cache import JobAnalysisCache
+
+        args = (results["master_resume"], results["job_details"], JobAnalysisCache())
+        if recorder is None:
+            resume_content, job_analysis, report = tailor_by_section(
+                *args, job_analysis=job_analysis
             )
-            print(
-                f"Keywords Integrated: {validation_report_output.keyword_analysis.keywords_integrated}/{validation_report_output.keyword_analysis.total_keywords_from_job}"
+        else:
+            run_metrics.tailoring_mode = "sections"
+            with recorder.attach():
+                resume_content, job_analysis, report = tailor_by_section(
+                    *args, job_analysis=job_analysis
+                )
+        print(f"✓ {describe_section_report(report)}")
+        return None, resume_content, job_analysis
+
+    def validate_tailored(results: Dict[str, Any]) -> Tuple[Any, Any]:
+        from gary.pipeline import validate_resume
+
+        _, resume_content, job_analysis = results["tailoring"]
+        if recorder is None:
+            return validate_resume(job_analysis, resume_content)
+        with recorder.attach():
+            return validate_resume(job_analysis, resume_content)
+
+    def write_documents(
+        results: Dict[str, Any], resume_content: ResumeContent
+    ) -> Tuple[Resume, str]:
+        from gary.batch import write_boilerplate_report, write_tailored_resume
+        from gary.pipeline import build_final_resume
+        from gary.utils.resume_word_doc_generator import generate_word_resume
+
+        # Combine tailored content with the header, located at the job
+        job_details = results["job_details"]
+        final_resume = build_final_resume(
+            results["master_resume"], resume_content, job_details
+        )
+        file_path = generate_word_resume(final_resume, job_details)
+        write_tailored_resume(final_resume, file_path)
+        write_boilerplate_report(job_details, file_path)
+        print(f"✓ Resume generated successfully: {file_path}")
+        return final_resume, file_path
+
+    def render(results: Dict[str, Any]) -> Tuple[Resume, str]:
+        _, resume_content, _ = results["tailoring"]
+        return write_documents(results, resume_content)
+
+    def repair(results: Dict[str, Any]) -> Tuple[Tuple[Any, Any], Tuple[Resume, str]]:
+        # Regenerate the sections behind a failed validation, then the
+        # document if any section changed
+        validation_report, _ = results["validation"]
+        _, resume_content, job_analysis = results["tailoring"]
+        if (
+            not REPAIR_ENABLED
+            or validation_report is None
+            or validation_report.passed_validation
+        ):
+            return results["validation"], results["document"]
+
+        from gary.repair import repair_resume
+
+        args = (
+            job_analysis,
+            resume_content,
+            validation_report,
+            results["master_resume"],
+        )
+        if recorder is None:
+            repaired, validation_report, keyword_report, _ = repair_resume(*args)
+        else:
+            with recorder.attach():
+                repaired, validation_report, keyword_report, _ = repair_resume(*args)
+        if repaired is resume_content:
+            return results["validation"], results["document"]
+        return (validation_report, keyword_report), write_documents(results, repaired)
+
+    def log(results: Dict[str, Any]) -> None:
+        from gary.pipeline import mirror_ledger_to_sheets
+
+        # Record the application in the local ledger and mirror it to
+        # Google Sheets
+        ledger = results["ledger"]
+        (validation_report, _), (_, file_path) = results["repair"]
+        # A replay after a failed Sheets sync must not record the run twice
+        if "ledger" not in reused:
+            ledger.record(
+                results["job_details"],
+                resume_path=file_path,
+                validation_report=validation_report,
+                elapsed_seconds=scheduler.elapsed()
+                - scheduler.timings["tailoring"].started,
             )
-            print(f"ATS Score: {validation_report_output.feedback.ats_score}/100")
-            print(
-                f"Human Readability Score: {validation_report_output.feedback.human_readability_score}/100"
+            if checkpoint:
+                checkpoint.save("ledger")
+        with timed(run_metrics.stages if run_metrics else {}, "sheets_sync"):
+            mirror_ledger_to_sheets(ledger)
+
+    scheduler.add(
+        "job_details",
+        checkpointed(
+            "job_details",
+            lambda r: get_job_details_from_cli(),
+            lambda r: checkpoint.load("job_details", JobDetails),
+            lambda job_details: {"job_details": job_details},
+        ),
+        interactive=True,
+    )
+    scheduler.add("crew_modules", load_crew_modules)
+    scheduler.add("llm_connection", connect_llm, deps=["crew_modules"], optional=True)
+    scheduler.add("master_resume", load_master_resume)
+    scheduler.add("ledger", lambda r: ApplicationLedger())
+    scheduler.add("sheets_client", connect_sheets, optional=True)
+    scheduler.add("word_template", compile_word_template, optional=True)
+    scheduler.add(
+        "near_duplicate_index",
+        open_near_duplicate_index,
+        deps=["ledger", "crew_modules"],
+        optional=True,
+    )
+    # A replayed posting was confirmed by the original run
+    scheduler.add(
+        "checks",
+        lambda r: (
+            None
+            if replaying
+            else _confirm_posting(
+                r["job_details"],
+                r["master_resume"],
+                r["ledger"],
+                r["near_duplicate_index"],
             )
+        ),
+        deps=["job_details", "master_resume", "ledger", "near_duplicate_index"],
+        interactive=True,
+    )
+    scheduler.add(
+        "tailoring",
+        checkpointed(
+            "tailoring",
+            tailor,
+            lambda r: (
+                None,
+                checkpoint.load("resume_content", ResumeContent),
+                checkpoint.load("job_analysis", JobAnalysis),
+            ),
+            lambda value: {"resume_content": value[1], "job_analysis": value[2]},
+        ),
+        deps=["checks", "crew_modules"],
+        interactive=True,
+    )
+    scheduler.add(
+        "validation",
+        checkpointed(
+            "validation",
+            validate_tailored,
+            lambda r: (
+                checkpoint.load("validation_report", ResumeValidationReport),
+                checkpoint.load("keyword_report", KeywordReport),
+            ),
+            lambda value: {"validation_report": value[0], "keyword_report": value[1]},
+        ),
+        deps=["tailoring"],
+    )
+    scheduler.add(
+        "document",
+        checkpointed(
+            "document",
+            render,
+            lambda r: load_document("resume_path"),
+            lambda value: {"resume_path": value[1]},
+        ),
+        deps=["tailoring", "word_template"],
+    )
+    scheduler.add(
+        "repair",
+        checkpointed(
+            "repair",
+            repair,
+            lambda r: (
+                (
+                    checkpoint.load("final_validation_report", ResumeValidationReport),
+                    checkpoint.load("final_keyword_report", KeywordReport),
+                ),
+                load_document("final_resume_path"),
+            ),
+            lambda value: {
+                "final_validation_report": value[0][0],
+                "final_keyword_report": value[0][1],
+                "final_resume_path": value[1][1],
+            },
+        ),
+        deps=["validation", "document"],
+    )
+    scheduler.add(
+        "logging",
+        checkpointed("logging", log, lambda r: None, lambda value: {}),
+        deps=["repair", "sheets_client", "ledger"],
+    )
+    return scheduler
 
-            if validation_report_output.feedback.strengths:
-                print(f"\nStrengths:")
-                for strength in validation_report_output.feedback.strengths:
-                    print(f"  ✓ {strength}")
 
-            if validation_report_output.feedback.weaknesses:
-                print(f"\nWeaknesses:")
-                for weakness in validation_report_output.feedback.weaknesses:
-                    print(f"  ✗ {weakness}")
+def _record_run_metrics(
+    run_metrics: RunMetrics,
+    scheduler: PipelineScheduler,
+    results: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Complete a run's metrics from the scheduler and export them.
+
+    Args:
+        run_metrics: Metrics collected during the run
+        scheduler: Scheduler that ran the pipeline
+        results: Stage results, if the pipeline finished
+    """
+    run_metrics.wall_seconds = scheduler.elapsed()
+    for timing in scheduler.timings.values():
+        run_metrics.stages[timing.name] = timing.seconds
+        if timing.status == "failed":
+            run_metrics.failed_stages.append(timing.name)
+    if results:
+        run_metrics.company_name = results["job_details"].company_name
+        run_metrics.job_title = results["job_details"].job_title
+        run_metrics.crew_usage = results["tailoring"][0] or {}
+    append_run_metrics(run_metrics)
+    write_prometheus_snapshot()
 
-            if validation_report_output.feedback.suggestions:
-                print(f"\nSuggestions:")
-                for suggestion in validation_report_output.feedback.suggestions:
-                    print(f"  → {suggestion}")
+
+def run() -> None:
+    """
+    Run the crew with comprehensive error handling.
+    """
+    checkpoint = None
+    if CHECKPOINTS_ENABLED:
+        checkpoint = RunCheckpoint()
+        prune_checkpoints()
+    _run_pipeline("run", checkpoint)
+
+
+def _run_pipeline(
+    mode: str,
+    checkpoint: Optional[RunCheckpoint] = None,
+    from_stage: Optional[str] = None,
+) -> None:
+    """
+    Run the interactive pipeline and print its results.
+
+    Args:
+        mode: Metrics mode, run or replay
+        checkpoint: Checkpoint of the run, or None to run without one
+        from_stage: First stage to run again when replaying
+    """
+    try:
+        run_metrics = None
+        if METRICS_ENABLED:
+            run_metrics = RunMetrics(mode=mode)
+            if checkpoint:
+                run_metrics.run_id = checkpoint.run_id
+        scheduler = build_run_pipeline(run_metrics, checkpoint, from_stage)
+        try:
+            results = asyncio.run(scheduler.run())
+        except PipelineCancelled:
+            return
+        except Exception:
+            if run_metrics:
+                _record_run_metrics(run_metrics, scheduler)
+            raise
+
+        usage_metrics = results["tailoring"][0]
+        (validation_report_output, keyword_report), (final_resume, _) = results[
+            "repair"
+        ]
+
+        # Display validation report
+        if validation_report_output:
+            print_validation_report(validation_report_output)
+        if keyword_report:
+            print_keyword_report(keyword_report)
 
         print("\n" + "=" * 80)
         print("FINAL RESUME")
         print("=" * 80)
         print(final_resume.model_dump_json(indent=2))
 
-        # 8. Generate Word document
-        print("\n" + "=" * 80)
-        print("GENERATING WORD DOCUMENT")
-        print("=" * 80)
-        file_path = generate_word_resume(final_resume, job_details)
-        print(f"✓ Resume generated successfully: {file_path}")
-
-        # 6. Append job details to Google Sheets
-        sheets_client = initialize_sheets_client()
-        row_data = [
-            job_details.date_applied,
-            job_details.company_name,
-            job_details.job_title,
-            job_details.location,
-            job_details.job_id or "",
-            job_details.job_description,
-            "Done",
-        ]
-        sheets_client.append_row(row_data)
-        print(f"✓ Job details logged to Google Sheets")
+        scheduler.print_report()
 
         # Display usage metrics if available
-        if hasattr(gary_crew, "usage_metrics") and gary_crew.usage_metrics:
-            print(gary_crew.usage_metrics)
+        if usage_metrics:
+            print(", ".join(f"{k}={v}" for k, v in usage_metrics.items()))
+
+        if run_metrics:
+            _record_run_metrics(run_metrics, scheduler, results)
+            print_run_metrics(run_metrics)
 
     except KeyboardInterrupt:
         print("\nExecution interrupted by user. Exiting...")
@@ -188,9 +764,384 @@ def run() -> None:
     except SystemExit:
         raise
     except Exception as e:
+        print(f"✗ Error: {e}")
+        if checkpoint and "job_details" in checkpoint.completed_stages:
+            print(
+                f"Completed stages are saved; resume with "
+                f"`gary replay {checkpoint.run_id}`"
+            )
+        sys.exit(1)
+
+
+def _add_replay_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("run_id", help="Run ID printed by the interrupted run")
+    parser.add_argument(
+        "--from-stage",
+        choices=REPLAYABLE_STAGES,
+        help="Run this stage and every later stage again (default: only the "
+        "stages without a saved checkpoint)",
+    )
+
+
+def replay(run_id: Optional[str] = None, from_stage: Optional[str] = None) -> None:
+    """
+    Resume an interactive run from its checkpoint.
+
+    Saved stages are loaded instead of run, so completed LLM calls are not
+    repeated. Without arguments (the `replay` script), they are read from
+    the command line.
+
+    Args:
+        run_id: Run ID printed by the run
+        from_stage: First stage to run again; by default only the stages
+            without a saved checkpoint run
+    """
+    if run_id is None:
+        parser = argparse.ArgumentParser(
+            prog="replay", description="Resume an interactive run from its checkpoint."
+        )
+        _add_replay_arguments(parser)
+        args = parser.parse_args()
+        run_id, from_stage = args.run_id, args.from_stage
+
+    try:
+        checkpoint = RunCheckpoint.open(run_id)
+    except DataLoadError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print(
+        f"Replaying run {run_id}; saved stages: {', '.join(checkpoint.completed_stages)}"
+    )
+    _run_pipeline("replay", checkpoint, from_stage)
+
+
+def batch(
+    file_path: str,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    log_to_sheets: bool = True,
+    use_cache: bool = True,
+    min_overlap: Optional[float] = TRIAGE_MIN_OVERLAP,
+    skip_duplicates: bool = True,
+    near_duplicates: str = NEAR_DUPLICATE_ACTION,
+    by_section: bool = SECTION_PARALLEL_TAILORING,
+) -> None:
+    """
+    Tailor resumes for every posting in a JSONL/CSV file.
+
+    Args:
+        file_path: Path to a .jsonl or .csv file of JobDetails records
+        concurrency: Maximum number of crews running at once
+        log_to_sheets: Whether to log successful postings to Google Sheets
+        use_cache: Whether to reuse cached job analyses
+        min_overlap: Fit-score threshold in percent (None disables triage)
+        skip_duplicates: Whether to skip postings already in the application ledger
+        near_duplicates: "reuse", "analysis", "skip" or "ignore" for near-duplicates of earlier applications
+        by_section: Whether to tailor with one concurrent crew per section
+    """
+    from gary.batch import run_batch
+
+    try:
+        results = run_batch(
+            file_path,
+            concurrency,
+            log_to_sheets,
+            use_cache,
+            min_overlap,
+            skip_duplicates,
+            near_duplicates,
+            by_section,
+        )
+    except KeyboardInterrupt:
+        print("\nExecution interrupted by user. Exiting...")
+        sys.exit(0)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    if any(r.error for r in results):
+        sys.exit(1)
+
+
+def serve(
+    host: str = SERVE_HOST,
+    port: int = SERVE_PORT,
+    socket_path: Optional[str] = None,
+    workers: int = SERVE_WORKERS,
+    log_to_sheets: bool = True,
+    use_cache: bool = True,
+    skip_duplicates: bool = True,
+    near_duplicates: str = NEAR_DUPLICATE_ACTION,
+) -> None:
+    """
+    Run the tailoring service until interrupted.
+
+    Args:
+        host: Interface to listen on
+        port: TCP port to listen on
+        socket_path: Listen on this Unix socket instead of host/port
+        workers: Maximum number of crews running at once
+        log_to_sheets: Whether to mirror finished postings to Google Sheets
+        use_cache: Whether to reuse cached job analyses
+        skip_duplicates: Whether to skip postings already in the application ledger
+        near_duplicates: "reuse", "analysis", "skip" or "ignore" for near-duplicates of earlier applications
+    """
+    from gary.server import run_server
+
+    try:
+        run_server(
+            host,
+            port,
+            socket_path,
+            workers,
+            log_to_sheets,
+            use_cache,
+            skip_duplicates,
+            near_duplicates,
+        )
+    except KeyboardInterrupt:
+        print("\nAborted; unfinished jobs were dropped.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+def triage(file_path: str, min_overlap: float = TRIAGE_MIN_OVERLAP) -> None:
+    """
+    Rank every posting in a JSONL/CSV file by fit with the master resume.
+
+    Args:
+        file_path: Path to a .jsonl or .csv file of JobDetails records
+        min_overlap: Minimum overlap percentage for a posting to pass
+    """
+    from gary.triage import run_triage
+
+    try:
+        run_triage(file_path, min_overlap)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+def render(resume_file: str, output_file: Optional[str] = None) -> None:
+    """
+    Re-render a Word document from a saved tailored resume, without the crew.
+
+    Args:
+        resume_file: Resume JSON saved next to a generated document
+        output_file: Document to write; defaults to the JSON path with a .docx suffix
+    """
+    from gary.utils.resume_word_doc_generator import ResumeWordRenderer
+
+    try:
+        resume = read_tailored_resume(Path(resume_file))
+        output = Path(output_file) if output_file else Path(resume_file)
+        file_path = ResumeWordRenderer().render_to(resume, output.with_suffix(".docx"))
+    except (DataLoadError, ResumeGenerationError) as e:
         print(f"✗ Error: {e}")
         sys.exit(1)
+    print(f"✓ Resume generated successfully: {file_path}")
+
+
+def validate(resume_file: str = str(RESUME_PATH)) -> None:
+    """
+    Check that a master resume file matches the MasterResume schema.
+
+    Args:
+        resume_file: Path to the master resume JSON file
+    """
+    try:
+        master_resume = read_resume_json(Path(resume_file))
+    except DataLoadError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    print(f"✓ {resume_file} is valid")
+    print(f"  Name: {master_resume.header.name}")
+    print(f"  Work experience: {len(master_resume.work_experience)}")
+    print(f"  Education: {len(master_resume.education)}")
+    print(f"  Skill categories: {len(master_resume.skills)}")
+    print(f"  Projects: {len(master_resume.projects)}")
+
+
+def cli() -> None:
+    """
+    Command line entry point.
+
+    Without a subcommand, runs the interactive single-posting flow.
+    """
+    parser = argparse.ArgumentParser(
+        prog="gary", description="Tailor resumes to job postings."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Tailor resumes for every posting in a JSONL/CSV file"
+    )
+    batch_parser.add_argument("file", help="Path to a .jsonl or .csv file")
+    batch_parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f"Maximum concurrent crews (default: {DEFAULT_BATCH_CONCURRENCY})",
+    )
+    batch_parser.add_argument(
+        "--no-sheets",
+        action="store_true",
+        help="Do not log processed postings to Google Sheets",
+    )
+    batch_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the job analyst instead of reusing cached analyses",
+    )
+    batch_parser.add_argument(
+        "--min-overlap",
+        type=float,
+        default=TRIAGE_MIN_OVERLAP,
+        help=f"Skip postings below this fit-score overlap %% (default: {TRIAGE_MIN_OVERLAP:.0f})",
+    )
+    batch_parser.add_argument(
+        "--no-triage",
+        action="store_true",
+        help="Send every posting to the crew regardless of fit score",
+    )
+    batch_parser.add_argument(
+        "--allow-duplicates",
+        action="store_true",
+        help="Tailor postings already recorded in the application ledger",
+    )
+    batch_parser.add_argument(
+        "--near-duplicates",
+        choices=NEAR_DUPLICATE_ACTIONS,
+        default=NEAR_DUPLICATE_ACTION,
+        help="For near-duplicates of earlier applications: reuse the tailored "
+        "resume, reuse the job analysis, skip or ignore (default: "
+        f"{NEAR_DUPLICATE_ACTION})",
+    )
+    batch_parser.add_argument(
+        "--by-section",
+        action=argparse.BooleanOptionalAction,
+        default=SECTION_PARALLEL_TAILORING,
+        help="Tailor each resume section in its own concurrent LLM call "
+        f"(default: {SECTION_PARALLEL_TAILORING})",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local HTTP service that tailors submitted postings"
+    )
+    serve_parser.add_argument(
+        "--host", default=SERVE_HOST, help=f"Interface (default: {SERVE_HOST})"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=SERVE_PORT, help=f"Port (default: {SERVE_PORT})"
+    )
+    serve_parser.add_argument(
+        "--socket", help="Listen on this Unix socket instead of host and port"
+    )
+    serve_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=SERVE_WORKERS,
+        help=f"Maximum concurrent crews (default: {SERVE_WORKERS})",
+    )
+    serve_parser.add_argument(
+        "--no-sheets",
+        action="store_true",
+        help="Do not log processed postings to Google Sheets",
+    )
+    serve_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the job analyst instead of reusing cached analyses",
+    )
+    serve_parser.add_argument(
+        "--allow-duplicates",
+        action="store_true",
+        help="Tailor postings already recorded in the application ledger",
+    )
+    serve_parser.add_argument(
+        "--near-duplicates",
+        choices=NEAR_DUPLICATE_ACTIONS,
+        default=NEAR_DUPLICATE_ACTION,
+        help="For near-duplicates of earlier applications: reuse the tailored "
+        "resume, reuse the job analysis, skip or ignore (default: "
+        f"{NEAR_DUPLICATE_ACTION})",
+    )
+
+    triage_parser = subparsers.add_parser(
+        "triage", help="Rank postings in a JSONL/CSV file by fit, without LLM calls"
+    )
+    triage_parser.add_argument("file", help="Path to a .jsonl or .csv file")
+    triage_parser.add_argument(
+        "--min-overlap",
+        type=float,
+        default=TRIAGE_MIN_OVERLAP,
+        help=f"Pass threshold for fit-score overlap %% (default: {TRIAGE_MIN_OVERLAP:.0f})",
+    )
+
+    render_parser = subparsers.add_parser(
+        "render", help="Re-render a Word document from a saved tailored resume"
+    )
+    render_parser.add_argument(
+        "file", help="Resume JSON saved next to a generated .docx"
+    )
+    render_parser.add_argument(
+        "-o", "--output", help="Output .docx path (default: next to the JSON)"
+    )
+
+    replay_parser = subparsers.add_parser(
+        "replay", help="Resume an interactive run from its checkpoint"
+    )
+    _add_replay_arguments(replay_parser)
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="Check that the master resume matches the schema"
+    )
+    validate_parser.add_argument(
+        "file",
+        nargs="?",
+        default=str(RESUME_PATH),
+        help=f"Master resume JSON (default: {RESUME_PATH})",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "batch":
+        batch(
+            args.file,
+            args.concurrency,
+            not args.no_sheets,
+            not args.no_cache,
+            None if args.no_triage else args.min_overlap,
+            not args.allow_duplicates,
+            args.near_duplicates,
+            args.by_section,
+        )
+    elif args.command == "serve":
+        serve(
+            args.host,
+            args.port,
+            args.socket,
+            args.workers,
+            not args.no_sheets,
+            not args.no_cache,
+            not args.allow_duplicates,
+            args.near_duplicates,
+        )
+    elif args.command == "triage":
+        triage(args.file, args.min_overlap)
+    elif args.command == "render":
+        render(args.file, args.output)
+    elif args.command == "replay":
+        replay(args.run_id, args.from_stage)
+    elif args.command == "validate":
+        validate(args.file)
+    else:
+        run()
 
 
 if __name__ == "__main__":
-    run()
+    cli()
@@ -0,0 +1,653 @@
+"""Per-stage latency, token and cost metrics for tailoring runs."""
+
+import os
+import statistics
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+from pydantic import BaseModel, Field
+from gary.config import (
+    MODEL_PRICING,
+    METRICS_JSONL_PATH,
+    METRICS_PROMETHEUS_PATH,
+    METRICS_QUANTILE_WINDOW,
+)
+from gary.utils.tokens import estimate_tokens
+
+
+class LLMCallMetric(BaseModel):
+    """Timing, token and cost estimate of one LLM call."""
+
+    model: str = Field(..., description="Model name")
+    agent: Optional[str] = Field(None, description="Role of the calling agent")
+    task: Optional[str] = Field(None, description="Name of the running task")
+    latency_seconds: float = Field(..., description="Wall time of the call")
+    time_to_first_token: Optional[float] = Field(
+        None, description="Seconds until the first streamed chunk, if streaming"
+    )
+    prompt_tokens: int = Field(0, description="Estimated prompt tokens")
+    completion_tokens: int = Field(0, description="Estimated completion tokens")
+    cost_usd: float = Field(0.0, description="Estimated cost from MODEL_PRICING")
+    failed: bool = Field(False, description="Whether the call raised")
+
+
+class RunMetrics(BaseModel):
+    """Metrics for one tailoring run, written as one JSON line."""
+
+    run_id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+    mode: str = Field(..., description="run, replay or batch")
+    tailoring_mode: str = Field(
+        "single", description="single (one tailoring call) or sections"
+    )
+    tailor_tiers: List[str] = Field(
+        default=[],
+        description="Tailor model tiers tried, in order; the last one was kept",
+    )
+    started_at: str = Field(
+        default_factory=lambda: datetime.now().isoformat(timespec="seconds")
+    )
+    company_name: Optional[str] = Field(None, description="Target company")
+    job_title: Optional[str] = Field(None, description="Target job title")
+    wall_seconds: float = Field(0.0, description="Total wall time")
+    stages: Dict[str, float] = Field(default={}, description="Seconds per stage")
+    failed_stages: List[str] = Field(default=[], description="Stages that failed")
+    tasks: Dict[str, float] = Field(default={}, description="Seconds per crew task")
+    llm_calls: List[LLMCallMetric] = Field(default=[], description="Every LLM call")
+    agent_iterations: Dict[str, int] = Field(
+        default={}, description="LLM calls per agent role"
+    )
+    agent_max_iter: Dict[str, int] = Field(
+        default={}, description="Configured max_iter per agent role"
+    )
+    crew_usage: Dict[str, int] = Field(
+        default={}, description="Token usage reported by the tailoring crew"
+    )
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(call.cost_usd for call in self.llm_calls)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the cost of an LLM call from MODEL_PRICING.
+
+    Args:
+        model: Model name
+        prompt_tokens: Prompt tokens
+        completion_tokens: Completion tokens
+
+    Returns:
+        float: Estimated USD cost, 0 for models without pricing
+    """
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        # Providers may report the model without its routing prefix
+        name = model.rsplit("/", 1)[-1]
+        pricing = next(
+            (p for m, p in MODEL_PRICING.items() if m.rsplit("/", 1)[-1] == name),
+            (0.0, 0.0),
+        )
+    input_price, output_price = pricing
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1e6
+
+
+@contextmanager
+def timed(durations: Dict[str, float], name: str) -> Iterator[None]:
+    """
+    Add the wall time of a block to durations[name].
+
+    Args:
+        durations: Mapping to update, e.g. RunMetrics.stages
+        name: Key to add the elapsed seconds to
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        durations[name] = durations.get(name, 0.0) + time.perf_counter() - start
+
+
+class MetricsRecorder:
+    """
+    Collects LLM call and task metrics from CrewAI events.
+
+    CrewAI emits events on the thread running the crew, so each thread is
+    bound to the RunMetrics it reports into with scope(). Events on threads
+    without a scope go to the default run, or are ignored if there is none.
+    """
+
+    def __init__(self, default: Optional[RunMetrics] = None):
+        """
+        Initialize the recorder.
+
+        Args:
+            default: Run that receives events from threads without a scope
+        """
+        self.default = default
+        self._local = threading.local()
+
+    def _run(self) -> Optional[RunMetrics]:
+        return getattr(self._local, "run", None) or self.default
+
+    @contextmanager
+    def scope(self, run: RunMetrics) -> Iterator[RunMetrics]:
+        """
+        Report events raised on the current thread into run.
+
+        Args:
+            run: Metrics of the run executing on this thread
+
+        Yields:
+            RunMetrics: The same run
+        """
+        previous = getattr(self._local, "run", None)
+        self._local.run = run
+        try:
+            yield run
+        finally:
+            self._local.run = previous
+
+    def call_in_scope(
+        self, run: RunMetrics, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Call func with events on this thread reported into run.
+
+        Convenient with asyncio.to_thread for crews kicked off from a batch.
+
+        Args:
+            run: Metrics of the run
+            func: Function to call, e.g. crew.kickoff
+
+        Returns:
+            Any: The function's return value
+        """
+        with self.scope(run):
+            return func(*args, **kwargs)
+
+    def _on_task_started(self, event: Any) -> None:
+        run = self._run()
+        if run is None:
+            return
+        task = getattr(event, "task", None)
+        agent = getattr(task, "agent", None)
+        self._local.task = getattr(task, "name", None)
+        self._local.agent = getattr(agent, "role", None)
+        self._local.task_start = time.perf_counter()
+        if self._local.agent and getattr(agent, "max_iter", None):
+            run.agent_max_iter[self._local.agent] = agent.max_iter
+
+    def _on_task_finished(self, event: Any) -> None:
+        run = self._run()
+        start = getattr(self._local, "task_start", None)
+        if run is None or start is None:
+            return
+        name = getattr(self._local, "task", None) or "task"
+        run.tasks[name] = run.tasks.get(name, 0.0) + time.perf_counter() - start
+        self._local.task_start = None
+
+    def _on_call_started(self, event: Any) -> None:
+        if self._run() is None:
+            return
+        self._local.call_start = time.perf_counter()
+        self._local.first_chunk = None
+        self._local.prompt_tokens = estimate_tokens(getattr(event, "messages", ""))
+
+    def _on_chunk(self, event: Any) -> None:
+        if getattr(self._local, "call_start", None) is None:
+            return
+        if self._local.first_chunk is None:
+            self._local.first_chunk = time.perf_counter()
+
+    def _on_call_finished(self, event: Any, failed: bool) -> None:
+        run = self._run()
+        start = getattr(self._local, "call_start", None)
+        if run is None or start is None:
+            return
+        now = time.perf_counter()
+        first_chunk = self._local.first_chunk
+        model = str(getattr(event, "model", None) or "unknown")
+        agent = getattr(event, "agent_role", None) or getattr(
+            self._local, "agent", None
+        )
+        prompt_tokens = self._local.prompt_tokens
+        completion_tokens = 0 if failed else estimate_tokens(event.response or "")
+
+        run.llm_calls.append(
+            LLMCallMetric(
+                model=model,
+                agent=agent,
+                task=getattr(event, "task_name", None)
+                or getattr(self._local, "task", None),
+                latency_seconds=now - start,
+                time_to_first_token=first_chunk - start if first_chunk else None,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost_usd=estimate_cost(model, prompt_tokens, completion_tokens),
+                failed=failed,
+            )
+        )
+        if agent:
+            run.agent_iterations[agent] = run.agent_iterations.get(agent, 0) + 1
+        self._local.call_start = None
+
+    @contextmanager
+    def attach(self) -> Iterator["MetricsRecorder"]:
+        """
+        Receive CrewAI events for the duration of a run, batch or service.
+
+        Attached recorders can nest and overlap; each records the events of
+        the threads it has a scope on (or of every thread, with a default).
+
+        Yields:
+            MetricsRecorder: This recorder
+        """
+        _register_event_handlers()
+        with _attached_lock:
+            _attached.append(self)
+        try:
+            yield self
+        finally:
+            with _attached_lock:
+                _attached.remove(self)
+
+
+# Recorders receiving events. The CrewAI event handlers are registered once
+# per process, next to CrewAI's own, and pass each event to every attached
+# recorder.
+_attached: List[MetricsRecorder] = []
+_attached_lock = threading.Lock()
+_handlers_registered = False
+
+
+def _dispatch(method: Callable[[MetricsRecorder, Any], None]) -> Callable:
+    def handler(source: Any, event: Any) -> None:
+        for recorder in tuple(_attached):
+            method(recorder, event)
+
+    return handler
+
+
+def _register_event_handlers() -> None:
+    """Subscribe the recorder dispatchers to CrewAI events, once per process."""
+    global _handlers_registered
+    with _attached_lock:
+        if _handlers_registered:
+            return
+        _handlers_registered = True
+
+    # Imported here so RunMetrics can be used without loading CrewAI
+    from crewai.events import (
+        LLMCallCompletedEvent,
+        LLMCallFailedEvent,
+        LLMCallStartedEvent,
+        LLMStreamChunkEvent,
+        TaskCompletedEvent,
+        TaskFailedEvent,
+        TaskStartedEvent,
+        crewai_event_bus,
+    )
+
+    handlers = {
+        TaskStartedEvent: MetricsRecorder._on_task_started,
+        TaskCompletedEvent: MetricsRecorder._on_task_finished,
+        TaskFailedEvent: MetricsRecorder._on_task_finished,
+        LLMCallStartedEvent: MetricsRecorder._on_call_started,
+        LLMStreamChunkEvent: MetricsRecorder._on_chunk,
+        LLMCallCompletedEvent: lambda r, e: r._on_call_finished(e, failed=False),
+        LLMCallFailedEvent: lambda r, e: r._on_call_finished(e, failed=True),
+    }
+    for event_type, method in handlers.items():
+        crewai_event_bus.register_handler(event_type, _dispatch(method))
+
+
+def crew_usage(usage_metrics: Any) -> Dict[str, int]:
+    """
+    Convert a crew's token usage after kickoff to plain counters.
+
+    Args:
+        usage_metrics: Crew.usage_metrics, read before the crew is reused
+
+    Returns:
+        Dict[str, int]: Usage counters, empty if unavailable
+    """
+    if usage_metrics is None:
+        return {}
+    return {k: v for k, v in usage_metrics.model_dump().items() if isinstance(v, int)}
+
+
+def add_usage(total: Dict[str, int], usage: Dict[str, int]) -> Dict[str, int]:
+    """
+    Add crew_usage counters, e.g. of every tier of the model cascade.
+
+    Args:
+        total: Counters so far
+        usage: Counters to add
+
+    Returns:
+        Dict[str, int]: Summed counters
+    """
+    summed = dict(total)
+    for key, value in usage.items():
+        summed[key] = summed.get(key, 0) + value
+    return summed
+
+
+def load_run_metrics(path: Path = METRICS_JSONL_PATH) -> List[RunMetrics]:
+    """
+    Read every recorded run.
+
+    Args:
+        path: JSON lines metrics file
+
+    Returns:
+        List[RunMetrics]: Runs in the order they were recorded
+    """
+    if not Path(path).exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [RunMetrics.model_validate_json(line) for line in f if line.strip()]
+
+
+@lru_cache(maxsize=None)
+def single_call_tailoring_seconds(
+    path: Path = METRICS_JSONL_PATH, window: int = METRICS_QUANTILE_WINDOW
+) -> Optional[float]:
+    """
+    Median tailoring wall time of recent single-call runs.
+
+    The p50 of gary_tailoring_seconds{tailoring_mode="single"}, used as the
+    baseline for section-parallel runs. Read once per process and path.
+
+    Args:
+        path: JSON lines metrics file
+        window: Number of recent single-call runs to take the median of
+
+    Returns:
+        Optional[float]: Median seconds, or None if no single-call run is recorded
+    """
+    seconds = [
+        run.stages["tailoring"]
+        for run in load_run_metrics(path)
+        if run.tailoring_mode == "single" and "tailoring" in run.stages
+    ]
+    return statistics.median(seconds[-window:]) if seconds else None
+
+
+def append_run_metrics(run: RunMetrics, path: Path = METRICS_JSONL_PATH) -> None:
+    """
+    Append one run to the JSON lines metrics file.
+
+    Args:
+        run: Finished run
+        path: JSON lines metrics file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(run.model_dump_json() + "\n")
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _summary(
+    lines: List[str], name: str, help_text: str, series: Dict[tuple, List[float]]
+) -> None:
+    import numpy as np
+
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} summary")
+    for key, values in sorted(series.items()):
+        labels = dict(key)
+        p50, p95 = np.percentile(values, [50, 95])
+        lines.append(f"{name}{_labels(**labels, quantile='0.5')} {p50:.6f}")
+        lines.append(f"{name}{_labels(**labels, quantile='0.95')} {p95:.6f}")
+        lines.append(f"{name}_sum{_labels(**labels)} {sum(values):.6f}")
+        lines.append(f"{name}_count{_labels(**labels)} {len(values)}")
+
+
+class PrometheusMetrics:
+    """
+    Aggregates of recorded runs, rendered in Prometheus text exposition format.
+
+    Counters cover every run added; summaries (p50/p95) cover the most recent
+    window of runs. A long-running process loads the history once and adds
+    each run as it finishes, instead of re-reading the metrics file. Runs can
+    be added and rendered from any thread.
+    """
+
+    def __init__(self, window: int = METRICS_QUANTILE_WINDOW):
+        """
+        Initialize empty aggregates.
+
+        Args:
+            window: Number of recent runs used for quantiles
+        """
+        self.runs_by_mode: Dict[str, int] = defaultdict(int)
+        self.kept_tiers: Dict[str, int] = defaultdict(int)
+        self.tokens: Dict[tuple, int] = defaultdict(int)
+        self.cost: Dict[str, float] = defaultdict(float)
+        self.recent: Deque[RunMetrics] = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: Path = METRICS_JSONL_PATH,
+        window: int = METRICS_QUANTILE_WINDOW,
+    ) -> "PrometheusMetrics":
+        """
+        Aggregate every run recorded in a JSON lines metrics file.
+
+        Args:
+            path: JSON lines metrics file
+            window: Number of recent runs used for quantiles
+
+        Returns:
+            PrometheusMetrics: Aggregates of the recorded runs
+        """
+        metrics = cls(window)
+        for run in load_run_metrics(path):
+            metrics.add(run)
+        return metrics
+
+    def add(self, run: RunMetrics) -> None:
+        """Add a finished run to the aggregates."""
+        with self._lock:
+            self.runs_by_mode[run.mode] += 1
+            if run.tailor_tiers:
+                self.kept_tiers[run.tailor_tiers[-1]] += 1
+            for call in run.llm_calls:
+                self.tokens[(call.model, "prompt")] += call.prompt_tokens
+                self.tokens[(call.model, "completion")] += call.completion_tokens
+                self.cost[call.model] += call.cost_usd
+            self.recent.append(run)
+
+    def render(self) -> str:
+        """
+        Render the aggregates.
+
+        Returns:
+            str: Metrics text for the node_exporter textfile collector
+        """
+        with self._lock:
+            runs_by_mode = dict(self.runs_by_mode)
+            kept_tiers = dict(self.kept_tiers)
+            tokens = dict(self.tokens)
+            cost = dict(self.cost)
+            recent = list(self.recent)
+
+        stages: Dict[tuple, List[float]] = defaultdict(list)
+        tailoring: Dict[tuple, List[float]] = defaultdict(list)
+        tiers: Dict[tuple, List[float]] = defaultdict(list)
+        tasks: Dict[tuple, List[float]] = defaultdict(list)
+        latency: Dict[tuple, List[float]] = defaultdict(list)
+        ttft: Dict[tuple, List[float]] = defaultdict(list)
+        iterations: Dict[tuple, List[float]] = defaultdict(list)
+        run_cost: Dict[tuple, List[float]] = defaultdict(list)
+        for run in recent:
+            for stage, seconds in run.stages.items():
+                stages[(("mode", run.mode), ("stage", stage))].append(seconds)
+            if "tailoring" in run.stages:
+                tailoring[(("tailoring_mode", run.tailoring_mode),)].append(
+                    run.stages["tailoring"]
+                )
+                if run.tailor_tiers:
+                    tiers[(("tier", run.tailor_tiers[-1]),)].append(
+                        run.stages["tailoring"]
+                    )
+            for task, seconds in run.tasks.items():
+                tasks[(("task", task),)].append(seconds)
+            for call in run.llm_calls:
+                latency[(("model", call.model),)].append(call.latency_seconds)
+                if call.time_to_first_token is not None:
+                    ttft[(("model", call.model),)].append(call.time_to_first_token)
+            for agent, count in run.agent_iterations.items():
+                iterations[(("agent", agent),)].append(count)
+            run_cost[(("mode", run.mode),)].append(run.cost_usd)
+
+        lines = [
+            "# HELP gary_runs_total Tailoring runs recorded.",
+            "# TYPE gary_runs_total counter",
+        ]
+        lines += [
+            f"gary_runs_total{_labels(mode=m)} {n}" for m, n in runs_by_mode.items()
+        ]
+        lines += [
+            "# HELP gary_llm_tokens_total Estimated LLM tokens.",
+            "# TYPE gary_llm_tokens_total counter",
+        ]
+        lines += [
+            f"gary_llm_tokens_total{_labels(model=model, kind=kind)} {n}"
+            for (model, kind), n in sorted(tokens.items())
+        ]
+        lines += [
+            "# HELP gary_llm_cost_usd_total Estimated LLM cost in USD.",
+            "# TYPE gary_llm_cost_usd_total counter",
+        ]
+        lines += [
+            f"gary_llm_cost_usd_total{_labels(model=model)} {usd:.6f}"
+            for model, usd in sorted(cost.items())
+        ]
+        lines += [
+            "# HELP gary_tailor_tier_total Runs whose resume came from each tailor tier.",
+            "# TYPE gary_tailor_tier_total counter",
+        ]
+        lines += [
+            f"gary_tailor_tier_total{_labels(tier=tier)} {n}"
+            for tier, n in sorted(kept_tiers.items())
+        ]
+        _summary(lines, "gary_stage_seconds", "Wall time per pipeline stage.", stages)
+        _summary(
+            lines,
+            "gary_tailoring_seconds",
+            "Wall time of tailoring, single call vs per section.",
+            tailoring,
+        )
+        _summary(
+            lines,
+            "gary_tailor_tier_seconds",
+            "Wall time of tailoring by the tier whose resume was kept.",
+            tiers,
+        )
+        _summary(lines, "gary_task_seconds", "Wall time per crew task.", tasks)
+        _summary(lines, "gary_llm_latency_seconds", "LLM call latency.", latency)
+        _summary(
+            lines,
+            "gary_llm_time_to_first_token_seconds",
+            "Time to first streamed token.",
+            ttft,
+        )
+        _summary(
+            lines, "gary_agent_iterations", "LLM calls per agent per run.", iterations
+        )
+        _summary(lines, "gary_run_cost_usd", "Estimated LLM cost per run.", run_cost)
+        return "\n".join(lines) + "\n"
+
+    def write(self, prom_path: Path = METRICS_PROMETHEUS_PATH) -> None:
+        """
+        Write the aggregates to the Prometheus textfile.
+
+        The file is replaced atomically so a collector never reads it half written.
+
+        Args:
+            prom_path: Prometheus textfile to write
+        """
+        prom_path = Path(prom_path)
+        prom_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = prom_path.with_suffix(prom_path.suffix + ".tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, prom_path)
+
+
+def render_prometheus(
+    runs: List[RunMetrics], window: int = METRICS_QUANTILE_WINDOW
+) -> str:
+    """
+    Render recorded runs in Prometheus text exposition format.
+
+    Args:
+        runs: Recorded runs, oldest first
+        window: Number of recent runs used for quantiles
+
+    Returns:
+        str: Metrics text for the node_exporter textfile collector
+    """
+    metrics = PrometheusMetrics(window)
+    for run in runs:
+        metrics.add(run)
+    return metrics.render()
+
+
+def write_prometheus_snapshot(
+    jsonl_path: Path = METRICS_JSONL_PATH,
+    prom_path: Path = METRICS_PROMETHEUS_PATH,
+) -> None:
+    """
+    Rewrite the Prometheus textfile from the JSON lines history.
+
+    Args:
+        jsonl_path: JSON lines metrics file
+        prom_path: Prometheus textfile to write
+    """
+    PrometheusMetrics.load(jsonl_path).write(prom_path)
+
+
+def print_run_metrics(run: RunMetrics) -> None:
+    """Print a per-model latency, token and cost summary of a run."""
+    by_model: Dict[str, List[LLMCallMetric]] = defaultdict(list)
+    for call in run.llm_calls:
+        by_model[call.model].append(call)
+
+    print("\n" + "=" * 80)
+    print("RUN METRICS")
+    print("=" * 80)
+    for model, calls in by_model.items():
+        latency = sum(c.latency_seconds for c in calls)
+        tokens_in = sum(c.prompt_tokens for c in calls)
+        tokens_out = sum(c.completion_tokens for c in calls)
+        print(
+            f"{model}: {len(calls)} call(s), {latency:.1f}s, "
+            f"~{tokens_in} in / ~{tokens_out} out tokens, ~${sum(c.cost_usd for c in calls):.4f}"
+        )
+    for agent, count in run.agent_iterations.items():
+        limit = run.agent_max_iter.get(agent)
+        print(
+            f"{agent}: {count} LLM call(s)" + (f" of max_iter {limit}" if limit else "")
+        )
+    if run.tailor_tiers:
+        print(f"Tailor tiers: {' → '.join(run.tailor_tiers)}")
+    print(f"Estimated cost: ${run.cost_usd:.4f}")
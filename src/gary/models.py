@@ -1,7 +1,27 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-# Job Model
+# Job Models
+
+
+class RemovedSection(BaseModel):
+    """A part of a job description dropped as boilerplate."""
+
+    category: str = Field(
+        ..., description="Phrase library category, e.g. eeo or benefits"
+    )
+    text: str = Field(..., description="Removed text as it appeared in the posting")
+
+
+class BoilerplateReport(BaseModel):
+    """What boilerplate stripping removed from a job description."""
+
+    original_chars: int = Field(..., description="Characters before stripping")
+    removed_chars: int = Field(..., description="Characters removed")
+    removed_tokens: int = Field(..., description="Estimated input tokens removed")
+    removed_sections: List[RemovedSection] = Field(
+        default=[], description="Removed sections, kept for audit"
+    )
 
 
 class JobDetails(BaseModel):
@@ -17,6 +37,27 @@ class JobDetails(BaseModel):
         ..., description="The full text of the job description."
     )
     date_applied: str = Field(..., description="Date applied in MM-DD-YYYY format.")
+    raw_job_description: Optional[str] = Field(
+        None,
+        exclude=True,
+        description="The description as submitted, before cleaning; not serialized.",
+    )
+    boilerplate: Optional[BoilerplateReport] = Field(
+        None,
+        description="Boilerplate removed from the job description, if stripping ran.",
+    )
+
+
+class InvalidJobRecord(BaseModel):
+    """A record of a job details file that could not be read as a posting."""
+
+    file_name: str = Field(..., description="Name of the job details file")
+    line_number: int = Field(..., description="Line of the JSONL record or CSV row")
+    error: str = Field(..., description="Why the record is invalid")
+
+    @property
+    def source(self) -> str:
+        return f"{self.file_name}:{self.line_number}"
 
 
 class Skills(BaseModel):
@@ -218,3 +259,165 @@ class ResumeValidationReport(BaseModel):
     ready_for_generation: bool = Field(
         ..., description="Whether resume is ready for Word document generation"
     )
+
+
+# Local Keyword Analysis Models
+
+
+class KeywordCount(BaseModel):
+    """Occurrences of one job keyword across resume sections."""
+
+    keyword: str = Field(..., description="Keyword from the job analysis")
+    category: str = Field(
+        ..., description="Skill category: technical, soft, management or bonus"
+    )
+    total: int = Field(0, description="Total occurrences in the resume")
+    sections: Dict[str, int] = Field(
+        default={}, description="Occurrences per resume section"
+    )
+
+
+class KeywordReport(BaseModel):
+    """Deterministic keyword integration metrics computed locally."""
+
+    keywords: List[KeywordCount] = Field(
+        default=[], description="Per-keyword counts per section"
+    )
+    keyword_analysis: KeywordIntegration = Field(
+        ..., description="Keyword integration metrics"
+    )
+
+
+# Resume Slicing Models
+
+
+class ResumeSliceReport(BaseModel):
+    """Input token savings from sending a relevance-sliced master resume."""
+
+    original_tokens: int = Field(..., description="Estimated tokens of the full resume")
+    sliced_tokens: int = Field(..., description="Estimated tokens after slicing")
+    saved_tokens: int = Field(..., description="Estimated input tokens saved")
+    items_total: int = Field(
+        ..., description="Bullets, projects and courses in the master resume"
+    )
+    items_kept: int = Field(..., description="Bullets, projects and courses kept")
+
+
+# Section Repair Models
+
+
+class SectionRepair(BaseModel):
+    """What to change in one ResumeContent section during a repair round."""
+
+    section: str = Field(..., description="ResumeContent field name")
+    add_keywords: List[str] = Field(
+        default=[], description="Missing keywords the master resume supports here"
+    )
+    reduce_keywords: Dict[str, int] = Field(
+        default={}, description="Overused keyword to its maximum uses in this section"
+    )
+    suggestions: List[str] = Field(
+        default=[], description="Validator suggestions that concern this section"
+    )
+
+
+class RepairRound(BaseModel):
+    """Outcome, token use and latency of one section repair round."""
+
+    round: int = Field(..., description="Round number, starting at 1")
+    sections: List[str] = Field(..., description="Sections regenerated")
+    prompt_tokens: int = Field(0, description="Prompt tokens of the repair calls")
+    completion_tokens: int = Field(
+        0, description="Completion tokens of the repair calls"
+    )
+    latency_seconds: float = Field(0.0, description="Wall time of the round")
+    score_before: int = Field(..., description="Overall score before the round")
+    score_after: int = Field(..., description="Overall score after local re-validation")
+    passed_validation: bool = Field(
+        ..., description="Validation verdict after the round"
+    )
+    kept: bool = Field(
+        True, description="Whether the repaired content was kept (False if worse)"
+    )
+
+
+# Section-Parallel Tailoring Models
+
+
+class SectionTiming(BaseModel):
+    """Token use and latency of tailoring one ResumeContent section."""
+
+    section: str = Field(..., description="ResumeContent field name")
+    prompt_tokens: int = Field(0, description="Prompt tokens of the section call")
+    completion_tokens: int = Field(
+        0, description="Completion tokens of the section call"
+    )
+    latency_seconds: float = Field(0.0, description="Wall time of the section call")
+
+
+class SectionTailoringReport(BaseModel):
+    """Timings of a section-parallel tailoring run."""
+
+    analysis_seconds: float = Field(
+        0.0, description="Wall time of the job analysis (0 when cached)"
+    )
+    sections: List[SectionTiming] = Field(
+        default=[], description="Per-section timings, summary last"
+    )
+    wall_seconds: float = Field(0.0, description="Wall time of the whole run")
+    single_call_seconds: Optional[float] = Field(
+        None,
+        description="Median wall time of recorded single-call tailoring runs, if any",
+    )
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(s.prompt_tokens for s in self.sections)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(s.completion_tokens for s in self.sections)
+
+    @property
+    def sequential_seconds(self) -> float:
+        """Wall time the section calls would take one after another."""
+        return self.analysis_seconds + sum(s.latency_seconds for s in self.sections)
+
+
+# Application Ledger Models
+
+
+class ApplicationRecord(BaseModel):
+    """One tailored application stored in the local ledger."""
+
+    id: int = Field(..., description="Ledger row id")
+    job_details: JobDetails = Field(..., description="The job posting applied to")
+    description_hash: str = Field(
+        ..., description="SHA-256 of the cleaned job description"
+    )
+    resume_path: Optional[str] = Field(None, description="Generated Word document")
+    report_path: Optional[str] = Field(None, description="Saved validation report")
+    passed_validation: Optional[bool] = Field(None, description="Validation verdict")
+    overall_score: Optional[int] = Field(None, description="Overall score (0-100)")
+    ats_score: Optional[int] = Field(None, description="ATS score (0-100)")
+    readability_score: Optional[int] = Field(
+        None, description="Human readability score (0-100)"
+    )
+    integration_rate: Optional[float] = Field(
+        None, description="Keyword integration rate (0-100)"
+    )
+    elapsed_seconds: Optional[float] = Field(
+        None, description="Wall time spent tailoring"
+    )
+    recorded_at: str = Field(
+        ..., description="When the application was recorded (ISO 8601)"
+    )
+
+
+class NearDuplicateMatch(BaseModel):
+    """An earlier application to a posting similar to a new one."""
+
+    record: ApplicationRecord = Field(..., description="The earlier application")
+    similarity: float = Field(
+        ..., description="Estimated Jaccard similarity of the descriptions (0-1)"
+    )
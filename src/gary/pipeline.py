@@ -0,0 +1,481 @@
+"""Shared building blocks for a single resume tailoring run."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from gary.models import (
+    ApplicationRecord,
+    JobAnalysis,
+    JobDetails,
+    KeywordReport,
+    MasterResume,
+    NearDuplicateMatch,
+    Resume,
+    ResumeContent,
+    ResumeValidationReport,
+)
+from gary.crew_pool import get_crew_pool
+from gary.config import (
+    MODEL_CASCADE_ENABLED,
+    NEAR_DUPLICATE_DETECTION_ENABLED,
+    RESUME_SLICING_ENABLED,
+    SKIP_LLM_VALIDATION_WHEN_CLEAR,
+    TAILOR_MODEL_TIERS,
+)
+from gary.exceptions import CrewExecutionError, DataLoadError, GoogleSheetsError
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.application_ledger import ApplicationLedger
+from gary.utils.local_validation import (
+    analyze_keywords,
+    apply_keyword_analysis,
+    build_local_validation_report,
+    local_verdict,
+)
+from gary.utils.near_duplicates import NearDuplicateIndex
+from gary.utils.read_json import read_tailored_resume
+from gary.utils.resume_artifact import compiled_for
+from gary.utils.resume_prompt import build_model_prompt, build_resume_prompt
+from gary.utils.resume_slicer import describe_slice_report, slice_master_resume
+from gary.utils.sheets_outbox import BufferedSheetsWriter
+
+
+def build_crew_inputs(
+    master_resume: MasterResume,
+    job_details: JobDetails,
+    cached_analysis: Optional[JobAnalysis] = None,
+) -> Dict[str, Any]:
+    """
+    Build the kickoff inputs for the Gary crew.
+
+    With a cached analysis, the master resume is sliced by relevance here;
+    otherwise the crew slices it once the job analyst has run.
+
+    Args:
+        master_resume: Parsed master resume
+        job_details: Job details with a cleaned description
+        cached_analysis: Cached job analysis to feed the tailor directly
+
+    Returns:
+        Dict[str, Any]: Inputs for the task prompt placeholders
+    """
+    if cached_analysis and RESUME_SLICING_ENABLED:
+        master_resume, slice_report = slice_master_resume(
+            master_resume, cached_analysis
+        )
+        print(f"✓ {describe_slice_report(slice_report)}")
+
+    compiled = compiled_for(master_resume)
+    inputs = {
+        "job_description": job_details.job_description,
+        "master_resume": (
+            compiled.resume_prompt if compiled else build_resume_prompt(master_resume)
+        ),
+    }
+    if cached_analysis:
+        inputs["job_analysis"] = build_model_prompt(cached_analysis)
+    return inputs
+
+
+@contextmanager
+def prepare_crew(
+    master_resume: MasterResume,
+    job_details: JobDetails,
+    analysis_cache: Optional[JobAnalysisCache] = None,
+    include_validation: bool = True,
+    tailor_tier: Optional[str] = None,
+    job_analysis: Optional[JobAnalysis] = None,
+) -> Iterator[Tuple[Any, Dict[str, Any], Optional[JobAnalysis]]]:
+    """
+    Lease a crew and build its kickoff inputs, reusing a cached job analysis if any.
+
+    On a cache hit, or when job_analysis is given, the crew skips the job
+    analyst agent. The crew comes from
+    the process-wide CrewPool and returns to it when the block exits, so it
+    must be kicked off inside the block.
+
+    Args:
+        master_resume: Parsed master resume
+        job_details: Job details with a cleaned description
+        analysis_cache: Job analysis cache to consult
+        include_validation: Whether the crew ends with the validation task (see validate_resume otherwise)
+        tailor_tier: Model tier of the tailor agent (see tailor_tiers)
+        job_analysis: Analysis to reuse instead of the cache's, e.g. from an earlier tier
+
+    Yields:
+        Tuple of the Crew, its kickoff inputs and the reused analysis (if any)
+    """
+    cached_analysis = job_analysis
+    if cached_analysis is None and analysis_cache is not None:
+        cached_analysis = analysis_cache.get(job_details.job_description)
+        if cached_analysis:
+            print(
+                f"✓ Reusing cached job analysis for {job_details.company_name} - {job_details.job_title}"
+            )
+
+    inputs = build_crew_inputs(master_resume, job_details, cached_analysis)
+    with get_crew_pool().lease(
+        master_resume, cached_analysis, include_validation, tailor_tier
+    ) as gary:
+        yield gary.crew(), inputs, cached_analysis
+
+
+def tailor_tiers() -> List[Optional[str]]:
+    """
+    List the tailor model tiers to try, in order.
+
+    Returns:
+        List[Optional[str]]: TAILOR_MODEL_TIERS names, or [None] (the
+        resume_tailor AGENT_LLM_SETTINGS) when MODEL_CASCADE_ENABLED is off
+
+    Raises:
+        ValueError: If the cascade is enabled with no tiers
+    """
+    if not MODEL_CASCADE_ENABLED:
+        return [None]
+    if not TAILOR_MODEL_TIERS:
+        raise ValueError(
+            "TAILOR_MODEL_TIERS is empty; add a tier or set MODEL_CASCADE_ENABLED = False"
+        )
+    return list(TAILOR_MODEL_TIERS)
+
+
+def needs_escalation(
+    tier: Optional[str],
+    job_analysis: Optional[JobAnalysis],
+    resume_content: ResumeContent,
+) -> bool:
+    """
+    Decide whether to tailor again with the next model tier.
+
+    A tier's resume is kept when it passes the local validation checks, or
+    when there is no stronger tier left to try.
+
+    Args:
+        tier: Tier that tailored the resume
+        job_analysis: Job analysis used for tailoring
+        resume_content: Tailored resume content
+
+    Returns:
+        bool: Whether a stronger tier should tailor the resume again
+    """
+    tiers = tailor_tiers()
+    if job_analysis is None or tier == tiers[-1]:
+        return False
+    keyword_report = analyze_keywords(job_analysis, resume_content)
+    report = build_local_validation_report(keyword_report, resume_content)
+    if report.passed_validation:
+        return False
+    next_tier = tiers[tiers.index(tier) + 1]
+    print(
+        f"↑ The {tier} tier failed local checks (score {report.overall_score}); "
+        f"tailoring again with the {next_tier} tier"
+    )
+    return True
+
+
+def extract_job_analysis(result: Any) -> Optional[JobAnalysis]:
+    """
+    Extract the job analysis from a crew result, if the analyst ran.
+
+    Args:
+        result: CrewOutput returned by kickoff
+
+    Returns:
+        Optional[JobAnalysis]: The analysis, or None if the analyst was skipped
+    """
+    for task_output in result.tasks_output:
+        if task_output.pydantic and isinstance(task_output.pydantic, JobAnalysis):
+            return task_output.pydantic
+    return None
+
+
+def cache_job_analysis(
+    result: Any,
+    job_details: JobDetails,
+    analysis_cache: Optional[JobAnalysisCache],
+) -> None:
+    """
+    Store the job analysis from a crew result in the cache.
+
+    Args:
+        result: CrewOutput returned by kickoff
+        job_details: Job details with a cleaned description
+        analysis_cache: Job analysis cache to update
+    """
+    if analysis_cache is None:
+        return
+    analysis = extract_job_analysis(result)
+    if analysis:
+        analysis_cache.put(job_details.job_description, analysis)
+
+
+def extract_crew_outputs(
+    result: Any,
+) -> Tuple[ResumeContent, Optional[ResumeValidationReport]]:
+    """
+    Extract the tailored resume content and validation report from a crew result.
+
+    The crew returns the last task's output (validation report), so the resume
+    content has to be read from the resume_tailoring_task output.
+
+    Args:
+        result: CrewOutput returned by kickoff
+
+    Returns:
+        Tuple of the tailored ResumeContent and the validation report, if any
+
+    Raises:
+        CrewExecutionError: If the resume content is missing from the crew output
+    """
+    resume_content_output = None
+    validation_report_output = None
+
+    for task_output in result.tasks_output:
+        if task_output.pydantic and isinstance(task_output.pydantic, ResumeContent):
+            resume_content_output = task_output.pydantic
+        elif task_output.pydantic and isinstance(
+            task_output.pydantic, ResumeValidationReport
+        ):
+            validation_report_output = task_output.pydantic
+
+    if not resume_content_output:
+        raise CrewExecutionError("Resume content not found in crew output")
+
+    return resume_content_output, validation_report_output
+
+
+def finalize_validation_report(
+    job_analysis: Optional[JobAnalysis],
+    resume_content: ResumeContent,
+    validation_report: Optional[ResumeValidationReport],
+) -> Tuple[Optional[ResumeValidationReport], Optional[KeywordReport]]:
+    """
+    Fill the keyword metrics of the validation report from local analysis.
+
+    If the LLM validator ran, its keyword counts are replaced with the local
+    ones. If it was skipped because the local verdict was clear, the report
+    is built entirely from local scores.
+
+    Args:
+        job_analysis: Job analysis used for tailoring
+        resume_content: Tailored resume content
+        validation_report: Report from the LLM validator, if it ran
+
+    Returns:
+        Tuple of the final validation report and the local keyword report
+    """
+    if job_analysis is None:
+        return validation_report, None
+
+    keyword_report = analyze_keywords(job_analysis, resume_content)
+    if validation_report:
+        validation_report = apply_keyword_analysis(validation_report, keyword_report)
+    else:
+        validation_report = build_local_validation_report(
+            keyword_report, resume_content
+        )
+    return validation_report, keyword_report
+
+
+def validate_resume(
+    job_analysis: Optional[JobAnalysis], resume_content: ResumeContent
+) -> Tuple[Optional[ResumeValidationReport], Optional[KeywordReport]]:
+    """
+    Validate tailored content outside the tailoring crew.
+
+    The LLM validator only runs when local keyword checks are inconclusive
+    (or SKIP_LLM_VALIDATION_WHEN_CLEAR is off); its keyword metrics are then
+    replaced with local ones as in finalize_validation_report.
+
+    Args:
+        job_analysis: Job analysis used for tailoring
+        resume_content: Tailored resume content
+
+    Returns:
+        Tuple of the final validation report and the local keyword report
+    """
+    if job_analysis is None:
+        return None, None
+
+    validation_report = None
+    if (
+        not SKIP_LLM_VALIDATION_WHEN_CLEAR
+        or local_verdict(job_analysis, resume_content) is None
+    ):
+        with get_crew_pool().lease() as gary:
+            result = gary.validation_crew().kickoff(
+                inputs={
+                    "job_analysis": build_model_prompt(job_analysis),
+                    "tailored_resume": build_model_prompt(resume_content),
+                }
+            )
+        if isinstance(result.pydantic, ResumeValidationReport):
+            validation_report = result.pydantic
+    return finalize_validation_report(job_analysis, resume_content, validation_report)
+
+
+def open_near_duplicate_index(
+    ledger: ApplicationLedger,
+) -> Optional[NearDuplicateIndex]:
+    """
+    Open the near-duplicate index and bring it up to date with the ledger.
+
+    Args:
+        ledger: Application ledger
+
+    Returns:
+        Optional[NearDuplicateIndex]: The index, or None when
+        NEAR_DUPLICATE_DETECTION_ENABLED is off
+    """
+    if not NEAR_DUPLICATE_DETECTION_ENABLED:
+        return None
+    index = NearDuplicateIndex()
+    indexed = index.sync(ledger)
+    if indexed:
+        print(f"✓ Indexed {indexed} application(s) for near-duplicate detection")
+    return index
+
+
+def find_near_duplicates(
+    job_details: JobDetails,
+    ledger: ApplicationLedger,
+    index: NearDuplicateIndex,
+    exclude_ids: Sequence[int] = (),
+) -> List[NearDuplicateMatch]:
+    """
+    Find earlier applications to postings similar to this one.
+
+    Applications recorded since the index was last synced are indexed first.
+
+    Args:
+        job_details: Posting about to be tailored
+        ledger: Application ledger
+        index: Near-duplicate index
+        exclude_ids: Ledger ids to leave out, e.g. exact duplicates already reported
+
+    Returns:
+        List[NearDuplicateMatch]: Matches at or above the index threshold,
+        most similar first
+    """
+    index.sync(ledger)
+    matches = []
+    for record_id, similarity in index.query(job_details.job_description, exclude_ids):
+        record = ledger.get(record_id)
+        if record:
+            matches.append(NearDuplicateMatch(record=record, similarity=similarity))
+    return matches
+
+
+def load_reusable_outputs(
+    record: ApplicationRecord, analysis_cache: Optional[JobAnalysisCache]
+) -> Tuple[Optional[JobAnalysis], Optional[ResumeContent]]:
+    """
+    Load the job analysis and tailored content of an earlier application.
+
+    The analysis is read from the cache under the earlier description, and
+    the content from the resume JSON saved next to its Word document. Either
+    may be gone, e.g. evicted from the cache or deleted with the document.
+
+    Args:
+        record: Earlier application
+        analysis_cache: Job analysis cache to consult
+
+    Returns:
+        Tuple of the job analysis and tailored content, each None if unavailable
+    """
+    analysis = None
+    if analysis_cache is not None:
+        analysis = analysis_cache.get(record.job_details.job_description)
+
+    resume_content = None
+    if record.resume_path:
+        try:
+            resume = read_tailored_resume(Path(record.resume_path).with_suffix(".json"))
+            resume_content = resume.resume_content
+        except DataLoadError:
+            pass
+    return analysis, resume_content
+
+
+def build_final_resume(
+    master_resume: MasterResume,
+    resume_content: ResumeContent,
+    job_details: JobDetails,
+) -> Resume:
+    """
+    Combine the master resume header with tailored content.
+
+    The header location is updated to match the job location.
+
+    Args:
+        master_resume: Parsed master resume
+        resume_content: Tailored resume content
+        job_details: Job details for the target posting
+
+    Returns:
+        Resume: Final resume ready for document generation
+    """
+    header = master_resume.header.model_copy()
+    header.location = job_details.location
+    return Resume(header=header, resume_content=resume_content)
+
+
+def build_sheets_row(job_details: JobDetails, status: str = "Done") -> List[str]:
+    """
+    Build the Google Sheets tracker row for a job application.
+
+    Args:
+        job_details: Job details for the application
+        status: Application status column value
+
+    Returns:
+        List[str]: Row values in tracker column order
+    """
+    return [
+        job_details.date_applied,
+        job_details.company_name,
+        job_details.job_title,
+        job_details.location,
+        job_details.job_id or "",
+        job_details.job_description,
+        status,
+    ]
+
+
+def mirror_ledger_to_sheets(
+    ledger: ApplicationLedger, sheets_writer: Optional[BufferedSheetsWriter] = None
+) -> None:
+    """
+    Copy ledger applications not yet in Google Sheets to the sheet.
+
+    New rows are moved into the Sheets outbox and flushed together with any
+    rows left over from earlier runs. Sheets failures are reported but not
+    raised; the rows stay in the outbox for the next run. Outbox rows are
+    keyed by ledger id, so applications queued by a run that stopped before
+    marking them mirrored are not queued twice.
+
+    Args:
+        ledger: Application ledger
+        sheets_writer: Writer to queue and flush rows with (default: a
+            BufferedSheetsWriter on the default outbox)
+    """
+    if sheets_writer is None:
+        sheets_writer = BufferedSheetsWriter()
+    records = ledger.unmirrored()
+    if records:
+        sheets_writer.append_many(
+            [build_sheets_row(r.job_details) for r in records],
+            ledger_ids=[r.id for r in records],
+        )
+        ledger.mark_mirrored([r.id for r in records])
+    if not len(sheets_writer.outbox):
+        return
+    try:
+        written = sheets_writer.flush()
+        print(f"✓ {written} row(s) logged to Google Sheets")
+    except GoogleSheetsError as e:
+        print(f"✗ Failed to log to Google Sheets: {e}")
+        print(
+            f"  {len(sheets_writer.outbox)} row(s) kept in the local outbox "
+            "and will be sent on the next run"
+        )
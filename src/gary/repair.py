@@ -0,0 +1,327 @@
+"""Section repair: fix a resume that failed validation one section at a time."""
+
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from gary.config import MAX_KEYWORD_USES, REPAIR_MAX_ROUNDS
+from gary.crew import Gary
+from gary.crew_pool import get_crew_pool
+from gary.metrics import crew_usage
+from gary.models import (
+    JobAnalysis,
+    KeywordReport,
+    MasterResume,
+    RepairRound,
+    ResumeContent,
+    ResumeValidationReport,
+    SectionRepair,
+)
+from gary.utils.keyword_matcher import KeywordMatcher
+from gary.utils.local_validation import (
+    analyze_keywords,
+    build_local_validation_report,
+    resume_section_texts,
+)
+from gary.utils.resume_prompt import build_sections_prompt
+
+# Sections a missing keyword is added to, in order of preference: the first
+# one whose master resume text contains the keyword
+KEYWORD_SECTIONS = (
+    "skills",
+    "work_experience",
+    "projects",
+    "professional_summary",
+    "education",
+)
+
+# Master resume sections sent as the source for regenerating each section
+SOURCE_SECTIONS = {
+    "professional_summary": ["professional_summary", "work_experience", "skills"],
+    "work_experience": ["work_experience", "skills"],
+    "skills": ["skills", "work_experience", "projects"],
+    "projects": ["projects", "skills"],
+    "education": ["education"],
+}
+
+# Validator suggestions are routed to the sections they mention
+_SUGGESTION_PATTERNS = {
+    "professional_summary": re.compile(r"\bsummary\b", re.IGNORECASE),
+    "work_experience": re.compile(
+        r"\b(work experience|bullets?|responsibilit\w*|achievements?|"
+        r"metrics?|quantif\w*)\b",
+        re.IGNORECASE,
+    ),
+    "skills": re.compile(r"\bskills? (section|list)\b", re.IGNORECASE),
+    "projects": re.compile(r"\bprojects?\b", re.IGNORECASE),
+    "education": re.compile(r"\b(education|coursework|degree)\b", re.IGNORECASE),
+}
+
+# Fields that identify an entry and must survive a repair unchanged
+_IDENTITY_FIELDS = {
+    "work_experience": ("title", "company", "startDate", "endDate"),
+    "education": ("degree", "institution", "startDate", "endDate"),
+}
+
+
+def _keyword_limits(sections: Dict[str, int], excess: int) -> Dict[str, int]:
+    """
+    Spread the uses of an overused keyword to remove across its sections.
+
+    Sections with the most uses give up uses first and keep at least one,
+    unless removing the excess needs more.
+
+    Args:
+        sections: Uses of the keyword per section
+        excess: Uses to remove
+
+    Returns:
+        Dict[str, int]: Maximum uses per section that has to change
+    """
+    limits = {}
+    ranked = sorted(sections.items(), key=lambda item: -item[1])
+    for section, uses in ranked:
+        cut = min(excess, uses - 1)
+        if cut > 0:
+            limits[section] = uses - cut
+            excess -= cut
+    if excess > 0 and ranked:
+        section, uses = ranked[0]
+        limits[section] = max(0, limits.get(section, uses) - excess)
+    return limits
+
+
+def plan_repairs(
+    validation_report: ResumeValidationReport,
+    keyword_report: KeywordReport,
+    master_resume: MasterResume,
+) -> List[SectionRepair]:
+    """
+    Work out which sections to regenerate and what to change in each.
+
+    A missing technical keyword goes to the first section in KEYWORD_SECTIONS
+    whose master resume text contains it; keywords the master resume does
+    not support are left out rather than invented. Overused keywords are
+    capped in the sections using them most, and suggestions go to the
+    sections they mention.
+
+    Args:
+        validation_report: Failed validation report
+        keyword_report: Local keyword analysis of the same content
+        master_resume: Parsed master resume
+
+    Returns:
+        List[SectionRepair]: Repairs in ResumeContent field order, empty if
+        nothing can be fixed section by section
+    """
+    repairs: Dict[str, SectionRepair] = {}
+
+    def repair(section: str) -> SectionRepair:
+        return repairs.setdefault(section, SectionRepair(section=section))
+
+    missing = validation_report.keyword_analysis.missing_critical_keywords
+    if missing:
+        matcher = KeywordMatcher(missing)
+        master_texts = resume_section_texts(master_resume)
+        unplaced = set(range(len(matcher.keywords)))
+        for section in KEYWORD_SECTIONS:
+            counts = matcher.count(" \n ".join(master_texts[section]))
+            for index in sorted(unplaced):
+                if counts[index]:
+                    repair(section).add_keywords.append(matcher.keywords[index])
+                    unplaced.discard(index)
+
+    counts = {k.keyword.lower(): k for k in keyword_report.keywords}
+    for keyword in validation_report.keyword_analysis.forced_keywords:
+        count = counts.get(keyword.lower())
+        if count is None or not count.sections:
+            continue
+        excess = max(1, count.total - MAX_KEYWORD_USES)
+        for section, limit in _keyword_limits(count.sections, excess).items():
+            repair(section).reduce_keywords[count.keyword] = limit
+
+    for suggestion in validation_report.feedback.suggestions:
+        for section, pattern in _SUGGESTION_PATTERNS.items():
+            if pattern.search(suggestion):
+                repair(section).suggestions.append(suggestion)
+
+    return [repairs[s] for s in ResumeContent.model_fields if s in repairs]
+
+
+def build_repair_instructions(repair: SectionRepair) -> str:
+    """
+    Describe a section repair as a bulleted list for the repair prompt.
+
+    Args:
+        repair: Planned section repair
+
+    Returns:
+        str: One line per fix
+    """
+    lines = []
+    if repair.add_keywords:
+        lines.append(
+            "- Add these missing keywords, which the source supports: "
+            + ", ".join(repair.add_keywords)
+        )
+    for keyword, limit in repair.reduce_keywords.items():
+        if limit:
+            lines.append(f'- Use "{keyword}" at most {limit} times in this section')
+        else:
+            lines.append(f'- Remove "{keyword}" from this section')
+    lines.extend(f"- {suggestion}" for suggestion in repair.suggestions)
+    return "\n".join(lines)
+
+
+def _keeps_structure(section: str, before: Any, after: Any) -> bool:
+    """Whether a regenerated section kept its entries and their identity."""
+    fields = _IDENTITY_FIELDS.get(section)
+    if fields is None:
+        return True
+
+    def identity(entries: List[Any]) -> List[Tuple[str, ...]]:
+        return [tuple(getattr(entry, f) for f in fields) for entry in entries]
+
+    return identity(before) == identity(after)
+
+
+def repair_section(
+    gary: Gary,
+    repair: SectionRepair,
+    resume_content: ResumeContent,
+    master_resume: MasterResume,
+) -> Tuple[Optional[Any], Dict[str, int]]:
+    """
+    Regenerate one section with the section repair crew.
+
+    Args:
+        gary: Gary container leased from the crew pool
+        repair: Planned section repair
+        resume_content: Current tailored content
+        master_resume: Parsed master resume
+
+    Returns:
+        Tuple of the new section value (None if the output was unusable or
+        changed the section's entries) and the crew's token usage
+    """
+    section = repair.section
+    crew = gary.repair_crew(section)
+    result = crew.kickoff(
+        inputs={
+            "section": section,
+            "instructions": build_repair_instructions(repair),
+            "max_keyword_uses": MAX_KEYWORD_USES,
+            "section_content": build_sections_prompt(resume_content, [section]),
+            "master_section": build_sections_prompt(
+                master_resume, SOURCE_SECTIONS[section]
+            ),
+        }
+    )
+    usage = crew_usage(crew.usage_metrics)
+
+    value = getattr(result.pydantic, section, None)
+    if value is None:
+        print(f"✗ Repair of {section} returned no usable output")
+    elif not _keeps_structure(section, getattr(resume_content, section), value):
+        print(f"✗ Discarded the repaired {section}: its entries changed")
+        value = None
+    return value, usage
+
+
+def describe_repair_round(repair_round: RepairRound) -> str:
+    """
+    Summarize a repair round in one line.
+
+    Args:
+        repair_round: Outcome of the round
+
+    Returns:
+        str: Sections, tokens, latency and score change
+    """
+    outcome = "passed" if repair_round.passed_validation else "failed"
+    if not repair_round.kept:
+        outcome = "reverted"
+    return (
+        f"Repair round {repair_round.round}: {', '.join(repair_round.sections)} "
+        f"({repair_round.prompt_tokens:,} prompt + "
+        f"{repair_round.completion_tokens:,} completion tokens, "
+        f"{repair_round.latency_seconds:.1f}s), score "
+        f"{repair_round.score_before} → {repair_round.score_after} ({outcome})"
+    )
+
+
+def repair_resume(
+    job_analysis: JobAnalysis,
+    resume_content: ResumeContent,
+    validation_report: ResumeValidationReport,
+    master_resume: MasterResume,
+    max_rounds: int = REPAIR_MAX_ROUNDS,
+) -> Tuple[ResumeContent, ResumeValidationReport, KeywordReport, List[RepairRound]]:
+    """
+    Regenerate the sections behind a failed validation until it passes.
+
+    Each round plans repairs from the latest report, regenerates only the
+    affected sections and re-validates the result locally. A round whose
+    content scores lower than before is reverted and ends the loop; so do a
+    round that does not raise the score, a passing report, an empty plan and
+    max_rounds.
+
+    Args:
+        job_analysis: Job analysis used for tailoring
+        resume_content: Tailored content that failed validation
+        validation_report: Failed validation report (LLM or local)
+        master_resume: Parsed master resume
+        max_rounds: Maximum number of repair rounds
+
+    Returns:
+        Tuple of the final content, its validation report (the input report
+        when no round was kept), its keyword report and the rounds run
+    """
+    keyword_report = analyze_keywords(job_analysis, resume_content)
+    # Rounds are compared on local scores, whichever validator failed the resume
+    local_report = build_local_validation_report(keyword_report, resume_content)
+    report = validation_report
+    rounds: List[RepairRound] = []
+
+    for number in range(1, max_rounds + 1):
+        if report.passed_validation:
+            break
+        plan = plan_repairs(report, keyword_report, master_resume)
+        if not plan:
+            break
+
+        start = time.perf_counter()
+        candidate = resume_content
+        prompt_tokens = completion_tokens = 0
+        with get_crew_pool().lease() as gary:
+            for repair in plan:
+                value, usage = repair_section(gary, repair, candidate, master_resume)
+                prompt_tokens += usage.get("prompt_tokens", 0)
+                completion_tokens += usage.get("completion_tokens", 0)
+                if value is not None:
+                    candidate = candidate.model_copy(update={repair.section: value})
+
+        candidate_keywords = analyze_keywords(job_analysis, candidate)
+        candidate_report = build_local_validation_report(candidate_keywords, candidate)
+        kept = candidate_report.overall_score >= local_report.overall_score
+        repair_round = RepairRound(
+            round=number,
+            sections=[repair.section for repair in plan],
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_seconds=round(time.perf_counter() - start, 3),
+            score_before=local_report.overall_score,
+            score_after=candidate_report.overall_score,
+            passed_validation=candidate_report.passed_validation,
+            kept=kept,
+        )
+        rounds.append(repair_round)
+        print(f"{'✓' if kept else '✗'} {describe_repair_round(repair_round)}")
+        if not kept:
+            break
+        improved = candidate_report.overall_score > local_report.overall_score
+        resume_content, keyword_report = candidate, candidate_keywords
+        report = local_report = candidate_report
+        if not improved:
+            break
+
+    return resume_content, report, keyword_report, rounds
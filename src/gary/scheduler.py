@@ -0,0 +1,256 @@
+"""Asyncio scheduler that runs pipeline stages as a dependency graph."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pydantic import BaseModel, Field
+
+
+class StageTiming(BaseModel):
+    """Wall-clock timing of one pipeline stage."""
+
+    name: str = Field(..., description="Stage name")
+    started: float = Field(..., description="Start offset from pipeline start (s)")
+    finished: float = Field(..., description="End offset from pipeline start (s)")
+    status: str = Field(..., description="done, failed or cancelled")
+
+    @property
+    def seconds(self) -> float:
+        return self.finished - self.started
+
+
+class _Stage(BaseModel):
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...]
+    optional: bool
+    inline: bool
+    interactive: bool
+
+
+async def _in_daemon_thread(func: Callable[[], Any], name: str) -> Any:
+    """
+    Await func called in a new daemon thread.
+
+    Unlike asyncio.to_thread, the process can exit while func is still
+    blocked, e.g. in input() when the run is interrupted.
+
+    Args:
+        func: Function to call
+        name: Thread name
+
+    Returns:
+        Any: The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    context = contextvars.copy_context()
+
+    def settle(value: Any, error: Optional[BaseException]) -> None:
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def target() -> None:
+        value, error = None, None
+        try:
+            value = context.run(func)
+        except BaseException as exc:
+            error = exc
+        try:
+            loop.call_soon_threadsafe(settle, value, error)
+        except RuntimeError:
+            pass  # The run was interrupted and its loop closed
+
+    threading.Thread(target=target, name=name, daemon=True).start()
+    return await future
+
+
+class PipelineScheduler:
+    """
+    Runs stages as soon as the stages they depend on have finished.
+
+    Each stage is a function taking the results of all finished stages, keyed
+    by stage name. Coroutine functions are awaited; plain functions run in a
+    worker thread so independent stages overlap. Interactive stages (terminal
+    prompts, the streamed crew kickoff) run one at a time in a daemon thread,
+    which an interrupted run abandons instead of waiting for a pending
+    input() or LLM call. Inline stages run on the event loop thread, and must
+    be cheap and never block.
+
+    If a required stage fails, the remaining stages are cancelled and its
+    exception is raised. A failed optional stage records None as its result.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, _Stage] = {}
+        self.timings: Dict[str, StageTiming] = {}
+        self._start = 0.0
+        self._terminal: Optional[asyncio.Lock] = None
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        deps: Sequence[str] = (),
+        optional: bool = False,
+        inline: bool = False,
+        interactive: bool = False,
+    ) -> None:
+        """
+        Register a stage.
+
+        Args:
+            name: Unique stage name
+            func: Stage function, called with the results of finished stages
+            deps: Names of stages that must finish first
+            optional: Whether a failure is tolerated (the result becomes None)
+            inline: Run a cheap, non-blocking plain function on the event loop thread
+            interactive: Run a plain function that uses the terminal in a daemon thread
+
+        Raises:
+            ValueError: If the name is taken or a dependency is not registered yet
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        unknown = [d for d in deps if d not in self._stages]
+        if unknown:
+            raise ValueError(f"Stage {name} depends on unknown stages: {unknown}")
+        if inline and interactive:
+            raise ValueError(f"Stage {name} cannot be both inline and interactive")
+        self._stages[name] = _Stage(
+            name=name,
+            func=func,
+            deps=tuple(deps),
+            optional=optional,
+            inline=inline,
+            interactive=interactive,
+        )
+
+    def elapsed(self) -> float:
+        """Seconds since the pipeline started."""
+        return time.perf_counter() - self._start
+
+    async def _run_stage(
+        self, stage: _Stage, tasks: Dict[str, asyncio.Task], results: Dict[str, Any]
+    ) -> Any:
+        await asyncio.gather(*(tasks[d] for d in stage.deps))
+
+        started = self.elapsed()
+        finished = None
+
+        def timed_call() -> Any:
+            # Timed inside the worker so a blocked event loop does not skew it
+            nonlocal started, finished
+            started = self.elapsed()
+            try:
+                return stage.func(results)
+            finally:
+                finished = self.elapsed()
+
+        status = "failed"
+        try:
+            if asyncio.iscoroutinefunction(stage.func):
+                value = await stage.func(results)
+                finished = self.elapsed()
+            elif stage.inline:
+                # Let every other ready stage reach its worker thread first
+                await asyncio.sleep(0)
+                value = timed_call()
+            elif stage.interactive:
+                # One stage owns the terminal at a time
+                async with self._terminal:
+                    value = await _in_daemon_thread(timed_call, stage.name)
+            else:
+                value = await asyncio.to_thread(timed_call)
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception:
+            if not stage.optional:
+                raise
+            value = None
+        else:
+            status = "done"
+        finally:
+            self.timings[stage.name] = StageTiming(
+                name=stage.name,
+                started=started,
+                finished=self.elapsed() if finished is None else finished,
+                status=status,
+            )
+        results[stage.name] = value
+        return value
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run every stage, overlapping stages that do not depend on each other.
+
+        Returns:
+            Dict[str, Any]: Result of each stage, keyed by name
+        """
+        self._start = time.perf_counter()
+        self.timings = {}
+        self._terminal = asyncio.Lock()
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        # Stages are registered after their dependencies, so this order is
+        # topological and every dependency task exists when it is awaited
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.create_task(
+                self._run_stage(stage, tasks, results), name=stage.name
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return results
+
+    def critical_path(self) -> List[str]:
+        """
+        Return the chain of stages that determined the total wall time.
+
+        Starting from the stage that finished last, each step follows the
+        dependency that finished last.
+
+        Returns:
+            List[str]: Stage names from first to last
+        """
+        finished = {n: t for n, t in self.timings.items() if t.status == "done"}
+        if not finished:
+            return []
+        name = max(finished, key=lambda n: finished[n].finished)
+        path = [name]
+        while True:
+            deps = [d for d in self._stages[name].deps if d in finished]
+            if not deps:
+                break
+            name = max(deps, key=lambda d: finished[d].finished)
+            path.append(name)
+        return path[::-1]
+
+    def print_report(self) -> None:
+        """Print per-stage wall time and the critical path."""
+        critical = set(self.critical_path())
+        print("\n" + "=" * 80)
+        print("PIPELINE STAGES")
+        print("=" * 80)
+        for timing in sorted(self.timings.values(), key=lambda t: t.started):
+            mark = "*" if timing.name in critical else " "
+            print(
+                f"{mark} {timing.name:<14} start {timing.started:7.2f}s  "
+                f"wall {timing.seconds:7.2f}s  {timing.status}"
+            )
+        path = self.critical_path()
+        if path:
+            total = self.timings[path[-1]].finished
+            print(f"\nCritical path ({total:.1f}s): {' → '.join(path)}")
@@ -0,0 +1,244 @@
+"""Section-parallel tailoring: one concurrent LLM call per resume section.
+
+The single tailoring call writes the whole ResumeContent in one long
+response, so its latency grows with the length of the resume. Here the job
+analysis is computed (or read from the cache) first, then the work
+experience, skills, projects and education sections are tailored
+concurrently, each from its own slice of the master resume. The professional
+summary is written last, from the finished sections, and the sections are
+merged and validated as one ResumeContent.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from pydantic import ValidationError
+from gary.config import (
+    METRICS_ENABLED,
+    RESUME_SLICING_ENABLED,
+    SECTION_TAILORING_CONCURRENCY,
+)
+from gary.crew import Gary
+from gary.crew_pool import get_crew_pool
+from gary.exceptions import CrewExecutionError
+from gary.metrics import (
+    MetricsRecorder,
+    RunMetrics,
+    crew_usage,
+    single_call_tailoring_seconds,
+)
+from gary.models import (
+    JobAnalysis,
+    JobDetails,
+    MasterResume,
+    ProfessionalSummary,
+    ResumeContent,
+    SectionTailoringReport,
+    SectionTiming,
+)
+from gary.repair import SOURCE_SECTIONS
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.resume_prompt import build_model_prompt, build_sections_prompt
+from gary.utils.resume_slicer import describe_slice_report, slice_master_resume
+
+# Sections tailored concurrently; the professional summary follows them
+PARALLEL_SECTIONS = ("work_experience", "skills", "projects", "education")
+SUMMARY_SECTION = "professional_summary"
+
+
+def merge_sections(sections: Dict[str, Any]) -> ResumeContent:
+    """
+    Assemble tailored sections into one validated ResumeContent.
+
+    Args:
+        sections: Section values keyed by ResumeContent field name
+
+    Returns:
+        ResumeContent: Merged content
+
+    Raises:
+        CrewExecutionError: If a section is missing or does not validate
+    """
+    missing = [s for s in ResumeContent.model_fields if s not in sections]
+    if missing:
+        raise CrewExecutionError(f"Sections missing from tailoring: {missing}")
+    try:
+        return ResumeContent.model_validate(sections)
+    except ValidationError as e:
+        raise CrewExecutionError(f"Tailored sections do not form a resume: {e}")
+
+
+def _tailor_section(
+    gary: Gary, section: str, inputs: Dict[str, Any]
+) -> Tuple[Any, SectionTiming]:
+    """
+    Kick off one section crew.
+
+    Args:
+        gary: Gary container whose section crews are built
+        section: ResumeContent field name
+        inputs: Kickoff inputs
+
+    Returns:
+        Tuple of the section value and its timing
+
+    Raises:
+        CrewExecutionError: If the output has no such section
+    """
+    start = time.perf_counter()
+    crew = gary.section_crew(section)
+    result = crew.kickoff(inputs=inputs)
+    usage = crew_usage(crew.usage_metrics)
+    value = getattr(result.pydantic, section, None)
+    if value is None:
+        raise CrewExecutionError(f"{section} not found in section output")
+    timing = SectionTiming(
+        section=section,
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+        latency_seconds=round(time.perf_counter() - start, 3),
+    )
+    print(f"✓ Tailored {section} ({timing.latency_seconds:.1f}s)")
+    return value, timing
+
+
+def tailor_by_section(
+    master_resume: MasterResume,
+    job_details: JobDetails,
+    analysis_cache: Optional[JobAnalysisCache] = None,
+    max_workers: int = SECTION_TAILORING_CONCURRENCY,
+    recorder: Optional[MetricsRecorder] = None,
+    run_metrics: Optional[RunMetrics] = None,
+    job_analysis: Optional[JobAnalysis] = None,
+) -> Tuple[ResumeContent, JobAnalysis, SectionTailoringReport]:
+    """
+    Tailor a resume with one concurrent crew per section.
+
+    Args:
+        master_resume: Parsed master resume
+        job_details: Job details with a cleaned description
+        analysis_cache: Job analysis cache to consult and update
+        max_workers: Section crews running at once
+        recorder: Metrics recorder; with run_metrics, LLM calls on the
+            section threads are reported into run_metrics
+        run_metrics: Metrics of the run
+        job_analysis: Analysis to use instead of the cache's, e.g. from a
+            near-duplicate posting
+
+    Returns:
+        Tuple of the merged content, the job analysis and the timings
+
+    Raises:
+        CrewExecutionError: If the analysis or a section is missing from its output
+    """
+    start = time.perf_counter()
+    report = SectionTailoringReport()
+
+    def in_scope(func: Any, *args: Any) -> Any:
+        if recorder is not None and run_metrics is not None:
+            return recorder.call_in_scope(run_metrics, func, *args)
+        return func(*args)
+
+    if job_analysis is None and analysis_cache is not None:
+        job_analysis = analysis_cache.get(job_details.job_description)
+        if job_analysis:
+            print(
+                f"✓ Reusing cached job analysis for {job_details.company_name} - {job_details.job_title}"
+            )
+
+    with get_crew_pool().lease(master_resume, job_analysis) as gary:
+        if job_analysis is None:
+            result = in_scope(
+                gary.analysis_crew().kickoff,
+                {"job_description": job_details.job_description},
+            )
+            if not isinstance(result.pydantic, JobAnalysis):
+                raise CrewExecutionError("Job analysis not found in crew output")
+            job_analysis = result.pydantic
+            report.analysis_seconds = round(time.perf_counter() - start, 3)
+            if analysis_cache is not None:
+                analysis_cache.put(job_details.job_description, job_analysis)
+
+        source = master_resume
+        if RESUME_SLICING_ENABLED:
+            source, slice_report = slice_master_resume(master_resume, job_analysis)
+            print(f"✓ {describe_slice_report(slice_report)}")
+        analysis_prompt = build_model_prompt(job_analysis)
+
+        # Built up front: crews are cached on the container, which is not
+        # safe to populate from several threads
+        for section in (*PARALLEL_SECTIONS, SUMMARY_SECTION):
+            gary.section_crew(section)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                section: pool.submit(
+                    in_scope,
+                    _tailor_section,
+                    gary,
+                    section,
+                    {
+                        "job_analysis": analysis_prompt,
+                        "master_section": build_sections_prompt(
+                            source, SOURCE_SECTIONS[section]
+                        ),
+                    },
+                )
+                for section in PARALLEL_SECTIONS
+            }
+            sections = {}
+            for section, future in futures.items():
+                sections[section], timing = future.result()
+                report.sections.append(timing)
+
+        # The summary introduces the finished sections, so it comes last
+        tailored = merge_sections(
+            {**sections, SUMMARY_SECTION: ProfessionalSummary(summary="")}
+        )
+        sections[SUMMARY_SECTION], timing = in_scope(
+            _tailor_section,
+            gary,
+            SUMMARY_SECTION,
+            {
+                "job_analysis": analysis_prompt,
+                "tailored_sections": build_sections_prompt(
+                    tailored, list(PARALLEL_SECTIONS)
+                ),
+                "master_section": build_sections_prompt(
+                    source, SOURCE_SECTIONS[SUMMARY_SECTION]
+                ),
+            },
+        )
+        report.sections.append(timing)
+
+    report.wall_seconds = round(time.perf_counter() - start, 3)
+    if METRICS_ENABLED:
+        report.single_call_seconds = single_call_tailoring_seconds()
+    return merge_sections(sections), job_analysis, report
+
+
+def describe_section_report(report: SectionTailoringReport) -> str:
+    """
+    Summarize a section-parallel run against single-call tailoring.
+
+    The baseline is the median wall time of the single-call runs in the
+    metrics history. Without one (no such run recorded, or metrics off),
+    the run is compared with its own calls made one after another, which
+    only shows what the concurrency saved.
+
+    Args:
+        report: Timings of the run
+
+    Returns:
+        str: Wall time, baseline time and speedup
+    """
+    if report.single_call_seconds:
+        baseline, label = report.single_call_seconds, "median single call"
+    else:
+        baseline, label = report.sequential_seconds, "one after another"
+    speedup = baseline / report.wall_seconds if report.wall_seconds else 1.0
+    tokens = report.prompt_tokens + report.completion_tokens
+    return (
+        f"Tailored {len(report.sections)} sections in {report.wall_seconds:.1f}s "
+        f"({baseline:.1f}s {label}, {speedup:.1f}x; {tokens:,} tokens)"
+    )
@@ -0,0 +1,562 @@
+"""Service mode: a local HTTP daemon that tailors resumes for submitted postings.
+
+Startup costs (imports, master resume, crew construction, LLM and Sheets
+connections) are paid once. Submitted postings are queued and processed by
+a bounded pool of workers that lease warm crews from the CrewPool, using the
+same per-posting flow as batch mode.
+
+API (JSON unless noted):
+    POST /jobs                 Submit a posting (JobDetails fields, plus an
+                               optional "allow_duplicate" to also bypass
+                               near-duplicate handling); returns 202, or
+                               411 without a Content-Length header
+    GET  /jobs                 List submitted jobs
+    GET  /jobs/<id>            Job status and result
+    GET  /jobs/<id>/resume     Generated Word document (.docx)
+    GET  /jobs/<id>/report     Validation report
+    GET  /health               Queue and worker counts
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socketserver
+import threading
+import uuid
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from gary.batch import BatchJobResult, _process_job, resolve_near_duplicate
+from gary.config import (
+    METRICS_ENABLED,
+    NEAR_DUPLICATE_ACTION,
+    SERVE_MAX_QUEUED_JOBS,
+    SERVE_MAX_REQUEST_BYTES,
+    SERVE_WORKERS,
+)
+from gary.crew_pool import get_crew_pool, warm_llm_connections
+from gary.exceptions import ServiceUnavailableError
+from gary.metrics import MetricsRecorder, PrometheusMetrics
+from gary.models import JobDetails
+from gary.pipeline import (
+    find_near_duplicates,
+    mirror_ledger_to_sheets,
+    open_near_duplicate_index,
+    tailor_tiers,
+)
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.application_ledger import ApplicationLedger
+from gary.utils.read_job_details import job_details_from_record
+from gary.utils.resume_artifact import load_compiled_resume
+
+DOCX_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+
+class ServeJob(BaseModel):
+    """A posting submitted to the tailoring service and its progress."""
+
+    id: str = Field(..., description="Job identifier assigned on submission")
+    status: str = Field(
+        "queued",
+        description="queued, running, succeeded, failed or skipped",
+    )
+    job_details: JobDetails = Field(..., description="The submitted posting")
+    allow_duplicate: bool = Field(
+        False,
+        description="Tailor even if the posting or a near-duplicate is in the ledger",
+    )
+    submitted_at: str = Field(..., description="Submission time (ISO 8601)")
+    started_at: Optional[str] = Field(None, description="Processing start time")
+    finished_at: Optional[str] = Field(None, description="Processing end time")
+    result: Optional[BatchJobResult] = Field(
+        None, description="Outcome, once the job has finished"
+    )
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class TailoringService:
+    """
+    Job queue and worker pool behind `gary serve`.
+
+    Workers run on one asyncio event loop in a background thread; each takes
+    the next queued job and runs it through the batch-mode job flow. Job
+    state is kept in memory and can be read from any thread.
+    """
+
+    def __init__(
+        self,
+        workers: int = SERVE_WORKERS,
+        max_queued: int = SERVE_MAX_QUEUED_JOBS,
+        log_to_sheets: bool = True,
+        use_cache: bool = True,
+        skip_duplicates: bool = True,
+        near_duplicates: str = NEAR_DUPLICATE_ACTION,
+    ):
+        """
+        Initialize the service and load the master resume.
+
+        Args:
+            workers: Maximum number of crews running at once
+            max_queued: Maximum number of jobs waiting for a worker
+            log_to_sheets: Whether to mirror finished postings to Google Sheets
+            use_cache: Whether to reuse cached job analyses
+            skip_duplicates: Whether to skip postings already in the ledger
+            near_duplicates: "reuse", "analysis", "skip" or "ignore" (see NEAR_DUPLICATE_ACTION)
+
+        Raises:
+            DataLoadError: If the master resume cannot be loaded
+            ValueError: If the model cascade is enabled with no tiers
+        """
+        tailor_tiers()  # Reject an empty TAILOR_MODEL_TIERS before accepting jobs
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.log_to_sheets = log_to_sheets
+        self.skip_duplicates = skip_duplicates
+        self.near_duplicates = near_duplicates
+        self.master_resume = load_compiled_resume().master_resume
+        self.ledger = ApplicationLedger()
+        self.analysis_cache = JobAnalysisCache() if use_cache else None
+        # Loaded once; each finished job is added instead of re-reading the file
+        self.prometheus = PrometheusMetrics.load() if METRICS_ENABLED else None
+        self.near_duplicate_index = (
+            open_near_duplicate_index(self.ledger)
+            if near_duplicates != "ignore"
+            else None
+        )
+
+        self._jobs: Dict[str, ServeJob] = {}
+        self._lock = threading.Lock()
+        self._sheets_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._accepting = False
+        self._loop = asyncio.new_event_loop()
+        self._queue: Optional[asyncio.Queue] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete,
+            args=(self._serve(),),
+            name="gary-workers",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        """Warm a crew and the LLM connection, then start the workers."""
+        with get_crew_pool().lease(self.master_resume):
+            pass
+        warm_llm_connections()
+        self._thread.start()
+        self._ready.wait()
+        with self._lock:
+            self._accepting = True
+
+    def stop(self) -> None:
+        """
+        Stop accepting jobs and wait until every accepted job has finished.
+
+        Jobs already queued are still processed, so every submission that
+        was answered with a job ID gets a result.
+        """
+        with self._lock:
+            if not self._accepting:
+                return
+            self._accepting = False
+        for _ in range(self.workers):
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+        self._thread.join()
+        self._loop.close()
+
+    def submit(
+        self, job_details: JobDetails, allow_duplicate: bool = False
+    ) -> ServeJob:
+        """
+        Queue a posting for tailoring.
+
+        Args:
+            job_details: Job details with a cleaned description
+            allow_duplicate: Tailor even if the posting is already in the ledger
+
+        Returns:
+            ServeJob: The queued job
+
+        Raises:
+            ServiceUnavailableError: If the service is shutting down or the queue is full
+        """
+        with self._lock:
+            if not self._accepting:
+                raise ServiceUnavailableError("Service is shutting down")
+            if self._queued >= self.max_queued:
+                raise ServiceUnavailableError(
+                    f"Queue is full ({self.max_queued} jobs waiting)"
+                )
+            job = ServeJob(
+                id=uuid.uuid4().hex,
+                job_details=job_details,
+                allow_duplicate=allow_duplicate,
+                submitted_at=_now(),
+            )
+            self._jobs[job.id] = job
+            self._queued += 1
+            # Under the lock, so stop() cannot queue its sentinels before this job
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, job.id)
+            queued = job.model_copy()
+        print(f"→ Queued: {job_details.company_name} - {job_details.job_title}")
+        return queued
+
+    def get(self, job_id: str) -> Optional[ServeJob]:
+        """Return a copy of a job's current state, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job else None
+
+    def list_jobs(self) -> List[ServeJob]:
+        """Return copies of every job, oldest first."""
+        with self._lock:
+            return [job.model_copy() for job in self._jobs.values()]
+
+    def health(self) -> Dict[str, Any]:
+        """Return queue and worker counts."""
+        with self._lock:
+            return {
+                "status": "ok" if self._accepting else "draining",
+                "workers": self.workers,
+                "queued": self._queued,
+                "running": self._running,
+                "jobs": len(self._jobs),
+            }
+
+    def _update(self, job_id: str, **fields: Any) -> ServeJob:
+        with self._lock:
+            job = self._jobs[job_id]
+            for name, value in fields.items():
+                setattr(job, name, value)
+            return job
+
+    async def _serve(self) -> None:
+        self._queue = asyncio.Queue()
+        # _process_job takes a semaphore; the worker count already bounds it
+        semaphore = asyncio.Semaphore(self.workers)
+        if METRICS_ENABLED:
+            with MetricsRecorder().attach() as recorder:
+                self._ready.set()
+                await self._run_workers(semaphore, recorder)
+        else:
+            self._ready.set()
+            await self._run_workers(semaphore, None)
+
+    async def _run_workers(
+        self, semaphore: asyncio.Semaphore, recorder: Optional[MetricsRecorder]
+    ) -> None:
+        await asyncio.gather(
+            *(self._worker(semaphore, recorder) for _ in range(self.workers))
+        )
+
+    async def _worker(
+        self, semaphore: asyncio.Semaphore, recorder: Optional[MetricsRecorder]
+    ) -> None:
+        while True:
+            job_id = await self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                await self._run_job(job_id, semaphore, recorder)
+            except Exception as e:
+                # A failing job must not take its worker down with it
+                self._fail(job_id, e)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+    async def _run_job(
+        self,
+        job_id: str,
+        semaphore: asyncio.Semaphore,
+        recorder: Optional[MetricsRecorder],
+    ) -> None:
+        job = self._update(job_id, status="running", started_at=_now())
+        job_details = job.job_details
+
+        if self.skip_duplicates and not job.allow_duplicate:
+            earlier = await asyncio.to_thread(self.ledger.find_duplicates, job_details)
+            if earlier:
+                self._skip(
+                    job, f"Already applied on {earlier[-1].job_details.date_applied}"
+                )
+                return
+
+        reused = None
+        if self.near_duplicate_index is not None and not job.allow_duplicate:
+            matches = await asyncio.to_thread(
+                find_near_duplicates,
+                job_details,
+                self.ledger,
+                self.near_duplicate_index,
+            )
+            if matches:
+                skip_reason, reused = await asyncio.to_thread(
+                    resolve_near_duplicate,
+                    job_details,
+                    matches[0],
+                    self.near_duplicates,
+                    self.analysis_cache,
+                )
+                if skip_reason:
+                    self._skip(job, skip_reason)
+                    return
+
+        result = await _process_job(
+            job_details,
+            self.master_resume,
+            semaphore,
+            self.analysis_cache,
+            self.ledger,
+            recorder,
+            reused,
+            prometheus=self.prometheus,
+        )
+        self._update(
+            job_id,
+            status="succeeded" if result.succeeded else "failed",
+            finished_at=_now(),
+            result=result,
+        )
+        if self.prometheus is not None:
+            await asyncio.to_thread(self.prometheus.write)
+        if self.log_to_sheets and result.succeeded:
+            await asyncio.to_thread(self._mirror_to_sheets)
+
+    def _skip(self, job: ServeJob, reason: str) -> None:
+        result = BatchJobResult(job_details=job.job_details, skip_reason=reason)
+        self._update(job.id, status="skipped", finished_at=_now(), result=result)
+        print(f"✓ Skipped: {reason}")
+
+    def _fail(self, job_id: str, error: Exception) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            result = BatchJobResult(job_details=job.job_details, error=str(error))
+            finished = job.finished
+            if not finished:
+                job.status = "failed"
+                job.finished_at = _now()
+                job.result = result
+        if finished:
+            # The resume is done; unsent Sheets rows stay in the outbox
+            print(f"⚠ After finishing {result.label}: {error}")
+        else:
+            print(f"✗ Failed: {result.label}: {error}")
+
+    def _mirror_to_sheets(self) -> None:
+        # One flush at a time; the Sheets client is shared by the process
+        with self._sheets_lock:
+            mirror_ledger_to_sheets(self.ledger)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes API requests to the TailoringService on self.server.service."""
+
+    server_version = "gary"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no host/port
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    @property
+    def service(self) -> TailoringService:
+        return self.server.service
+
+    def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _send_file(self, path: Path, content_type: str) -> None:
+        try:
+            body = path.read_bytes()
+        except OSError as e:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Output file unavailable: {e}")
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self) -> Tuple[str, ...]:
+        return tuple(part for part in self.path.split("?")[0].split("/") if part)
+
+    def do_GET(self) -> None:
+        route = self._route()
+        if route == ("health",):
+            self._send_json(HTTPStatus.OK, self.service.health())
+        elif route == ("jobs",):
+            jobs = [job.model_dump(mode="json") for job in self.service.list_jobs()]
+            self._send_json(HTTPStatus.OK, {"jobs": jobs})
+        elif len(route) in (2, 3) and route[0] == "jobs":
+            job = self.service.get(route[1])
+            if job is None:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job {route[1]}")
+            elif len(route) == 2:
+                self._send_json(HTTPStatus.OK, job.model_dump(mode="json"))
+            else:
+                self._send_output(job, route[2])
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"No route for GET {self.path}")
+
+    def _send_output(self, job: ServeJob, name: str) -> None:
+        if name == "resume":
+            path, content_type = job.result and job.result.file_path, DOCX_CONTENT_TYPE
+        elif name == "report":
+            path, content_type = (
+                job.result and job.result.report_path,
+                "application/json",
+            )
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown output '{name}'")
+            return
+
+        if not job.finished:
+            self._send_error(HTTPStatus.CONFLICT, f"Job is {job.status}")
+        elif not path:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Job {job.status} without a {name}")
+        else:
+            self._send_file(Path(path), content_type)
+
+    def do_POST(self) -> None:
+        if self._route() != ("jobs",):
+            self._send_error(HTTPStatus.NOT_FOUND, f"No route for POST {self.path}")
+            return
+
+        content_length = self.headers.get("Content-Length")
+        if content_length is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+            return
+        try:
+            length = int(content_length)
+            if length < 0:
+                raise ValueError("must not be negative")
+        except ValueError:
+            self._send_error(
+                HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {content_length!r}"
+            )
+            return
+        if length > SERVE_MAX_REQUEST_BYTES:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request too large")
+            return
+
+        try:
+            record = json.loads(self.rfile.read(length) or b"null")
+            if not isinstance(record, dict):
+                raise ValueError("expected a JSON object with the JobDetails fields")
+            allow_duplicate = bool(record.pop("allow_duplicate", False))
+            job_details = job_details_from_record(record)
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid job: {e}")
+            return
+
+        try:
+            job = self.service.submit(job_details, allow_duplicate)
+        except ServiceUnavailableError as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+        self._send_json(HTTPStatus.ACCEPTED, job.model_dump(mode="json"))
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def run_server(
+    host: str,
+    port: int,
+    socket_path: Optional[str] = None,
+    workers: int = SERVE_WORKERS,
+    log_to_sheets: bool = True,
+    use_cache: bool = True,
+    skip_duplicates: bool = True,
+    near_duplicates: str = NEAR_DUPLICATE_ACTION,
+) -> None:
+    """
+    Serve the tailoring API until SIGINT or SIGTERM, then drain and exit.
+
+    On the first signal, new submissions are rejected with 503 while queued
+    and running jobs finish; status and downloads keep working meanwhile.
+    A second Ctrl+C aborts immediately.
+
+    Args:
+        host: Interface to listen on
+        port: TCP port to listen on
+        socket_path: Listen on this Unix socket instead of host/port
+        workers: Maximum number of crews running at once
+        log_to_sheets: Whether to mirror finished postings to Google Sheets
+        use_cache: Whether to reuse cached job analyses
+        skip_duplicates: Whether to skip postings already in the ledger
+        near_duplicates: "reuse", "analysis", "skip" or "ignore" (see NEAR_DUPLICATE_ACTION)
+    """
+    service = TailoringService(
+        workers=workers,
+        log_to_sheets=log_to_sheets,
+        use_cache=use_cache,
+        skip_duplicates=skip_duplicates,
+        near_duplicates=near_duplicates,
+    )
+    service.start()
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # Stale socket from an earlier run
+        server = _UnixHTTPServer(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o600)
+        address = socket_path
+    else:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        address = f"http://{host}:{server.server_address[1]}"
+    server.service = service
+
+    stopping = threading.Event()
+
+    def request_stop(signum: int, frame: Any) -> None:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        stopping.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    print(f"✓ Gary is serving on {address} with {service.workers} worker(s)")
+
+    stopping.wait()
+    print("\nShutting down: finishing accepted jobs (Ctrl+C again to abort)...")
+    try:
+        service.stop()
+    finally:
+        server.shutdown()
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+    print("✓ All jobs finished")
@@ -0,0 +1,147 @@
+"""Live progress for the streamed resume tailoring output."""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Set
+from crewai.events import (
+    LLMCallStartedEvent,
+    LLMStreamChunkEvent,
+    TaskCompletedEvent,
+    crewai_event_bus,
+)
+from gary.models import JobAnalysis
+from gary.utils.keyword_matcher import KeywordMatcher
+from gary.utils.local_validation import SCORED_CATEGORIES
+from gary.utils.stream_parser import (
+    IncrementalResumeParser,
+    StreamedSection,
+    describe_section,
+    section_texts,
+)
+
+
+class TailorStreamMonitor:
+    """
+    Follows the tailor agent's streamed output and reports each section.
+
+    As sections complete, job keyword coverage is updated incrementally, so
+    it is known before the tailor finishes. Only the tailor LLM streams (see
+    STREAM_TAILOR_OUTPUT), and CrewAI emits events on the thread running the
+    crew, so a monitor receives the events of the thread it is attached on.
+    """
+
+    def __init__(self, job_analysis: Optional[JobAnalysis] = None):
+        """
+        Initialize the monitor.
+
+        Args:
+            job_analysis: Cached job analysis; otherwise taken from the job analysis task output
+        """
+        self.parser = IncrementalResumeParser()
+        self.sections: List[StreamedSection] = []
+        self.keywords: List[str] = []
+        self.covered: Set[int] = set()
+        self._matcher: Optional[KeywordMatcher] = None
+        if job_analysis:
+            self.set_job_analysis(job_analysis)
+
+    def set_job_analysis(self, job_analysis: JobAnalysis) -> None:
+        """
+        Set the job keywords tracked for coverage.
+
+        Args:
+            job_analysis: Job analysis with categorized skills
+        """
+        self._matcher = KeywordMatcher(
+            keyword
+            for category in SCORED_CATEGORIES
+            for keyword in getattr(job_analysis.skills, category)
+        )
+        self.keywords = self._matcher.keywords
+        self.covered = set()
+        for section in self.sections:
+            self._update_coverage(section)
+
+    def _update_coverage(self, section: StreamedSection) -> None:
+        if self._matcher:
+            for text in section_texts(section):
+                self.covered.update(index for index, _ in self._matcher.find_all(text))
+
+    def feed(self, chunk: str) -> None:
+        """
+        Consume a streamed chunk and report any sections it completes.
+
+        Args:
+            chunk: Text received from the tailor LLM
+        """
+        for section in self.parser.feed(chunk):
+            if not self.sections:
+                print("\nStreaming tailored resume:")
+
+            self.sections.append(section)
+            self._update_coverage(section)
+            progress = ""
+            if self.keywords:
+                progress = f"  [keywords {len(self.covered)}/{len(self.keywords)}]"
+            print(f"  ✓ {describe_section(section)}{progress}")
+
+    def _on_call_started(self) -> None:
+        # A retried tailor call streams a fresh answer
+        if not self.parser.done:
+            self.parser.reset()
+            self.sections = []
+            self.covered = set()
+
+    def _on_task_completed(self, output: Any) -> None:
+        if self._matcher is None and isinstance(output.pydantic, JobAnalysis):
+            self.set_job_analysis(output.pydantic)
+
+    @contextmanager
+    def attach(self) -> Iterator["TailorStreamMonitor"]:
+        """
+        Receive the CrewAI events of the current thread during a kickoff.
+
+        Yields:
+            TailorStreamMonitor: This monitor
+        """
+        _register_event_handlers()
+        previous = getattr(_local, "monitor", None)
+        _local.monitor = self
+        try:
+            yield self
+        finally:
+            _local.monitor = previous
+
+
+# Monitor attached on each thread. The CrewAI event handlers are registered
+# once per process, next to CrewAI's own, and pass events to that monitor.
+_local = threading.local()
+_registered_lock = threading.Lock()
+_handlers_registered = False
+
+
+def _register_event_handlers() -> None:
+    """Subscribe the monitor dispatchers to CrewAI events, once per process."""
+    global _handlers_registered
+    with _registered_lock:
+        if _handlers_registered:
+            return
+        _handlers_registered = True
+
+    @crewai_event_bus.on(LLMCallStartedEvent)
+    def on_call_started(source, event):
+        monitor = getattr(_local, "monitor", None)
+        if monitor is not None:
+            monitor._on_call_started()
+
+    @crewai_event_bus.on(LLMStreamChunkEvent)
+    def on_chunk(source, event):
+        monitor = getattr(_local, "monitor", None)
+        if monitor is not None:
+            monitor.feed(event.chunk)
+
+    @crewai_event_bus.on(TaskCompletedEvent)
+    def on_task_completed(source, event):
+        monitor = getattr(_local, "monitor", None)
+        if monitor is not None:
+            monitor._on_task_completed(event.output)
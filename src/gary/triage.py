@@ -0,0 +1,76 @@
+"""Fit-score triage: rank postings locally before spending LLM tokens."""
+
+from pathlib import Path
+from typing import List
+from gary.config import TRIAGE_MIN_OVERLAP
+from gary.models import InvalidJobRecord, JobDetails, MasterResume
+from gary.utils.fit_score import ResumeTermIndex, TriageResult, score_postings
+from gary.utils.resume_artifact import compiled_for, load_compiled_resume
+from gary.utils.read_job_details import read_job_details_file
+
+
+def triage_jobs(
+    jobs: List[JobDetails],
+    master_resume: MasterResume,
+    min_overlap: float = TRIAGE_MIN_OVERLAP,
+) -> List[TriageResult]:
+    """
+    Score postings against the master resume.
+
+    Args:
+        jobs: Postings read by read_job_details_file or job_details_from_record
+        master_resume: Parsed master resume
+        min_overlap: Minimum overlap percentage for a posting to pass
+
+    Returns:
+        List[TriageResult]: Results sorted by score, best first
+    """
+    compiled = compiled_for(master_resume)
+    index = compiled.term_index if compiled else ResumeTermIndex(master_resume)
+    return score_postings(index, jobs, min_overlap)
+
+
+def print_triage_results(results: List[TriageResult], min_overlap: float) -> None:
+    """Print a ranked triage table."""
+    print("\n" + "=" * 80)
+    print("FIT-SCORE TRIAGE")
+    print("=" * 80)
+    for rank, r in enumerate(results, start=1):
+        mark = "✓" if r.passed else "✗"
+        print(
+            f"{rank:>4}. {mark} {r.overlap_percentage:5.1f}%  score {r.score:7.2f}  "
+            f"{r.job_details.company_name} - {r.job_details.job_title}"
+        )
+        if r.matched_skills:
+            print(f"        Skills: {', '.join(r.matched_skills)}")
+        if r.missing_skills:
+            print(f"        Missing: {', '.join(r.missing_skills)}")
+
+    passed = sum(1 for r in results if r.passed)
+    print(
+        f"\n{passed}/{len(results)} posting(s) at or above {min_overlap:.0f}% overlap"
+    )
+
+
+def run_triage(
+    file_path: str, min_overlap: float = TRIAGE_MIN_OVERLAP
+) -> List[TriageResult]:
+    """
+    Rank every posting in a JSONL/CSV file by fit with the master resume.
+
+    Args:
+        file_path: Path to a .jsonl or .csv file of JobDetails records
+        min_overlap: Minimum overlap percentage for a posting to pass
+
+    Returns:
+        List[TriageResult]: Results sorted by score, best first
+    """
+    jobs = []
+    for record in read_job_details_file(Path(file_path)):
+        if isinstance(record, InvalidJobRecord):
+            print(f"✗ Skipping invalid job record at {record.source}: {record.error}")
+        else:
+            jobs.append(record)
+    results = triage_jobs(jobs, load_compiled_resume().master_resume, min_overlap)
+    print_triage_results(results, min_overlap)
+    return results
@@ -0,0 +1,178 @@
+"""On-disk LRU cache of JobAnalysis results keyed by job description content."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import ContextManager, Dict, Optional
+import yaml
+from pydantic import ValidationError
+from gary.models import JobAnalysis
+from gary.utils.sqlite_transaction import sqlite_transaction
+from gary.config import (
+    AGENT_LLM_SETTINGS,
+    AGENTS_CONFIG_PATH,
+    TASKS_CONFIG_PATH,
+    JOB_ANALYSIS_CACHE_PATH,
+    JOB_ANALYSIS_CACHE_MAX_ENTRIES,
+)
+
+
+def job_analysis_prompt_version() -> str:
+    """
+    Compute a version hash of the job analysis prompt.
+
+    The hash covers the job_analyst agent and job_analysis_task definitions so
+    that editing either invalidates previously cached analyses.
+
+    Returns:
+        str: Short hex digest of the prompt definitions
+    """
+    with open(AGENTS_CONFIG_PATH, "r", encoding="utf-8") as f:
+        agents = yaml.safe_load(f)
+    with open(TASKS_CONFIG_PATH, "r", encoding="utf-8") as f:
+        tasks = yaml.safe_load(f)
+
+    prompt = {
+        "agent": agents.get("job_analyst"),
+        "task": tasks.get("job_analysis_task"),
+    }
+    payload = json.dumps(prompt, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class JobAnalysisCache:
+    """
+    SQLite-backed LRU cache of JobAnalysis results.
+
+    Entries are keyed by a hash of the cleaned job description, the analyst
+    model name and the prompt version. When the cache grows past max_entries,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path = JOB_ANALYSIS_CACHE_PATH,
+        max_entries: int = JOB_ANALYSIS_CACHE_MAX_ENTRIES,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of cached analyses
+            model: Analyst model name included in the cache key (the
+                job_analyst model of AGENT_LLM_SETTINGS if omitted)
+            prompt_version: Prompt version included in the cache key (computed from the YAML configs if omitted)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.model = model or AGENT_LLM_SETTINGS["job_analyst"]["model"]
+        self.prompt_version = prompt_version or job_analysis_prompt_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_analysis ("
+                "key TEXT PRIMARY KEY, analysis TEXT NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_job_analysis_last_access "
+                "ON job_analysis (last_access)"
+            )
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return sqlite_transaction(self.path)
+
+    def key(self, job_description: str) -> str:
+        """
+        Build the cache key for a cleaned job description.
+
+        Args:
+            job_description: Output of clean_job_description
+
+        Returns:
+            str: Hex digest identifying the description, model and prompt version
+        """
+        digest = hashlib.sha256()
+        for part in (self.model, self.prompt_version, job_description):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, job_description: str) -> Optional[JobAnalysis]:
+        """
+        Look up a cached analysis and mark it as recently used.
+
+        Args:
+            job_description: Output of clean_job_description
+
+        Returns:
+            Optional[JobAnalysis]: The cached analysis, or None on a miss
+        """
+        key = self.key(job_description)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT analysis FROM job_analysis WHERE key = ?", (key,)
+            ).fetchone()
+
+            analysis = None
+            if row:
+                try:
+                    analysis = JobAnalysis.model_validate_json(row[0])
+                except ValidationError:
+                    # Stale entry from an older schema; drop it
+                    conn.execute("DELETE FROM job_analysis WHERE key = ?", (key,))
+
+            if analysis is None:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE job_analysis SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self.hits += 1
+            return analysis
+
+    def put(self, job_description: str, analysis: JobAnalysis) -> None:
+        """
+        Store an analysis and evict least recently used entries over the cap.
+
+        Args:
+            job_description: Output of clean_job_description
+            analysis: Analysis produced by the job analyst agent
+        """
+        key = self.key(job_description)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_analysis (key, analysis, last_access) "
+                "VALUES (?, ?, ?)",
+                (key, analysis.model_dump_json(), time.time()),
+            )
+            conn.execute(
+                "DELETE FROM job_analysis WHERE key IN ("
+                "SELECT key FROM job_analysis ORDER BY last_access DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM job_analysis").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters for this process and the current entry count.
+
+        Returns:
+            Dict[str, int]: hits, misses and entries
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
@@ -0,0 +1,297 @@
+"""Local SQLite ledger of tailored job applications."""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import ContextManager, List, Optional
+from gary.models import ApplicationRecord, JobDetails, ResumeValidationReport
+from gary.config import APPLICATION_LEDGER_PATH
+from gary.utils.sqlite_transaction import sqlite_transaction
+
+_COLUMNS = (
+    "id, company_name, job_title, location, job_id, job_description, "
+    "date_applied, description_hash, resume_path, report_path, "
+    "passed_validation, overall_score, ats_score, readability_score, "
+    "integration_rate, elapsed_seconds, recorded_at"
+)
+
+
+def description_hash(job_description: str) -> str:
+    """
+    Hash a cleaned job description for duplicate detection.
+
+    Whitespace and case differences do not change the hash.
+
+    Args:
+        job_description: Output of clean_job_description
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    normalized = " ".join(job_description.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def company_key(company_name: str) -> str:
+    """Normalize a company name for duplicate matching."""
+    return " ".join(company_name.lower().split())
+
+
+def _iso_date(date_applied: str) -> Optional[str]:
+    """Convert MM-DD-YYYY to a sortable YYYY-MM-DD, or None if malformed."""
+    try:
+        return datetime.strptime(date_applied, "%m-%d-%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _to_record(row: sqlite3.Row) -> ApplicationRecord:
+    passed = row["passed_validation"]
+    return ApplicationRecord(
+        id=row["id"],
+        job_details=JobDetails(
+            company_name=row["company_name"],
+            job_title=row["job_title"],
+            location=row["location"],
+            job_id=row["job_id"],
+            job_description=row["job_description"],
+            date_applied=row["date_applied"],
+        ),
+        description_hash=row["description_hash"],
+        resume_path=row["resume_path"],
+        report_path=row["report_path"],
+        passed_validation=None if passed is None else bool(passed),
+        overall_score=row["overall_score"],
+        ats_score=row["ats_score"],
+        readability_score=row["readability_score"],
+        integration_rate=row["integration_rate"],
+        elapsed_seconds=row["elapsed_seconds"],
+        recorded_at=row["recorded_at"],
+    )
+
+
+class ApplicationLedger:
+    """
+    SQLite ledger of every application Gary has tailored.
+
+    The ledger is the source of truth for application history. It is indexed
+    on (company, job_id), on the application date and on a hash of the
+    cleaned description, so duplicate checks never need the Google Sheet.
+    Rows not yet copied to Google Sheets are tracked so the sheet can be
+    mirrored incrementally.
+    """
+
+    def __init__(self, path: Path = APPLICATION_LEDGER_PATH):
+        """
+        Open the ledger, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS applications ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "company_name TEXT NOT NULL, company_key TEXT NOT NULL, "
+                "job_title TEXT NOT NULL, location TEXT NOT NULL, job_id TEXT, "
+                "job_description TEXT NOT NULL, date_applied TEXT NOT NULL, "
+                "applied_on TEXT, description_hash TEXT NOT NULL, "
+                "resume_path TEXT, report_path TEXT, passed_validation INTEGER, "
+                "overall_score INTEGER, ats_score INTEGER, readability_score INTEGER, "
+                "integration_rate REAL, elapsed_seconds REAL, "
+                "recorded_at TEXT NOT NULL, mirrored INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_company_job "
+                "ON applications (company_key, job_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_applied_on "
+                "ON applications (applied_on)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_description_hash "
+                "ON applications (description_hash)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_unmirrored "
+                "ON applications (id) WHERE mirrored = 0"
+            )
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return sqlite_transaction(self.path, row_factory=sqlite3.Row)
+
+    def find_duplicates(self, job_details: JobDetails) -> List[ApplicationRecord]:
+        """
+        Find earlier applications to the same posting.
+
+        A posting matches when the company and job ID are the same, or when
+        the cleaned description is identical.
+
+        Args:
+            job_details: Posting about to be tailored
+
+        Returns:
+            List[ApplicationRecord]: Matching applications, oldest first
+        """
+        query = f"SELECT {_COLUMNS} FROM applications WHERE description_hash = ?"
+        params = [description_hash(job_details.job_description)]
+        if job_details.job_id:
+            query += " OR (company_key = ? AND job_id = ?)"
+            params += [company_key(job_details.company_name), job_details.job_id]
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def get(self, record_id: int) -> Optional[ApplicationRecord]:
+        """
+        Look up an application by ledger row id.
+
+        Args:
+            record_id: Ledger row id
+
+        Returns:
+            Optional[ApplicationRecord]: The application, or None if not found
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM applications WHERE id = ?", (record_id,)
+            ).fetchone()
+        return _to_record(row) if row else None
+
+    def recorded_after(
+        self, record_id: int, limit: Optional[int] = None
+    ) -> List[ApplicationRecord]:
+        """
+        List applications recorded after a ledger row id.
+
+        Args:
+            record_id: Last row id already seen (0 for all)
+            limit: Maximum number of applications to return
+
+        Returns:
+            List[ApplicationRecord]: Applications, oldest first
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM applications WHERE id > ? ORDER BY id LIMIT ?",
+                (record_id, -1 if limit is None else limit),
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def last_record_id(self) -> int:
+        """Return the highest ledger row id, or 0 when the ledger is empty."""
+        with self._connect() as conn:
+            return conn.execute("SELECT MAX(id) FROM applications").fetchone()[0] or 0
+
+    def record(
+        self,
+        job_details: JobDetails,
+        resume_path: Optional[str] = None,
+        report_path: Optional[str] = None,
+        validation_report: Optional[ResumeValidationReport] = None,
+        elapsed_seconds: Optional[float] = None,
+    ) -> int:
+        """
+        Record a tailored application.
+
+        Args:
+            job_details: Posting the resume was tailored for
+            resume_path: Generated Word document
+            report_path: Saved validation report
+            validation_report: Final validation report, if one was produced
+            elapsed_seconds: Wall time spent tailoring
+
+        Returns:
+            int: Ledger row id
+        """
+        scores = (None, None, None, None, None)
+        if validation_report:
+            scores = (
+                int(validation_report.passed_validation),
+                validation_report.overall_score,
+                validation_report.feedback.ats_score,
+                validation_report.feedback.human_readability_score,
+                validation_report.keyword_analysis.integration_rate,
+            )
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO applications (company_name, company_key, job_title, "
+                "location, job_id, job_description, date_applied, applied_on, "
+                "description_hash, resume_path, report_path, passed_validation, "
+                "overall_score, ats_score, readability_score, integration_rate, "
+                "elapsed_seconds, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_details.company_name,
+                    company_key(job_details.company_name),
+                    job_details.job_title,
+                    job_details.location,
+                    job_details.job_id,
+                    job_details.job_description,
+                    job_details.date_applied,
+                    _iso_date(job_details.date_applied),
+                    description_hash(job_details.job_description),
+                    resume_path,
+                    report_path,
+                    *scores,
+                    elapsed_seconds,
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+            return cursor.lastrowid
+
+    def applied_between(self, start: str, end: str) -> List[ApplicationRecord]:
+        """
+        List applications dated within a range.
+
+        Args:
+            start: First date, inclusive, in YYYY-MM-DD format
+            end: Last date, inclusive, in YYYY-MM-DD format
+
+        Returns:
+            List[ApplicationRecord]: Applications ordered by date
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM applications "
+                "WHERE applied_on BETWEEN ? AND ? ORDER BY applied_on, id",
+                (start, end),
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def unmirrored(self) -> List[ApplicationRecord]:
+        """
+        List applications not yet copied to Google Sheets.
+
+        Returns:
+            List[ApplicationRecord]: Applications, oldest first
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM applications WHERE mirrored = 0 ORDER BY id"
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def mark_mirrored(self, record_ids: List[int]) -> None:
+        """
+        Mark applications as copied to Google Sheets.
+
+        Args:
+            record_ids: Ledger row ids
+        """
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "UPDATE applications SET mirrored = 1 WHERE id = ?",
+                [(i,) for i in record_ids],
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
@@ -0,0 +1,272 @@
+"""Rule-driven removal of boilerplate sections from job descriptions.
+
+EEO statements, benefits lists, pay transparency notices and "about us"
+copy say nothing about the role, yet often make up half of a posting. The
+raw description is split into paragraphs, each under the heading it
+directly follows (if any), and each paragraph is matched against the phrase library in config/boilerplate.yaml.
+Descriptions without line breaks are matched sentence by sentence instead.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+from gary.config import (
+    BOILERPLATE_MAX_REMOVED_FRACTION,
+    BOILERPLATE_MIN_PHRASE_HITS,
+    BOILERPLATE_PHRASES_PATH,
+)
+from gary.exceptions import DataLoadError
+from gary.models import BoilerplateReport, RemovedSection
+from gary.utils.tokens import estimate_tokens
+
+_BULLET_PATTERN = re.compile(r"^\s*(?:[-*•·▪◦★☆✓✔>]|\d+[.)])")
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+_QUOTES = str.maketrans({"‘": "'", "’": "'"})
+
+# Headings are short label lines, e.g. "Benefits" or "What You'll Do:"
+MAX_HEADING_CHARS = 60
+MAX_HEADING_WORDS = 8
+
+
+def _normalize(text: str) -> str:
+    """Lowercase ASCII form used for matching, as clean_job_description produces."""
+    text = unicodedata.normalize("NFKD", text.translate(_QUOTES))
+    return text.encode("ascii", "ignore").decode("ascii").lower()
+
+
+def _phrase_pattern(phrase: str) -> Pattern[str]:
+    return re.compile(r"(?<!\w)" + re.escape(_normalize(phrase)) + r"(?!\w)")
+
+
+class PhraseLibrary:
+    """Compiled heading and body phrases per boilerplate category."""
+
+    def __init__(
+        self,
+        categories: Dict[str, Dict[str, List[str]]],
+        keep_headings: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            categories: Category name to its `headings` and `phrases` lists
+            keep_headings: Headings whose paragraphs are never removed
+        """
+        self.keep_headings = [_phrase_pattern(p) for p in keep_headings or []]
+        self.headings = {
+            name: [_phrase_pattern(p) for p in spec.get("headings") or []]
+            for name, spec in categories.items()
+        }
+        self.phrases = {
+            name: [_phrase_pattern(p) for p in spec.get("phrases") or []]
+            for name, spec in categories.items()
+        }
+
+    def is_kept_heading(self, heading: str) -> bool:
+        return any(p.search(heading) for p in self.keep_headings)
+
+    def heading_category(self, heading: str) -> Optional[str]:
+        """Return the category a normalized heading belongs to, if any."""
+        for name, patterns in self.headings.items():
+            if any(p.search(heading) for p in patterns):
+                return name
+        return None
+
+    def body_category(self, text: str, min_hits: int) -> Optional[str]:
+        """
+        Return the category with the most distinct phrases in normalized text.
+
+        Args:
+            text: Normalized paragraph or sentence
+            min_hits: Distinct phrases a category needs to match
+
+        Returns:
+            Optional[str]: Best category with at least min_hits matches
+        """
+        best, best_hits = None, 0
+        for name, patterns in self.phrases.items():
+            hits = sum(1 for p in patterns if p.search(text))
+            if hits >= min_hits and hits > best_hits:
+                best, best_hits = name, hits
+        return best
+
+
+@lru_cache(maxsize=None)
+def load_phrase_library(path: Path = BOILERPLATE_PHRASES_PATH) -> PhraseLibrary:
+    """
+    Load and compile the boilerplate phrase library.
+
+    Args:
+        path: YAML file with `categories` and `keep_headings`
+
+    Returns:
+        PhraseLibrary: Compiled library, cached per path
+
+    Raises:
+        DataLoadError: If the file cannot be read or parsed
+    """
+    import yaml
+
+    try:
+        config = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise DataLoadError(f"Failed to load boilerplate phrases from {path}: {e}")
+    return PhraseLibrary(config.get("categories") or {}, config.get("keep_headings"))
+
+
+def _heading_text(line: str, after_blank: bool) -> Optional[str]:
+    """Return a line's heading text if it looks like a section heading."""
+    stripped = line.strip()
+    if _BULLET_PATTERN.match(stripped) and not stripped.startswith("#"):
+        return None
+    text = stripped.strip("#*_ ").rstrip(":").strip()
+    if (
+        not text
+        or len(text) > MAX_HEADING_CHARS
+        or len(text.split()) > MAX_HEADING_WORDS
+        or text.endswith((".", "!", "?", ",", ";"))
+    ):
+        return None
+    if after_blank or stripped.endswith(":") or stripped.startswith("#"):
+        return text
+    return None
+
+
+def _paragraphs(text: str) -> List[Tuple[Optional[str], List[str]]]:
+    """
+    Split text into paragraphs, each with the heading it falls under.
+
+    A heading starts a new paragraph and stays in it. It also covers the
+    bullet-list paragraphs directly after it; a paragraph that starts with
+    prose after a blank line falls under no heading.
+
+    Returns:
+        List of (normalized heading or None, paragraph lines)
+    """
+    paragraphs = []
+    heading = None
+    lines: List[str] = []
+    after_blank = True
+    for line in text.splitlines():
+        if not line.strip():
+            if lines:
+                paragraphs.append((heading, lines))
+                lines = []
+            after_blank = True
+            continue
+        heading_text = _heading_text(line, after_blank)
+        if heading_text is not None:
+            if lines:
+                paragraphs.append((heading, lines))
+                lines = []
+            heading = _normalize(heading_text)
+        elif after_blank and not _BULLET_PATTERN.match(line):
+            heading = None
+        lines.append(line)
+        after_blank = False
+    if lines:
+        paragraphs.append((heading, lines))
+    return paragraphs
+
+
+def _classify_paragraphs(
+    text: str, library: PhraseLibrary, min_hits: int
+) -> List[Tuple[Optional[str], str]]:
+    """Label each paragraph with its boilerplate category, or None to keep it."""
+    labelled = []
+    for heading, lines in _paragraphs(text):
+        paragraph = "\n".join(lines)
+        category = None
+        if heading is None or not library.is_kept_heading(heading):
+            # Body phrases name the category more precisely than the heading,
+            # e.g. an EEO statement placed under "Benefits"
+            category = library.body_category(_normalize(paragraph), min_hits)
+            category = category or (heading and library.heading_category(heading))
+        labelled.append((category, paragraph))
+    return labelled
+
+
+def _classify_sentences(
+    text: str, library: PhraseLibrary, min_hits: int
+) -> List[Tuple[Optional[str], str]]:
+    """Label each sentence of unstructured text with its category, or None."""
+    return [
+        (library.body_category(_normalize(sentence), min_hits), sentence)
+        for sentence in _SENTENCE_END_PATTERN.split(text.strip())
+    ]
+
+
+def strip_boilerplate(
+    text: str,
+    library: Optional[PhraseLibrary] = None,
+    min_hits: int = BOILERPLATE_MIN_PHRASE_HITS,
+    max_removed_fraction: float = BOILERPLATE_MAX_REMOVED_FRACTION,
+) -> Tuple[str, BoilerplateReport]:
+    """
+    Remove boilerplate sections from a raw job description.
+
+    Runs before clean_job_description, which flattens the line breaks the
+    section detection relies on. Escaped line breaks (a literal backslash-n,
+    as in some scraped exports) count as line breaks.
+
+    Args:
+        text: Raw job description
+        library: Phrase library (default: config/boilerplate.yaml)
+        min_hits: Distinct phrases of one category that mark a paragraph
+        max_removed_fraction: Return the text unchanged if more would be removed
+
+    Returns:
+        Tuple of the remaining text and a report of what was removed
+    """
+    library = library or load_phrase_library()
+    structured = text.replace("\\r\\n", "\n").replace("\\n", "\n")
+    structured = structured.replace("\r\n", "\n")
+
+    if "\n" in structured.strip():
+        parts = _classify_paragraphs(structured, library, min_hits)
+        separator = "\n\n"
+    else:
+        parts = _classify_sentences(structured, library, min_hits)
+        separator = " "
+
+    removed = [
+        RemovedSection(category=category, text=part)
+        for category, part in parts
+        if category
+    ]
+    removed_chars = sum(len(section.text) for section in removed)
+    if not removed or removed_chars > max_removed_fraction * len(text):
+        return text, BoilerplateReport(
+            original_chars=len(text), removed_chars=0, removed_tokens=0
+        )
+
+    kept = separator.join(part for category, part in parts if not category)
+    return kept, BoilerplateReport(
+        original_chars=len(text),
+        removed_chars=removed_chars,
+        removed_tokens=estimate_tokens(
+            separator.join(section.text for section in removed)
+        ),
+        removed_sections=removed,
+    )
+
+
+def describe_boilerplate_report(report: BoilerplateReport) -> str:
+    """
+    Summarize a boilerplate report in one line.
+
+    Args:
+        report: Boilerplate report
+
+    Returns:
+        str: Human-readable summary
+    """
+    if not report.removed_sections:
+        return "No boilerplate removed from the job description"
+    categories = sorted({section.category for section in report.removed_sections})
+    return (
+        f"Boilerplate removed: {', '.join(categories)} "
+        f"({report.removed_chars}/{report.original_chars} chars, "
+        f"~{report.removed_tokens} input tokens)"
+    )
@@ -1,5 +1,26 @@
+import os
 import re
+import string
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+from gary.config import BOILERPLATE_STRIPPING_ENABLED, CLEAN_PARALLEL_MIN_TEXTS
+from gary.models import BoilerplateReport
+
+T = TypeVar("T")
+
+# Literal \n, \r and \t sequences (escaped strings)
+_ESCAPED_WHITESPACE_PATTERN = re.compile(r"\\[nrt]")
+
+# Spaces left before punctuation once whitespace is collapsed
+_SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r" ([.,;:!?])")
+
+# One pass over ASCII text: word characters and basic punctuation are kept,
+# whitespace and every other character become spaces
+_KEPT_CHARACTERS = set(string.ascii_letters + string.digits + "_.,;:!?()-'")
+_ASCII_TRANSLATION = str.maketrans(
+    {chr(code): " " for code in range(128) if chr(code) not in _KEPT_CHARACTERS}
+)
 
 
 def clean_job_description(text: str) -> str:
@@ -11,33 +32,101 @@ def clean_job_description(text: str) -> str:
     Returns:
         str: Cleaned job description text
     """
-    # Normalize unicode characters
-    normalized_text = unicodedata.normalize("NFKD", text)
-
-    # Convert to ASCII, ignoring non-ASCII characters
-    ascii_text = normalized_text.encode("ascii", "ignore").decode("ascii")
+    # Normalize unicode characters and drop what has no ASCII form; NFKD
+    # leaves ASCII text unchanged
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = text.encode("ascii", "ignore").decode("ascii")
 
     # Replace literal \n, \r, \t sequences (escaped strings) with spaces
-    cleaned_text = (
-        ascii_text.replace("\\n", " ").replace("\\r", " ").replace("\\t", " ")
-    )
+    if "\\" in text:
+        text = _ESCAPED_WHITESPACE_PATTERN.sub(" ", text)
 
-    # Replace actual newlines, carriage returns, and tabs with spaces
-    cleaned_text = cleaned_text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
+    # Replace whitespace and special characters with spaces (keep basic
+    # punctuation), then collapse runs of spaces and trim both ends
+    text = " ".join(text.translate(_ASCII_TRANSLATION).split())
 
-    # Replace all other whitespace characters (tabs, form feeds, vertical tabs)
-    cleaned_text = re.sub(r"[\t\f\v]", " ", cleaned_text)
+    # Remove spaces before punctuation
+    return _SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r"\1", text)
 
-    # Remove special characters and extra punctuation (keep basic punctuation)
-    cleaned_text = re.sub(r"[^\w\s.,;:!?()\-\']", " ", cleaned_text)
 
-    # Collapse multiple spaces into single space (this handles all whitespace)
-    cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+def prepare_job_description(text: str) -> Tuple[str, Optional[BoilerplateReport]]:
+    """
+    Strip boilerplate sections from a raw job description, then clean it.
 
-    # Remove spaces before punctuation
-    cleaned_text = re.sub(r"\s+([.,;:!?])", r"\1", cleaned_text)
+    Args:
+        text: Raw job description text
+
+    Returns:
+        Tuple of the cleaned text and the boilerplate report (None when
+        BOILERPLATE_STRIPPING_ENABLED is off)
+    """
+    if not BOILERPLATE_STRIPPING_ENABLED:
+        return clean_job_description(text), None
+
+    from gary.utils.boilerplate import strip_boilerplate
+
+    text, report = strip_boilerplate(text)
+    return clean_job_description(text), report
+
+
+def _map_texts(
+    func: Callable[[str], T], texts: Sequence[str], max_workers: Optional[int]
+) -> List[T]:
+    """
+    Apply func to every text, with a process pool for large inputs.
+
+    Args:
+        func: Module-level function, so it can be sent to worker processes
+        texts: Texts to process
+        max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
 
-    # Remove extra whitespace at start and end
-    cleaned_text = cleaned_text.strip()
+    Returns:
+        List[T]: Results in input order
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(texts) < CLEAN_PARALLEL_MIN_TEXTS:
+        return [func(text) for text in texts]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(texts) // (workers * 4))
+        return list(pool.map(func, texts, chunksize=chunksize))
+
+
+def clean_job_descriptions(
+    texts: Sequence[str], max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Clean many job descriptions, e.g. when importing scraped postings.
+
+    Inputs of at least CLEAN_PARALLEL_MIN_TEXTS descriptions are spread
+    across a process pool. The output is identical to calling
+    clean_job_description on each text.
+
+    Args:
+        texts: Raw job description texts
+        max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
+
+    Returns:
+        List[str]: Cleaned texts, in input order
+    """
+    return _map_texts(clean_job_description, texts, max_workers)
+
+
+def prepare_job_descriptions(
+    texts: Sequence[str], max_workers: Optional[int] = None
+) -> List[Tuple[str, Optional[BoilerplateReport]]]:
+    """
+    Strip boilerplate from and clean many job descriptions.
 
-    return cleaned_text
+    Same as prepare_job_description on each text, with a process pool for
+    inputs of at least CLEAN_PARALLEL_MIN_TEXTS descriptions.
+
+    Args:
+        texts: Raw job description texts
+        max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
+
+    Returns:
+        List of (cleaned text, boilerplate report), in input order
+    """
+    return _map_texts(prepare_job_description, texts, max_workers)
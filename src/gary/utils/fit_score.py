@@ -0,0 +1,248 @@
+"""Local fit-score triage of job postings against the master resume."""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+import numpy as np
+from pydantic import BaseModel, Field
+from gary.exceptions import DataLoadError
+from gary.models import JobDetails, MasterResume
+from gary.config import SKILL_VOCABULARY_PATH, TRIAGE_MIN_OVERLAP
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[+#]+|(?:\.[a-z0-9]+)+)?")
+
+STOPWORDS = frozenset("""
+    a about above after all also an and any are as at be been being both but by
+    can could did do does doing for from had has have having he her here his how
+    i if in into is it its just may me more most must my no not of on one or our
+    out over own per same she should so some such than that the their them then
+    there these they this those through to too under until up very was we were
+    what when where which while who whom why will with within would you your
+    able across etc including new work working team teams role join year years
+    """.split())
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Extra query weight for terms that come from the resume skills section
+SKILL_TERM_WEIGHT = 2.0
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase terms, keeping tokens like c++, c# and node.js.
+
+    Args:
+        text: Raw or cleaned text
+
+    Returns:
+        List[str]: Terms with stopwords removed
+    """
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+@lru_cache(maxsize=None)
+def load_skill_vocabulary(path: Path = SKILL_VOCABULARY_PATH) -> Tuple[str, ...]:
+    """
+    Load the skill vocabulary used to find the skills a posting asks for.
+
+    Args:
+        path: YAML file with skill lists under `categories`
+
+    Returns:
+        Tuple[str, ...]: Skills of every category, cached per path
+
+    Raises:
+        DataLoadError: If the file cannot be read or parsed
+    """
+    import yaml
+
+    try:
+        config = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise DataLoadError(f"Failed to load skill vocabulary from {path}: {e}")
+    categories = config.get("categories") or {}
+    return tuple(str(skill) for skills in categories.values() for skill in skills or [])
+
+
+def _phrases(terms: List[str], max_length: int) -> Set[Tuple[str, ...]]:
+    """Every run of up to max_length consecutive terms."""
+    return {
+        tuple(terms[start : start + length])
+        for length in range(1, max_length + 1)
+        for start in range(len(terms) - length + 1)
+    }
+
+
+class TriageResult(BaseModel):
+    """Fit score of one posting against the master resume."""
+
+    job_details: JobDetails = Field(..., description="The job posting scored")
+    score: float = Field(..., description="BM25 relevance of the resume to the posting")
+    overlap_percentage: float = Field(
+        ...,
+        description="Share of the skills the posting mentions that the resume covers (0-100)",
+    )
+    matched_skills: List[str] = Field(
+        default=[], description="Resume skill items mentioned in the posting"
+    )
+    missing_skills: List[str] = Field(
+        default=[], description="Skills the posting mentions that the resume lacks"
+    )
+    passed: bool = Field(..., description="Whether the posting meets the threshold")
+
+
+class ResumeTermIndex:
+    """
+    Inverted index of master resume terms.
+
+    Terms come from the skills items and the work experience bullets. Each
+    term maps to the resume locations it appears in, so matched terms can be
+    traced back to the skills or bullets that support them.
+    """
+
+    def __init__(self, master_resume: MasterResume):
+        """
+        Build the index.
+
+        Args:
+            master_resume: Parsed master resume
+        """
+        self.postings: Dict[str, Set[str]] = {}
+        self.skill_terms: Set[str] = set()
+        self.skills: Dict[str, List[str]] = {}
+
+        for skill in master_resume.skills:
+            for item in skill.items:
+                terms = tokenize(item)
+                if terms:
+                    self.skills[item] = terms
+                for term in terms:
+                    self.skill_terms.add(term)
+                    self.postings.setdefault(term, set()).add(f"skills:{item}")
+
+        for i, exp in enumerate(master_resume.work_experience):
+            for j, bullet in enumerate(exp.responsibilities):
+                for term in tokenize(bullet):
+                    self.postings.setdefault(term, set()).add(
+                        f"work_experience[{i}].responsibilities[{j}]"
+                    )
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.postings
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+
+def score_postings(
+    index: ResumeTermIndex,
+    jobs: List[JobDetails],
+    min_overlap: float = TRIAGE_MIN_OVERLAP,
+    vocabulary_path: Path = SKILL_VOCABULARY_PATH,
+) -> List[TriageResult]:
+    """
+    Rank postings by how well the master resume fits them.
+
+    Every posting is tokenized once into a sparse (posting, term, count)
+    table, and BM25 scores are computed for the whole inbox with NumPy,
+    using document frequencies across the inbox; they only order postings.
+
+    Whether a posting passes depends on the posting alone: its skills are
+    the skill vocabulary entries and resume skill items it mentions, and its
+    overlap is the share of them whose terms appear in the resume. Every
+    skill counts once, as in the skill overlap rule of the job analysis
+    task, and a posting that mentions no known skill is not filtered out.
+
+    Args:
+        index: Inverted index of the master resume
+        jobs: Postings; the raw description is scored when it is kept
+        min_overlap: Minimum overlap percentage for a posting to pass
+        vocabulary_path: Skill vocabulary (default: config/skills.yaml)
+
+    Returns:
+        List[TriageResult]: Results sorted by score, best first
+    """
+    if not jobs:
+        return []
+
+    # Skills by their terms; resume items come first to keep their spelling
+    skills: Dict[Tuple[str, ...], str] = {}
+    for skill in (*index.skills, *load_skill_vocabulary(vocabulary_path)):
+        skills.setdefault(tuple(tokenize(skill)), skill)
+    skills.pop((), None)
+    max_skill_length = max((len(key) for key in skills), default=0)
+
+    vocabulary: Dict[str, int] = {}
+    doc_ids: List[int] = []
+    term_ids: List[int] = []
+    doc_terms: List[Set[str]] = []
+    doc_skills: List[List[Tuple[str, ...]]] = []
+    for doc, job in enumerate(jobs):
+        # Cleaning drops "+" and "#", so C++ and C# only survive in the raw text
+        terms = tokenize(job.raw_job_description or job.job_description)
+        doc_terms.append(set(terms))
+        phrases = _phrases(terms, max_skill_length)
+        doc_skills.append([key for key in skills if key in phrases])
+        for term in terms:
+            doc_ids.append(doc)
+            term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+
+    n_docs = len(jobs)
+    n_terms = len(vocabulary)
+    doc_ids_arr = np.asarray(doc_ids, dtype=np.int64)
+    term_ids_arr = np.asarray(term_ids, dtype=np.int64)
+
+    # Collapse token occurrences into unique (doc, term) pairs with counts
+    pairs, tf = np.unique(doc_ids_arr * n_terms + term_ids_arr, return_counts=True)
+    pair_docs = pairs // n_terms
+    pair_terms = pairs % n_terms
+
+    doc_len = np.bincount(doc_ids_arr, minlength=n_docs).astype(np.float64)
+    avg_len = doc_len.mean() if doc_len.size else 0.0
+    df = np.bincount(pair_terms, minlength=n_terms).astype(np.float64)
+    idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+
+    query_weight = np.zeros(n_terms, dtype=np.float64)
+    for term, term_id in vocabulary.items():
+        if term in index:
+            query_weight[term_id] = (
+                SKILL_TERM_WEIGHT if term in index.skill_terms else 1.0
+            )
+
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len[pair_docs] / max(avg_len, 1e-9))
+    bm25 = idf[pair_terms] * tf * (BM25_K1 + 1) / (tf + norm)
+    scores = np.bincount(
+        pair_docs, weights=bm25 * query_weight[pair_terms], minlength=n_docs
+    )
+
+    results = []
+    for doc in np.argsort(-scores, kind="stable"):
+        terms = doc_terms[doc]
+        matched_skills = [
+            item
+            for item, item_terms in index.skills.items()
+            if all(t in terms for t in item_terms)
+        ]
+        missing_skills = [
+            skills[key] for key in doc_skills[doc] if not all(t in index for t in key)
+        ]
+        posting_skills = len(doc_skills[doc])
+        overlap = (
+            (posting_skills - len(missing_skills)) / posting_skills * 100
+            if posting_skills
+            else 100.0
+        )
+        results.append(
+            TriageResult(
+                job_details=jobs[doc],
+                score=round(float(scores[doc]), 3),
+                overlap_percentage=round(overlap, 1),
+                matched_skills=matched_skills,
+                missing_skills=missing_skills,
+                passed=overlap >= min_overlap,
+            )
+        )
+    return results
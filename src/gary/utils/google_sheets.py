@@ -1,6 +1,7 @@
 import os
+import threading
 import gspread
-from typing import List
+from typing import List, Optional
 from google.oauth2.service_account import Credentials
 from gary.config import DEFAULT_WORKSHEET_NAME, CREDENTIALS_FILE
 from gary.exceptions import GoogleSheetsError
@@ -54,6 +55,23 @@ class GoogleSheetsClient:
 
         self.worksheet.append_row(row_data)
 
+    def append_rows(self, rows: List[List[str]]) -> None:
+        """
+        Append several rows to the worksheet in a single API call.
+
+        Args:
+            rows: Rows to append, in order
+
+        Raises:
+            GoogleSheetsError: If no worksheet is connected
+        """
+        if not self.worksheet:
+            raise GoogleSheetsError(
+                "No worksheet connected. Call connect_to_sheet() first."
+            )
+
+        self.worksheet.append_rows(rows)
+
 
 def initialize_sheets_client(
     credentials_file: str = CREDENTIALS_FILE,
@@ -88,3 +106,27 @@ def initialize_sheets_client(
         raise GoogleSheetsError(
             f"Failed to initialize Google Sheets client: {e}"
         ) from e
+
+
+_shared_client: Optional[GoogleSheetsClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_sheets_client() -> GoogleSheetsClient:
+    """
+    Return the process-wide Google Sheets client, connecting on first use.
+
+    The service account session and the opened worksheet are reused across
+    calls instead of authorizing again for every write.
+
+    Returns:
+        Connected GoogleSheetsClient instance
+
+    Raises:
+        GoogleSheetsError: If GOOGLE_SHEETS_ID not found or connection fails
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = initialize_sheets_client()
+        return _shared_client
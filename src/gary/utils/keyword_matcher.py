@@ -0,0 +1,135 @@
+"""Multi-pattern keyword matching with an Aho-Corasick automaton."""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase text and collapse whitespace for case-insensitive matching.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        str: Normalized text
+    """
+    return " ".join(text.lower().split())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _continues_word(char: str) -> bool:
+    # "+" and "#" extend a word ("C++", "C#"), so "C" does not end before them
+    return _is_word_char(char) or char in "+#"
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that counts many keywords in one pass over a text.
+
+    Matching is case-insensitive and respects word boundaries: a keyword that
+    starts or ends with a word character only matches when the neighbouring
+    character in the text is not a word character, so "Java" does not match
+    inside "JavaScript" while "C++" and ".NET" still match next to punctuation.
+    A keyword ending with a word character does not match before "+" or "#"
+    either, so "C" does not match inside "C++" or "C#".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to match; duplicates after normalization are merged
+        """
+        self.keywords: List[str] = []
+        self._patterns: List[str] = []
+        seen: Dict[str, int] = {}
+        for keyword in keywords:
+            pattern = normalize_text(keyword)
+            if pattern and pattern not in seen:
+                seen[pattern] = len(self.keywords)
+                self.keywords.append(keyword.strip())
+                self._patterns.append(pattern)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self._patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            self._out[node].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find every keyword occurrence in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[Tuple[int, int]]: (keyword index, start offset) pairs in the normalized text
+        """
+        text = normalize_text(text)
+        matches = []
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._out[node]:
+                pattern = self._patterns[index]
+                start = position - len(pattern) + 1
+                end = position + 1
+                if (
+                    _is_word_char(pattern[0])
+                    and start > 0
+                    and _is_word_char(text[start - 1])
+                ):
+                    continue
+                if (
+                    _is_word_char(pattern[-1])
+                    and end < len(text)
+                    and _continues_word(text[end])
+                ):
+                    continue
+                matches.append((index, start))
+        return matches
+
+    def count(self, text: str) -> List[int]:
+        """
+        Count occurrences of each keyword in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[int]: Occurrence count per keyword, aligned with self.keywords
+        """
+        counts = [0] * len(self.keywords)
+        for index, _ in self.find_all(text):
+            counts[index] += 1
+        return counts
@@ -0,0 +1,370 @@
+"""Deterministic keyword integration scoring for tailored resumes."""
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Union
+from gary.models import (
+    JobAnalysis,
+    KeywordCount,
+    KeywordIntegration,
+    KeywordReport,
+    MasterResume,
+    PhraseUsage,
+    ResumeContent,
+    ResumeValidationReport,
+    ValidationFeedback,
+)
+from gary.config import (
+    MAX_KEYWORD_USES,
+    MIN_OVERALL_SCORE,
+    MIN_ATS_SCORE,
+    MIN_READABILITY_SCORE,
+    MIN_INTEGRATION_RATE,
+    LOCAL_CLEAR_PASS_RATE,
+    LOCAL_CLEAR_FAIL_RATE,
+)
+from gary.utils.keyword_matcher import KeywordMatcher, normalize_text
+
+# Skill categories counted toward the integration rate; bonus skills are
+# reported per keyword but are nice-to-have and do not affect the rate
+SCORED_CATEGORIES = ("technical", "soft", "management")
+KEYWORD_CATEGORIES = SCORED_CATEGORIES + ("bonus",)
+
+# AI-sounding phrases called out in the tailoring and validation prompts
+AI_PATTERN_PHRASES = ("leveraged", "spearheaded", "synergy", "utilized", "cutting-edge")
+
+_NUMBER_PATTERN = re.compile(r"\d")
+
+
+def resume_section_texts(
+    resume_content: Union[ResumeContent, MasterResume],
+) -> Dict[str, List[str]]:
+    """
+    Split resume content into searchable text fragments per section.
+
+    Args:
+        resume_content: Tailored resume content, or the master resume
+
+    Returns:
+        Dict[str, List[str]]: Text fragments keyed by section name
+    """
+    return {
+        "professional_summary": (
+            [resume_content.professional_summary.summary]
+            if resume_content.professional_summary
+            else []
+        ),
+        "work_experience": [
+            text
+            for exp in resume_content.work_experience
+            for text in [exp.title, *exp.responsibilities]
+        ],
+        "education": [
+            text
+            for edu in resume_content.education
+            for text in [edu.degree, *edu.coursework]
+        ],
+        "skills": [item for skill in resume_content.skills for item in skill.items],
+        "projects": [
+            text
+            for proj in resume_content.projects
+            for text in (proj.name, proj.description)
+        ],
+    }
+
+
+def analyze_keywords(
+    job_analysis: JobAnalysis, resume_content: ResumeContent
+) -> KeywordReport:
+    """
+    Count job keywords in the resume and compute integration metrics.
+
+    Args:
+        job_analysis: Job analysis with categorized skills
+        resume_content: Tailored resume content
+
+    Returns:
+        KeywordReport: Per-keyword counts per section and KeywordIntegration metrics
+    """
+    category_by_pattern: Dict[str, str] = {}
+    for category in KEYWORD_CATEGORIES:
+        for keyword in getattr(job_analysis.skills, category):
+            category_by_pattern.setdefault(normalize_text(keyword), category)
+
+    matcher = KeywordMatcher(
+        keyword
+        for category in KEYWORD_CATEGORIES
+        for keyword in getattr(job_analysis.skills, category)
+    )
+    counts = [
+        KeywordCount(
+            keyword=keyword,
+            category=category_by_pattern[normalize_text(keyword)],
+            sections={},
+        )
+        for keyword in matcher.keywords
+    ]
+
+    for section, texts in resume_section_texts(resume_content).items():
+        for text in texts:
+            for index, _ in matcher.find_all(text):
+                counts[index].total += 1
+                counts[index].sections[section] = (
+                    counts[index].sections.get(section, 0) + 1
+                )
+
+    scored = [c for c in counts if c.category in SCORED_CATEGORIES]
+    integrated = [c for c in scored if c.total > 0]
+    forced = [c.keyword for c in integrated if c.total > MAX_KEYWORD_USES]
+    # Nothing to integrate counts as full coverage
+    integration_rate = len(integrated) / len(scored) * 100 if scored else 100.0
+
+    keyword_analysis = KeywordIntegration(
+        total_keywords_from_job=len(scored),
+        keywords_integrated=len(integrated),
+        integration_rate=round(integration_rate, 1),
+        missing_critical_keywords=[
+            c.keyword for c in counts if c.category == "technical" and c.total == 0
+        ],
+        naturally_integrated_keywords=[
+            c.keyword for c in integrated if c.keyword not in forced
+        ],
+        forced_keywords=forced,
+    )
+    return KeywordReport(keywords=counts, keyword_analysis=keyword_analysis)
+
+
+def estimate_ats_score(
+    keyword_report: KeywordReport, resume_content: ResumeContent
+) -> int:
+    """
+    Estimate ATS compatibility from technical keyword coverage, quantified
+    bullets and section completeness.
+
+    Args:
+        keyword_report: Local keyword analysis
+        resume_content: Tailored resume content
+
+    Returns:
+        int: ATS score (0-100)
+    """
+    technical = [k for k in keyword_report.keywords if k.category == "technical"]
+    technical_coverage = (
+        sum(1 for k in technical if k.total > 0) / len(technical) if technical else 1.0
+    )
+
+    bullets = [
+        resp for exp in resume_content.work_experience for resp in exp.responsibilities
+    ]
+    quantified = (
+        sum(1 for b in bullets if _NUMBER_PATTERN.search(b)) / len(bullets)
+        if bullets
+        else 0.0
+    )
+
+    sections = (
+        resume_content.professional_summary.summary.strip(),
+        resume_content.work_experience,
+        resume_content.education,
+        resume_content.skills,
+    )
+    completeness = sum(1 for s in sections if s) / len(sections)
+
+    return round(
+        100 * (0.6 * technical_coverage + 0.2 * quantified + 0.2 * completeness)
+    )
+
+
+def estimate_readability_score(
+    keyword_report: KeywordReport, resume_content: ResumeContent
+) -> int:
+    """
+    Estimate readability by penalizing AI-sounding phrases, keyword stuffing
+    and repeated bullet opening verbs.
+
+    Args:
+        keyword_report: Local keyword analysis
+        resume_content: Tailored resume content
+
+    Returns:
+        int: Human readability score (0-100)
+    """
+    texts = [
+        text
+        for section in resume_section_texts(resume_content).values()
+        for text in section
+    ]
+    ai_phrases = sum(KeywordMatcher(AI_PATTERN_PHRASES).count(" \n ".join(texts)))
+
+    openers = Counter(
+        resp.split()[0].lower()
+        for exp in resume_content.work_experience
+        for resp in exp.responsibilities
+        if resp.split()
+    )
+    repeated_openers = sum(n - 2 for n in openers.values() if n > 2)
+
+    score = 100
+    score -= 5 * ai_phrases
+    score -= 10 * len(keyword_report.keyword_analysis.forced_keywords)
+    score -= 5 * repeated_openers
+    return max(0, min(100, score))
+
+
+def _overall_score(
+    integration_rate: float, ats_score: int, readability_score: int
+) -> int:
+    # Weighted as in resume_validation_task: 40% keywords, 30% ATS, 30% readability
+    return round(0.4 * integration_rate + 0.3 * ats_score + 0.3 * readability_score)
+
+
+def _passes(
+    overall_score: int, ats_score: int, readability_score: int, integration_rate: float
+) -> bool:
+    return (
+        overall_score >= MIN_OVERALL_SCORE
+        and ats_score >= MIN_ATS_SCORE
+        and readability_score >= MIN_READABILITY_SCORE
+        and integration_rate >= MIN_INTEGRATION_RATE
+    )
+
+
+def build_local_validation_report(
+    keyword_report: KeywordReport, resume_content: ResumeContent
+) -> ResumeValidationReport:
+    """
+    Build a complete validation report without the LLM validator.
+
+    Args:
+        keyword_report: Local keyword analysis
+        resume_content: Tailored resume content
+
+    Returns:
+        ResumeValidationReport: Report with locally estimated scores and feedback
+    """
+    keyword_analysis = keyword_report.keyword_analysis
+    ats_score = estimate_ats_score(keyword_report, resume_content)
+    readability_score = estimate_readability_score(keyword_report, resume_content)
+    overall_score = _overall_score(
+        keyword_analysis.integration_rate, ats_score, readability_score
+    )
+    passed = _passes(
+        overall_score, ats_score, readability_score, keyword_analysis.integration_rate
+    )
+
+    strengths = [
+        f"Integrates {keyword_analysis.keywords_integrated} of "
+        f"{keyword_analysis.total_keywords_from_job} job keywords "
+        f"({keyword_analysis.integration_rate:.1f}%)"
+    ]
+    weaknesses = []
+    suggestions = []
+    if keyword_analysis.missing_critical_keywords:
+        missing = ", ".join(keyword_analysis.missing_critical_keywords)
+        weaknesses.append(f"Missing technical keywords: {missing}")
+        suggestions.append(
+            f"Add these keywords where the experience supports them: {missing}"
+        )
+    if keyword_analysis.forced_keywords:
+        forced = ", ".join(keyword_analysis.forced_keywords)
+        weaknesses.append(f"Keywords used more than {MAX_KEYWORD_USES} times: {forced}")
+        suggestions.append(f"Reduce repetition of: {forced}")
+
+    return ResumeValidationReport(
+        passed_validation=passed,
+        overall_score=overall_score,
+        keyword_analysis=keyword_analysis,
+        phrase_analysis=PhraseUsage(),
+        feedback=ValidationFeedback(
+            strengths=strengths,
+            weaknesses=weaknesses,
+            suggestions=suggestions,
+            ats_score=ats_score,
+            human_readability_score=readability_score,
+        ),
+        ready_for_generation=passed and not keyword_analysis.missing_critical_keywords,
+    )
+
+
+def local_verdict(
+    job_analysis: JobAnalysis, resume_content: ResumeContent
+) -> Optional[bool]:
+    """
+    Decide whether local checks alone clearly pass or fail the resume.
+
+    Args:
+        job_analysis: Job analysis with categorized skills
+        resume_content: Tailored resume content
+
+    Returns:
+        Optional[bool]: True for a clear pass, False for a clear fail, None if the LLM validator is needed
+    """
+    keyword_report = analyze_keywords(job_analysis, resume_content)
+    keyword_analysis = keyword_report.keyword_analysis
+
+    if keyword_analysis.integration_rate < LOCAL_CLEAR_FAIL_RATE:
+        return False
+
+    report = build_local_validation_report(keyword_report, resume_content)
+    if (
+        keyword_analysis.integration_rate >= LOCAL_CLEAR_PASS_RATE
+        and report.passed_validation
+        and not keyword_analysis.forced_keywords
+    ):
+        return True
+    return None
+
+
+def apply_keyword_analysis(
+    validation_report: ResumeValidationReport, keyword_report: KeywordReport
+) -> ResumeValidationReport:
+    """
+    Replace the LLM's keyword counts with local ones and recompute the verdict.
+
+    Forced keywords flagged by the LLM are kept alongside locally detected
+    keyword stuffing, since awkward placement is a subjective judgement.
+
+    Args:
+        validation_report: Report produced by the LLM validator
+        keyword_report: Local keyword analysis
+
+    Returns:
+        ResumeValidationReport: Report with local keyword metrics and recomputed scores
+    """
+    keyword_analysis = keyword_report.keyword_analysis.model_copy(deep=True)
+    integrated = {k.keyword.lower() for k in keyword_report.keywords if k.total > 0}
+    for keyword in validation_report.keyword_analysis.forced_keywords:
+        if (
+            keyword.lower() in integrated
+            and keyword not in keyword_analysis.forced_keywords
+        ):
+            keyword_analysis.forced_keywords.append(keyword)
+    forced = {k.lower() for k in keyword_analysis.forced_keywords}
+    keyword_analysis.naturally_integrated_keywords = [
+        k
+        for k in keyword_analysis.naturally_integrated_keywords
+        if k.lower() not in forced
+    ]
+
+    feedback = validation_report.feedback
+    overall_score = _overall_score(
+        keyword_analysis.integration_rate,
+        feedback.ats_score,
+        feedback.human_readability_score,
+    )
+    passed = _passes(
+        overall_score,
+        feedback.ats_score,
+        feedback.human_readability_score,
+        keyword_analysis.integration_rate,
+    )
+
+    return validation_report.model_copy(
+        update={
+            "keyword_analysis": keyword_analysis,
+            "overall_score": overall_score,
+            "passed_validation": passed,
+            "ready_for_generation": passed
+            and not keyword_analysis.missing_critical_keywords,
+        }
+    )
@@ -0,0 +1,320 @@
+"""Near-duplicate job posting detection with MinHash and LSH.
+
+The same role is often posted by several recruiters and job boards with
+small wording changes. Each cleaned description is reduced to a MinHash
+signature over its word shingles; the fraction of positions where two
+signatures agree estimates the Jaccard similarity of their shingle sets.
+Signatures are split into bands, and postings sharing a band are the only
+candidates compared, so a lookup reads a few index rows however many
+postings are indexed.
+
+The index is a SQLite file next to the other caches. The application ledger
+stays the source of truth: NearDuplicateIndex.sync indexes ledger rows
+recorded since the last sync, and the index is rebuilt from the ledger when
+deleted or when its MinHash parameters change.
+"""
+
+import sqlite3
+import string
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from gary.config import (
+    NEAR_DUPLICATE_BANDS,
+    NEAR_DUPLICATE_INDEX_PATH,
+    NEAR_DUPLICATE_PERMUTATIONS,
+    NEAR_DUPLICATE_SHINGLE_SIZE,
+    NEAR_DUPLICATE_THRESHOLD,
+)
+from gary.utils.application_ledger import ApplicationLedger
+
+# Punctuation separates words like whitespace does
+_PUNCTUATION_TO_SPACE = bytes.maketrans(
+    string.punctuation.encode("ascii"), b" " * len(string.punctuation)
+)
+
+# Fixed so that signatures stored in the index stay comparable across runs
+_SEED = 20240917
+_SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_SHIFT = np.uint64(32)
+
+# Rows indexed per transaction while syncing from the ledger
+_SYNC_BATCH_SIZE = 1000
+
+
+def shingle_hashes(text: str, size: int = NEAR_DUPLICATE_SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hash the word shingles of a cleaned description.
+
+    Matching is case-insensitive and ignores punctuation. Texts shorter than
+    one shingle are hashed as a single shingle of all their words. Repeated
+    shingles are kept, since they do not change a MinHash signature.
+
+    Args:
+        text: Output of clean_job_description
+        size: Words per shingle
+
+    Returns:
+        np.ndarray: 64-bit shingle hashes in text order (empty for empty text)
+    """
+    words = text.encode("utf-8").lower().translate(_PUNCTUATION_TO_SPACE).split()
+    words_hashed = np.fromiter(map(zlib.crc32, words), dtype=np.uint64)
+    size = max(1, min(size, len(words)))
+    count = len(words) - size + 1
+    hashes = np.zeros(max(0, count), dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * _SHINGLE_MULTIPLIER + words_hashed[offset : offset + count]
+    return hashes
+
+
+class MinHasher:
+    """MinHash signatures and LSH band keys with fixed random parameters."""
+
+    def __init__(
+        self,
+        num_perm: int = NEAR_DUPLICATE_PERMUTATIONS,
+        bands: int = NEAR_DUPLICATE_BANDS,
+        shingle_size: int = NEAR_DUPLICATE_SHINGLE_SIZE,
+    ):
+        """
+        Args:
+            num_perm: Hash functions per signature
+            bands: LSH bands; must divide num_perm
+            shingle_size: Words per shingle
+
+        Raises:
+            ValueError: If bands does not divide num_perm
+        """
+        if num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {num_perm} permutations")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+
+        # Multiply-shift hashing: the top 32 bits of a * x + b (mod 2^64)
+        rng = np.random.default_rng(_SEED)
+        max_value = np.iinfo(np.uint64).max
+        self._a = rng.integers(1, max_value, size=num_perm, dtype=np.uint64) | 1
+        self._b = rng.integers(0, max_value, size=num_perm, dtype=np.uint64)
+        self._row_multipliers = (
+            rng.integers(1, max_value, size=num_perm // bands, dtype=np.uint64) | 1
+        )
+        self._band_offsets = rng.integers(0, max_value, size=bands, dtype=np.uint64)
+
+    @property
+    def params(self) -> str:
+        """Parameters a stored signature depends on."""
+        return f"{_SEED}:{self.num_perm}:{self.bands}:{self.shingle_size}"
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a cleaned description.
+
+        Args:
+            text: Output of clean_job_description
+
+        Returns:
+            np.ndarray: num_perm uint32 values (all 0xFFFFFFFF for empty text)
+        """
+        shingles = shingle_hashes(text, self.shingle_size)
+        if not len(shingles):
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        # In place, to avoid num_perm x shingles temporaries; the shift is
+        # monotonic, so it can follow the minimum
+        hashed = np.multiply.outer(self._a, shingles)
+        hashed += self._b[:, None]
+        return (hashed.min(axis=1) >> _SHIFT).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """
+        Hash each band of a signature to a signed 64-bit bucket key.
+
+        Args:
+            signature: Output of signature()
+
+        Returns:
+            List[int]: One key per band, distinct across bands
+        """
+        rows = signature.astype(np.uint64).reshape(self.bands, -1)
+        keys = (rows * self._row_multipliers).sum(axis=1, dtype=np.uint64)
+        return (keys + self._band_offsets).view(np.int64).tolist()
+
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash/LSH index of cleaned descriptions, keyed by ledger id.
+
+    Lookups reuse one SQLite connection, guarded by a lock, since opening a
+    connection costs more than the lookup itself.
+    """
+
+    def __init__(
+        self,
+        path: Path = NEAR_DUPLICATE_INDEX_PATH,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        hasher: Optional[MinHasher] = None,
+    ):
+        """
+        Open the index, creating the database if needed.
+
+        Entries indexed with different MinHash parameters are dropped, and
+        are indexed again by the next sync.
+
+        Args:
+            path: Path to the SQLite database file
+            threshold: Minimum estimated Jaccard similarity of a match
+            hasher: MinHash parameters (default: from config)
+        """
+        self.path = Path(path)
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS signatures ("
+                "record_id INTEGER PRIMARY KEY, signature BLOB NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "key INTEGER NOT NULL, record_id INTEGER NOT NULL, "
+                "PRIMARY KEY (key, record_id)) WITHOUT ROWID"
+            )
+            row = conn.execute(
+                "SELECT value FROM meta WHERE name = 'params'"
+            ).fetchone()
+            if row is None or row[0] != self.hasher.params:
+                conn.execute("DELETE FROM signatures")
+                conn.execute("DELETE FROM buckets")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('params', ?)",
+                    (self.hasher.params,),
+                )
+
+    def add_many(self, entries: Iterable[Tuple[int, str]]) -> int:
+        """
+        Index cleaned descriptions of new ledger records.
+
+        Args:
+            entries: (ledger record id, cleaned description) pairs
+
+        Returns:
+            int: Number of descriptions indexed
+        """
+        signatures = []
+        buckets = []
+        for record_id, job_description in entries:
+            signature = self.hasher.signature(job_description)
+            signatures.append((record_id, signature.tobytes()))
+            buckets.extend((key, record_id) for key in self.hasher.band_keys(signature))
+        with self._lock, self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO signatures (record_id, signature) VALUES (?, ?)",
+                signatures,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO buckets (key, record_id) VALUES (?, ?)", buckets
+            )
+        return len(signatures)
+
+    def add(self, record_id: int, job_description: str) -> None:
+        """
+        Index one cleaned description.
+
+        Args:
+            record_id: Ledger row id of the application
+            job_description: Output of clean_job_description
+        """
+        self.add_many([(record_id, job_description)])
+
+    def query(
+        self, job_description: str, exclude: Sequence[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """
+        Find indexed descriptions similar to a cleaned description.
+
+        Args:
+            job_description: Output of clean_job_description
+            exclude: Ledger record ids to leave out of the result
+
+        Returns:
+            List of (ledger record id, estimated Jaccard similarity) at or
+            above the threshold, most similar first
+        """
+        signature = self.hasher.signature(job_description)
+        keys = self.hasher.band_keys(signature)
+        placeholders = ", ".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record_id, signature FROM signatures WHERE record_id IN ("
+                f"SELECT record_id FROM buckets WHERE key IN ({placeholders}))",
+                keys,
+            ).fetchall()
+
+        excluded = set(exclude)
+        matches = []
+        for record_id, blob in rows:
+            if record_id in excluded:
+                continue
+            similarity = estimate_similarity(
+                signature, np.frombuffer(blob, dtype=np.uint32)
+            )
+            if similarity >= self.threshold:
+                matches.append((record_id, similarity))
+        matches.sort(key=lambda match: (-match[1], -match[0]))
+        return matches
+
+    def last_record_id(self) -> int:
+        """Return the highest indexed ledger id, or 0 when the index is empty."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(record_id) FROM signatures").fetchone()
+        return row[0] or 0
+
+    def sync(self, ledger: ApplicationLedger) -> int:
+        """
+        Index applications recorded in the ledger since the last sync.
+
+        Args:
+            ledger: Application ledger
+
+        Returns:
+            int: Number of applications indexed
+        """
+        # A newer ledger reuses ids of the one the index was built from
+        if self.last_record_id() > ledger.last_record_id():
+            self.clear()
+
+        indexed = 0
+        while True:
+            records = ledger.recorded_after(self.last_record_id(), _SYNC_BATCH_SIZE)
+            if not records:
+                return indexed
+            indexed += self.add_many(
+                (r.id, r.job_details.job_description) for r in records
+            )
+
+    def clear(self) -> None:
+        """Remove every indexed description."""
+        with self._lock, self._conn as conn:
+            conn.execute("DELETE FROM signatures")
+            conn.execute("DELETE FROM buckets")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,177 @@
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from gary.models import BoilerplateReport, InvalidJobRecord, JobDetails
+from gary.exceptions import DataLoadError
+from gary.utils.clean_job_description import (
+    prepare_job_description,
+    prepare_job_descriptions,
+)
+
+REQUIRED_FIELDS = ("company_name", "job_title", "location", "job_description")
+
+
+def _field(record: Dict[str, Any], key: str) -> str:
+    """Return a record field as a stripped string, empty if missing."""
+    value = record.get(key)
+    return str(value).strip() if value is not None else ""
+
+
+def _check_required_fields(record: Dict[str, Any]) -> None:
+    """
+    Raises:
+        ValueError: If a required field is missing or empty
+    """
+    missing = [key for key in REQUIRED_FIELDS if not _field(record, key)]
+    if missing:
+        raise ValueError(f"missing required fields: {', '.join(missing)}")
+
+
+def _to_job_details(
+    record: Dict[str, Any],
+    default_date: str,
+    prepared: Optional[Tuple[str, Optional[BoilerplateReport]]] = None,
+) -> JobDetails:
+    """
+    Convert a raw record into a JobDetails model with a cleaned description.
+
+    Args:
+        record: Raw field mapping from a JSONL line or CSV row
+        default_date: Date used when the record has no date_applied
+        prepared: Output of prepare_job_description for the record's
+            description, if already computed
+
+    Returns:
+        JobDetails: Populated job details model
+
+    Raises:
+        ValueError: If a required field is missing or empty
+    """
+    _check_required_fields(record)
+
+    job_id = _field(record, "job_id")
+    raw_job_description = _field(record, "job_description")
+    job_description, boilerplate = prepared or prepare_job_description(
+        raw_job_description
+    )
+    return JobDetails(
+        company_name=_field(record, "company_name"),
+        job_title=_field(record, "job_title"),
+        location=_field(record, "location"),
+        job_id=job_id if job_id else None,
+        job_description=job_description,
+        date_applied=_field(record, "date_applied") or default_date,
+        raw_job_description=raw_job_description,
+        boilerplate=boilerplate,
+    )
+
+
+def job_details_from_record(record: Dict[str, Any]) -> JobDetails:
+    """
+    Convert one submitted posting into a JobDetails model.
+
+    Uses the same rules as read_job_details_file: the description is cleaned
+    and date_applied defaults to today.
+
+    Args:
+        record: Field mapping with the JobDetails fields
+
+    Returns:
+        JobDetails: Populated job details model
+
+    Raises:
+        ValueError: If a required field is missing or empty
+    """
+    return _to_job_details(record, datetime.now().strftime("%m-%d-%Y"))
+
+
+def read_job_details_file(path: Path) -> List[Union[JobDetails, InvalidJobRecord]]:
+    """
+    Read job postings from a JSONL or CSV file.
+
+    Each JSONL line or CSV row must provide the JobDetails fields. date_applied
+    is optional and defaults to today in MM-DD-YYYY format. A line that is not
+    valid JSON, or a record with a missing field, is returned as an
+    InvalidJobRecord in its place, so the rest of the file is still read.
+
+    Args:
+        path: Path to a .jsonl or .csv file
+
+    Returns:
+        List[Union[JobDetails, InvalidJobRecord]]: Parsed job details and
+        invalid records, in file order
+
+    Raises:
+        DataLoadError: If the file is missing, unreadable or has an unsupported extension
+    """
+    path = Path(path)
+    if not path.exists():
+        raise DataLoadError(f"Job details file not found at {path}")
+
+    default_date = datetime.now().strftime("%m-%d-%Y")
+    suffix = path.suffix.lower()
+
+    entries: List[Union[Dict[str, Any], InvalidJobRecord]] = []
+    line_numbers: List[int] = []
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            if suffix in (".jsonl", ".ndjson"):
+                for line_no, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    line_numbers.append(line_no)
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        entries.append(
+                            InvalidJobRecord(
+                                file_name=path.name,
+                                line_number=line_no,
+                                error=f"invalid JSON: {e}",
+                            )
+                        )
+            elif suffix == ".csv":
+                for line_no, row in enumerate(csv.DictReader(f), start=2):
+                    line_numbers.append(line_no)
+                    entries.append(row)
+            else:
+                raise DataLoadError(
+                    f"Unsupported job details file type '{suffix}' (expected .jsonl or .csv)"
+                )
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise DataLoadError(f"Failed to read {path.name}: {e}") from e
+
+    for i, (line_no, entry) in enumerate(zip(line_numbers, entries)):
+        if isinstance(entry, InvalidJobRecord):
+            continue
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("expected a JSON object")
+            _check_required_fields(entry)
+        except ValueError as e:
+            entries[i] = InvalidJobRecord(
+                file_name=path.name, line_number=line_no, error=str(e)
+            )
+
+    # Descriptions are prepared together, in a process pool for large files
+    records = [entry for entry in entries if isinstance(entry, dict)]
+    prepared = iter(
+        prepare_job_descriptions(
+            [_field(record, "job_description") for record in records]
+        )
+    )
+
+    jobs: List[Union[JobDetails, InvalidJobRecord]] = []
+    for line_no, entry in zip(line_numbers, entries):
+        if isinstance(entry, InvalidJobRecord):
+            jobs.append(entry)
+            continue
+        try:
+            jobs.append(_to_job_details(entry, default_date, next(prepared)))
+        except ValueError as e:
+            jobs.append(
+                InvalidJobRecord(file_name=path.name, line_number=line_no, error=str(e))
+            )
+    return jobs
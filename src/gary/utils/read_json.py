@@ -1,13 +1,17 @@
 import json
-from gary.models import MasterResume
+from pathlib import Path
+from gary.models import MasterResume, Resume
 from gary.config import RESUME_PATH
 from gary.exceptions import DataLoadError
 
 
-def read_resume_json() -> MasterResume:
+def read_resume_json(path: Path = RESUME_PATH) -> MasterResume:
     """
     Read resume.json from the data directory and return as MasterResume model.
 
+    Args:
+        path: Path to the master resume JSON file
+
     Returns:
         MasterResume: Parsed resume data containing header and content
 
@@ -15,10 +19,11 @@ def read_resume_json() -> MasterResume:
         DataLoadError: If resume.json does not exist, is invalid, or doesn't match schema
     """
     try:
-        if not RESUME_PATH.exists():
-            raise DataLoadError(f"resume.json not found at {RESUME_PATH}")
+        path = Path(path)
+        if not path.exists():
+            raise DataLoadError(f"resume.json not found at {path}")
 
-        with open(RESUME_PATH, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
         return MasterResume(**data)
@@ -26,3 +31,25 @@ def read_resume_json() -> MasterResume:
         raise DataLoadError(f"Failed to parse resume.json: {e}") from e
     except Exception as e:
         raise DataLoadError(f"Failed to read resume.json: {e}") from e
+
+
+def read_tailored_resume(path: Path) -> Resume:
+    """
+    Read a tailored resume saved next to its generated Word document.
+
+    Args:
+        path: Path to the saved Resume JSON file
+
+    Returns:
+        Resume: Parsed tailored resume
+
+    Raises:
+        DataLoadError: If the file does not exist or doesn't match the Resume schema
+    """
+    path = Path(path)
+    if not path.exists():
+        raise DataLoadError(f"Resume file not found at {path}")
+    try:
+        return Resume.model_validate_json(path.read_text(encoding="utf-8"))
+    except ValueError as e:
+        raise DataLoadError(f"Failed to parse {path}: {e}") from e
@@ -1,8 +1,106 @@
-"""Utility for parsing CrewAI result outputs."""
+"""Utility for parsing CrewAI result outputs.
+
+Agent answers often wrap their JSON in a "Thought:" preamble, a Markdown
+code fence or a closing remark, and may mention other braces along the way.
+Candidates start at the braces that can open a JSON value, which a
+lookahead tells apart from braces in prose; the C decoder then finds where
+each candidate ends, instead of a greedy regex that also captures the text
+between two objects.
+"""
 
 import json
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# An object opens with a key or closes at once; an array opens with a value
+_OBJECT_OPENER = re.compile(r'\{(?=\s*["}])')
+_VALUE_OPENER = re.compile(r'\{(?=\s*["}])|\[(?=\s*[\[\]{"\-\dtfn])')
+_FENCE = re.compile(r"^```[\w-]*[ \t]*\n?(.*?)\n?```$", re.DOTALL)
+
+_decoder = json.JSONDecoder()
+
+
+def strip_code_fence(text: str) -> str:
+    """
+    Remove a Markdown code fence around the whole text, if any.
+
+    Args:
+        text: Agent output
+
+    Returns:
+        str: The fenced content, or the stripped text when it is not fenced
+    """
+    text = text.strip()
+    match = _FENCE.match(text)
+    return match.group(1).strip() if match else text
+
+
+def iter_json_spans(
+    text: str, objects_only: bool = False
+) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Yield the top-level JSON values in a text, in order.
+
+    After a value the scan resumes at its end, and after an opening bracket
+    that does not start valid JSON, right after that bracket.
+
+    Args:
+        text: Text that may contain JSON
+        objects_only: Skip arrays
+
+    Yields:
+        Tuple of the start and end offsets of each value, and the value
+    """
+    opener_pattern = _OBJECT_OPENER if objects_only else _VALUE_OPENER
+    pos = 0
+    while True:
+        opener = opener_pattern.search(text, pos)
+        if opener is None:
+            return
+        begin = opener.start()
+        try:
+            value, end = _decoder.raw_decode(text, begin)
+        except json.JSONDecodeError:
+            pos = begin + 1
+            continue
+        yield begin, end, value
+        pos = end
+
+
+def parse_json_model(text: str, model: Type[ModelT]) -> ModelT:
+    """
+    Validate the first JSON object in an agent output that fits the model.
+
+    The whole (unfenced) text is validated first, as most outputs are
+    nothing but the JSON. Otherwise each JSON object in it is validated in
+    turn, straight from its text with model_validate_json.
+
+    Args:
+        text: Agent output
+        model: Pydantic model to validate into
+
+    Returns:
+        ModelT: Validated model
+
+    Raises:
+        ValueError: If no JSON value in the text validates as the model
+    """
+    text = strip_code_fence(text)
+    try:
+        return model.model_validate_json(text)
+    except ValidationError as e:
+        error: Optional[ValidationError] = e
+    for begin, end, _ in iter_json_spans(text, objects_only=True):
+        try:
+            return model.model_validate_json(text[begin:end])
+        except ValidationError as e:
+            error = e
+    raise ValueError(
+        f"No {model.__name__} JSON found in result: {text[:200]}...\n{error}"
+    )
 
 
 def parse_crew_result(result: Any) -> Dict[str, Any]:
@@ -15,6 +113,8 @@ def parse_crew_result(result: Any) -> Dict[str, Any]:
     - Dictionary objects
     - Other objects (returned as-is)
 
+    The first JSON value in a string wins and anything after it is ignored.
+
     Args:
         result: Result from CrewAI kickoff
 
@@ -30,23 +130,8 @@ def parse_crew_result(result: Any) -> Dict[str, Any]:
 
     # Handle string results
     if isinstance(result, str):
-        # Try to extract JSON from string (handles extra text after JSON)
-        result = result.strip()
-
-        # Try parsing as-is first
-        try:
-            return json.loads(result)
-        except json.JSONDecodeError:
-            pass
-
-        # Try to find JSON object/array in the string
-        # Look for outermost {...} or [...]
-        json_match = re.search(r"(\{.*\}|\[.*\])", result, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+        for _, _, value in iter_json_spans(strip_code_fence(result)):
+            return value
 
         raise ValueError(f"Could not parse result as JSON: {result[:200]}...")
 
@@ -0,0 +1,197 @@
+"""Compiled master resume artifact, rebuilt only when resume.json changes.
+
+Parsing and validating resume.json, encoding it as the tailor prompt,
+building the term index used by triage and tokenizing every bullet for
+relevance slicing depend only on the file's content. They are computed once
+per edit and pickled to RESUME_ARTIFACT_PATH behind a header holding a hash
+of the file, which later runs check before loading the rest with a single
+memory-mapped read.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+from collections import Counter
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from gary.config import COMPACT_PROMPT_ENCODING, RESUME_ARTIFACT_PATH, RESUME_PATH
+from gary.exceptions import DataLoadError
+from gary.models import MasterResume
+from gary.utils.fit_score import ResumeTermIndex, tokenize
+from gary.utils.resume_prompt import build_resume_prompt
+from gary.utils.tokens import estimate_tokens
+
+# Bump when CompiledResume, tokenize or the prompt encoding change
+ARTIFACT_VERSION = 1
+
+_HEADER_PREFIX = b"gary-resume-artifact "
+
+# Sliceable resume item: (kind, parent index, item index, text)
+ResumeItem = Tuple[str, int, int, str]
+
+# Artifact of the master resume this process loaded last
+_current: Optional["CompiledResume"] = None
+
+
+def resume_items(master_resume: MasterResume) -> List[ResumeItem]:
+    """
+    Flatten the items relevance slicing can drop: bullets, projects, courses.
+
+    Args:
+        master_resume: Parsed master resume
+
+    Returns:
+        List[ResumeItem]: Items in resume order
+    """
+    items: List[ResumeItem] = []
+    for i, exp in enumerate(master_resume.work_experience):
+        items += [("bullet", i, j, b) for j, b in enumerate(exp.responsibilities)]
+    for i, proj in enumerate(master_resume.projects):
+        items.append(("project", 0, i, f"{proj.name} {proj.description}"))
+    for i, edu in enumerate(master_resume.education):
+        items += [("course", i, j, c) for j, c in enumerate(edu.coursework)]
+    return items
+
+
+class CompiledResume:
+    """
+    The master resume with everything derived from it that does not depend
+    on the job.
+    """
+
+    def __init__(self, master_resume: MasterResume, content_hash: str):
+        """
+        Compile the artifact.
+
+        Args:
+            master_resume: Parsed master resume
+            content_hash: Artifact key of the resume.json content
+        """
+        self.content_hash = content_hash
+        self.master_resume = master_resume
+        self.resume_prompt: Union[str, dict] = build_resume_prompt(master_resume)
+        self.prompt_tokens = estimate_tokens(self.resume_prompt)
+        self.term_index = ResumeTermIndex(master_resume)
+        self.items = resume_items(master_resume)
+        # Term frequencies per item, aligned with items
+        self.item_terms: List[Counter] = [
+            Counter(tokenize(text)) for *_, text in self.items
+        ]
+
+
+def artifact_key(resume_bytes: bytes) -> str:
+    """
+    Hash resume.json content together with what shapes the artifact.
+
+    Args:
+        resume_bytes: Raw resume.json content
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{ARTIFACT_VERSION}:{COMPACT_PROMPT_ENCODING}\0".encode("utf-8"))
+    digest.update(resume_bytes)
+    return digest.hexdigest()
+
+
+def _read_artifact(path: Path, key: str) -> Optional[CompiledResume]:
+    """Map the artifact file and unpickle it if its header matches the key."""
+    header = _HEADER_PREFIX + key.encode("ascii") + b"\n"
+    try:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            if data[: len(header)] != header:
+                return None
+            data.seek(len(header))
+            compiled = pickle.load(data)
+    except (
+        OSError,
+        ValueError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+    ):
+        # Missing, empty, truncated or written by older code: rebuild it
+        return None
+    return compiled if isinstance(compiled, CompiledResume) else None
+
+
+def _write_artifact(path: Path, compiled: CompiledResume) -> None:
+    """Write the artifact atomically; a failure only costs the next run a rebuild."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER_PREFIX + compiled.content_hash.encode("ascii") + b"\n")
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"⚠ Could not save the compiled master resume: {e}")
+
+
+def load_compiled_resume(
+    path: Path = RESUME_PATH, artifact_path: Path = RESUME_ARTIFACT_PATH
+) -> CompiledResume:
+    """
+    Load the compiled master resume, compiling it if resume.json changed.
+
+    The loaded artifact becomes the process's current one (see compiled_for).
+
+    Args:
+        path: Path to the master resume JSON file
+        artifact_path: Path to the compiled artifact
+
+    Returns:
+        CompiledResume: Compiled master resume
+
+    Raises:
+        DataLoadError: If resume.json does not exist, is invalid, or doesn't match schema
+    """
+    global _current
+    path = Path(path)
+    if not path.exists():
+        raise DataLoadError(f"resume.json not found at {path}")
+    try:
+        resume_bytes = path.read_bytes()
+    except OSError as e:
+        raise DataLoadError(f"Failed to read resume.json: {e}") from e
+
+    key = artifact_key(resume_bytes)
+    compiled = _read_artifact(Path(artifact_path), key)
+    if compiled is None:
+        try:
+            master_resume = MasterResume.model_validate_json(resume_bytes)
+        except ValidationError as e:
+            raise DataLoadError(f"Failed to parse resume.json: {e}") from e
+        compiled = CompiledResume(master_resume, key)
+        _write_artifact(Path(artifact_path), compiled)
+
+    _current = compiled
+    return compiled
+
+
+def compiled_for(master_resume: Any) -> Optional[CompiledResume]:
+    """
+    Return the current compiled artifact if it was built from this very object.
+
+    Sliced copies and resumes loaded some other way get None, and callers
+    compute what they need from the model instead.
+
+    Args:
+        master_resume: Master resume about to be used
+
+    Returns:
+        Optional[CompiledResume]: The artifact, or None
+    """
+    compiled = _current
+    if compiled is not None and compiled.master_resume is master_resume:
+        return compiled
+    return None
@@ -0,0 +1,205 @@
+"""Prompt payloads built from the master resume and other crew models.
+
+With COMPACT_PROMPT_ENCODING, models are sent in a sectioned format that
+names each field once per section instead of once per item:
+
+    ## work_experience (title|company|startDate|endDate|responsibilities)
+    ["Senior Engineer","Acme","2021","Present",["Built ...","Led ..."]]
+    ["Engineer","Initech","2018","2021",["Shipped ..."]]
+    ## tone_and_priorities
+    ["Fast-paced","Ownership"]
+
+Every row is minified JSON, so the encoding is lossless and decode_compact
+maps it back to the model.
+"""
+
+import json
+import typing
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+from pydantic import BaseModel
+from gary.config import COMPACT_PROMPT_ENCODING
+from gary.models import MasterResume
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+SECTION_PREFIX = "## "
+
+# Leads every compact payload so the agent can read the format
+COMPACT_FORMAT_NOTE = (
+    "(Format: '## section (field|...)' then one JSON row per item, in field order)"
+)
+
+
+def build_resume_content_dict(master_resume: MasterResume) -> Dict[str, Any]:
+    """
+    Extract resume content (without header) for crew processing.
+
+    Args:
+        master_resume: Parsed master resume
+
+    Returns:
+        Dict[str, Any]: Resume content sections keyed by field name
+    """
+    return {
+        "professional_summary": (
+            master_resume.professional_summary.model_dump()
+            if master_resume.professional_summary
+            else None
+        ),
+        "work_experience": [exp.model_dump() for exp in master_resume.work_experience],
+        "education": [edu.model_dump() for edu in master_resume.education],
+        "skills": [skill.model_dump() for skill in master_resume.skills],
+        "projects": [proj.model_dump() for proj in master_resume.projects],
+    }
+
+
+def _field_shape(annotation: Any) -> Tuple[bool, Optional[Type[BaseModel]]]:
+    """
+    Describe a field annotation as (is a list, nested model class or None).
+
+    Optional[...] is unwrapped; other unions are treated as scalars.
+    """
+    if typing.get_origin(annotation) is Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    is_list = typing.get_origin(annotation) in (list, List)
+    if is_list:
+        annotation = typing.get_args(annotation)[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return is_list, annotation
+    return is_list, None
+
+
+def _row(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_compact(model: BaseModel, exclude: Optional[Set[str]] = None) -> str:
+    """
+    Encode a model as compact prompt sections.
+
+    Fields set to None are left out and restored from their defaults by
+    decode_compact.
+
+    Args:
+        model: Model to encode
+        exclude: Top-level fields to leave out
+
+    Returns:
+        str: Compact encoding, starting with COMPACT_FORMAT_NOTE
+    """
+    data = model.model_dump(mode="json", exclude=exclude)
+    lines = [COMPACT_FORMAT_NOTE]
+    for name, field in type(model).model_fields.items():
+        value = data.get(name)
+        if value is None:
+            continue
+        is_list, nested = _field_shape(field.annotation)
+        if nested is None:
+            # Scalars and lists of scalars take a single row
+            lines.append(f"{SECTION_PREFIX}{name}")
+            lines.append(_row(value))
+            continue
+
+        fields = list(nested.model_fields)
+        lines.append(f"{SECTION_PREFIX}{name} ({'|'.join(fields)})")
+        for item in value if is_list else [value]:
+            lines.append(_row([item[f] for f in fields]))
+    return "\n".join(lines)
+
+
+def decode_compact(text: str, model_cls: Type[ModelT]) -> ModelT:
+    """
+    Map compact prompt sections, e.g. from model output, back to a model.
+
+    Text before the first section header (such as the format note) is
+    ignored.
+
+    Args:
+        text: Output of encode_compact, or text in the same format
+        model_cls: Model to validate the sections against
+
+    Returns:
+        ModelT: Validated model
+
+    Raises:
+        ValueError: If a row is not valid JSON or the sections fail validation
+    """
+    sections: Dict[str, Tuple[Optional[List[str]], List[Any]]] = {}
+    rows = None
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if line.startswith(SECTION_PREFIX):
+            header = line[len(SECTION_PREFIX) :].strip()
+            name, _, fields = header.partition(" ")
+            fields = fields.strip()
+            columns = fields[1:-1].split("|") if fields.startswith("(") else None
+            rows = []
+            sections[name] = (columns, rows)
+        elif rows is not None and line.strip():
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid row on line {line_no}: {e}") from e
+
+    data = {}
+    for name, (columns, section_rows) in sections.items():
+        field = model_cls.model_fields.get(name)
+        if field is None:
+            continue
+        is_list, nested = _field_shape(field.annotation)
+        if columns is not None:
+            section_rows = [dict(zip(columns, row)) for row in section_rows]
+        if is_list and nested is not None:
+            data[name] = section_rows
+        elif section_rows:
+            data[name] = section_rows[0]
+    return model_cls.model_validate(data)
+
+
+def build_resume_prompt(master_resume: MasterResume) -> Union[str, Dict[str, Any]]:
+    """
+    Build the `{master_resume}` prompt input.
+
+    Args:
+        master_resume: Parsed (possibly sliced) master resume
+
+    Returns:
+        Union[str, Dict[str, Any]]: Compact sections without the header, or
+        the content dict when COMPACT_PROMPT_ENCODING is off
+    """
+    if COMPACT_PROMPT_ENCODING:
+        return encode_compact(master_resume, exclude={"header"})
+    return build_resume_content_dict(master_resume)
+
+
+def build_model_prompt(model: BaseModel) -> str:
+    """
+    Build a prompt input such as `{job_analysis}` or `{tailored_resume}`.
+
+    Args:
+        model: Job analysis, tailored resume content or another model
+
+    Returns:
+        str: Compact sections, or minified JSON when COMPACT_PROMPT_ENCODING is off
+    """
+    if COMPACT_PROMPT_ENCODING:
+        return encode_compact(model)
+    return model.model_dump_json()
+
+
+def build_sections_prompt(model: BaseModel, sections: List[str]) -> str:
+    """
+    Build a prompt input with only some top-level fields of a model.
+
+    Args:
+        model: Tailored resume content, master resume or another model
+        sections: Field names to include
+
+    Returns:
+        str: Compact sections, or minified JSON when COMPACT_PROMPT_ENCODING is off
+    """
+    exclude = set(type(model).model_fields) - set(sections)
+    if COMPACT_PROMPT_ENCODING:
+        return encode_compact(model, exclude=exclude)
+    return model.model_dump_json(exclude=exclude)
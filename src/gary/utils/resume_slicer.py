@@ -0,0 +1,217 @@
+"""Relevance-based slicing of the master resume sent to the tailor agent."""
+
+import math
+from collections import Counter
+from typing import Dict, List, Tuple
+from gary.models import JobAnalysis, MasterResume, ResumeSliceReport
+from gary.config import (
+    TAILOR_MAX_BULLETS_PER_ROLE,
+    TAILOR_MIN_BULLETS_PER_ROLE,
+    TAILOR_MAX_PROJECTS,
+    TAILOR_MAX_COURSES,
+    TAILOR_RESUME_TOKEN_BUDGET,
+)
+from gary.utils.fit_score import tokenize
+from gary.utils.resume_artifact import compiled_for, resume_items
+from gary.utils.resume_prompt import build_resume_prompt
+from gary.utils.tokens import estimate_tokens
+
+# Query weight for terms from the job's skills vs. its responsibilities
+SKILL_QUERY_WEIGHT = 2.0
+RESPONSIBILITY_QUERY_WEIGHT = 1.0
+
+
+def _query_weights(job_analysis: JobAnalysis) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for phrase in job_analysis.responsibilities_and_qualifications:
+        for term in tokenize(phrase):
+            weights[term] = max(weights.get(term, 0.0), RESPONSIBILITY_QUERY_WEIGHT)
+    skills = job_analysis.skills
+    for phrase in skills.technical + skills.soft + skills.management + skills.bonus:
+        for term in tokenize(phrase):
+            weights[term] = SKILL_QUERY_WEIGHT
+    return weights
+
+
+def score_items(job_analysis: JobAnalysis, texts: List[str]) -> List[float]:
+    """
+    Score resume items by TF-IDF cosine similarity to the job analysis.
+
+    IDF is computed over the resume items themselves, so terms that appear in
+    most bullets (e.g. "developed") contribute little.
+
+    Args:
+        job_analysis: Job analysis used as the query
+        texts: Resume item texts (bullets, projects, courses)
+
+    Returns:
+        List[float]: Similarity per item, aligned with texts
+    """
+    return score_item_terms(job_analysis, [Counter(tokenize(text)) for text in texts])
+
+
+def score_item_terms(job_analysis: JobAnalysis, docs: List[Counter]) -> List[float]:
+    """
+    Score tokenized resume items, as in score_items.
+
+    Args:
+        job_analysis: Job analysis used as the query
+        docs: Term frequencies per item
+
+    Returns:
+        List[float]: Similarity per item, aligned with docs
+    """
+    query = _query_weights(job_analysis)
+    df = Counter(term for doc in docs for term in doc)
+    n_docs = len(docs)
+    idf = {term: math.log(1 + n_docs / count) for term, count in df.items()}
+
+    query_norm = math.sqrt(sum((w * idf.get(t, 0.0)) ** 2 for t, w in query.items()))
+    scores = []
+    for doc in docs:
+        dot = sum(
+            tf * idf[t] * query[t] * idf[t] for t, tf in doc.items() if t in query
+        )
+        doc_norm = math.sqrt(sum((tf * idf[t]) ** 2 for t, tf in doc.items()))
+        scores.append(dot / (doc_norm * query_norm) if dot else 0.0)
+    return scores
+
+
+def _top_indices(scores: List[float], limit: int) -> List[int]:
+    """Indices of the highest scores, ties broken by original order."""
+    ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    return sorted(ranked[:limit])
+
+
+def slice_master_resume(
+    master_resume: MasterResume,
+    job_analysis: JobAnalysis,
+    max_bullets_per_role: int = TAILOR_MAX_BULLETS_PER_ROLE,
+    max_projects: int = TAILOR_MAX_PROJECTS,
+    max_courses: int = TAILOR_MAX_COURSES,
+    token_budget: int = TAILOR_RESUME_TOKEN_BUDGET,
+) -> Tuple[MasterResume, ResumeSliceReport]:
+    """
+    Keep only the master resume items most relevant to the job.
+
+    Each role keeps its top bullets, and the resume keeps its top projects
+    and top courses per degree. Headers, titles, companies, dates and skills
+    are never removed. If the result is still over the token budget, the
+    lowest-scoring remaining items are dropped, keeping at least
+    TAILOR_MIN_BULLETS_PER_ROLE bullets per role and one project.
+
+    Args:
+        master_resume: Parsed master resume
+        job_analysis: Job analysis used to rank items
+        max_bullets_per_role: Bullets kept per work experience entry
+        max_projects: Projects kept
+        max_courses: Courses kept per education entry
+        token_budget: Estimated token budget for the resume prompt payload
+
+    Returns:
+        Tuple of the sliced MasterResume and a report of the tokens saved
+    """
+    # The compiled artifact of the loaded master resume has every sliceable
+    # item tokenized already
+    compiled = compiled_for(master_resume)
+    if compiled is not None:
+        items = compiled.items
+        scores = score_item_terms(job_analysis, compiled.item_terms)
+    else:
+        items = resume_items(master_resume)
+        scores = score_items(job_analysis, [text for *_, text in items])
+    score_of = {item[:3]: score for item, score in zip(items, scores)}
+
+    def scores_for(kind: str, parent: int, count: int) -> List[float]:
+        return [score_of[(kind, parent, j)] for j in range(count)]
+
+    kept = {
+        ("bullet", i): _top_indices(
+            scores_for("bullet", i, len(exp.responsibilities)), max_bullets_per_role
+        )
+        for i, exp in enumerate(master_resume.work_experience)
+    }
+    kept[("project", 0)] = _top_indices(
+        scores_for("project", 0, len(master_resume.projects)), max_projects
+    )
+    for i, edu in enumerate(master_resume.education):
+        kept[("course", i)] = _top_indices(
+            scores_for("course", i, len(edu.coursework)), max_courses
+        )
+
+    text_of = {item[:3]: item[3] for item in items}
+    minimum = {"bullet": TAILOR_MIN_BULLETS_PER_ROLE, "project": 1, "course": 0}
+    budget_tokens = estimate_tokens(build_resume_prompt(_apply(master_resume, kept)))
+    while budget_tokens > token_budget:
+        droppable = [
+            (score_of[(kind, parent, j)], kind, parent, j)
+            for (kind, parent), indices in kept.items()
+            if len(indices) > minimum[kind]
+            for j in indices
+        ]
+        if not droppable:
+            break
+        _, kind, parent, j = min(droppable, key=lambda d: (d[0], -d[3]))
+        kept[(kind, parent)].remove(j)
+        budget_tokens -= estimate_tokens(repr(text_of[(kind, parent, j)])) + 1
+
+    sliced = _apply(master_resume, kept)
+    if compiled is not None:
+        original_tokens = compiled.prompt_tokens
+    else:
+        original_tokens = estimate_tokens(build_resume_prompt(master_resume))
+    sliced_tokens = estimate_tokens(build_resume_prompt(sliced))
+    report = ResumeSliceReport(
+        original_tokens=original_tokens,
+        sliced_tokens=sliced_tokens,
+        saved_tokens=max(0, original_tokens - sliced_tokens),
+        items_total=len(items),
+        items_kept=sum(len(indices) for indices in kept.values()),
+    )
+    return sliced, report
+
+
+def _apply(
+    master_resume: MasterResume, kept: Dict[Tuple[str, int], List[int]]
+) -> MasterResume:
+    """Build a copy of the master resume containing only the kept items."""
+    return master_resume.model_copy(
+        update={
+            "work_experience": [
+                exp.model_copy(
+                    update={
+                        "responsibilities": [
+                            exp.responsibilities[j] for j in kept[("bullet", i)]
+                        ]
+                    }
+                )
+                for i, exp in enumerate(master_resume.work_experience)
+            ],
+            "projects": [master_resume.projects[j] for j in kept[("project", 0)]],
+            "education": [
+                edu.model_copy(
+                    update={
+                        "coursework": [edu.coursework[j] for j in kept[("course", i)]]
+                    }
+                )
+                for i, edu in enumerate(master_resume.education)
+            ],
+        }
+    )
+
+
+def describe_slice_report(report: ResumeSliceReport) -> str:
+    """
+    Summarize a slice report in one line.
+
+    Args:
+        report: Slice report
+
+    Returns:
+        str: Human-readable summary
+    """
+    return (
+        f"Master resume sliced: kept {report.items_kept}/{report.items_total} items, "
+        f"~{report.saved_tokens} input tokens saved "
+        f"({report.original_tokens} → {report.sliced_tokens})"
+    )
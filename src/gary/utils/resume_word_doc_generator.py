@@ -1,4 +1,10 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
 from docxtpl import DocxTemplate
+from jinja2 import Environment, Template, UndefinedError
 from gary.models import Resume, JobDetails, MasterResume, ResumeContent
 from gary.config import RESUMES_DIR, RESUME_WORD_TEMPLATE
 from gary.exceptions import ResumeGenerationError
@@ -6,6 +12,175 @@ import json
 from pathlib import Path
 
 
+class _CompiledTemplateEnvironment(Environment):
+    """Jinja environment that compiles each distinct template source only once."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._compiled: Dict[str, Template] = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        template = self._compiled.get(source)
+        if template is None:
+            template = super().from_string(source)
+            self._compiled[source] = template
+        return template
+
+
+class _CachedPatchDocxTemplate(DocxTemplate):
+    """DocxTemplate that reuses patched template XML across renders."""
+
+    def __init__(self, template_file, patched_xml: Dict[str, str]):
+        super().__init__(template_file)
+        self._patched_xml = patched_xml
+
+    def patch_xml(self, src_xml):
+        patched = self._patched_xml.get(src_xml)
+        if patched is None:
+            patched = super().patch_xml(src_xml)
+            self._patched_xml[src_xml] = patched
+        return patched
+
+
+def resume_file_name(resume: Resume, job_details: JobDetails) -> str:
+    """
+    Build the output file name from job details and candidate name.
+
+    Args:
+        resume: Resume object containing the candidate header
+        job_details: JobDetails object containing job information
+
+    Returns:
+        str: File name such as jane_doe_Acme_Engineer_123.docx
+    """
+    company_name = job_details.company_name.replace(" ", "_").replace("/", "_")
+    job_title = job_details.job_title.replace(" ", "_").replace("/", "_")
+    job_id = job_details.job_id if job_details.job_id else ""
+    candidate_name = "_".join(resume.header.name.lower().split(" "))
+
+    file_name = f"{candidate_name}_{company_name}_{job_title}"
+    if job_id:
+        file_name += f"_{job_id}"
+    return file_name + ".docx"
+
+
+class ResumeWordRenderer:
+    """
+    Renders many resumes from one pre-loaded Word template.
+
+    The template file is read once. The patched template XML and the compiled
+    Jinja template are cached after the first render, so later renders only
+    unpack the in-memory docx, render and save.
+    """
+
+    def __init__(self, template_path: Path = RESUME_WORD_TEMPLATE):
+        """
+        Load the template.
+
+        Args:
+            template_path: Path to the .docx Jinja template
+
+        Raises:
+            ResumeGenerationError: If the template file does not exist
+        """
+        template_path = Path(template_path)
+        if not template_path.exists():
+            raise ResumeGenerationError(f"Template file not found: {template_path}")
+
+        self.template_path = template_path
+        self._template_bytes = template_path.read_bytes()
+        self._jinja_env = _CompiledTemplateEnvironment()
+        self._patched_xml: Dict[str, str] = {}
+
+    def warm(self) -> None:
+        """
+        Patch and compile the template body ahead of the first render.
+
+        Safe to call from a background thread while resume content is still
+        being generated; the next render reuses the cached results.
+        """
+        doc = _CachedPatchDocxTemplate(BytesIO(self._template_bytes), self._patched_xml)
+        doc.render_init()
+        xml = doc.patch_xml(doc.get_xml())
+        try:
+            # Compilation is cached before rendering, so an empty context
+            # failing to render is expected and harmless
+            doc.render_xml_part(xml, doc.docx._part, {}, self._jinja_env)
+        except UndefinedError:
+            pass
+
+    def render(
+        self,
+        resume: Resume,
+        job_details: JobDetails,
+        output_dir: Path = RESUMES_DIR,
+    ) -> str:
+        """
+        Render one resume and write it straight to its output path.
+
+        Args:
+            resume: Resume object containing all resume data
+            job_details: JobDetails object containing job information
+            output_dir: Directory for the generated document
+
+        Returns:
+            str: Path to the generated Word document
+
+        Raises:
+            ResumeGenerationError: If resume data is invalid or the output cannot be written
+        """
+        output_dir = Path(output_dir)
+        return self.render_to(
+            resume, output_dir / resume_file_name(resume, job_details)
+        )
+
+    def render_to(self, resume: Resume, file_path: Path) -> str:
+        """
+        Render one resume to an explicit output path.
+
+        Args:
+            resume: Resume object containing all resume data
+            file_path: Path of the Word document to write
+
+        Returns:
+            str: Path to the generated Word document
+
+        Raises:
+            ResumeGenerationError: If resume data is invalid or the output cannot be written
+        """
+        try:
+            file_path = Path(file_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            doc = _CachedPatchDocxTemplate(
+                BytesIO(self._template_bytes), self._patched_xml
+            )
+            doc.render(resume.model_dump(mode="json"), jinja_env=self._jinja_env)
+            doc.save(str(file_path))
+
+            return str(file_path)
+        except ResumeGenerationError:
+            raise
+        except (ValueError, KeyError) as e:
+            raise ResumeGenerationError(f"Invalid resume data: {e}") from e
+        except PermissionError as e:
+            raise ResumeGenerationError(f"Cannot write to output directory: {e}") from e
+        except Exception as e:
+            raise ResumeGenerationError(f"Failed to generate resume: {e}") from e
+
+
+_default_renderer: Optional[ResumeWordRenderer] = None
+
+
+def _get_default_renderer() -> ResumeWordRenderer:
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = ResumeWordRenderer()
+    return _default_renderer
+
+
 def generate_word_resume(resume: Resume, job_details: JobDetails) -> str:
     """
     Generate a Word document resume from Resume and JobDetails objects.
@@ -20,40 +195,80 @@ def generate_word_resume(resume: Resume, job_details: JobDetails) -> str:
     Raises:
         ResumeGenerationError: If template not found, resume data invalid, or cannot write output
     """
-    try:
-        RESUMES_DIR.mkdir(parents=True, exist_ok=True)
+    return _get_default_renderer().render(resume, job_details)
+
+
+def prewarm_word_renderer() -> None:
+    """
+    Load and compile the default Word template before it is needed.
 
-        # Generate filename from job details and candidate name
-        company_name = job_details.company_name.replace(" ", "_").replace("/", "_")
-        job_title = job_details.job_title.replace(" ", "_").replace("/", "_")
-        job_id = job_details.job_id if job_details.job_id else ""
-        candidate_name = "_".join(resume.header.name.lower().split(" "))
+    Raises:
+        ResumeGenerationError: If the template file does not exist
+    """
+    _get_default_renderer().warm()
 
-        file_name = f"{candidate_name}_{company_name}_{job_title}"
-        if job_id:
-            file_name += f"_{job_id}"
-        file_name += ".docx"
 
-        file_path = RESUMES_DIR / file_name
+# Per-process renderer for worker pools, built once by the pool initializer
+_worker_renderer: Optional[ResumeWordRenderer] = None
 
-        if not RESUME_WORD_TEMPLATE.exists():
-            raise ResumeGenerationError(
-                f"Template file not found: {RESUME_WORD_TEMPLATE}"
-            )
 
-        doc = DocxTemplate(RESUME_WORD_TEMPLATE)
-        doc.render(resume.model_dump(mode="json"))
-        doc.save(str(file_path))
-
-        return str(file_path)
-    except ResumeGenerationError:
-        raise
-    except (ValueError, KeyError) as e:
-        raise ResumeGenerationError(f"Invalid resume data: {e}") from e
-    except PermissionError as e:
-        raise ResumeGenerationError(f"Cannot write to output directory: {e}") from e
-    except Exception as e:
-        raise ResumeGenerationError(f"Failed to generate resume: {e}") from e
+def _init_render_worker(template_path: str) -> None:
+    global _worker_renderer
+    _worker_renderer = ResumeWordRenderer(Path(template_path))
+
+
+def _render_in_worker(resume: Resume, job_details: JobDetails, output_dir: str) -> str:
+    return _worker_renderer.render(resume, job_details, Path(output_dir))
+
+
+def generate_word_resumes(
+    documents: Sequence[Tuple[Resume, JobDetails]],
+    max_workers: Optional[int] = None,
+    template_path: Path = RESUME_WORD_TEMPLATE,
+    output_dir: Path = RESUMES_DIR,
+) -> List[str]:
+    """
+    Generate many Word resumes with a process pool.
+
+    Each worker loads and compiles the template once, then renders its share
+    of the documents directly to their output paths.
+
+    Args:
+        documents: (Resume, JobDetails) pairs to render
+        max_workers: Worker processes (defaults to the CPU count; 1 renders in-process)
+        template_path: Path to the .docx Jinja template
+        output_dir: Directory for the generated documents
+
+    Returns:
+        List[str]: Paths to the generated documents, in input order
+
+    Raises:
+        ResumeGenerationError: If the template is missing or any document fails
+    """
+    if not documents:
+        return []
+
+    if max_workers == 1 or len(documents) == 1:
+        renderer = ResumeWordRenderer(template_path)
+        return [renderer.render(r, j, output_dir) for r, j in documents]
+
+    workers = max_workers or os.cpu_count() or 1
+    resumes, jobs = zip(*documents)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(str(template_path),),
+    ) as pool:
+        chunksize = max(1, len(documents) // (workers * 4))
+        return list(
+            pool.map(
+                _render_in_worker,
+                resumes,
+                jobs,
+                repeat(str(output_dir)),
+                chunksize=chunksize,
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+"""Per-run checkpoints of the interactive pipeline's stage outputs."""
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Type, TypeVar
+from pydantic import BaseModel
+from gary.config import CHECKPOINTS_DIR, CHECKPOINTS_MAX_RUNS
+from gary.exceptions import DataLoadError
+
+# Checkpointed stages in pipeline order. Replaying from a stage runs it and
+# every later stage again; "ledger" is the ledger write inside "logging".
+CHECKPOINT_STAGES = (
+    "job_details",
+    "tailoring",
+    "validation",
+    "document",
+    "repair",
+    "ledger",
+    "logging",
+)
+REPLAYABLE_STAGES = ("tailoring", "validation", "document", "repair", "logging")
+
+_MANIFEST = "stages.json"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class RunCheckpoint:
+    """
+    Stage outputs of one run, saved in CHECKPOINTS_DIR/<run_id>/.
+
+    Each output is a JSON file named after it. A stage is listed in
+    stages.json once all of its outputs are written, and every file is
+    written under a temporary name and renamed into place, so a crash never
+    leaves a stage half saved.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, root: Path = CHECKPOINTS_DIR):
+        """
+        Create the checkpoint directory of a run.
+
+        Args:
+            run_id: Run ID; a new one is generated if omitted
+            root: Directory holding one checkpoint directory per run
+        """
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.path = Path(root) / self.run_id
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, run_id: str, root: Path = CHECKPOINTS_DIR) -> "RunCheckpoint":
+        """
+        Open the checkpoint of an earlier run.
+
+        Args:
+            run_id: Run ID printed by the run
+            root: Directory holding one checkpoint directory per run
+
+        Returns:
+            RunCheckpoint: The run's checkpoint
+
+        Raises:
+            DataLoadError: If the run has no checkpoint or no saved job details
+        """
+        path = Path(root) / run_id
+        if not run_id or path.name != run_id or not path.is_dir():
+            raise DataLoadError(f"No checkpoint found for run {run_id}")
+        checkpoint = cls(run_id, root)
+        if "job_details" not in checkpoint.completed_stages:
+            raise DataLoadError(
+                f"Run {run_id} stopped before its job details were saved"
+            )
+        return checkpoint
+
+    def _write(self, name: str, text: str) -> None:
+        target = self.path / name
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, target)
+
+    @property
+    def completed_stages(self) -> List[str]:
+        """Stages whose outputs are all saved, in pipeline order."""
+        manifest = self.path / _MANIFEST
+        if not manifest.exists():
+            return []
+        stages = json.loads(manifest.read_text(encoding="utf-8"))
+        return [s for s in CHECKPOINT_STAGES if s in stages]
+
+    def save(self, stage: str, **outputs: Any) -> None:
+        """
+        Save a stage's outputs, then mark the stage complete.
+
+        Args:
+            stage: Stage name in CHECKPOINT_STAGES
+            **outputs: Pydantic models or JSON-serializable values keyed by
+                output name; None values are not saved
+        """
+        for name, value in outputs.items():
+            if value is None:
+                continue
+            if isinstance(value, BaseModel):
+                text = value.model_dump_json(indent=2)
+            else:
+                text = json.dumps(value)
+            self._write(f"{name}.json", text)
+        # Stages of the pipeline finish on different threads
+        with self._lock:
+            stages = self.completed_stages
+            if stage not in stages:
+                stages.append(stage)
+            self._write(_MANIFEST, json.dumps(stages))
+
+    def load(self, name: str, model: Optional[Type[ModelT]] = None) -> Any:
+        """
+        Load a saved output.
+
+        Args:
+            name: Output name passed to save
+            model: Pydantic model to validate into, or None for plain JSON
+
+        Returns:
+            The saved output, or None if it was not saved
+
+        Raises:
+            DataLoadError: If the file does not parse
+        """
+        path = self.path / f"{name}.json"
+        if not path.exists():
+            return None
+        text = path.read_text(encoding="utf-8")
+        try:
+            if model is None:
+                return json.loads(text)
+            return model.model_validate_json(text)
+        except ValueError as e:
+            raise DataLoadError(f"Failed to parse checkpoint {path}: {e}") from e
+
+    def discard(self, stages: Iterable[str]) -> None:
+        """
+        Mark stages incomplete, so a replay that fails midway never reuses
+        outputs older than the stages before them.
+
+        Args:
+            stages: Stage names to discard
+        """
+        discarded = set(stages)
+        with self._lock:
+            remaining = [s for s in self.completed_stages if s not in discarded]
+            self._write(_MANIFEST, json.dumps(remaining))
+
+
+def prune_checkpoints(
+    root: Path = CHECKPOINTS_DIR, keep: int = CHECKPOINTS_MAX_RUNS
+) -> int:
+    """
+    Delete all but the most recently modified run checkpoints.
+
+    Args:
+        root: Directory holding one checkpoint directory per run
+        keep: Number of checkpoints to keep
+
+    Returns:
+        int: Number of checkpoints deleted
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return 0
+    runs = sorted(
+        (p for p in root.iterdir() if p.is_dir()),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in runs[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+    return len(runs[keep:])
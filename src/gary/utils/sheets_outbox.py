@@ -0,0 +1,290 @@
+"""Durable local outbox for Google Sheets rows, flushed in batches."""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, ContextManager, List, Optional, Protocol, Tuple
+from gary.config import (
+    SHEETS_CLAIM_LEASE_SECONDS,
+    SHEETS_OUTBOX_PATH,
+    SHEETS_FLUSH_BATCH_SIZE,
+    SHEETS_MAX_RETRIES,
+    SHEETS_RETRY_BASE_DELAY,
+)
+from gary.exceptions import GoogleSheetsError
+from gary.utils.sqlite_transaction import sqlite_transaction
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class RowAppender(Protocol):
+    """Anything that can append rows to a sheet, e.g. GoogleSheetsClient."""
+
+    def append_rows(self, rows: List[List[str]]) -> None: ...
+
+
+def _default_client() -> RowAppender:
+    # Imported lazily so queueing rows never needs gspread or credentials
+    from gary.utils.google_sheets import get_sheets_client
+
+    return get_sheets_client()
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Decide whether a failed Sheets call is worth retrying.
+
+    Network errors (including requests exceptions, which are OSErrors) and
+    API errors carrying a retryable HTTP status are transient.
+
+    Args:
+        error: Exception raised by the Sheets client
+
+    Returns:
+        bool: True if the call should be retried
+    """
+    if isinstance(error, GoogleSheetsError):
+        return False
+    if isinstance(error, OSError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUS_CODES
+
+
+class SheetsOutbox:
+    """
+    SQLite queue of rows waiting to be appended to Google Sheets.
+
+    Rows are kept in insertion order and only removed once they have been
+    written, so rows from a run whose Sheets write failed are sent by the
+    next flush. A flush claims rows before sending them, so several
+    processes flushing the same outbox (a batch run and `gary serve`, say)
+    never send the same row twice.
+    """
+
+    def __init__(self, path: Path = SHEETS_OUTBOX_PATH):
+        """
+        Open the outbox, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sheets_outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, row TEXT NOT NULL, "
+                "created REAL NOT NULL, claim TEXT, claimed_at REAL, "
+                "ledger_id INTEGER)"
+            )
+            # Outboxes created by earlier versions lack the newer columns
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(sheets_outbox)")}
+            for column, kind in (
+                ("claim", "TEXT"),
+                ("claimed_at", "REAL"),
+                ("ledger_id", "INTEGER"),
+            ):
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE sheets_outbox ADD COLUMN {column} {kind}"
+                    )
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_sheets_outbox_ledger_id "
+                "ON sheets_outbox (ledger_id)"
+            )
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return sqlite_transaction(self.path)
+
+    def enqueue(
+        self, rows: List[List[str]], ledger_ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Queue rows for the next flush.
+
+        A row keyed by a ledger id is only queued once: queueing the same
+        application again while its row is still in the outbox is a no-op.
+
+        Args:
+            rows: Rows to append, in order
+            ledger_ids: Application ledger ids of the rows, aligned with rows
+        """
+        now = time.time()
+        keys = ledger_ids if ledger_ids is not None else [None] * len(rows)
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO sheets_outbox (row, created, ledger_id) "
+                "VALUES (?, ?, ?)",
+                [(json.dumps(row), now, key) for row, key in zip(rows, keys)],
+            )
+
+    def claim(
+        self, limit: int, lease_seconds: float = SHEETS_CLAIM_LEASE_SECONDS
+    ) -> Tuple[str, List[Tuple[int, List[str]]]]:
+        """
+        Claim the oldest rows no other flush holds.
+
+        Rows are claimed with a single UPDATE, so two processes claiming at
+        once never get the same row. A claim older than lease_seconds is
+        treated as abandoned.
+
+        Args:
+            limit: Maximum number of rows
+            lease_seconds: How long a claim holds its rows
+
+        Returns:
+            Tuple of the claim token and the claimed (row id, row values)
+            pairs, oldest first
+        """
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE sheets_outbox SET claim = ?, claimed_at = ? WHERE id IN ("
+                "SELECT id FROM sheets_outbox "
+                "WHERE claim IS NULL OR claimed_at < ? ORDER BY id LIMIT ?)",
+                (token, now, now - lease_seconds, limit),
+            )
+            rows = conn.execute(
+                "SELECT id, row FROM sheets_outbox WHERE claim = ? ORDER BY id",
+                (token,),
+            ).fetchall()
+        return token, [(row_id, json.loads(row)) for row_id, row in rows]
+
+    def remove(self, token: str) -> None:
+        """
+        Remove the rows of a claim once they have been written.
+
+        Args:
+            token: Token returned by claim()
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM sheets_outbox WHERE claim = ?", (token,))
+
+    def release(self, token: str) -> None:
+        """
+        Return the rows of a claim to the queue after a failed write.
+
+        Args:
+            token: Token returned by claim()
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE sheets_outbox SET claim = NULL, claimed_at = NULL "
+                "WHERE claim = ?",
+                (token,),
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM sheets_outbox").fetchone()[0]
+
+
+class BufferedSheetsWriter:
+    """
+    Queues tracker rows in a SheetsOutbox and writes them with append_rows.
+
+    Each flush sends up to batch_size rows per API call and retries transient
+    failures with exponential backoff. The Sheets client is created on the
+    first flush and reused afterwards.
+    """
+
+    def __init__(
+        self,
+        outbox: Optional[SheetsOutbox] = None,
+        client_factory: Callable[[], RowAppender] = _default_client,
+        batch_size: int = SHEETS_FLUSH_BATCH_SIZE,
+        max_retries: int = SHEETS_MAX_RETRIES,
+        base_delay: float = SHEETS_RETRY_BASE_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            outbox: Outbox holding queued rows (default: SHEETS_OUTBOX_PATH)
+            client_factory: Returns the client used to append rows
+            batch_size: Maximum rows per append_rows call
+            max_retries: Retries per batch after the first attempt
+            base_delay: Delay before the first retry in seconds, doubled each time
+            sleep: Sleep function, replaceable in tests
+        """
+        self.outbox = outbox if outbox is not None else SheetsOutbox()
+        self.client_factory = client_factory
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.sleep = sleep
+        self._client: Optional[RowAppender] = None
+
+    def append(self, row: List[str]) -> None:
+        """
+        Queue one row.
+
+        Args:
+            row: Row values
+        """
+        self.outbox.enqueue([row])
+
+    def append_many(
+        self, rows: List[List[str]], ledger_ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Queue several rows.
+
+        Args:
+            rows: Rows to append, in order
+            ledger_ids: Application ledger ids of the rows, aligned with rows
+        """
+        self.outbox.enqueue(rows, ledger_ids)
+
+    def _append_with_retry(self, rows: List[List[str]]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                if self._client is None:
+                    self._client = self.client_factory()
+                self._client.append_rows(rows)
+                return
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient_error(e):
+                    if isinstance(e, GoogleSheetsError):
+                        raise
+                    raise GoogleSheetsError(
+                        f"Failed to append rows to Google Sheets: {e}"
+                    ) from e
+                self.sleep(self.base_delay * 2**attempt)
+
+    def flush(self) -> int:
+        """
+        Write every queued row that no other flush has claimed, oldest first.
+
+        Each batch is claimed before it is sent and removed once written.
+        A batch that fails is released. It stays queued for the next flush,
+        together with the batches after it; batches written before the
+        failure are not sent again.
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            GoogleSheetsError: If a batch still fails after retrying
+        """
+        written = 0
+        while True:
+            token, batch = self.outbox.claim(self.batch_size)
+            if not batch:
+                return written
+            try:
+                self._append_with_retry([row for _, row in batch])
+            except BaseException:
+                self.outbox.release(token)
+                raise
+            self.outbox.remove(token)
+            written += len(batch)
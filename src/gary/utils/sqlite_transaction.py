@@ -0,0 +1,32 @@
+"""Short-lived SQLite connections for the on-disk stores."""
+
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+@contextmanager
+def sqlite_transaction(
+    path: Path, row_factory: Optional[Any] = None
+) -> Iterator[sqlite3.Connection]:
+    """
+    Open a connection for one transaction and close it afterwards.
+
+    A sqlite3 connection used as a context manager only commits or rolls
+    back; it stays open until garbage collected. Batch and serve mode call
+    the stores many times per posting, so each call closes its connection.
+
+    Args:
+        path: Database file
+        row_factory: Row factory for the connection, e.g. sqlite3.Row
+
+    Yields:
+        sqlite3.Connection: Connection, committed on success and rolled back
+        on error
+    """
+    with closing(sqlite3.connect(path, timeout=30)) as conn:
+        if row_factory is not None:
+            conn.row_factory = row_factory
+        with conn:
+            yield conn
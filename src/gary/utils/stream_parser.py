@@ -0,0 +1,186 @@
+"""Incremental parsing of ResumeContent JSON streamed by the tailor agent."""
+
+import json
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, ValidationError
+from gary.models import Education, ProfessionalSummary, Project, Skill, WorkExperience
+
+# Model for each ResumeContent section; list sections are emitted per item
+SECTION_MODELS: Dict[str, type] = {
+    "professional_summary": ProfessionalSummary,
+    "work_experience": WorkExperience,
+    "education": Education,
+    "skills": Skill,
+    "projects": Project,
+}
+
+
+class StreamedSection(BaseModel):
+    """A ResumeContent section, or one item of a list section, parsed from a stream."""
+
+    section: str = Field(..., description="ResumeContent field name")
+    index: Optional[int] = Field(
+        None, description="Position within a list section, None for the summary"
+    )
+    item: Any = Field(..., description="Validated section model")
+
+
+class IncrementalResumeParser:
+    """
+    Parses ResumeContent JSON as it streams in, one chunk at a time.
+
+    Each completed section (the professional summary, and every work
+    experience, education, skill and project entry) is emitted as soon as its
+    closing brace arrives. Text before the JSON object, such as an agent's
+    "Thought:" preamble or a Markdown code fence, is skipped.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state, e.g. when the LLM call is retried."""
+        self._text = ""
+        self._pos = 0
+        self._started = False
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = ""
+        self._key: Optional[str] = None
+        self._value_start = 0
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+        self.done = False
+
+    def _can_start(self, index: int) -> bool:
+        # An agent answer has its JSON after "Final Answer:"; braces inside a
+        # preceding "Thought:" must not start the object
+        preamble = self._text[:index]
+        return "Thought:" not in preamble or "Final Answer:" in preamble
+
+    def _emit(self, end: int, index: Optional[int]) -> Optional[StreamedSection]:
+        start = self._value_start if index is None else self._item_start
+        model = SECTION_MODELS.get(self._key)
+        if model is None:
+            return None
+        try:
+            item = model.model_validate_json(self._text[start : end + 1])
+        except ValidationError:
+            # Malformed section; the final output is still validated in full
+            return None
+        return StreamedSection(section=self._key, index=index, item=item)
+
+    def feed(self, chunk: str) -> List[StreamedSection]:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            chunk: Text received from the LLM
+
+        Returns:
+            List[StreamedSection]: Sections completed by this chunk, in order
+        """
+        self._text += chunk
+        sections = []
+        text = self._text
+        while self._pos < len(text) and not self.done:
+            i = self._pos
+            ch = text[i]
+            self._pos += 1
+
+            if not self._started:
+                if ch == "{" and self._can_start(i):
+                    self._started = True
+                    self._stack.append(ch)
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start : i + 1]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ":" and len(self._stack) == 1:
+                self._key = json.loads(self._last_string)
+                self._item_index = 0
+            elif ch in "{[":
+                self._stack.append(ch)
+                depth = len(self._stack)
+                if depth == 2:
+                    self._value_start = i
+                elif depth == 3 and ch == "{" and self._stack[1] == "[":
+                    self._item_start = i
+            elif ch in "}]":
+                if not self._stack:
+                    continue
+                opener = self._stack.pop()
+                depth = len(self._stack)
+                section = None
+                if depth == 2 and opener == "{" and self._item_start is not None:
+                    section = self._emit(i, self._item_index)
+                    self._item_index += 1
+                    self._item_start = None
+                elif depth == 1 and opener == "{":
+                    section = self._emit(i, None)
+                elif depth == 0:
+                    self.done = True
+                if section:
+                    sections.append(section)
+        return sections
+
+
+def describe_section(section: StreamedSection) -> str:
+    """
+    Summarize a streamed section in one line.
+
+    Args:
+        section: Parsed section
+
+    Returns:
+        str: Human-readable label
+    """
+    item = section.item
+    if isinstance(item, ProfessionalSummary):
+        return "Professional summary"
+    if isinstance(item, WorkExperience):
+        return f"Experience: {item.title} at {item.company}"
+    if isinstance(item, Education):
+        return f"Education: {item.degree}"
+    if isinstance(item, Skill):
+        return f"Skills: {item.category}"
+    if isinstance(item, Project):
+        return f"Project: {item.name}"
+    return section.section
+
+
+def section_texts(section: StreamedSection) -> List[str]:
+    """
+    Return the searchable text of a streamed section.
+
+    Args:
+        section: Parsed section
+
+    Returns:
+        List[str]: Text fragments, matching resume_section_texts for that section
+    """
+    item = section.item
+    if isinstance(item, ProfessionalSummary):
+        return [item.summary]
+    if isinstance(item, WorkExperience):
+        return [item.title, *item.responsibilities]
+    if isinstance(item, Education):
+        return [item.degree, *item.coursework]
+    if isinstance(item, Skill):
+        return list(item.items)
+    if isinstance(item, Project):
+        return [item.name, item.description]
+    return []
@@ -0,0 +1,25 @@
+"""Lightweight token estimates for prompt sizing."""
+
+import math
+from typing import Any
+
+# Average characters per token for English prose and JSON with common LLM
+# tokenizers; close enough for budgeting without a model-specific tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Estimate the number of tokens a value occupies in a prompt.
+
+    Non-string values are measured by their string form, which is how CrewAI
+    interpolates them into task descriptions.
+
+    Args:
+        value: Prompt text or an object interpolated into a prompt
+
+    Returns:
+        int: Estimated token count
+    """
+    text = value if isinstance(value, str) else str(value)
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -0,0 +1,68 @@
+"""Shared fixtures: the benchmark fixtures, loaded as Gary's models."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+import pytest
+from gary.models import JobAnalysis, MasterResume, ResumeContent
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def resume_dict() -> dict:
+    return json.loads((FIXTURES_DIR / "resume.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def master_resume(resume_dict: dict) -> MasterResume:
+    return MasterResume.model_validate(resume_dict)
+
+
+@pytest.fixture
+def resume_content(resume_dict: dict) -> ResumeContent:
+    content = {k: v for k, v in resume_dict.items() if k != "header"}
+    return ResumeContent.model_validate(content)
+
+
+@pytest.fixture
+def job_analysis() -> JobAnalysis:
+    return JobAnalysis.model_validate_json(
+        (FIXTURES_DIR / "job_analysis.json").read_text(encoding="utf-8")
+    )
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class FakeAPIError(Exception):
+    """An API error carrying an HTTP status, like gspread's APIError."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code)
+
+
+class FakeSheets:
+    """
+    Local stand-in for the Sheets endpoint: records appended rows and
+    raises the queued errors, one per append_rows call, before succeeding.
+    """
+
+    def __init__(self, errors: Optional[List[Exception]] = None):
+        self.errors = list(errors or [])
+        self.calls: List[List[List[str]]] = []
+        self.rows: List[List[str]] = []
+
+    def append_rows(self, rows: List[List[str]]) -> None:
+        self.calls.append(rows)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.rows.extend(rows)
+
+
+@pytest.fixture
+def fake_sheets() -> FakeSheets:
+    return FakeSheets()
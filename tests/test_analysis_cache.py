@@ -0,0 +1,17 @@
+from gary.config import AGENT_LLM_SETTINGS
+from gary.utils.analysis_cache import JobAnalysisCache
+
+
+def test_changing_the_analyst_model_misses_the_cache(
+    tmp_path, monkeypatch, job_analysis
+):
+    path = tmp_path / "analyses.sqlite3"
+    JobAnalysisCache(path).put("Build APIs.", job_analysis)
+    assert JobAnalysisCache(path).get("Build APIs.") == job_analysis
+
+    settings = {**AGENT_LLM_SETTINGS["job_analyst"], "model": "openrouter/other"}
+    monkeypatch.setitem(AGENT_LLM_SETTINGS, "job_analyst", settings)
+
+    cache = JobAnalysisCache(path)
+    assert cache.model == "openrouter/other"
+    assert cache.get("Build APIs.") is None
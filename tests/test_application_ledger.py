@@ -0,0 +1,105 @@
+import pytest
+from gary.models import JobDetails
+from gary.pipeline import mirror_ledger_to_sheets
+from gary.utils.application_ledger import ApplicationLedger, description_hash
+from gary.utils.sheets_outbox import BufferedSheetsWriter, SheetsOutbox
+
+
+def _job(
+    company: str = "Acme",
+    job_id=None,
+    description: str = "Build APIs.",
+    date="03-15-2026",
+):
+    return JobDetails(
+        company_name=company,
+        job_title="Engineer",
+        location="Remote",
+        job_id=job_id,
+        job_description=description,
+        date_applied=date,
+    )
+
+
+@pytest.fixture
+def ledger(tmp_path) -> ApplicationLedger:
+    return ApplicationLedger(tmp_path / "ledger.sqlite3")
+
+
+@pytest.fixture
+def writer(tmp_path, fake_sheets) -> BufferedSheetsWriter:
+    return BufferedSheetsWriter(
+        SheetsOutbox(tmp_path / "outbox.sqlite3"),
+        client_factory=lambda: fake_sheets,
+        sleep=lambda _: None,
+    )
+
+
+def test_description_hash_ignores_case_and_whitespace():
+    assert description_hash("Build  APIs.\n") == description_hash("build apis.")
+
+
+def test_find_duplicates_by_company_and_job_id(ledger):
+    first = ledger.record(_job(job_id="ENG-1", description="Old text"))
+
+    [match] = ledger.find_duplicates(
+        _job(" ACME ", job_id="ENG-1", description="New text")
+    )
+    assert match.id == first
+    assert (
+        ledger.find_duplicates(_job("Other", job_id="ENG-1", description="New")) == []
+    )
+
+
+def test_find_duplicates_by_identical_description(ledger):
+    ledger.record(_job("Acme"))
+    assert len(ledger.find_duplicates(_job("Acme Corp"))) == 1
+
+
+def test_applied_between_uses_iso_dates(ledger):
+    ledger.record(_job(description="a", date="12-31-2025"))
+    ledger.record(_job(description="b", date="01-02-2026"))
+    ledger.record(_job(description="c", date="not a date"))
+
+    records = ledger.applied_between("2026-01-01", "2026-12-31")
+    assert [r.job_details.job_description for r in records] == ["b"]
+
+
+def test_mirror_queues_flushes_and_marks_applications(ledger, writer, fake_sheets):
+    ledger.record(_job(description="a"))
+    ledger.record(_job(description="b"))
+
+    mirror_ledger_to_sheets(ledger, writer)
+
+    assert [row[5] for row in fake_sheets.rows] == ["a", "b"]
+    assert ledger.unmirrored() == []
+    mirror_ledger_to_sheets(ledger, writer)
+    assert len(fake_sheets.rows) == 2
+
+
+def test_crash_before_marking_mirrored_does_not_duplicate_rows(
+    ledger, writer, fake_sheets
+):
+    ledger.record(_job(description="a"))
+    records = ledger.unmirrored()
+    # A run that queued the rows and stopped before mark_mirrored
+    writer.append_many([["a"]], ledger_ids=[r.id for r in records])
+
+    mirror_ledger_to_sheets(ledger, writer)
+
+    assert len(fake_sheets.rows) == 1
+    assert ledger.unmirrored() == []
+
+
+def test_failed_flush_keeps_rows_for_the_next_run(ledger, writer, fake_sheets):
+    fake_sheets.errors.extend([OSError("down")] * 10)
+    ledger.record(_job(description="a"))
+
+    mirror_ledger_to_sheets(ledger, writer)
+    assert fake_sheets.rows == []
+    assert len(writer.outbox) == 1
+    assert ledger.unmirrored() == []
+
+    fake_sheets.errors.clear()
+    mirror_ledger_to_sheets(ledger, writer)
+    assert len(fake_sheets.rows) == 1
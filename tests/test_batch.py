@@ -0,0 +1,149 @@
+import asyncio
+from contextlib import contextmanager
+import pytest
+from gary import batch, pipeline
+from gary.metrics import MetricsRecorder
+from gary.models import ApplicationRecord, JobDetails, NearDuplicateMatch
+from gary.utils.analysis_cache import JobAnalysisCache
+from gary.utils.local_validation import analyze_keywords, build_local_validation_report
+
+
+@pytest.fixture
+def job_details() -> JobDetails:
+    return JobDetails(
+        company_name="Acme",
+        job_title="Engineer",
+        location="Remote",
+        job_description="Build APIs.",
+        date_applied="03-15-2026",
+    )
+
+
+@pytest.fixture
+def fake_cascade(monkeypatch, tmp_path, job_analysis, resume_content):
+    """Two model tiers whose crews return the fixtures; records every call."""
+    calls = {"crews": [], "validations": 0, "runs": []}
+    usage = {"prompt_tokens": 1000, "completion_tokens": 200}
+
+    @contextmanager
+    def prepare_crew(master_resume, job_details, analysis_cache, **kwargs):
+        calls["crews"].append(kwargs)
+        crew = type("Crew", (), {})()
+        crew.usage_metrics = type("Usage", (), {"model_dump": lambda self: usage})()
+
+        def kickoff(inputs):
+            # The analyst only runs when no analysis is passed in
+            return job_analysis if kwargs["job_analysis"] is None else None
+
+        async def kickoff_async(inputs):
+            return kickoff(inputs)
+
+        crew.kickoff = kickoff
+        crew.kickoff_async = kickoff_async
+        yield crew, {}, kwargs["job_analysis"]
+
+    def validate_resume(analysis, content):
+        calls["validations"] += 1
+        keyword_report = analyze_keywords(analysis, content)
+        return build_local_validation_report(keyword_report, content), keyword_report
+
+    monkeypatch.setattr(batch, "prepare_crew", prepare_crew)
+    monkeypatch.setattr(batch, "tailor_tiers", lambda: ["fast", "strong"])
+    monkeypatch.setattr(batch, "needs_escalation", lambda tier, *a: tier == "fast")
+    monkeypatch.setattr(batch, "cache_job_analysis", lambda *a: None)
+    monkeypatch.setattr(batch, "extract_crew_outputs", lambda r: (resume_content, None))
+    monkeypatch.setattr(batch, "extract_job_analysis", lambda result: result)
+    monkeypatch.setattr(batch, "validate_resume", validate_resume)
+    monkeypatch.setattr(batch, "REPAIR_ENABLED", False)
+    monkeypatch.setattr(
+        batch, "generate_word_resume", lambda *a: str(tmp_path / "resume.docx")
+    )
+    monkeypatch.setattr(batch, "write_tailored_resume", lambda *a: None)
+    monkeypatch.setattr(batch, "append_run_metrics", calls["runs"].append)
+    return calls
+
+
+def test_cascade_reuses_the_first_analysis_and_validates_once(
+    fake_cascade, job_details, master_resume, job_analysis
+):
+    result = asyncio.run(
+        batch._process_job(
+            job_details,
+            master_resume,
+            asyncio.Semaphore(1),
+            analysis_cache=None,
+            ledger=None,
+            by_section=False,
+        )
+    )
+
+    assert result.succeeded
+    assert result.tailor_tier == "strong"
+    assert [c["tailor_tier"] for c in fake_cascade["crews"]] == ["fast", "strong"]
+    assert [c["job_analysis"] for c in fake_cascade["crews"]] == [None, job_analysis]
+    assert not any(c["include_validation"] for c in fake_cascade["crews"])
+    assert fake_cascade["validations"] == 1
+
+
+def test_cascade_usage_adds_up_every_tier(fake_cascade, job_details, master_resume):
+    asyncio.run(
+        batch._process_job(
+            job_details,
+            master_resume,
+            asyncio.Semaphore(1),
+            analysis_cache=None,
+            ledger=None,
+            recorder=MetricsRecorder(),
+            by_section=False,
+        )
+    )
+
+    [run] = fake_cascade["runs"]
+    assert run.tailor_tiers == ["fast", "strong"]
+    assert run.crew_usage == {"prompt_tokens": 2000, "completion_tokens": 400}
+
+
+def test_empty_tier_config_is_rejected_up_front(monkeypatch):
+    monkeypatch.setattr(pipeline, "MODEL_CASCADE_ENABLED", True)
+    monkeypatch.setattr(pipeline, "TAILOR_MODEL_TIERS", {})
+
+    with pytest.raises(ValueError, match="TAILOR_MODEL_TIERS is empty"):
+        batch.run_batch("jobs.jsonl")
+
+
+def test_near_duplicate_analysis_is_passed_to_the_crew_not_cached(
+    tmp_path, fake_cascade, job_details, master_resume, job_analysis
+):
+    cache = JobAnalysisCache(tmp_path / "analyses.sqlite3")
+    earlier = job_details.model_copy(update={"job_description": "Build Globex APIs."})
+    cache.put(earlier.job_description, job_analysis)
+    match = NearDuplicateMatch(
+        record=ApplicationRecord(
+            id=1,
+            job_details=earlier,
+            description_hash="0" * 64,
+            recorded_at="2026-03-01T09:00:00",
+        ),
+        similarity=0.9,
+    )
+
+    skip_reason, reused = batch.resolve_near_duplicate(
+        job_details, match, "reuse", cache
+    )
+    result = asyncio.run(
+        batch._process_job(
+            job_details,
+            master_resume,
+            asyncio.Semaphore(1),
+            analysis_cache=cache,
+            ledger=None,
+            reused=reused,
+            by_section=False,
+        )
+    )
+
+    # The earlier resume JSON is gone, so only the analysis is reused
+    assert (skip_reason, reused) == (None, (None, job_analysis))
+    assert result.succeeded
+    assert [c["job_analysis"] for c in fake_cascade["crews"]] == [job_analysis] * 2
+    assert cache.get(job_details.job_description) is None
@@ -0,0 +1,79 @@
+from gary.utils.boilerplate import strip_boilerplate
+
+POSTING = """About the role
+We build payments infrastructure for small businesses.
+
+Benefits:
+- Dental and vision insurance
+- 401(k) match and unlimited PTO
+
+You will design and operate distributed systems in Go and Python.
+
+Additional nice-to-have: Kubernetes, Terraform, gRPC."""
+
+
+def test_prose_after_a_heading_section_is_kept():
+    text, report = strip_boilerplate(POSTING)
+
+    assert [s.category for s in report.removed_sections] == ["benefits"]
+    assert "Dental" not in text
+    assert "distributed systems in Go and Python" in text
+    assert "Additional nice-to-have: Kubernetes, Terraform, gRPC." in text
+
+
+def test_bullet_lists_directly_after_a_heading_are_removed_with_it():
+    posting = POSTING.replace("Benefits:\n", "Perks\n\n")
+
+    text, report = strip_boilerplate(posting)
+
+    assert [s.category for s in report.removed_sections] == ["benefits", "benefits"]
+    assert "Dental" not in text and "401(k)" not in text
+    assert "distributed systems in Go and Python" in text
+
+
+def test_unstructured_text_is_matched_sentence_by_sentence():
+    posting = (
+        "Build and operate the billing APIs behind our invoicing product in "
+        "Python and PostgreSQL. We are an equal opportunity employer and do not "
+        "discriminate on the basis of race or religion. Own on-call for the "
+        "payments services with the platform team."
+    )
+
+    text, report = strip_boilerplate(posting)
+
+    assert text == (
+        "Build and operate the billing APIs behind our invoicing product in "
+        "Python and PostgreSQL. Own on-call for the payments services with the "
+        "platform team."
+    )
+    assert [s.category for s in report.removed_sections] == ["eeo"]
+
+
+def test_kept_headings_protect_their_section():
+    posting = (
+        "Requirements:\n"
+        "- Built claims systems for dental and health insurance carriers\n"
+        "- 5+ years of Python\n\n"
+        "- Experience with 401(k) and PTO accrual rules\n\n"
+        "Our benefits:\n"
+        "- Dental and health insurance\n"
+        "- 401(k) match"
+    )
+
+    text, report = strip_boilerplate(posting)
+
+    assert text.startswith("Requirements:")
+    assert "claims systems for dental" in text
+    assert "401(k) and PTO accrual rules" in text
+    assert [s.text.splitlines()[0] for s in report.removed_sections] == [
+        "Our benefits:"
+    ]
+
+
+def test_text_is_unchanged_when_too_much_would_be_removed():
+    text, report = strip_boilerplate(POSTING, max_removed_fraction=0.1)
+
+    assert text == POSTING
+    assert report.removed_chars == 0
+    assert report.removed_sections == []
+    assert report.original_chars == len(POSTING)
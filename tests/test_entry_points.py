@@ -0,0 +1,15 @@
+import importlib
+from pathlib import Path
+import pytest
+
+tomllib = pytest.importorskip("tomllib")
+
+PYPROJECT = Path(__file__).parent.parent / "pyproject.toml"
+
+
+def test_every_script_points_at_a_callable():
+    scripts = tomllib.loads(PYPROJECT.read_text(encoding="utf-8"))["project"]["scripts"]
+
+    for name, target in scripts.items():
+        module, _, attribute = target.partition(":")
+        assert callable(getattr(importlib.import_module(module), attribute, None)), name
@@ -0,0 +1,109 @@
+from pathlib import Path
+import pytest
+from gary.models import JobDetails
+from gary.utils.fit_score import ResumeTermIndex, score_postings, tokenize
+from gary.utils.read_job_details import job_details_from_record
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+def _job(title: str, description: str) -> JobDetails:
+    return JobDetails(
+        company_name="Acme",
+        job_title=title,
+        location="Remote",
+        job_description=description,
+        date_applied="01-01-2026",
+    )
+
+
+@pytest.fixture
+def index(master_resume) -> ResumeTermIndex:
+    return ResumeTermIndex(master_resume)
+
+
+@pytest.fixture
+def fixture_job() -> JobDetails:
+    text = (FIXTURES_DIR / "job_description.txt").read_text(encoding="utf-8")
+    return _job("Backend Engineer", text)
+
+
+def test_tokenize_keeps_language_tokens_and_drops_stopwords():
+    assert tokenize("The C++ and C# devs use Node.js") == [
+        "c++",
+        "c#",
+        "devs",
+        "use",
+        "node.js",
+    ]
+
+
+def test_overlap_does_not_depend_on_other_postings(index, fixture_job):
+    others = [
+        _job("Mobile", "Build iOS apps with Kotlin, Flutter and Dart."),
+        _job("Data", "Own Spark, Airflow and Snowflake pipelines. " * 20),
+    ]
+
+    [alone] = score_postings(index, [fixture_job])
+    together = {
+        r.job_details.job_title: r
+        for r in score_postings(index, [fixture_job, *others])
+    }
+
+    assert together["Backend Engineer"].overlap_percentage == alone.overlap_percentage
+    assert together["Backend Engineer"].missing_skills == alone.missing_skills
+
+
+def test_overlap_is_the_share_of_posting_skills_the_resume_covers(index):
+    [result] = score_postings(
+        index, [_job("Platform", "We use Python, Elixir, Terraform and Rust daily.")]
+    )
+
+    # The fixture resume lists Python and Terraform, not Elixir or Rust
+    assert result.missing_skills == ["Rust", "Elixir"]
+    assert result.overlap_percentage == 50.0
+    assert result.passed
+
+
+def test_prose_words_are_not_counted_as_skills(index):
+    [result] = score_postings(
+        index, [_job("Prose", "A Series C company; go swiftly and rest well.")]
+    )
+
+    assert result.missing_skills == []
+    assert result.overlap_percentage == 100.0
+
+
+def test_posting_without_resume_skills_fails(index):
+    [result] = score_postings(
+        index,
+        [_job("Mobile", "Build iOS apps with Kotlin, Flutter and Dart.")],
+        min_overlap=30,
+    )
+
+    assert result.overlap_percentage == 0.0
+    assert not result.passed
+    assert result.missing_skills == ["Kotlin", "Dart", "Flutter"]
+
+
+def test_results_are_ranked_by_bm25(index, fixture_job):
+    weak = _job("Sales", "Sell our product to enterprise customers using Python.")
+    results = score_postings(index, [weak, fixture_job])
+    assert [r.job_details.job_title for r in results] == ["Backend Engineer", "Sales"]
+
+
+def test_language_skills_survive_description_cleaning(index):
+    job = job_details_from_record(
+        {
+            "company_name": "Acme",
+            "job_title": "Windows",
+            "location": "Remote",
+            "job_description": "5+ years of C++ and C# on .NET",
+        }
+    )
+
+    [result] = score_postings(index, [job])
+
+    assert "C++" not in job.job_description
+    assert sorted(result.missing_skills) == [".NET", "C#", "C++"]
+    assert "raw_job_description" not in job.model_dump()
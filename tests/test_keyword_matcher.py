@@ -0,0 +1,102 @@
+from gary.config import MAX_KEYWORD_USES
+from gary.models import JobAnalysis, ResumeContent, Skills
+from gary.utils.keyword_matcher import KeywordMatcher, normalize_text
+from gary.utils.local_validation import analyze_keywords
+
+
+def _found(matcher: KeywordMatcher, text: str) -> list:
+    return [(matcher.keywords[index], start) for index, start in matcher.find_all(text)]
+
+
+def test_normalize_text_lowercases_and_collapses_whitespace():
+    assert (
+        normalize_text("  Event-Driven\n\tArchitecture ") == "event-driven architecture"
+    )
+
+
+def test_matches_case_insensitively_at_word_boundaries():
+    matcher = KeywordMatcher(["Java", "AWS"])
+    assert _found(matcher, "java, JavaScript and aws-cdk on AWS") == [
+        ("Java", 0),
+        ("AWS", 21),
+        ("AWS", 32),
+    ]
+
+
+def test_single_letter_keyword_does_not_match_inside_cpp_or_csharp():
+    matcher = KeywordMatcher(["C", "C++", "C#"])
+    assert _found(matcher, "Used C++ and C.") == [("C++", 5), ("C", 13)]
+    assert _found(matcher, "C# and C/C++") == [("C#", 0), ("C", 7), ("C++", 9)]
+
+
+def test_keywords_with_punctuation_match_next_to_punctuation():
+    matcher = KeywordMatcher([".NET", "CI/CD", "Node.js"])
+    assert _found(matcher, "ASP.NET, CI/CD (Node.js).") == [
+        (".NET", 3),
+        ("CI/CD", 9),
+        ("Node.js", 16),
+    ]
+
+
+def test_overlapping_keywords_are_all_found():
+    matcher = KeywordMatcher(["Distributed Systems", "Systems", "Distributed"])
+    assert sorted(_found(matcher, "distributed systems")) == [
+        ("Distributed", 0),
+        ("Distributed Systems", 0),
+        ("Systems", 12),
+    ]
+
+
+def test_duplicate_keywords_are_merged():
+    matcher = KeywordMatcher(["Python", "python ", "PYTHON"])
+    assert matcher.keywords == ["Python"]
+    assert matcher.count("Python and python") == [2]
+
+
+def test_analyze_keywords_counts_per_section(job_analysis, resume_content):
+    report = analyze_keywords(job_analysis, resume_content)
+    counts = {c.keyword: c for c in report.keywords}
+
+    assert counts["Python"].total == sum(counts["Python"].sections.values())
+    assert counts["Python"].sections["skills"] >= 1
+    metrics = report.keyword_analysis
+    scored = sum(
+        len(getattr(job_analysis.skills, c))
+        for c in ("technical", "soft", "management")
+    )
+    assert metrics.total_keywords_from_job == scored
+    assert metrics.integration_rate == round(
+        metrics.keywords_integrated / scored * 100, 1
+    )
+
+
+def _summary_only(summary: str) -> ResumeContent:
+    return ResumeContent.model_validate(
+        {
+            "professional_summary": {"summary": summary},
+            "work_experience": [],
+            "education": [],
+            "skills": [],
+            "projects": [],
+        }
+    )
+
+
+def test_analyze_keywords_does_not_count_c_inside_cpp():
+    resume_content = _summary_only("Systems engineer writing C++ and C# daily.")
+    analysis = JobAnalysis(skills=Skills(technical=["C"], soft=[], management=[]))
+
+    metrics = analyze_keywords(analysis, resume_content).keyword_analysis
+
+    assert metrics.keywords_integrated == 0
+    assert metrics.missing_critical_keywords == ["C"]
+
+
+def test_analyze_keywords_flags_stuffed_keywords():
+    resume_content = _summary_only(" ".join(["Kafka"] * (MAX_KEYWORD_USES + 1)))
+    analysis = JobAnalysis(skills=Skills(technical=["Kafka"], soft=[], management=[]))
+
+    metrics = analyze_keywords(analysis, resume_content).keyword_analysis
+
+    assert metrics.forced_keywords == ["Kafka"]
+    assert metrics.naturally_integrated_keywords == []
@@ -0,0 +1,109 @@
+import threading
+from crewai.events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    crewai_event_bus,
+)
+from crewai.events.types.llm_events import LLMCallType
+from gary.metrics import (
+    LLMCallMetric,
+    MetricsRecorder,
+    PrometheusMetrics,
+    RunMetrics,
+    append_run_metrics,
+    render_prometheus,
+    single_call_tailoring_seconds,
+)
+
+
+def _handler_count() -> int:
+    return sum(len(handlers) for handlers in crewai_event_bus._handlers.values())
+
+
+def _llm_call(model: str = "gpt-4o-mini") -> None:
+    crewai_event_bus.emit(None, LLMCallStartedEvent(messages="Tailor the resume"))
+    crewai_event_bus.emit(
+        None,
+        LLMCallCompletedEvent(
+            response="{}", call_type=LLMCallType.LLM_CALL, model=model
+        ),
+    )
+
+
+def test_attach_keeps_crewai_handlers_and_registers_once():
+    with MetricsRecorder().attach():
+        registered = _handler_count()
+    with MetricsRecorder().attach(), MetricsRecorder().attach():
+        assert _handler_count() == registered
+    assert _handler_count() == registered
+
+
+def test_records_calls_only_while_attached():
+    run = RunMetrics(mode="tailor")
+    recorder = MetricsRecorder(default=run)
+
+    with recorder.attach():
+        _llm_call()
+    _llm_call()
+
+    assert [call.model for call in run.llm_calls] == ["gpt-4o-mini"]
+
+
+def test_scopes_route_events_by_thread():
+    first, second = RunMetrics(mode="batch"), RunMetrics(mode="batch")
+    recorder = MetricsRecorder()
+
+    with recorder.attach():
+        worker = threading.Thread(
+            target=recorder.call_in_scope, args=(second, _llm_call, "second")
+        )
+        worker.start()
+        worker.join()
+        recorder.call_in_scope(first, _llm_call, "first")
+        _llm_call("unscoped")
+
+    assert [call.model for call in first.llm_calls] == ["first"]
+    assert [call.model for call in second.llm_calls] == ["second"]
+
+
+def _run(seconds: float, tokens: int) -> RunMetrics:
+    call = LLMCallMetric(
+        model="gpt-4o-mini",
+        latency_seconds=seconds,
+        prompt_tokens=tokens,
+        completion_tokens=tokens,
+        cost_usd=0.01,
+    )
+    return RunMetrics(mode="serve", stages={"tailoring": seconds}, llm_calls=[call])
+
+
+def test_prometheus_aggregates_grow_without_rereading_history(tmp_path):
+    history = tmp_path / "runs.jsonl"
+    runs = [_run(float(i), 10) for i in range(1, 6)]
+    for run in runs[:3]:
+        append_run_metrics(run, history)
+
+    metrics = PrometheusMetrics.load(history, window=2)
+    history.unlink()
+    for run in runs[3:]:
+        metrics.add(run)
+    metrics.write(tmp_path / "gary.prom")
+
+    text = (tmp_path / "gary.prom").read_text(encoding="utf-8")
+    assert text == render_prometheus(runs, window=2)
+    assert 'gary_runs_total{mode="serve"} 5' in text
+    assert 'gary_llm_tokens_total{model="gpt-4o-mini",kind="prompt"} 50' in text
+    assert 'gary_llm_latency_seconds_count{model="gpt-4o-mini"} 2' in text
+
+
+def test_single_call_baseline_ignores_section_runs(tmp_path):
+    history = tmp_path / "runs.jsonl"
+    assert single_call_tailoring_seconds(history) is None
+
+    history = tmp_path / "more_runs.jsonl"
+    for seconds in (30.0, 10.0, 20.0):
+        append_run_metrics(_run(seconds, 10), history)
+    sections = _run(5.0, 10).model_copy(update={"tailoring_mode": "sections"})
+    append_run_metrics(sections, history)
+
+    assert single_call_tailoring_seconds(history) == 20.0
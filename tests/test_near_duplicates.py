@@ -0,0 +1,113 @@
+from pathlib import Path
+import numpy as np
+import pytest
+from gary.models import JobDetails
+from gary.utils.application_ledger import ApplicationLedger
+from gary.utils.clean_job_description import clean_job_description
+from gary.utils.near_duplicates import (
+    MinHasher,
+    NearDuplicateIndex,
+    estimate_similarity,
+    shingle_hashes,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def posting() -> str:
+    text = (FIXTURES_DIR / "job_description.txt").read_text(encoding="utf-8")
+    return clean_job_description(text)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "index.sqlite3", threshold=0.7)
+    yield index
+    index.close()
+
+
+def _reworded(text: str) -> str:
+    # A recruiter's repost: a new opening sentence and no closing sentence
+    return "Exciting opportunity via Acme Recruiting! " + text.rsplit(". ", 1)[0]
+
+
+def _job(description: str, company: str = "Acme") -> JobDetails:
+    return JobDetails(
+        company_name=company,
+        job_title="Engineer",
+        location="Remote",
+        job_description=description,
+        date_applied="03-15-2026",
+    )
+
+
+def test_shingles_ignore_case_and_punctuation():
+    assert np.array_equal(
+        shingle_hashes("Build APIs, in Python!", 2),
+        shingle_hashes("build apis in python", 2),
+    )
+    assert len(shingle_hashes("Build APIs in Python", 2)) == 3
+    assert len(shingle_hashes("Python", 5)) == 1
+    assert len(shingle_hashes("", 5)) == 0
+
+
+def test_similarity_estimates_follow_the_text(posting):
+    hasher = MinHasher()
+    signature = hasher.signature(posting)
+
+    assert estimate_similarity(signature, hasher.signature(posting)) == 1.0
+    assert estimate_similarity(signature, hasher.signature(_reworded(posting))) > 0.7
+    unrelated = hasher.signature("Bake bread and pastries for our downtown cafe.")
+    assert estimate_similarity(signature, unrelated) < 0.1
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=128, bands=10)
+
+
+def test_query_finds_reposts_most_similar_first(index, posting):
+    index.add_many(
+        [
+            (1, _reworded(posting)),
+            (2, posting),
+            (3, "Bake bread and pastries for our downtown cafe."),
+        ]
+    )
+
+    matches = index.query(posting)
+
+    assert [record_id for record_id, _ in matches] == [2, 1]
+    assert matches[0][1] == 1.0
+    assert index.query(posting, exclude=[2])[0][0] == 1
+
+
+def test_changed_parameters_drop_stored_signatures(tmp_path, posting):
+    path = tmp_path / "index.sqlite3"
+    index = NearDuplicateIndex(path)
+    index.add(1, posting)
+    index.close()
+
+    reopened = NearDuplicateIndex(path, hasher=MinHasher(num_perm=64, bands=16))
+    assert len(reopened) == 0
+    reopened.close()
+
+
+def test_sync_indexes_new_ledger_rows_and_rebuilds_for_a_new_ledger(
+    tmp_path, index, posting
+):
+    ledger = ApplicationLedger(tmp_path / "ledger.sqlite3")
+    first = ledger.record(_job(posting))
+
+    assert index.sync(ledger) == 1
+    assert index.sync(ledger) == 0
+    second = ledger.record(_job(_reworded(posting), company="Globex"))
+    assert index.sync(ledger) == 1
+    assert {record_id for record_id, _ in index.query(posting)} == {first, second}
+
+    # A replaced ledger reuses ids, so the index starts over
+    fresh = ApplicationLedger(tmp_path / "fresh.sqlite3")
+    fresh.record(_job("Bake bread and pastries for our downtown cafe."))
+    assert index.sync(fresh) == 1
+    assert index.query(posting) == []
@@ -0,0 +1,150 @@
+from contextlib import contextmanager
+import pytest
+from gary import repair
+from gary.config import MAX_KEYWORD_USES
+from gary.models import KeywordCount, KeywordReport, SectionRepair
+from gary.repair import (
+    _keyword_limits,
+    build_repair_instructions,
+    plan_repairs,
+    repair_resume,
+)
+from gary.utils.local_validation import analyze_keywords, build_local_validation_report
+
+
+@pytest.fixture
+def keyword_report(job_analysis, resume_content) -> KeywordReport:
+    return analyze_keywords(job_analysis, resume_content)
+
+
+def _failed_report(
+    keyword_report, resume_content, missing=(), forced=(), suggestions=()
+):
+    report = build_local_validation_report(keyword_report, resume_content)
+    keyword_analysis = report.keyword_analysis.model_copy(
+        update={
+            "missing_critical_keywords": list(missing),
+            "forced_keywords": list(forced),
+        }
+    )
+    feedback = report.feedback.model_copy(update={"suggestions": list(suggestions)})
+    return report.model_copy(
+        update={
+            "passed_validation": False,
+            "keyword_analysis": keyword_analysis,
+            "feedback": feedback,
+        }
+    )
+
+
+def test_missing_keywords_go_to_the_first_section_that_supports_them(
+    keyword_report, resume_content, master_resume
+):
+    report = _failed_report(
+        keyword_report, resume_content, missing=["Kafka", "Python", "Elixir"]
+    )
+
+    plan = plan_repairs(report, keyword_report, master_resume)
+
+    added = {r.section: r.add_keywords for r in plan}
+    assert added == {"work_experience": ["Kafka"], "skills": ["Python"]}
+
+
+def test_overused_keywords_are_capped_where_used_most(
+    keyword_report, resume_content, master_resume
+):
+    overused = KeywordCount(
+        keyword="Python",
+        category="technical",
+        total=MAX_KEYWORD_USES + 2,
+        sections={"work_experience": MAX_KEYWORD_USES, "skills": 1, "projects": 1},
+    )
+    counts = keyword_report.model_copy(update={"keywords": [overused]})
+    report = _failed_report(keyword_report, resume_content, forced=["python"])
+
+    plan = plan_repairs(report, counts, master_resume)
+
+    assert [(r.section, r.reduce_keywords) for r in plan] == [
+        ("work_experience", {"Python": MAX_KEYWORD_USES - 2})
+    ]
+
+
+def test_keyword_limits_keep_one_use_per_section_unless_needed():
+    assert _keyword_limits({"skills": 2, "projects": 3}, 3) == {
+        "projects": 1,
+        "skills": 1,
+    }
+    assert _keyword_limits({"skills": 1, "projects": 1}, 1) == {"skills": 0}
+
+
+def test_suggestions_are_routed_to_the_sections_they_mention(
+    keyword_report, resume_content, master_resume
+):
+    suggestions = [
+        "Quantify achievements in work experience bullets",
+        "Tighten the professional summary",
+        "Mention coursework relevant to the role",
+    ]
+    report = _failed_report(keyword_report, resume_content, suggestions=suggestions)
+
+    plan = plan_repairs(report, keyword_report, master_resume)
+
+    # In ResumeContent field order
+    assert [(r.section, r.suggestions) for r in plan] == [
+        ("professional_summary", [suggestions[1]]),
+        ("work_experience", [suggestions[0]]),
+        ("education", [suggestions[2]]),
+    ]
+
+
+def test_repair_instructions_list_each_fix():
+    instructions = build_repair_instructions(
+        SectionRepair(
+            section="skills",
+            add_keywords=["Kafka", "Redis"],
+            reduce_keywords={"Python": 2, "AWS": 0},
+            suggestions=["Group cloud tools together"],
+        )
+    )
+
+    assert instructions.splitlines() == [
+        "- Add these missing keywords, which the source supports: Kafka, Redis",
+        '- Use "Python" at most 2 times in this section',
+        '- Remove "AWS" from this section',
+        "- Group cloud tools together",
+    ]
+
+
+@pytest.fixture
+def fake_crew_pool(monkeypatch):
+    @contextmanager
+    def lease():
+        yield None
+
+    pool = type("Pool", (), {"lease": staticmethod(lease)})
+    monkeypatch.setattr(repair, "get_crew_pool", lambda: pool)
+
+
+def test_round_that_lowers_the_score_is_reverted(
+    monkeypatch, fake_crew_pool, job_analysis, resume_content, master_resume
+):
+    def drop_bullets(gary, section_repair, content, master):
+        roles = [
+            role.model_copy(update={"responsibilities": []})
+            for role in content.work_experience
+        ]
+        return roles, {"prompt_tokens": 100, "completion_tokens": 20}
+
+    monkeypatch.setattr(repair, "repair_section", drop_bullets)
+    keywords = analyze_keywords(job_analysis, resume_content)
+    report = _failed_report(keywords, resume_content, missing=["Kafka"])
+
+    content, final_report, _, rounds = repair_resume(
+        job_analysis, resume_content, report, master_resume
+    )
+
+    assert content == resume_content
+    assert final_report is report
+    assert [(r.sections, r.kept, r.prompt_tokens) for r in rounds] == [
+        (["work_experience"], False, 100)
+    ]
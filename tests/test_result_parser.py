@@ -0,0 +1,76 @@
+import json
+import pytest
+from gary.models import ResumeContent, Skill
+from gary.utils.result_parser import (
+    iter_json_spans,
+    parse_crew_result,
+    parse_json_model,
+    strip_code_fence,
+)
+
+
+def _agent_answer(content: str) -> str:
+    return (
+        "Thought: keep the {strongest} bullets; the [draft] had too many.\n"
+        f"Final Answer:\n```json\n{content}\n```\n"
+        'Scores: {"ats": 88, "readability": 91}'
+    )
+
+
+def test_strip_code_fence():
+    assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip_code_fence("  ```\n[1]\n```  ") == "[1]"
+    assert strip_code_fence('{"a": 1}') == '{"a": 1}'
+
+
+def test_iter_json_spans_skips_braces_in_prose():
+    text = 'Use {braces} and [notes] here: {"a": [1, 2]} then [3, {"b": null}]'
+
+    values = [value for _, _, value in iter_json_spans(text)]
+    objects = [value for _, _, value in iter_json_spans(text, objects_only=True)]
+
+    assert values == [{"a": [1, 2]}, [3, {"b": None}]]
+    assert objects == [{"a": [1, 2]}, {"b": None}]
+
+
+def test_iter_json_spans_offsets_cover_each_value():
+    text = 'x {"a": 1} y {"b": 2}'
+
+    spans = [(text[begin:end], value) for begin, end, value in iter_json_spans(text)]
+
+    assert spans == [('{"a": 1}', {"a": 1}), ('{"b": 2}', {"b": 2})]
+
+
+def test_iter_json_spans_recovers_after_an_unclosed_object():
+    text = '{"truncated": [1, 2 ... and later {"ok": true}'
+
+    assert [value for _, _, value in iter_json_spans(text)] == [{"ok": True}]
+
+
+def test_parse_json_model_from_noisy_answer(resume_content):
+    text = _agent_answer(resume_content.model_dump_json(indent=2))
+
+    assert parse_json_model(text, ResumeContent) == resume_content
+
+
+def test_parse_json_model_skips_objects_that_do_not_fit():
+    text = 'Draft: {"category": 1} Final: {"category": "Cloud", "items": ["AWS"]}'
+
+    assert parse_json_model(text, Skill) == Skill(category="Cloud", items=["AWS"])
+
+
+def test_parse_json_model_raises_when_nothing_fits():
+    with pytest.raises(ValueError, match="No Skill JSON found"):
+        parse_json_model('Thought: nothing here {"ats": 88}', Skill)
+
+
+def test_parse_crew_result_takes_the_first_value(resume_dict):
+    text = _agent_answer(json.dumps(resume_dict))
+    crew_output = type("CrewOutput", (), {"raw": text})()
+
+    assert parse_crew_result(crew_output) == resume_dict
+    assert parse_crew_result({"a": 1}) == {"a": 1}
+    with pytest.raises(ValueError):
+        parse_crew_result("no JSON at all")
+    with pytest.raises(ValueError):
+        parse_crew_result(42)
@@ -0,0 +1,70 @@
+from typing import Optional
+import pytest
+from gary.models import Header, JobAnalysis, MasterResume, ResumeContent, Skills
+from gary.utils.resume_prompt import (
+    COMPACT_FORMAT_NOTE,
+    decode_compact,
+    encode_compact,
+)
+
+TRICKY = "Cut p95 latency | 40%\n## not a section"
+
+
+class ResumeBody(MasterResume):
+    """MasterResume as sent to the crew, without the header."""
+
+    header: Optional[Header] = None
+
+
+def test_resume_content_round_trips(resume_content):
+    role = resume_content.work_experience[0]
+    tricky_role = role.model_copy(
+        update={"title": "## Lead | Staff", "responsibilities": [TRICKY, ""]}
+    )
+    content = resume_content.model_copy(
+        update={"work_experience": [tricky_role, *resume_content.work_experience]}
+    )
+
+    text = encode_compact(content)
+
+    assert text.startswith(COMPACT_FORMAT_NOTE)
+    assert decode_compact(text, ResumeContent) == content
+
+
+@pytest.mark.parametrize("with_summary", [True, False])
+def test_master_resume_without_header_round_trips(master_resume, with_summary):
+    summary = master_resume.professional_summary if with_summary else None
+    master = master_resume.model_copy(update={"professional_summary": summary})
+
+    text = encode_compact(master, exclude={"header"})
+    decoded = decode_compact(text, ResumeBody)
+
+    assert "## header" not in text
+    assert decoded.header is None
+    assert decoded.model_dump(exclude={"header"}) == master.model_dump(
+        exclude={"header"}
+    )
+
+
+def test_job_analysis_round_trips(job_analysis):
+    analysis = job_analysis.model_copy(
+        update={
+            "skills": job_analysis.skills.model_copy(
+                update={"technical": ["C++ | C#", "## Go"], "bonus": []}
+            ),
+            "culture_and_values": [TRICKY],
+        }
+    )
+
+    assert decode_compact(encode_compact(analysis), JobAnalysis) == analysis
+
+
+def test_empty_job_analysis_round_trips():
+    analysis = JobAnalysis(skills=Skills())
+
+    assert decode_compact(encode_compact(analysis), JobAnalysis) == analysis
+
+
+def test_invalid_row_is_reported_with_its_line():
+    with pytest.raises(ValueError, match="line 3"):
+        decode_compact("## tone_and_priorities\n[]\n[oops", JobAnalysis)
@@ -0,0 +1,79 @@
+from pathlib import Path
+from gary.config import TAILOR_MIN_BULLETS_PER_ROLE
+from gary.models import JobAnalysis, Skills
+from gary.utils.resume_artifact import load_compiled_resume
+from gary.utils.resume_slicer import score_items, slice_master_resume
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+def _analysis(*technical: str) -> JobAnalysis:
+    return JobAnalysis(skills=Skills(technical=list(technical), soft=[], management=[]))
+
+
+def test_score_items_ranks_items_sharing_job_terms():
+    scores = score_items(
+        _analysis("Kafka", "Terraform"),
+        [
+            "Built Kafka consumers",
+            "Wrote Terraform modules for Kafka",
+            "Organized team offsites",
+        ],
+    )
+    assert scores[1] > scores[0] > 0
+    assert scores[2] == 0.0
+
+
+def test_keeps_most_relevant_bullets_in_resume_order(master_resume):
+    role = master_resume.work_experience[0]
+    target = role.responsibilities[-1]
+    analysis = _analysis(*target.split()[:6])
+
+    sliced, report = slice_master_resume(
+        master_resume, analysis, max_bullets_per_role=2, token_budget=100_000
+    )
+
+    kept = sliced.work_experience[0].responsibilities
+    assert len(kept) == 2
+    assert target in kept
+    assert kept == [b for b in role.responsibilities if b in kept]
+    assert report.items_kept < report.items_total
+
+
+def test_never_drops_header_titles_or_skills(master_resume, job_analysis):
+    sliced, _ = slice_master_resume(master_resume, job_analysis, token_budget=1)
+
+    assert sliced.header == master_resume.header
+    assert sliced.skills == master_resume.skills
+    assert [(e.title, e.company) for e in sliced.work_experience] == [
+        (e.title, e.company) for e in master_resume.work_experience
+    ]
+
+
+def test_token_budget_keeps_minimum_items(master_resume, job_analysis):
+    _, unbounded = slice_master_resume(
+        master_resume, job_analysis, token_budget=100_000
+    )
+    sliced, report = slice_master_resume(master_resume, job_analysis, token_budget=1)
+
+    for exp, original in zip(sliced.work_experience, master_resume.work_experience):
+        assert len(exp.responsibilities) == min(
+            TAILOR_MIN_BULLETS_PER_ROLE, len(original.responsibilities)
+        )
+    assert len(sliced.projects) == 1
+    assert report.sliced_tokens < unbounded.sliced_tokens
+    assert report.saved_tokens == report.original_tokens - report.sliced_tokens
+
+
+def test_compiled_and_uncompiled_resumes_slice_the_same(tmp_path, job_analysis):
+    compiled = load_compiled_resume(
+        FIXTURES_DIR / "resume.json", tmp_path / "artifact.pickle"
+    )
+    from_artifact, artifact_report = slice_master_resume(
+        compiled.master_resume, job_analysis
+    )
+    copy = compiled.master_resume.model_copy(deep=True)
+    from_model, model_report = slice_master_resume(copy, job_analysis)
+
+    assert from_artifact == from_model
+    assert artifact_report == model_report
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+import pytest
+from gary.scheduler import PipelineScheduler
+
+
+def test_passes_results_of_dependencies():
+    scheduler = PipelineScheduler()
+    scheduler.add("a", lambda r: 2)
+    scheduler.add("b", lambda r: 3)
+    scheduler.add("sum", lambda r: r["a"] + r["b"], deps=["a", "b"])
+
+    results = asyncio.run(scheduler.run())
+
+    assert results["sum"] == 5
+    assert scheduler.critical_path()[-1] == "sum"
+    assert {t.status for t in scheduler.timings.values()} == {"done"}
+
+
+def test_independent_stages_overlap():
+    scheduler = PipelineScheduler()
+    scheduler.add("a", lambda r: time.sleep(0.2))
+    scheduler.add("b", lambda r: time.sleep(0.2))
+
+    start = time.perf_counter()
+    asyncio.run(scheduler.run())
+
+    assert time.perf_counter() - start < 0.35
+
+
+def test_rejects_unknown_or_duplicate_stages():
+    scheduler = PipelineScheduler()
+    scheduler.add("a", lambda r: None)
+    with pytest.raises(ValueError):
+        scheduler.add("a", lambda r: None)
+    with pytest.raises(ValueError):
+        scheduler.add("b", lambda r: None, deps=["missing"])
+    with pytest.raises(ValueError):
+        scheduler.add("c", lambda r: None, inline=True, interactive=True)
+
+
+def test_interactive_stage_leaves_event_loop_free():
+    release = threading.Event()
+    scheduler = PipelineScheduler()
+
+    async def ticker(results):
+        # Runs only if the blocked interactive stage is off the loop thread
+        await asyncio.sleep(0.01)
+        release.set()
+        return "ticked"
+
+    scheduler.add("prompt", lambda r: release.wait(5), interactive=True)
+    scheduler.add("ticker", ticker)
+
+    results = asyncio.run(scheduler.run())
+
+    assert results["prompt"] is True
+    assert results["ticker"] == "ticked"
+
+
+def test_interactive_stages_take_turns():
+    active, overlaps = [], []
+    scheduler = PipelineScheduler()
+
+    def prompt(results):
+        overlaps.append(bool(active))
+        active.append(True)
+        time.sleep(0.05)
+        active.pop()
+
+    scheduler.add("first", prompt, interactive=True)
+    scheduler.add("second", prompt, interactive=True)
+    asyncio.run(scheduler.run())
+
+    assert overlaps == [False, False]
+
+
+def test_optional_failure_records_none_and_required_failure_cancels():
+    def fail(results):
+        raise RuntimeError("boom")
+
+    scheduler = PipelineScheduler()
+    scheduler.add("optional", fail, optional=True, interactive=True)
+    scheduler.add("after", lambda r: r["optional"], deps=["optional"])
+    assert asyncio.run(scheduler.run())["after"] is None
+
+    scheduler = PipelineScheduler()
+    scheduler.add("required", fail, interactive=True)
+    scheduler.add("after", lambda r: None, deps=["required"])
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(scheduler.run())
+    assert scheduler.timings["required"].status == "failed"
+    assert "after" not in scheduler.timings
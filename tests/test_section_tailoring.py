@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+import pytest
+from gary import section_tailoring
+from gary.exceptions import CrewExecutionError
+from gary.models import ProfessionalSummary, SectionTailoringReport, SectionTiming
+from gary.section_tailoring import (
+    PARALLEL_SECTIONS,
+    SUMMARY_SECTION,
+    describe_section_report,
+    merge_sections,
+    tailor_by_section,
+)
+
+
+def _sections(resume_content) -> dict:
+    return {
+        name: getattr(resume_content, name)
+        for name in type(resume_content).model_fields
+    }
+
+
+def test_merge_sections_reports_missing_sections(resume_content):
+    sections = _sections(resume_content)
+    del sections["skills"], sections["projects"]
+
+    with pytest.raises(CrewExecutionError, match=r"\['skills', 'projects'\]"):
+        merge_sections(sections)
+
+
+def test_merge_sections_rejects_sections_that_do_not_validate(resume_content):
+    sections = {**_sections(resume_content), "education": "BSc, somewhere"}
+
+    with pytest.raises(CrewExecutionError, match="do not form a resume"):
+        merge_sections(sections)
+
+
+@pytest.fixture
+def fake_section_crews(monkeypatch, resume_content):
+    """Section crews that return the fixture sections and record their calls."""
+    calls = []
+    tailored_role = resume_content.work_experience[0].model_copy(
+        update={"title": "Tailored Staff Engineer"}
+    )
+    outputs = {
+        **_sections(resume_content),
+        "work_experience": [tailored_role],
+        SUMMARY_SECTION: ProfessionalSummary(summary="Written last."),
+    }
+
+    def section_crew(section):
+        def kickoff(inputs):
+            calls.append((section, inputs))
+            return SimpleNamespace(
+                pydantic=SimpleNamespace(**{section: outputs[section]})
+            )
+
+        return SimpleNamespace(kickoff=kickoff, usage_metrics=None)
+
+    @contextmanager
+    def lease(master_resume, job_analysis):
+        yield SimpleNamespace(section_crew=section_crew)
+
+    pool = SimpleNamespace(lease=lease)
+    monkeypatch.setattr(section_tailoring, "get_crew_pool", lambda: pool)
+    monkeypatch.setattr(section_tailoring, "METRICS_ENABLED", False)
+    return calls
+
+
+def test_summary_is_tailored_last_from_the_finished_sections(
+    fake_section_crews, master_resume, job_analysis
+):
+    job_details = SimpleNamespace(
+        company_name="Acme", job_title="Engineer", job_description="Build APIs."
+    )
+
+    content, analysis, report = tailor_by_section(
+        master_resume, job_details, job_analysis=job_analysis
+    )
+
+    sections = [section for section, _ in fake_section_crews]
+    assert sorted(sections[:-1]) == sorted(PARALLEL_SECTIONS)
+    assert sections[-1] == SUMMARY_SECTION
+    summary_inputs = fake_section_crews[-1][1]
+    assert "Tailored Staff Engineer" in summary_inputs["tailored_sections"]
+    assert content.professional_summary.summary == "Written last."
+    assert content.work_experience[0].title == "Tailored Staff Engineer"
+    assert analysis is job_analysis
+    assert [t.section for t in report.sections][-1] == SUMMARY_SECTION
+
+
+def test_section_report_compares_with_recorded_single_call_runs():
+    report = SectionTailoringReport(
+        sections=[
+            SectionTiming(section="skills", latency_seconds=4.0),
+            SectionTiming(section=SUMMARY_SECTION, latency_seconds=2.0),
+        ],
+        wall_seconds=5.0,
+    )
+
+    assert "(6.0s one after another, 1.2x;" in describe_section_report(report)
+    report.single_call_seconds = 15.0
+    assert "(15.0s median single call, 3.0x;" in describe_section_report(report)
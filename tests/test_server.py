@@ -0,0 +1,137 @@
+import http.client
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer
+import pytest
+from gary import server
+from gary.batch import BatchJobResult
+from gary.models import JobDetails
+from gary.utils.application_ledger import ApplicationLedger
+
+
+def _job(company: str) -> JobDetails:
+    return JobDetails(
+        company_name=company,
+        job_title="Engineer",
+        location="Remote",
+        job_description=f"Build APIs at {company}.",
+        date_applied="03-15-2026",
+    )
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch, master_resume):
+    # Everything the service opens at startup, without CrewAI, Sheets or .cache
+    monkeypatch.setattr(server, "METRICS_ENABLED", False)
+    monkeypatch.setattr(
+        server,
+        "load_compiled_resume",
+        lambda: type("Compiled", (), {"master_resume": master_resume}),
+    )
+    monkeypatch.setattr(
+        server, "ApplicationLedger", lambda: ApplicationLedger(tmp_path / "l.sqlite3")
+    )
+    service = server.TailoringService(
+        workers=1, use_cache=False, log_to_sheets=False, near_duplicates="ignore"
+    )
+    service._thread.start()
+    service._ready.wait()
+    service._accepting = True
+    yield service
+    service.stop()
+
+
+def _wait_finished(service, job_id: str):
+    for _ in range(500):
+        job = service.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} is still {job.status}")
+
+
+def test_failed_job_is_marked_failed_and_worker_keeps_running(service, monkeypatch):
+    def find_duplicates(job_details):
+        if job_details.company_name == "Broken":
+            raise RuntimeError("database is locked")
+        return []
+
+    async def process_job(job_details, *args, **kwargs):
+        return BatchJobResult(job_details=job_details, file_path="resume.docx")
+
+    monkeypatch.setattr(service.ledger, "find_duplicates", find_duplicates)
+    monkeypatch.setattr(server, "_process_job", process_job)
+
+    broken = _wait_finished(service, service.submit(_job("Broken")).id)
+    healthy = _wait_finished(service, service.submit(_job("Acme")).id)
+
+    assert broken.status == "failed"
+    assert broken.result.error == "database is locked"
+    assert healthy.status == "succeeded"
+    assert service.health()["running"] == 0
+
+
+def test_failure_after_the_resume_keeps_the_job_succeeded(service, monkeypatch):
+    async def process_job(job_details, *args, **kwargs):
+        return BatchJobResult(job_details=job_details, file_path="resume.docx")
+
+    def mirror_to_sheets():
+        raise RuntimeError("Sheets unavailable")
+
+    monkeypatch.setattr(server, "_process_job", process_job)
+    monkeypatch.setattr(service, "log_to_sheets", True)
+    monkeypatch.setattr(service, "_mirror_to_sheets", mirror_to_sheets)
+
+    first = _wait_finished(service, service.submit(_job("Acme")).id)
+    second = _wait_finished(service, service.submit(_job("Globex")).id)
+
+    assert (first.status, second.status) == ("succeeded", "succeeded")
+
+
+@pytest.fixture
+def http_server(service):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), server._RequestHandler)
+    httpd.service = service
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _post_jobs(httpd, content_length=None, body=b""):
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    try:
+        conn.putrequest("POST", "/jobs")
+        if content_length is not None:
+            conn.putheader("Content-Length", content_length)
+        conn.endheaders(body)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "content_length, status",
+    [(None, 411), ("ten", 400), ("-1", 400), (str(10**9), 413)],
+)
+def test_bad_content_length_is_rejected(http_server, content_length, status):
+    code, payload = _post_jobs(http_server, content_length)
+
+    assert code == status
+    assert "error" in payload
+
+
+def test_job_with_content_length_is_accepted(http_server, monkeypatch):
+    async def process_job(job_details, *args, **kwargs):
+        return BatchJobResult(job_details=job_details, file_path="resume.docx")
+
+    monkeypatch.setattr(server, "_process_job", process_job)
+    body = _job("Acme").model_dump_json().encode("utf-8")
+
+    code, payload = _post_jobs(http_server, str(len(body)), body)
+
+    assert code == 202
+    assert _wait_finished(http_server.service, payload["id"]).status == "succeeded"
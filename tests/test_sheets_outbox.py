@@ -0,0 +1,148 @@
+import threading
+from typing import List
+import pytest
+from conftest import FakeAPIError, FakeSheets
+from gary.exceptions import GoogleSheetsError
+from gary.utils.sheets_outbox import (
+    BufferedSheetsWriter,
+    SheetsOutbox,
+    is_transient_error,
+)
+
+
+def _rows(count: int, start: int = 0) -> List[List[str]]:
+    return [[f"row {i}", "Acme"] for i in range(start, start + count)]
+
+
+@pytest.fixture
+def outbox(tmp_path) -> SheetsOutbox:
+    return SheetsOutbox(tmp_path / "outbox.sqlite3")
+
+
+def _writer(outbox: SheetsOutbox, sheets: FakeSheets, **kwargs) -> BufferedSheetsWriter:
+    delays: List[float] = []
+    writer = BufferedSheetsWriter(
+        outbox, client_factory=lambda: sheets, sleep=delays.append, **kwargs
+    )
+    writer.delays = delays
+    return writer
+
+
+def test_flush_sends_rows_in_batches_oldest_first(outbox, fake_sheets):
+    writer = _writer(outbox, fake_sheets, batch_size=2)
+    writer.append_many(_rows(3))
+    writer.append(["row 3", "Acme"])
+
+    assert writer.flush() == 4
+    assert [len(call) for call in fake_sheets.calls] == [2, 2]
+    assert fake_sheets.rows == _rows(4)
+    assert len(outbox) == 0
+    assert writer.flush() == 0
+
+
+def test_transient_errors_are_retried_with_exponential_backoff(outbox):
+    sheets = FakeSheets([OSError("reset"), FakeAPIError(429), FakeAPIError(503)])
+    writer = _writer(outbox, sheets, base_delay=0.5)
+    writer.append_many(_rows(2))
+
+    assert writer.flush() == 2
+    assert writer.delays == [0.5, 1.0, 2.0]
+    assert sheets.rows == _rows(2)
+
+
+def test_permanent_error_is_not_retried_and_rows_stay_queued(outbox):
+    sheets = FakeSheets([FakeAPIError(403)])
+    writer = _writer(outbox, sheets)
+    writer.append_many(_rows(2))
+
+    with pytest.raises(GoogleSheetsError):
+        writer.flush()
+    assert len(sheets.calls) == 1
+    assert writer.delays == []
+    assert len(outbox) == 2
+
+
+def test_retries_give_up_after_max_retries(outbox):
+    sheets = FakeSheets([FakeAPIError(500)] * 3)
+    writer = _writer(outbox, sheets, max_retries=2)
+    writer.append_many(_rows(1))
+
+    with pytest.raises(GoogleSheetsError):
+        writer.flush()
+    assert len(sheets.calls) == 3
+    assert len(outbox) == 1
+
+
+def test_partial_failure_requeues_only_unsent_batches(outbox):
+    sheets = FakeSheets()
+    writer = _writer(outbox, sheets, batch_size=2, max_retries=0)
+    writer.append_many(_rows(5))
+    original = sheets.append_rows
+
+    def fail_second_batch(rows):
+        if len(sheets.calls) == 1:
+            sheets.errors.append(FakeAPIError(500))
+        original(rows)
+
+    sheets.append_rows = fail_second_batch
+    with pytest.raises(GoogleSheetsError):
+        writer.flush()
+    assert sheets.rows == _rows(2)
+    assert len(outbox) == 3
+
+    sheets.append_rows = original
+    assert writer.flush() == 3
+    assert sheets.rows == _rows(5)
+
+
+def test_claimed_rows_are_not_claimed_again(outbox):
+    outbox.enqueue(_rows(3))
+
+    first_token, first = outbox.claim(2)
+    second_token, second = outbox.claim(2)
+    assert [row_id for row_id, _ in first] == [1, 2]
+    assert [row_id for row_id, _ in second] == [3]
+
+    outbox.release(first_token)
+    _, again = outbox.claim(5)
+    assert [row_id for row_id, _ in again] == [1, 2]
+    outbox.remove(second_token)
+    assert len(outbox) == 2
+
+
+def test_expired_claims_are_claimed_again(outbox):
+    outbox.enqueue(_rows(1))
+    outbox.claim(1)
+
+    assert outbox.claim(1, lease_seconds=60)[1] == []
+    assert len(outbox.claim(1, lease_seconds=-1)[1]) == 1
+
+
+def test_concurrent_flushers_send_each_row_once(tmp_path):
+    path = tmp_path / "outbox.sqlite3"
+    SheetsOutbox(path).enqueue(_rows(200))
+    sheets = FakeSheets()
+    lock = threading.Lock()
+
+    def append_rows(rows):
+        with lock:
+            sheets.rows.extend(rows)
+
+    sheets.append_rows = append_rows
+    # Separate outbox objects, as in separate processes
+    writers = [_writer(SheetsOutbox(path), sheets, batch_size=7) for _ in range(4)]
+    threads = [threading.Thread(target=w.flush) for w in writers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(map(tuple, sheets.rows)) == sorted(map(tuple, _rows(200)))
+    assert len(SheetsOutbox(path)) == 0
+
+
+def test_is_transient_error():
+    assert is_transient_error(OSError("timeout"))
+    assert is_transient_error(FakeAPIError(429))
+    assert not is_transient_error(FakeAPIError(400))
+    assert not is_transient_error(GoogleSheetsError("no worksheet"))
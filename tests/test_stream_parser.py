@@ -0,0 +1,101 @@
+import json
+from gary.models import ProfessionalSummary, WorkExperience
+from gary.utils.stream_parser import (
+    IncrementalResumeParser,
+    StreamedSection,
+    describe_section,
+    section_texts,
+)
+
+
+def _feed_in_chunks(parser: IncrementalResumeParser, text: str, size: int) -> list:
+    sections = []
+    for start in range(0, len(text), size):
+        sections.extend(parser.feed(text[start : start + size]))
+    return sections
+
+
+def _expected(resume_content) -> list:
+    expected = [("professional_summary", None)]
+    for field in ("work_experience", "education", "skills", "projects"):
+        expected += [(field, i) for i in range(len(getattr(resume_content, field)))]
+    return expected
+
+
+def test_emits_every_section_whatever_the_chunking(resume_content):
+    text = resume_content.model_dump_json(indent=2)
+
+    for size in (1, 7, len(text)):
+        parser = IncrementalResumeParser()
+        sections = _feed_in_chunks(parser, text, size)
+
+        assert [(s.section, s.index) for s in sections] == _expected(resume_content)
+        assert sections[1].item == resume_content.work_experience[0]
+        assert parser.done
+
+
+def test_emits_a_section_as_soon_as_it_closes(resume_content):
+    text = resume_content.model_dump_json()
+    summary_end = text.index("}") + 1
+    parser = IncrementalResumeParser()
+
+    sections = parser.feed(text[:summary_end])
+
+    assert [s.section for s in sections] == ["professional_summary"]
+    assert not parser.done
+
+
+def test_skips_thought_preamble_and_code_fence(resume_content):
+    text = (
+        "Thought: keep {the} strongest bullets\nFinal Answer:\n```json\n"
+        + resume_content.model_dump_json()
+        + "\n```\nTrailing {remark}"
+    )
+    parser = IncrementalResumeParser()
+
+    sections = _feed_in_chunks(parser, text, 5)
+
+    assert [(s.section, s.index) for s in sections] == _expected(resume_content)
+
+
+def test_braces_and_quotes_inside_strings_do_not_end_a_section():
+    summary = {"summary": 'Built "fast" {services} with \\ escapes }]'}
+    text = json.dumps({"professional_summary": summary, "education": []})
+    parser = IncrementalResumeParser()
+
+    sections = _feed_in_chunks(parser, text, 3)
+
+    assert len(sections) == 1
+    assert sections[0].item == ProfessionalSummary.model_validate(summary)
+    assert parser.done
+
+
+def test_malformed_section_is_skipped(resume_content):
+    content = resume_content.model_dump()
+    del content["work_experience"][0]["company"]
+    parser = IncrementalResumeParser()
+
+    sections = parser.feed(json.dumps(content))
+
+    indexes = [s.index for s in sections if s.section == "work_experience"]
+    assert indexes == list(range(1, len(content["work_experience"])))
+
+
+def test_reset_discards_a_partial_answer(resume_content):
+    text = resume_content.model_dump_json()
+    parser = IncrementalResumeParser()
+    parser.feed(text[: len(text) // 2])
+
+    parser.reset()
+    sections = parser.feed(text)
+
+    assert [(s.section, s.index) for s in sections] == _expected(resume_content)
+
+
+def test_describe_section_and_texts(resume_content):
+    role = resume_content.work_experience[0]
+    section = StreamedSection(section="work_experience", index=0, item=role)
+
+    assert describe_section(section) == f"Experience: {role.title} at {role.company}"
+    assert section_texts(section) == [role.title, *role.responsibilities]
+    assert isinstance(section.item, WorkExperience)